@@ -1,8 +1,18 @@
 """Multi-provider orchestrator (import-safe, deterministic).
 
-Public entrypoint: orchestrate_providers(payload, *, metrics_client=None, fake_mode=None).
+Public entrypoints: orchestrate_providers(payload, *, metrics_client=None, fake_mode=None)
+and the concurrent orchestrate_providers_async(payload, ..., provider_timeout=None,
+deadline=None, hedge=None, hedge_delay=None). Both accept cache= (a
+ProviderResultCache, False to disable, default from env).
 """
 
-from .core import orchestrate_providers
+from .cache import ProviderResultCache, default_provider_cache, payload_digest
+from .core import orchestrate_providers, orchestrate_providers_async
 
-__all__ = ["orchestrate_providers"]
+__all__ = [
+    "ProviderResultCache",
+    "default_provider_cache",
+    "orchestrate_providers",
+    "orchestrate_providers_async",
+    "payload_digest",
+]
@@ -0,0 +1,177 @@
+"""TTL + LRU cache for provider signals, keyed by provider id and payload digest.
+
+The same signals envelope is often re-evaluated several times per tick (the
+decision pipeline, the canary); a cache hit skips the provider call entirely.
+Only successful signals are cached. Import-safe: nothing is created on import
+except the lazily built default instance.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from .schema import ProviderSignal
+
+DEFAULT_MAX_ENTRIES = 4096
+
+_CacheKey = Tuple[str, str]
+
+
+def payload_digest(payload: Optional[Dict[str, Any]]) -> str:
+    """Canonical SHA-256 of a payload; key order (nested too) does not matter."""
+    if not payload:
+        return ""
+    try:
+        raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=repr)
+    except TypeError:
+        # Mixed-type keys cannot be sorted by json; fall back to the providers' repr form.
+        raw = repr(sorted(payload.items(), key=repr))
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def _env_ttls(env: Mapping[str, str]) -> Dict[str, float]:
+    """Parse BRAIN_PROVIDER_CACHE_TTLS_MS="brain=250,indicators=1000" into seconds."""
+    ttls: Dict[str, float] = {}
+    for item in (env.get("BRAIN_PROVIDER_CACHE_TTLS_MS") or "").split(","):
+        provider_id, sep, raw = item.partition("=")
+        if not sep or not provider_id.strip():
+            continue
+        try:
+            ttls[provider_id.strip()] = float(raw) / 1000
+        except ValueError:
+            continue
+    return ttls
+
+
+class ProviderResultCache:
+    """Thread-safe TTL + LRU map of (provider_id, payload digest) -> ProviderSignal.
+
+    default_ttl applies to providers without an entry in ttls; a TTL of 0 or
+    less disables caching for that provider. Past max_entries the least
+    recently used entry is dropped. Hits return a copy so callers cannot
+    mutate the cached signal.
+    """
+
+    def __init__(
+        self,
+        default_ttl: float = 1.0,
+        ttls: Optional[Mapping[str, float]] = None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._lock = threading.Lock()
+        # insertion/access order doubles as the LRU order; value is (expires_at, signal)
+        self._entries: "OrderedDict[_CacheKey, Tuple[float, ProviderSignal]]" = OrderedDict()
+        self.default_ttl = default_ttl
+        self.ttls: Dict[str, float] = dict(ttls or {})
+        self.max_entries = max_entries
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_env(cls, env: Optional[Mapping[str, str]] = None) -> Optional["ProviderResultCache"]:
+        """Build a cache from BRAIN_PROVIDER_CACHE_TTL_MS (None when unset or <= 0)."""
+        env = os.environ if env is None else env
+        raw = (env.get("BRAIN_PROVIDER_CACHE_TTL_MS") or "").strip()
+        try:
+            default_ttl = float(raw) / 1000 if raw else 0.0
+        except ValueError:
+            default_ttl = 0.0
+        if default_ttl <= 0:
+            return None
+        max_raw = (env.get("BRAIN_PROVIDER_CACHE_MAX_ENTRIES") or "").strip()
+        max_entries = int(max_raw) if max_raw.isdigit() and int(max_raw) > 0 else DEFAULT_MAX_ENTRIES
+        return cls(default_ttl=default_ttl, ttls=_env_ttls(env), max_entries=max_entries)
+
+    def ttl_for(self, provider_id: str) -> float:
+        return self.ttls.get(provider_id, self.default_ttl)
+
+    def get(self, provider_id: str, digest: str) -> Optional[ProviderSignal]:
+        key = (provider_id, digest)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            signal = entry[1]
+        return dataclasses.replace(signal, rationale=list(signal.rationale))
+
+    def put(self, provider_id: str, digest: str, signal: ProviderSignal) -> None:
+        ttl = self.ttl_for(provider_id)
+        if ttl <= 0:
+            return
+        key = (provider_id, digest)
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, signal)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            size = len(self._entries)
+        return {
+            "size": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hit_ratio(), 4),
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_default_cache: Optional[ProviderResultCache] = None
+_default_loaded = False
+_default_lock = threading.Lock()
+
+
+def default_provider_cache() -> Optional[ProviderResultCache]:
+    """Process-wide cache configured from env on first use (None when disabled)."""
+    global _default_cache, _default_loaded
+    if not _default_loaded:
+        with _default_lock:
+            if not _default_loaded:
+                _default_cache = ProviderResultCache.from_env()
+                _default_loaded = True
+    return _default_cache
+
+
+def reset_default_provider_cache() -> None:
+    """Forget the default cache so the next call re-reads env (tests, config reload)."""
+    global _default_cache, _default_loaded
+    with _default_lock:
+        _default_cache = None
+        _default_loaded = False
+
+
+__all__ = [
+    "ProviderResultCache",
+    "default_provider_cache",
+    "payload_digest",
+    "reset_default_provider_cache",
+]
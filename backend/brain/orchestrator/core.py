@@ -1,11 +1,41 @@
 from __future__ import annotations
 
+import asyncio
+import functools
+import inspect
 import os
-from typing import Any, Dict, List, Tuple
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Collection, Dict, List, Optional, Tuple, Union
 
+from .cache import ProviderResultCache, default_provider_cache, payload_digest
 from .providers import PROVIDER_FUNCS, _fake_mode_enabled
 from .schema import OrchestratorResult, ProviderSignal, clamp_confidence
 
+# Upper bounds (seconds) for the latency_le label on provider metrics.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+_FLAG_TRUE = {"1", "true", "yes", "on"}
+
+# (signal or None, failure reason or None, latency in seconds)
+_Outcome = Tuple[Optional[ProviderSignal], Optional[str], float]
+
+# Sync providers run here rather than in the loop's default executor:
+# asyncio.run() joins the default executor on exit, which would make the sync
+# entrypoint wait for providers that already missed their deadline.
+_provider_executor: Optional[ThreadPoolExecutor] = None
+_provider_executor_lock = threading.Lock()
+
+
+def _get_provider_executor() -> ThreadPoolExecutor:
+    global _provider_executor
+    with _provider_executor_lock:
+        if _provider_executor is None:
+            workers = int(os.environ.get("BRAIN_PROVIDER_THREADS", "32"))
+            _provider_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="brain-provider")
+        return _provider_executor
+
 
 def _inc(metrics_client: Any, name: str, labels: Dict[str, Any]) -> None:
     if not metrics_client:
@@ -19,33 +49,94 @@ def _inc(metrics_client: Any, name: str, labels: Dict[str, Any]) -> None:
         return
 
 
+def _observe(metrics_client: Any, name: str, value: float, labels: Dict[str, Any]) -> None:
+    observe = getattr(metrics_client, "observe", None) if metrics_client else None
+    if not callable(observe):
+        return
+    try:
+        observe(name, value, labels=labels)
+    except Exception:
+        return
+
+
+def _latency_le(seconds: float) -> str:
+    for bound in LATENCY_BUCKETS:
+        if seconds <= bound:
+            return str(bound)
+    return "+Inf"
+
+
+def _env_seconds(env: Dict[str, str], name: str) -> Optional[float]:
+    raw = (env.get(name) or "").strip()
+    if not raw:
+        return None
+    value = float(raw) / 1000
+    return value if value > 0 else None
+
+
+def _env_list(env: Dict[str, str], name: str) -> List[str]:
+    return [item.strip() for item in (env.get(name) or "").split(",") if item.strip()]
+
+
 def _select_best(signals: List[ProviderSignal]) -> ProviderSignal:
     # Deterministic: sort by confidence desc, then provider_id asc.
     return sorted(signals, key=lambda s: (-s.confidence, s.provider_id))[0]
 
 
-def orchestrate_providers(
-    payload: Dict[str, Any],
-    *,
-    metrics_client: Any = None,
-    fake_mode: bool | None = None,
-) -> Dict[str, Any]:
-    env = os.environ
-    use_fake = _fake_mode_enabled(env) if fake_mode is None else bool(fake_mode)
+def _record_outcome(metrics_client: Any, provider_id: str, outcome: _Outcome) -> None:
+    signal, reason, latency = outcome
+    labels = {"provider": provider_id, "latency_le": _latency_le(latency)}
+    if signal is not None:
+        _inc(metrics_client, "brain_orchestrator_provider_success_total", labels)
+    else:
+        _inc(metrics_client, "brain_orchestrator_provider_failure_total", {**labels, "reason": reason})
+    _observe(metrics_client, "brain_orchestrator_provider_latency_seconds", latency, {"provider": provider_id})
 
-    _inc(metrics_client, "brain_orchestrator_requests_total", {})
 
+def _resolve_cache(
+    cache: Union[ProviderResultCache, bool, None], use_fake: bool, metrics_client: Any
+) -> Optional[ProviderResultCache]:
+    """None/True -> env-configured default, False -> off; fake mode always bypasses."""
+    if cache is False:
+        return None
+    resolved = default_provider_cache() if cache is None or cache is True else cache
+    if resolved is not None and use_fake:
+        _inc(metrics_client, "brain_orchestrator_provider_cache_total", {"provider": "all", "result": "bypass"})
+        return None
+    return resolved
+
+
+def _cache_get(
+    cache: Optional[ProviderResultCache], digest: str, provider_id: str, metrics_client: Any
+) -> Optional[ProviderSignal]:
+    if cache is None:
+        return None
+    signal = cache.get(provider_id, digest)
+    result = "hit" if signal is not None else "miss"
+    _inc(metrics_client, "brain_orchestrator_provider_cache_total", {"provider": provider_id, "result": result})
+    return signal
+
+
+def _cache_put(cache: Optional[ProviderResultCache], digest: str, provider_id: str, outcome: _Outcome) -> None:
+    if cache is not None and outcome[0] is not None:
+        cache.put(provider_id, digest, outcome[0])
+
+
+def _build_result(
+    outcomes: Dict[str, _Outcome],
+    *,
+    metrics_client: Any,
+    use_fake: bool,
+) -> Dict[str, Any]:
+    """Assemble the decision from per-provider outcomes, in PROVIDER_FUNCS order."""
     signals: List[ProviderSignal] = []
     failures: List[str] = []
-
-    for provider_id, func in PROVIDER_FUNCS.items():
-        try:
-            sig = func(payload, env=env)
-            signals.append(sig)
-            _inc(metrics_client, "brain_orchestrator_provider_success_total", {"provider": provider_id})
-        except Exception:
+    for provider_id, (signal, _reason, _latency) in outcomes.items():
+        if signal is not None:
+            signals.append(signal)
+        else:
             failures.append(provider_id)
-            _inc(metrics_client, "brain_orchestrator_provider_failure_total", {"provider": provider_id})
+    latency_ms = {provider_id: round(latency * 1000, 3) for provider_id, (_s, _r, latency) in outcomes.items()}
 
     if not signals:
         result = OrchestratorResult(
@@ -53,34 +144,29 @@ def orchestrate_providers(
             confidence=0.3,
             provider="none",
             rationale=["no_providers_available"],
-            meta={"signals_used": [], "failed_providers": failures, "fake_mode": use_fake},
+            meta={
+                "signals_used": [],
+                "failed_providers": failures,
+                "fake_mode": use_fake,
+                "provider_latency_ms": latency_ms,
+            },
+        )
+    else:
+        best = _select_best(signals)
+        result = OrchestratorResult(
+            action=best.action or "hold",
+            confidence=clamp_confidence(best.confidence),
+            provider=best.provider_id,
+            rationale=best.rationale or [f"selected:{best.provider_id}"],
+            meta={
+                "signals_used": [s.provider_id for s in signals],
+                "failed_providers": failures,
+                "fake_mode": use_fake,
+                "provider_latency_ms": latency_ms,
+            },
         )
-        _inc(metrics_client, "brain_orchestrator_decisions_total", {"action": result.action})
-        return {
-            "action": result.action,
-            "confidence": result.confidence,
-            "rationale": result.rationale,
-            "meta": result.meta,
-        }
-
-    best = _select_best(signals)
-    confidence = clamp_confidence(best.confidence)
-    rationale = best.rationale or [f"selected:{best.provider_id}"]
-
-    result = OrchestratorResult(
-        action=best.action or "hold",
-        confidence=confidence,
-        provider=best.provider_id,
-        rationale=rationale,
-        meta={
-            "signals_used": [s.provider_id for s in signals],
-            "failed_providers": failures,
-            "fake_mode": use_fake,
-        },
-    )
 
     _inc(metrics_client, "brain_orchestrator_decisions_total", {"action": result.action})
-
     return {
         "action": result.action,
         "confidence": result.confidence,
@@ -89,4 +175,204 @@ def orchestrate_providers(
     }
 
 
-__all__ = ["orchestrate_providers"]
+def _call_sync(func: Callable[..., Any], payload: Dict[str, Any], env: Dict[str, str]) -> _Outcome:
+    started = time.perf_counter()
+    try:
+        signal = func(payload, env=env)
+        return signal, None, time.perf_counter() - started
+    except Exception:
+        return None, "error", time.perf_counter() - started
+
+
+def orchestrate_providers(
+    payload: Dict[str, Any],
+    *,
+    metrics_client: Any = None,
+    fake_mode: bool | None = None,
+    cache: Union[ProviderResultCache, bool, None] = None,
+) -> Dict[str, Any]:
+    """Call each provider in turn and pick the best signal.
+
+    cache=None uses the env-configured default_provider_cache() (off unless
+    BRAIN_PROVIDER_CACHE_TTL_MS is set), False disables caching, or pass a
+    ProviderResultCache. Fake mode never reads or writes the cache.
+    """
+    env = os.environ
+    use_fake = _fake_mode_enabled(env) if fake_mode is None else bool(fake_mode)
+
+    if env.get("BRAIN_ORCHESTRATOR_CONCURRENT", "").strip().lower() in _FLAG_TRUE:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(
+                orchestrate_providers_async(payload, metrics_client=metrics_client, fake_mode=fake_mode, cache=cache)
+            )
+        # Called from inside an event loop: use the sequential path below.
+
+    _inc(metrics_client, "brain_orchestrator_requests_total", {})
+    result_cache = _resolve_cache(cache, use_fake, metrics_client)
+    digest = payload_digest(payload) if result_cache is not None else ""
+
+    outcomes: Dict[str, _Outcome] = {}
+    for provider_id, func in PROVIDER_FUNCS.items():
+        cached = _cache_get(result_cache, digest, provider_id, metrics_client)
+        if cached is not None:
+            outcomes[provider_id] = (cached, None, 0.0)
+            continue
+        outcomes[provider_id] = _call_sync(func, payload, env)
+        _record_outcome(metrics_client, provider_id, outcomes[provider_id])
+        _cache_put(result_cache, digest, provider_id, outcomes[provider_id])
+
+    return _build_result(outcomes, metrics_client=metrics_client, use_fake=use_fake)
+
+
+async def _invoke(func: Callable[..., Any], payload: Dict[str, Any], env: Dict[str, str]) -> ProviderSignal:
+    if inspect.iscoroutinefunction(func):
+        return await func(payload, env=env)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_provider_executor(), functools.partial(func, payload, env=env))
+
+
+async def _hedged(
+    provider_id: str,
+    func: Callable[..., Any],
+    payload: Dict[str, Any],
+    env: Dict[str, str],
+    delay: float,
+    metrics_client: Any,
+) -> ProviderSignal:
+    """Start a second call if the first has not answered after `delay`; first success wins."""
+    calls = {asyncio.ensure_future(_invoke(func, payload, env))}
+    try:
+        done, _ = await asyncio.wait(calls, timeout=delay)
+        if not done:
+            _inc(metrics_client, "brain_orchestrator_provider_hedged_total", {"provider": provider_id})
+            calls.add(asyncio.ensure_future(_invoke(func, payload, env)))
+        while True:
+            done, calls = await asyncio.wait(calls, return_when=asyncio.FIRST_COMPLETED)
+            for call in done:
+                if call.exception() is None:
+                    return call.result()
+            if not calls:
+                raise next(iter(done)).exception()
+    finally:
+        for call in calls:
+            call.cancel()
+
+
+async def _run_provider(
+    provider_id: str,
+    func: Callable[..., Any],
+    payload: Dict[str, Any],
+    env: Dict[str, str],
+    *,
+    timeout: Optional[float],
+    hedge_delay: Optional[float],
+    metrics_client: Any,
+) -> _Outcome:
+    started = time.perf_counter()
+    if hedge_delay is not None:
+        call = _hedged(provider_id, func, payload, env, hedge_delay, metrics_client)
+    else:
+        call = _invoke(func, payload, env)
+    try:
+        signal = await asyncio.wait_for(call, timeout) if timeout else await call
+        return signal, None, time.perf_counter() - started
+    except asyncio.TimeoutError:
+        return None, "timeout", time.perf_counter() - started
+    except Exception:
+        return None, "error", time.perf_counter() - started
+
+
+async def orchestrate_providers_async(
+    payload: Dict[str, Any],
+    *,
+    metrics_client: Any = None,
+    fake_mode: bool | None = None,
+    provider_timeout: Optional[float] = None,
+    deadline: Optional[float] = None,
+    hedge: Optional[Collection[str]] = None,
+    hedge_delay: Optional[float] = None,
+    cache: Union[ProviderResultCache, bool, None] = None,
+) -> Dict[str, Any]:
+    """Run every provider concurrently and decide from those that answer in time.
+
+    provider_timeout caps each provider call and deadline caps the whole
+    fan-out (seconds; env defaults BRAIN_PROVIDER_TIMEOUT_MS and
+    BRAIN_DECISION_DEADLINE_MS). Providers that time out, miss the deadline
+    or raise are listed in meta["failed_providers"]. Providers named in
+    hedge (env BRAIN_HEDGED_PROVIDERS) get a second call after hedge_delay
+    (BRAIN_HEDGE_DELAY_MS, default half the provider timeout) and the first
+    successful answer is used. Sync providers run in a shared, long-lived
+    thread pool (BRAIN_PROVIDER_THREADS, default 32); a call that overruns
+    keeps running in its thread, its result unused, and neither this
+    coroutine nor the sync entrypoint waits for it.
+
+    The result is built exactly like orchestrate_providers: signals are taken
+    in PROVIDER_FUNCS order and _select_best picks the winner, so completion
+    order never changes the decision. Providers with a live entry in the
+    result cache (see orchestrate_providers) are not called at all.
+    """
+    env = os.environ
+    use_fake = _fake_mode_enabled(env) if fake_mode is None else bool(fake_mode)
+    if provider_timeout is None:
+        provider_timeout = _env_seconds(env, "BRAIN_PROVIDER_TIMEOUT_MS")
+    if deadline is None:
+        deadline = _env_seconds(env, "BRAIN_DECISION_DEADLINE_MS")
+    hedged = set(_env_list(env, "BRAIN_HEDGED_PROVIDERS") if hedge is None else hedge)
+    if hedge_delay is None:
+        hedge_delay = _env_seconds(env, "BRAIN_HEDGE_DELAY_MS")
+        if hedge_delay is None:
+            hedge_delay = provider_timeout / 2 if provider_timeout else 0.05
+
+    _inc(metrics_client, "brain_orchestrator_requests_total", {})
+    result_cache = _resolve_cache(cache, use_fake, metrics_client)
+    digest = payload_digest(payload) if result_cache is not None else ""
+
+    cached: Dict[str, ProviderSignal] = {}
+    for provider_id in PROVIDER_FUNCS:
+        signal = _cache_get(result_cache, digest, provider_id, metrics_client)
+        if signal is not None:
+            cached[provider_id] = signal
+
+    started = time.perf_counter()
+    tasks = {
+        provider_id: asyncio.ensure_future(
+            _run_provider(
+                provider_id,
+                func,
+                payload,
+                env,
+                timeout=provider_timeout,
+                hedge_delay=hedge_delay if provider_id in hedged else None,
+                metrics_client=metrics_client,
+            )
+        )
+        for provider_id, func in PROVIDER_FUNCS.items()
+        if provider_id not in cached
+    }
+    pending = set()
+    if tasks:
+        _, pending = await asyncio.wait(tasks.values(), timeout=deadline)
+    for task in pending:
+        task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+    outcomes: Dict[str, _Outcome] = {}
+    for provider_id in PROVIDER_FUNCS:
+        if provider_id in cached:
+            outcomes[provider_id] = (cached[provider_id], None, 0.0)
+            continue
+        task = tasks[provider_id]
+        if task.cancelled():
+            outcomes[provider_id] = (None, "deadline", time.perf_counter() - started)
+        else:
+            outcomes[provider_id] = task.result()
+        _record_outcome(metrics_client, provider_id, outcomes[provider_id])
+        _cache_put(result_cache, digest, provider_id, outcomes[provider_id])
+
+    return _build_result(outcomes, metrics_client=metrics_client, use_fake=use_fake)
+
+
+__all__ = ["orchestrate_providers", "orchestrate_providers_async"]
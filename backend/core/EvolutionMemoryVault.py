@@ -13,6 +13,7 @@ import logging
 import os
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
@@ -20,7 +21,8 @@ from pathlib import Path
 import pickle
 import hashlib
 from enum import Enum
-from collections import defaultdict, deque
+from collections import Counter, defaultdict, deque
+from itertools import islice
 import sqlite3
 import aiofiles
 import aiofiles.os
@@ -82,6 +84,292 @@ class VaultSnapshot:
     summary_stats: Dict[str, Any]
 
 
+_INSERT_SQL = '''
+    INSERT INTO evolution_records 
+    (vault_id, timestamp, module, event_type, previous_state, new_state, 
+     reason, metrics, success, error_message, correlation_id)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+
+def _record_row(record: EvolutionRecord) -> tuple:
+    """Serialize a record into an evolution_records row"""
+    return (
+        record.vault_id,
+        record.timestamp,
+        record.module,
+        record.event_type.value,
+        json.dumps(record.previous_state),
+        json.dumps(record.new_state),
+        record.reason,
+        json.dumps(record.metrics),
+        1 if record.success else 0,
+        record.error_message,
+        record.correlation_id
+    )
+
+
+_FLUSH = object()  # queue marker: commit the current batch now
+
+
+def _env_flag(name: str, default: bool = False) -> bool:
+    value = os.getenv(name)
+    if value is None or value == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+class _VaultWriter:
+    """
+    Single-threaded SQLite writer for the vault
+    
+    Owns one persistent WAL-mode connection on a dedicated thread. In
+    write-behind mode rows go through a bounded queue and a background task
+    group-commits them with executemany once `batch_size` rows are waiting
+    or `flush_interval` seconds have passed since the first one. A full
+    queue makes submit() wait (backpressure).
+    """
+    
+    def __init__(self, db_path: str, batch_size: int = 100, flush_interval: float = 0.05,
+                 max_pending: int = 10000):
+        self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.max_pending = max(1, max_pending)
+        self.batches_committed = 0
+        self.rows_committed = 0
+        self.rows_failed = 0
+        self._conn: Optional[sqlite3.Connection] = None
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="evolution-vault")
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+    
+    async def _run(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, fn, *args)
+    
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        return self._conn
+    
+    def _insert(self, rows: List[tuple]) -> None:
+        conn = self._connect()
+        with conn:
+            conn.executemany(_INSERT_SQL, rows)
+    
+    def _write_rows(self, rows: List[tuple]) -> int:
+        """Insert rows in one transaction; returns the number written"""
+        try:
+            self._insert(rows)
+            written = len(rows)
+        except sqlite3.Error as e:
+            if len(rows) == 1:
+                logger.error(f"Database save error: {e}")
+                written = 0
+            else:
+                # One bad row (e.g. a duplicate vault_id) fails the batch; retry row by row
+                logger.warning(f"Batch insert failed ({e}), retrying {len(rows)} rows individually")
+                written = 0
+                for row in rows:
+                    try:
+                        self._insert([row])
+                        written += 1
+                    except sqlite3.Error as row_error:
+                        logger.error(f"Database save error: {row_error}")
+        if written:
+            self.batches_committed += 1
+        self.rows_committed += written
+        self.rows_failed += len(rows) - written
+        return written
+    
+    def _close_connection(self) -> None:
+        if self._conn is not None:
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            self._conn.close()
+            self._conn = None
+    
+    async def open(self) -> None:
+        await self._run(self._connect)
+    
+    async def write(self, record: EvolutionRecord) -> bool:
+        """Write one record now, on the persistent connection"""
+        return await self._run(self._write_rows, [_record_row(record)]) == 1
+    
+    async def submit(self, record: EvolutionRecord) -> None:
+        """Queue a record for the next group commit; waits while the queue is full"""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_pending)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush_loop())
+        await self._queue.put(_record_row(record))
+    
+    async def _flush_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        batch: List[tuple] = []
+        taken = 0  # queue items in this batch, including flush markers
+        try:
+            while True:
+                item = await self._queue.get()
+                taken += 1
+                if item is not _FLUSH:
+                    batch.append(item)
+                    deadline = loop.time() + self.flush_interval
+                    while len(batch) < self.batch_size:
+                        remaining = deadline - loop.time()
+                        try:
+                            if self._queue.qsize():
+                                item = self._queue.get_nowait()
+                            elif remaining > 0:
+                                item = await asyncio.wait_for(self._queue.get(), remaining)
+                            else:
+                                break
+                        except asyncio.TimeoutError:
+                            break
+                        taken += 1
+                        if item is _FLUSH:
+                            break
+                        batch.append(item)
+                if batch:
+                    try:
+                        await self._run(self._write_rows, batch)
+                    except Exception as e:
+                        logger.error(f"Evolution vault group commit failed: {e}")
+                        self.rows_failed += len(batch)
+                for _ in range(taken):
+                    self._queue.task_done()
+                batch, taken = [], 0
+        except asyncio.CancelledError:
+            # Never drop accepted records: write whatever is still queued
+            while self._queue.qsize():
+                item = self._queue.get_nowait()
+                taken += 1
+                if item is not _FLUSH:
+                    batch.append(item)
+            if batch:
+                self._executor.submit(self._write_rows, batch).result()
+            for _ in range(taken):
+                self._queue.task_done()
+            raise
+    
+    async def flush(self) -> None:
+        """Commit queued records now and wait until every submitted one is written"""
+        if self._queue is None:
+            return
+        if self._task is not None and not self._task.done():
+            await self._queue.put(_FLUSH)
+        await self._queue.join()
+    
+    async def checkpoint(self) -> None:
+        """Fold the WAL into the main database file (used before file backups)"""
+        def checkpoint():
+            self._connect().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        await self._run(checkpoint)
+    
+    async def close(self) -> None:
+        """Flush, stop the background task and close the connection"""
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self._run(self._close_connection)
+        self._executor.shutdown(wait=True)
+
+
+class _RecordCacheIndex:
+    """
+    Per-module and per-pattern views of the vault's record cache
+    
+    The cache is a chronological deque, so an evicted record is always the
+    oldest of its module and of its (event type, module) group. add() and
+    remove() are therefore O(1), and module history or summaries cost
+    O(result) instead of a scan of the whole cache.
+    """
+    
+    RECENT_PER_GROUP = 5  # records kept for the pattern trend
+    
+    def __init__(self):
+        self.by_module: Dict[str, deque] = {}
+        self.module_stats: Dict[str, Dict[str, Any]] = {}
+        self.event_type_counts: Counter = Counter()
+        self.groups: Dict[tuple, Dict[str, Any]] = {}
+    
+    def clear(self) -> None:
+        self.by_module.clear()
+        self.module_stats.clear()
+        self.event_type_counts.clear()
+        self.groups.clear()
+    
+    def add(self, record: EvolutionRecord) -> None:
+        module = record.module
+        records = self.by_module.get(module)
+        if records is None:
+            records = self.by_module[module] = deque()
+            self.module_stats[module] = {"total_events": 0, "success_count": 0, "event_types": Counter()}
+        records.append(record)
+        stats = self.module_stats[module]
+        stats["total_events"] += 1
+        stats["success_count"] += 1 if record.success else 0
+        stats["event_types"][record.event_type.value] += 1
+        self.event_type_counts[record.event_type.value] += 1
+        
+        key = (record.event_type.value, module)
+        group = self.groups.get(key)
+        if group is None:
+            group = self.groups[key] = {
+                "count": 0,
+                "success_count": 0,
+                "last_timestamp": record.timestamp,
+                "recent": deque(maxlen=self.RECENT_PER_GROUP),
+            }
+        group["count"] += 1
+        group["success_count"] += 1 if record.success else 0
+        group["last_timestamp"] = max(group["last_timestamp"], record.timestamp)
+        group["recent"].append(record)
+    
+    def remove(self, record: EvolutionRecord) -> None:
+        """Drop the oldest cached record (called on cache eviction)"""
+        module = record.module
+        records = self.by_module[module]
+        records.popleft()
+        stats = self.module_stats[module]
+        stats["total_events"] -= 1
+        stats["success_count"] -= 1 if record.success else 0
+        stats["event_types"][record.event_type.value] -= 1
+        if not records:
+            del self.by_module[module]
+            del self.module_stats[module]
+        self.event_type_counts[record.event_type.value] -= 1
+        if not self.event_type_counts[record.event_type.value]:
+            del self.event_type_counts[record.event_type.value]
+        
+        key = (record.event_type.value, module)
+        group = self.groups[key]
+        group["count"] -= 1
+        group["success_count"] -= 1 if record.success else 0
+        if group["recent"] and group["recent"][0] is record:
+            group["recent"].popleft()
+        if not group["count"]:
+            del self.groups[key]
+        # last_timestamp is kept: a group's latest insertion is evicted last
+    
+    def module_history(self, module: str, limit: int) -> List[EvolutionRecord]:
+        """Last `limit` cached records of a module, oldest first"""
+        records = self.by_module.get(module)
+        if not records:
+            return []
+        recent = list(islice(reversed(records), limit))
+        recent.reverse()
+        return recent
+
+
 class EvolutionMemoryVault:
     """
     Evolution Memory Vault - Persistent storage for evolution data
@@ -94,21 +382,38 @@ class EvolutionMemoryVault:
     - Read-only access for TradingPipelineCore and Shield Intelligence API
     - Fallback caching for storage overload scenarios
     - Thread-safe operations
+    - Optional write-behind mode: saves return once queued and are
+      group-committed in batches (EVOLUTION_VAULT_WRITE_BEHIND=1)
     """
     
-    def __init__(self, vault_path: Optional[str] = None, max_cache_size: int = 10000):
+    def __init__(self, vault_path: Optional[str] = None, max_cache_size: int = 10000,
+                 write_behind: Optional[bool] = None, batch_size: Optional[int] = None,
+                 flush_interval_ms: Optional[float] = None, max_pending_writes: Optional[int] = None):
         # Configuration
         self.vault_path = vault_path or os.path.join(os.path.dirname(__file__), '../../data/evolution')
         self.max_cache_size = max_cache_size
+        self.write_behind = (
+            _env_flag("EVOLUTION_VAULT_WRITE_BEHIND") if write_behind is None else write_behind
+        )
+        self.batch_size = batch_size or int(os.getenv("EVOLUTION_VAULT_BATCH_SIZE", "100"))
+        self.flush_interval_ms = (
+            float(os.getenv("EVOLUTION_VAULT_FLUSH_MS", "50"))
+            if flush_interval_ms is None else flush_interval_ms
+        )
+        self.max_pending_writes = max_pending_writes or int(
+            os.getenv("EVOLUTION_VAULT_MAX_PENDING", "10000")
+        )
         
         # Database path
         self.db_path = os.path.join(self.vault_path, 'evolution.db')
         self.backup_path = os.path.join(self.vault_path, 'backups')
+        self._writer: Optional[_VaultWriter] = None
         
         # In-memory cache for performance
         self.record_cache: deque = deque(maxlen=max_cache_size)
         self.pattern_cache: Dict[str, EvolutionPattern] = {}
         self.module_stats_cache: Dict[str, Dict[str, Any]] = {}
+        self.cache_index = _RecordCacheIndex()
         
         # Thread safety
         self.write_lock = asyncio.Lock()
@@ -124,6 +429,9 @@ class EvolutionMemoryVault:
         self.failed_writes = 0
         self.cache_hits = 0
         self.cache_misses = 0
+        # Per index that answered: "recent" (record cache) or "module" (module index)
+        self.cache_hits_by_index: Dict[str, int] = defaultdict(int)
+        self.cache_misses_by_index: Dict[str, int] = defaultdict(int)
     
     async def initialize(self) -> None:
         """Initialize the Evolution Memory Vault"""
@@ -169,13 +477,13 @@ class EvolutionMemoryVault:
                     logger.warning("Storage overload detected, using fallback cache")
                     return await self._fallback_cache_save(record)
                 
-                # Save to database
+                # Save to database (queued for the next group commit in write-behind mode)
                 success = await self._save_to_database(record)
                 
                 if success:
                     # Update cache
                     with self.cache_lock:
-                        self.record_cache.append(record)
+                        self._cache_append(record)
                         self._update_module_stats_cache(record)
                     
                     self.total_writes += 1
@@ -204,10 +512,15 @@ class EvolutionMemoryVault:
             with self.cache_lock:
                 if len(self.record_cache) >= count:
                     self.cache_hits += 1
-                    return list(self.record_cache)[-count:]
+                    self.cache_hits_by_index["recent"] += 1
+                    recent = list(islice(reversed(self.record_cache), count))
+                    recent.reverse()
+                    return recent
             
             # Load from database
             self.cache_misses += 1
+            self.cache_misses_by_index["recent"] += 1
+            await self.flush()
             return await self._load_from_database(limit=count)
             
         except Exception as error:
@@ -219,17 +532,19 @@ class EvolutionMemoryVault:
         Get evolution history for a specific module
         """
         try:
-            # Check cache first
-            cached_records = []
+            # Check the per-module index first
             with self.cache_lock:
-                cached_records = [r for r in self.record_cache if r.module == module]
+                cached_records = self.cache_index.module_history(module, limit)
             
             if len(cached_records) >= limit:
                 self.cache_hits += 1
-                return cached_records[-limit:]
+                self.cache_hits_by_index["module"] += 1
+                return cached_records
             
             # Load from database
             self.cache_misses += 1
+            self.cache_misses_by_index["module"] += 1
+            await self.flush()
             return await self._load_module_history_from_database(module, limit)
             
         except Exception as error:
@@ -263,28 +578,15 @@ class EvolutionMemoryVault:
                     "trend": pattern.trend
                 }
             
-            # Module trends
+            # Module trends, from the running per-module counters
             with self.cache_lock:
-                for record in self.record_cache:
-                    summary["event_frequencies"][record.event_type.value] += 1
-                    
-                    if record.module not in summary["module_trends"]:
-                        summary["module_trends"][record.module] = {
-                            "total_events": 0,
-                            "success_rate": 0.0,
-                            "last_activity": None
-                        }
-                    
-                    module_trends = summary["module_trends"][record.module]
-                    module_trends["total_events"] += 1
-                    module_trends["last_activity"] = record.timestamp
-            
-            # Calculate success rates
-            for module, trends in summary["module_trends"].items():
-                module_records = [r for r in self.record_cache if r.module == module]
-                if module_records:
-                    successes = sum(1 for r in module_records if r.success)
-                    trends["success_rate"] = successes / len(module_records)
+                summary["event_frequencies"].update(self.cache_index.event_type_counts)
+                for module, stats in self.cache_index.module_stats.items():
+                    summary["module_trends"][module] = {
+                        "total_events": stats["total_events"],
+                        "success_rate": stats["success_count"] / stats["total_events"],
+                        "last_activity": self.cache_index.by_module[module][-1].timestamp
+                    }
             
             return summary
             
@@ -313,7 +615,7 @@ class EvolutionMemoryVault:
             vault_size = await self._calculate_vault_size()
             
             # Get module count
-            modules_tracked = len(set(r.module for r in self.record_cache))
+            modules_tracked = len(self.cache_index.by_module)
             
             # Summary statistics
             summary_stats = {
@@ -360,16 +662,32 @@ class EvolutionMemoryVault:
             "cache_hits": self.cache_hits,
             "cache_misses": self.cache_misses,
             "cache_hit_rate": self.cache_hits / max(1, self.cache_hits + self.cache_misses),
+            "cache_hits_by_index": dict(self.cache_hits_by_index),
+            "cache_misses_by_index": dict(self.cache_misses_by_index),
             "cache_size": len(self.record_cache),
             "max_cache_size": self.max_cache_size,
             "storage_overload": self.storage_overload,
             "patterns_identified": len(self.pattern_cache),
-            "last_backup": self.last_backup_time.isoformat()
+            "last_backup": self.last_backup_time.isoformat(),
+            "write_behind": self.write_behind,
+            "pending_writes": self._writer.pending if self._writer else 0,
+            "batches_committed": self._writer.batches_committed if self._writer else 0,
+            "failed_rows": self._writer.rows_failed if self._writer else 0
         }
     
+    async def flush(self) -> None:
+        """Wait until every queued write-behind record is committed"""
+        if self._writer is not None:
+            await self._writer.flush()
+    
     async def create_backup(self) -> bool:
         """Create a backup of the vault"""
         try:
+            # The database file alone must hold every accepted record
+            if self._writer is not None:
+                await self._writer.flush()
+                await self._writer.checkpoint()
+            
             backup_dir = os.path.join(self.backup_path, datetime.now().strftime("%Y%m%d_%H%M%S"))
             await aiofiles.os.makedirs(backup_dir, exist_ok=True)
             
@@ -446,6 +764,16 @@ class EvolutionMemoryVault:
         # Run database initialization in thread pool
         loop = asyncio.get_event_loop()
         await loop.run_in_executor(None, init_db)
+        
+        # Persistent writer connection (WAL) for all saves
+        if self._writer is None:
+            self._writer = _VaultWriter(
+                self.db_path,
+                batch_size=self.batch_size,
+                flush_interval=self.flush_interval_ms / 1000,
+                max_pending=self.max_pending_writes
+            )
+            await self._writer.open()
     
     async def _load_cache(self) -> None:
         """Load recent records into cache"""
@@ -453,7 +781,10 @@ class EvolutionMemoryVault:
             recent_records = await self._load_from_database(limit=self.max_cache_size)
             with self.cache_lock:
                 self.record_cache.clear()
-                self.record_cache.extend(recent_records)
+                self.cache_index.clear()
+                # The query is newest first; the cache is kept oldest first
+                for record in reversed(recent_records):
+                    self._cache_append(record)
             
             logger.info(f"Loaded {len(recent_records)} records into cache")
             
@@ -461,42 +792,11 @@ class EvolutionMemoryVault:
             logger.warning(f"Error loading cache: {error}")
     
     async def _save_to_database(self, record: EvolutionRecord) -> bool:
-        """Save record to SQLite database"""
-        def save_record():
-            try:
-                conn = sqlite3.connect(self.db_path, timeout=10)
-                cursor = conn.cursor()
-                
-                cursor.execute('''
-                    INSERT INTO evolution_records 
-                    (vault_id, timestamp, module, event_type, previous_state, new_state, 
-                     reason, metrics, success, error_message, correlation_id)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    record.vault_id,
-                    record.timestamp,
-                    record.module,
-                    record.event_type.value,
-                    json.dumps(record.previous_state),
-                    json.dumps(record.new_state),
-                    record.reason,
-                    json.dumps(record.metrics),
-                    1 if record.success else 0,
-                    record.error_message,
-                    record.correlation_id
-                ))
-                
-                conn.commit()
-                conn.close()
-                return True
-                
-            except Exception as e:
-                logger.error(f"Database save error: {e}")
-                return False
-        
-        # Run in thread pool to avoid blocking
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, save_record)
+        """Save record to SQLite database, or queue it in write-behind mode"""
+        if self.write_behind:
+            await self._writer.submit(record)
+            return True
+        return await self._writer.write(record)
     
     async def _load_from_database(self, limit: int = 100) -> List[EvolutionRecord]:
         """Load records from SQLite database"""
@@ -593,7 +893,7 @@ class EvolutionMemoryVault:
         """Fallback save to cache when database is unavailable"""
         try:
             with self.cache_lock:
-                self.record_cache.append(record)
+                self._cache_append(record)
                 self._update_module_stats_cache(record)
             
             logger.debug(f"Saved record to fallback cache: {record.module}")
@@ -616,6 +916,13 @@ class EvolutionMemoryVault:
         
         return True
     
+    def _cache_append(self, record: EvolutionRecord) -> None:
+        """Append to the record cache and its index (caller holds cache_lock)"""
+        if len(self.record_cache) == self.record_cache.maxlen:
+            self.cache_index.remove(self.record_cache[0])
+        self.record_cache.append(record)
+        self.cache_index.add(record)
+    
     def _update_module_stats_cache(self, record: EvolutionRecord) -> None:
         """Update module statistics cache"""
         if record.module not in self.module_stats_cache:
@@ -634,25 +941,20 @@ class EvolutionMemoryVault:
     async def _analyze_patterns(self) -> None:
         """Analyze evolution patterns from historical data"""
         try:
-            # Simple pattern analysis - would be more sophisticated in production
+            # Simple pattern analysis over the running (event type, module) counters
             with self.cache_lock:
-                records = list(self.record_cache)
-            
-            # Group by event type and module
-            event_groups = defaultdict(list)
-            for record in records:
-                key = f"{record.event_type.value}_{record.module}"
-                event_groups[key].append(record)
+                groups = [
+                    (key, dict(group, recent=list(group["recent"])))
+                    for key, group in self.cache_index.groups.items()
+                ]
             
             # Analyze patterns
-            for group_key, group_records in event_groups.items():
-                if len(group_records) >= 3:  # Need at least 3 occurrences
-                    event_type, module = group_key.rsplit('_', 1)
-                    
-                    success_rate = sum(1 for r in group_records if r.success) / len(group_records)
+            for (event_type, module), group in groups:
+                if group["count"] >= 3:  # Need at least 3 occurrences
+                    success_rate = group["success_count"] / group["count"]
                     
-                    # Calculate trend (simple)
-                    recent_records = group_records[-5:] if len(group_records) >= 5 else group_records
+                    # Calculate trend (simple): last 5 occurrences against all
+                    recent_records = group["recent"]
                     recent_success_rate = sum(1 for r in recent_records if r.success) / len(recent_records)
                     
                     if recent_success_rate > success_rate + 0.1:
@@ -664,15 +966,15 @@ class EvolutionMemoryVault:
                     
                     pattern = EvolutionPattern(
                         pattern_type=event_type,
-                        frequency=len(group_records),
+                        frequency=group["count"],
                         modules_affected=[module],
                         success_rate=success_rate,
                         average_impact=0.5,  # Would calculate from metrics in production
-                        last_occurrence=datetime.fromtimestamp(max(r.timestamp for r in group_records)),
+                        last_occurrence=datetime.fromtimestamp(group["last_timestamp"]),
                         trend=trend
                     )
                     
-                    self.pattern_cache[group_key] = pattern
+                    self.pattern_cache[f"{event_type}_{module}"] = pattern
             
             logger.debug(f"Analyzed {len(self.pattern_cache)} patterns")
             
@@ -696,12 +998,19 @@ class EvolutionMemoryVault:
         """Shutdown the vault and cleanup resources"""
         logger.info("Shutting down Evolution Memory Vault...")
         
-        # Create final backup
+        # Create final backup (flushes pending write-behind records first)
         await self.create_backup()
         
+        # Commit anything queued since the backup and close the connection
+        if self._writer is not None:
+            await self._writer.close()
+            self._writer = None
+        self.is_initialized = False
+        
         # Clear caches
         with self.cache_lock:
             self.record_cache.clear()
+            self.cache_index.clear()
             self.pattern_cache.clear()
             self.module_stats_cache.clear()
         
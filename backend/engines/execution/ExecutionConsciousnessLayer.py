@@ -25,10 +25,13 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from collections import defaultdict, deque
+from itertools import islice
 import statistics
 import math
 import uuid
 
+from backend.utils.rolling import RollingWindow
+
 # Import execution nervous system
 from .ExecutionNervousSystem import (
     ExecutionNervousSystem,
@@ -40,6 +43,14 @@ from .ExecutionNervousSystem import (
 
 logger = logging.getLogger(__name__)
 
+# Rolling windows kept per UnifiedState field, keyed by window size
+STATE_WINDOW_SIZES: Dict[str, Tuple[int, ...]] = {
+    "stability_score": (5, 10, 20),
+    "aggregated_confidence": (5, 10, 20),
+    "consensus_level": (3, 10, 20),
+    "processing_latency": (10,),
+}
+
 
 class AnomalyType(Enum):
     """Anomaly types detected by consciousness layer"""
@@ -175,6 +186,12 @@ class ExecutionConsciousnessLayer:
         self.anomaly_history: deque = deque(maxlen=200)  # Last 200 anomalies
         self.insight_history: deque = deque(maxlen=100)  # Last 100 insights
         
+        # O(1) statistics over the most recent states, updated on every observation
+        self.state_windows: Dict[str, Dict[int, RollingWindow]] = {
+            name: {size: RollingWindow(size) for size in sizes}
+            for name, sizes in STATE_WINDOW_SIZES.items()
+        }
+        
         # Current state indicators
         self.consciousness_score = 85.0  # Initial consciousness level
         self.system_fatigue_index = 0.2  # Initial fatigue level
@@ -227,6 +244,10 @@ class ExecutionConsciousnessLayer:
             # Store state in memory
             self.ens_state_memory.append(state)
             self.total_states_observed += 1
+            for name, windows in self.state_windows.items():
+                value = getattr(state, name)
+                for window in windows.values():
+                    window.append(value)
             
             # Update system metrics
             self._update_system_metrics(state)
@@ -265,12 +286,12 @@ class ExecutionConsciousnessLayer:
                 return insight
             
             # Analyze patterns in recent states
-            recent_states = list(self.ens_state_memory)[-20:]  # Last 20 states
+            recent_states = self._recent_states(20)  # Last 20 states
             
             # Pattern analysis
-            stability_pattern = self._analyze_stability_pattern(recent_states)
-            confidence_pattern = self._analyze_confidence_pattern(recent_states)
-            consensus_pattern = self._analyze_consensus_pattern(recent_states)
+            stability_pattern = self._analyze_stability_pattern(self.state_windows["stability_score"][20])
+            confidence_pattern = self._analyze_confidence_pattern(self.state_windows["aggregated_confidence"][20])
+            consensus_pattern = self._analyze_consensus_pattern(self.state_windows["consensus_level"][20])
             
             # Generate insight based on strongest pattern
             insight = self._generate_meta_cognitive_insight(
@@ -312,7 +333,7 @@ class ExecutionConsciousnessLayer:
             if len(self.ens_state_memory) < 3:
                 return anomalies
             
-            recent_states = list(self.ens_state_memory)[-10:]  # Last 10 states
+            recent_states = self._recent_states(10)  # Last 10 states
             
             # Check each anomaly type
             for anomaly_type in AnomalyType:
@@ -497,31 +518,19 @@ class ExecutionConsciousnessLayer:
         """Update system performance metrics"""
         try:
             # Calculate stability variance
-            if len(self.ens_state_memory) >= 5:
-                recent_stability = [s.stability_score for s in list(self.ens_state_memory)[-5:]]
-                self.system_metrics.stability_variance = statistics.variance(recent_stability)
+            stability = self.state_windows["stability_score"][5]
+            if len(stability) >= 5:
+                self.system_metrics.stability_variance = stability.variance
             
             # Calculate confidence volatility
-            if len(self.ens_state_memory) >= 5:
-                recent_confidence = [s.aggregated_confidence for s in list(self.ens_state_memory)[-5:]]
-                self.system_metrics.confidence_volatility = statistics.stdev(recent_confidence)
-            
-            # Calculate consensus degradation rate
-            if len(self.ens_state_memory) >= 10:
-                recent_consensus = [s.consensus_level for s in list(self.ens_state_memory)[-10:]]
-                if len(recent_consensus) >= 2:
-                    # Simple slope calculation
-                    x_values = list(range(len(recent_consensus)))
-                    x_mean = statistics.mean(x_values)
-                    y_mean = statistics.mean(recent_consensus)
-                    
-                    numerator = sum((x_values[i] - x_mean) * (recent_consensus[i] - y_mean) 
-                                  for i in range(len(recent_consensus)))
-                    denominator = sum((x_values[i] - x_mean) ** 2 for i in range(len(recent_consensus)))
-                    
-                    if denominator > 0:
-                        slope = numerator / denominator
-                        self.system_metrics.consensus_degradation_rate = max(0, -slope)  # Positive = degrading
+            confidence = self.state_windows["aggregated_confidence"][5]
+            if len(confidence) >= 5:
+                self.system_metrics.confidence_volatility = confidence.stdev
+            
+            # Calculate consensus degradation rate from the least-squares slope
+            consensus = self.state_windows["consensus_level"][10]
+            if len(consensus) >= 10:
+                self.system_metrics.consensus_degradation_rate = max(0, -consensus.slope)  # Positive = degrading
             
             # Update overall health score
             self._calculate_overall_health_score()
@@ -529,6 +538,12 @@ class ExecutionConsciousnessLayer:
         except Exception as e:
             logger.warning(f"Error updating system metrics: {e}")
     
+    def _recent_states(self, count: int) -> List[UnifiedState]:
+        """Last `count` observed states, oldest first, without copying the whole buffer"""
+        recent = list(islice(reversed(self.ens_state_memory), count))
+        recent.reverse()
+        return recent
+    
     def _update_consciousness_score(self, state: UnifiedState) -> None:
         """Update consciousness score based on state quality"""
         try:
@@ -555,7 +570,7 @@ class ExecutionConsciousnessLayer:
             # Factors that contribute to fatigue
             processing_latency_factor = min(1.0, state.processing_latency / 1000)  # Normalize to 0-1
             signal_overload_factor = min(1.0, len(state.active_signals) / 10)      # Max 10 signals
-            conflict_factor = min(1.0, len(state.conflicting_signals) / 5)        # Max 5 conflicts
+            conflict_factor = min(1.0, state.conflict_count / 5)        # Max 5 conflicts
             
             # Calculate fatigue increase
             fatigue_increase = (processing_latency_factor + signal_overload_factor + conflict_factor) / 3
@@ -591,115 +606,43 @@ class ExecutionConsciousnessLayer:
         except Exception as e:
             logger.warning(f"Error updating risk pressure index: {e}")
     
-    def _analyze_stability_pattern(self, states: List[UnifiedState]) -> Dict[str, Any]:
+    def _analyze_stability_pattern(self, window: RollingWindow) -> Dict[str, Any]:
         """Analyze stability pattern in recent states"""
-        try:
-            if len(states) < 3:
-                return {"trend": "unknown", "strength": 0.0, "volatility": 0.0}
-            
-            stability_scores = [state.stability_score for state in states]
-            
-            # Calculate trend
-            if len(stability_scores) >= 2:
-                trend_slope = (stability_scores[-1] - stability_scores[0]) / len(stability_scores)
-                if trend_slope > 1.0:
-                    trend = "improving"
-                elif trend_slope < -1.0:
-                    trend = "degrading"
-                else:
-                    trend = "stable"
-            else:
-                trend = "unknown"
-            
-            # Calculate volatility
-            volatility = statistics.stdev(stability_scores) if len(stability_scores) > 1 else 0.0
-            
-            # Calculate strength
-            strength = abs(trend_slope) / 10 if 'trend_slope' in locals() else 0.0
-            
-            return {
-                "trend": trend,
-                "strength": min(1.0, strength),
-                "volatility": min(1.0, volatility / 20),  # Normalize
-                "current_level": stability_scores[-1]
-            }
-            
-        except Exception as e:
-            logger.warning(f"Error analyzing stability pattern: {e}")
-            return {"trend": "unknown", "strength": 0.0, "volatility": 0.0}
+        return self._analyze_window_pattern(window, "improving", "degrading", "stability")
     
-    def _analyze_confidence_pattern(self, states: List[UnifiedState]) -> Dict[str, Any]:
+    def _analyze_confidence_pattern(self, window: RollingWindow) -> Dict[str, Any]:
         """Analyze confidence pattern in recent states"""
-        try:
-            if len(states) < 3:
-                return {"trend": "unknown", "strength": 0.0, "volatility": 0.0}
-            
-            confidence_scores = [state.aggregated_confidence for state in states]
-            
-            # Calculate trend
-            if len(confidence_scores) >= 2:
-                trend_slope = (confidence_scores[-1] - confidence_scores[0]) / len(confidence_scores)
-                if trend_slope > 1.0:
-                    trend = "increasing"
-                elif trend_slope < -1.0:
-                    trend = "decreasing"
-                else:
-                    trend = "stable"
-            else:
-                trend = "unknown"
-            
-            # Calculate volatility
-            volatility = statistics.stdev(confidence_scores) if len(confidence_scores) > 1 else 0.0
-            
-            # Calculate strength
-            strength = abs(trend_slope) / 10 if 'trend_slope' in locals() else 0.0
-            
-            return {
-                "trend": trend,
-                "strength": min(1.0, strength),
-                "volatility": min(1.0, volatility / 20),  # Normalize
-                "current_level": confidence_scores[-1]
-            }
-            
-        except Exception as e:
-            logger.warning(f"Error analyzing confidence pattern: {e}")
-            return {"trend": "unknown", "strength": 0.0, "volatility": 0.0}
+        return self._analyze_window_pattern(window, "increasing", "decreasing", "confidence")
     
-    def _analyze_consensus_pattern(self, states: List[UnifiedState]) -> Dict[str, Any]:
+    def _analyze_consensus_pattern(self, window: RollingWindow) -> Dict[str, Any]:
         """Analyze consensus pattern in recent states"""
+        return self._analyze_window_pattern(window, "improving", "deteriorating", "consensus")
+    
+    def _analyze_window_pattern(self, window: RollingWindow, rising: str, falling: str,
+                                name: str) -> Dict[str, Any]:
+        """Trend, strength and volatility of a rolling window of state scores"""
         try:
-            if len(states) < 3:
+            if len(window) < 3:
                 return {"trend": "unknown", "strength": 0.0, "volatility": 0.0}
             
-            consensus_scores = [state.consensus_level for state in states]
-            
             # Calculate trend
-            if len(consensus_scores) >= 2:
-                trend_slope = (consensus_scores[-1] - consensus_scores[0]) / len(consensus_scores)
-                if trend_slope > 1.0:
-                    trend = "improving"
-                elif trend_slope < -1.0:
-                    trend = "deteriorating"
-                else:
-                    trend = "stable"
+            trend_slope = (window.last - window.first) / len(window)
+            if trend_slope > 1.0:
+                trend = rising
+            elif trend_slope < -1.0:
+                trend = falling
             else:
-                trend = "unknown"
-            
-            # Calculate volatility
-            volatility = statistics.stdev(consensus_scores) if len(consensus_scores) > 1 else 0.0
-            
-            # Calculate strength
-            strength = abs(trend_slope) / 10 if 'trend_slope' in locals() else 0.0
+                trend = "stable"
             
             return {
                 "trend": trend,
-                "strength": min(1.0, strength),
-                "volatility": min(1.0, volatility / 20),  # Normalize
-                "current_level": consensus_scores[-1]
+                "strength": min(1.0, abs(trend_slope) / 10),
+                "volatility": min(1.0, window.stdev / 20),  # Normalize
+                "current_level": window.last
             }
             
         except Exception as e:
-            logger.warning(f"Error analyzing consensus pattern: {e}")
+            logger.warning(f"Error analyzing {name} pattern: {e}")
             return {"trend": "unknown", "strength": 0.0, "volatility": 0.0}
     
     def _generate_meta_cognitive_insight(self, stability_pattern: Dict[str, Any], 
@@ -822,11 +765,11 @@ class ExecutionConsciousnessLayer:
         """Detect high volatility risk anomaly"""
         try:
             # Check stability score variance
-            stability_scores = [state.stability_score for state in states]
+            stability_scores = self.state_windows["stability_score"][10]
             if len(stability_scores) < 3:
                 return None
             
-            volatility = statistics.stdev(stability_scores)
+            volatility = stability_scores.stdev
             severity = min(1.0, volatility / 30)  # Normalize to 0-1
             
             if severity > 0.6:
@@ -925,7 +868,7 @@ class ExecutionConsciousnessLayer:
     def _detect_contradictory_signals(self, states: List[UnifiedState]) -> Optional[AnomalyDetection]:
         """Detect contradictory signals anomaly"""
         try:
-            total_conflicts = sum(len(state.conflicting_signals) for state in states)
+            total_conflicts = sum(state.conflict_count for state in states)
             total_states = len(states)
             
             conflict_rate = total_conflicts / total_states if total_states > 0 else 0
@@ -994,19 +937,10 @@ class ExecutionConsciousnessLayer:
             if len(states) < 5:
                 return None
             
-            latencies = [state.processing_latency for state in states]
-            
-            # Calculate trend
-            n = len(latencies)
-            x_values = list(range(n))
-            x_mean = statistics.mean(x_values)
-            y_mean = statistics.mean(latencies)
-            
-            numerator = sum((x_values[i] - x_mean) * (latencies[i] - y_mean) for i in range(n))
-            denominator = sum((x_values[i] - x_mean) ** 2 for i in range(n))
+            # Least-squares trend of the recent latencies
+            slope = self.state_windows["processing_latency"][10].slope
             
-            if denominator > 0:
-                slope = numerator / denominator
+            if slope is not None:
                 # Positive slope indicates rising latency
                 severity = min(1.0, max(0, slope / 10))  # Normalize
                 
@@ -1033,11 +967,13 @@ class ExecutionConsciousnessLayer:
             if len(states) < 3:
                 return None
             
-            consensus_levels = [state.consensus_level for state in states]
+            recent = self.state_windows["consensus_level"][3]
+            window = self.state_windows["consensus_level"][10]
             
-            # Check for declining consensus
-            recent_avg = statistics.mean(consensus_levels[-3:])  # Last 3
-            earlier_avg = statistics.mean(consensus_levels[:-3]) if len(consensus_levels) > 3 else recent_avg
+            # Check for declining consensus: last 3 against the rest of the window
+            recent_avg = recent.mean
+            earlier_count = len(window) - len(recent)
+            earlier_avg = (window.sum - recent.sum) / earlier_count if earlier_count > 0 else recent_avg
             
             degradation = earlier_avg - recent_avg
             severity = min(1.0, degradation / 50)  # 50 point drop = max severity
@@ -1065,8 +1001,7 @@ class ExecutionConsciousnessLayer:
             if len(states) < 3:
                 return None
             
-            confidence_scores = [state.aggregated_confidence for state in states]
-            volatility = statistics.stdev(confidence_scores)
+            volatility = self.state_windows["aggregated_confidence"][10].stdev
             
             severity = min(1.0, volatility / 25)  # 25 point std dev = max severity
             
@@ -1100,7 +1035,7 @@ class ExecutionConsciousnessLayer:
                     high_latency_count += 1
                 if len(state.active_signals) > 8:  # 8+ signals
                     high_signal_count += 1
-                if len(state.conflicting_signals) > 3:  # 3+ conflicts
+                if state.conflict_count > 3:  # 3+ conflicts
                     high_conflict_count += 1
             
             # Calculate overload score
@@ -1232,10 +1167,8 @@ class ExecutionConsciousnessLayer:
             health_factors.append(1 - self.risk_pressure_index)
             
             # Stability factor
-            if len(self.ens_state_memory) > 0:
-                recent_stability = statistics.mean(
-                    [state.stability_score for state in list(self.ens_state_memory)[-5:]]
-                )
+            recent_stability = self.state_windows["stability_score"][5].mean
+            if recent_stability is not None:
                 health_factors.append(recent_stability / 100)
             
             # Overall health score
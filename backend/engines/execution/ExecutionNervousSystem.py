@@ -26,9 +26,12 @@ from datetime import datetime, timedelta
 from enum import Enum
 from collections import defaultdict, deque
 import statistics
+import heapq
 import math
 import uuid
 
+from backend.workers.metrics import SlidingWindowHistogram
+
 # Import related execution systems
 from .ExecutionReflexLoopEngine import (
     get_execution_reflex_loop_engine,
@@ -101,8 +104,10 @@ class UnifiedState:
     
     # Signal analysis
     active_signals: List[EngineSignal]
-    conflicting_signals: List[Tuple[EngineSignal, EngineSignal]]
+    conflicting_signals: List[Tuple[EngineSignal, EngineSignal]]  # sample, capped at MAX_CONFLICT_SAMPLES
     dominant_engine: Optional[EngineType] = None
+    conflict_count: int = 0  # all conflicting pairs
+    action_votes: Dict[str, float] = field(default_factory=dict)
     
     # State metadata
     timestamp: float = field(default_factory=time.time)
@@ -156,6 +161,169 @@ class TrendAnalysis:
     confidence_in_prediction: float  # 0-100
 
 
+# Action recommendations that contradict each other
+CONFLICTING_ACTION_PAIRS = (
+    ("BUY", "SELL"),
+    ("CANCEL", "BUY"),
+    ("CANCEL", "SELL"),
+    ("HOLD", "BUY"),
+    ("HOLD", "SELL"),
+    ("RE_ROUTE", "CANCEL"),
+)
+_CONFLICTS = frozenset(frozenset(pair) for pair in CONFLICTING_ACTION_PAIRS)
+
+MAX_CONFLICT_SAMPLES = 50  # conflicting pairs materialised on UnifiedState
+
+
+class SignalAggregator:
+    """
+    Running aggregates over the active signal set.
+
+    Weighted sums, per-action counts/votes and per-engine influence are
+    updated as signals are added or expire, so computing a unified state
+    costs O(actions + engines) instead of rescanning every signal and
+    comparing every pair. Expiry uses a heap ordered by signal timestamp.
+    Sums are rebuilt from the live signals every REBUILD_EVERY removals to
+    keep floating-point drift bounded.
+    """
+
+    REBUILD_EVERY = 4096
+
+    def __init__(self, engine_weights: Dict[EngineType, float], priority_weights: Dict[SignalPriority, float]):
+        self.engine_weights = engine_weights
+        self.priority_weights = priority_weights
+        self.signals: Dict[str, EngineSignal] = {}
+        self._expiry: List[Tuple[float, int, str]] = []
+        self._seq = 0
+        self._removals = 0
+        self._reset_sums()
+
+    def _reset_sums(self) -> None:
+        self.confidence_sum = 0.0
+        self.confidence_weight = 0.0
+        self.stability_sum = 0.0
+        self.aggression_sum = 0.0
+        self.engine_weight_sum = 0.0
+        self.action_counts: Dict[str, int] = defaultdict(int)
+        self.action_votes: Dict[str, float] = defaultdict(float)
+        self.action_signals: Dict[str, Dict[str, EngineSignal]] = defaultdict(dict)
+        self.engine_influence: Dict[EngineType, float] = defaultdict(float)
+        self.engine_counts: Dict[EngineType, int] = defaultdict(int)
+
+    def __len__(self) -> int:
+        return len(self.signals)
+
+    def _apply(self, signal: EngineSignal, sign: int) -> None:
+        engine_weight = self.engine_weights.get(signal.engine_type, 0.1)
+        signal_weight = engine_weight * self.priority_weights.get(signal.priority, 0.5)
+        vote = signal_weight * signal.confidence / 100.0
+        action = signal.action_recommendation
+
+        self.confidence_sum += sign * signal.confidence * signal_weight
+        self.confidence_weight += sign * signal_weight
+        self.stability_sum += sign * signal.stability_impact * engine_weight
+        self.aggression_sum += sign * signal.aggression_level * engine_weight
+        self.engine_weight_sum += sign * engine_weight
+        self.action_counts[action] += sign
+        self.action_votes[action] += sign * vote
+        self.engine_influence[signal.engine_type] += sign * vote
+        self.engine_counts[signal.engine_type] += sign
+
+        if sign > 0:
+            self.action_signals[action][signal.signal_id] = signal
+        else:
+            self.action_signals[action].pop(signal.signal_id, None)
+            if not self.action_counts[action]:
+                del self.action_counts[action]
+                del self.action_votes[action]
+                del self.action_signals[action]
+            if not self.engine_counts[signal.engine_type]:
+                del self.engine_counts[signal.engine_type]
+                del self.engine_influence[signal.engine_type]
+
+    def add(self, signal: EngineSignal) -> None:
+        if signal.signal_id in self.signals:
+            self.remove(signal.signal_id)
+        self.signals[signal.signal_id] = signal
+        self._apply(signal, 1)
+        self._seq += 1
+        heapq.heappush(self._expiry, (signal.timestamp, self._seq, signal.signal_id))
+
+    def remove(self, signal_id: str) -> None:
+        signal = self.signals.pop(signal_id, None)
+        if signal is None:
+            return
+        if not self.signals:
+            self._reset_sums()
+            self._expiry.clear()
+            return
+        self._apply(signal, -1)
+        self._removals += 1
+        if self._removals >= self.REBUILD_EVERY:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._removals = 0
+        self._reset_sums()
+        for signal in self.signals.values():
+            self._apply(signal, 1)
+
+    def expire(self, cutoff: float) -> int:
+        """Drop signals with timestamp < cutoff; returns how many were dropped."""
+        expired = 0
+        while self._expiry and self._expiry[0][0] < cutoff:
+            timestamp, _, signal_id = heapq.heappop(self._expiry)
+            signal = self.signals.get(signal_id)
+            if signal is not None and signal.timestamp == timestamp:
+                self.remove(signal_id)
+                expired += 1
+        return expired
+
+    # Aggregates -------------------------------------------------------
+
+    def aggregated_confidence(self) -> float:
+        if self.confidence_weight <= 0:
+            return 50.0
+        return min(100.0, max(0.0, self.confidence_sum / self.confidence_weight))
+
+    def stability_score(self) -> float:
+        avg_impact = self.stability_sum / self.engine_weight_sum if self.engine_weight_sum > 0 else 0.0
+        return min(100.0, max(0.0, 50.0 + avg_impact * 50.0))
+
+    def aggression_score(self) -> float:
+        avg_aggression = self.aggression_sum / self.engine_weight_sum if self.engine_weight_sum > 0 else 0.0
+        return min(100.0, max(0.0, avg_aggression * 100))
+
+    def conflict_count(self) -> int:
+        """Conflicting signal pairs, from the action histogram in O(actions)."""
+        counts = self.action_counts
+        return sum(counts.get(a, 0) * counts.get(b, 0) for a, b in CONFLICTING_ACTION_PAIRS)
+
+    def consensus_level(self, conflicts: int) -> float:
+        n = len(self.signals)
+        total_possible_conflicts = n * (n - 1) / 2
+        if total_possible_conflicts == 0:
+            return 100.0
+        consensus = (total_possible_conflicts - conflicts) / total_possible_conflicts * 100
+        return min(100.0, max(0.0, consensus))
+
+    def dominant_engine(self) -> Optional[EngineType]:
+        if not self.engine_influence:
+            return None
+        return max(self.engine_influence.items(), key=lambda x: x[1])[0]
+
+    def conflict_samples(self, limit: int = MAX_CONFLICT_SAMPLES) -> List[Tuple[EngineSignal, EngineSignal]]:
+        """Up to `limit` conflicting pairs, for callers that inspect them."""
+        pairs: List[Tuple[EngineSignal, EngineSignal]] = []
+        for a, b in CONFLICTING_ACTION_PAIRS:
+            for first in self.action_signals.get(a, {}).values():
+                for second in self.action_signals.get(b, {}).values():
+                    if len(pairs) >= limit:
+                        return pairs
+                    pairs.append((first, second))
+        return pairs
+
+
 class ExecutionNervousSystem:
     """
     Execution Nervous System (ENS)
@@ -194,7 +362,8 @@ class ExecutionNervousSystem:
         }
         
         # Signal management
-        self.active_signals: Dict[str, EngineSignal] = {}
+        self.signal_aggregator = SignalAggregator(self.engine_weights, self.priority_weights)
+        self.active_signals: Dict[str, EngineSignal] = self.signal_aggregator.signals
         self.signal_history: deque = deque(maxlen=1000)  # Historical signals
         
         # Unified state tracking
@@ -206,6 +375,7 @@ class ExecutionNervousSystem:
         self.total_signals_processed = 0
         self.total_actions_generated = 0
         self.average_processing_latency = 0.0
+        self.processing_latency_histogram = SlidingWindowHistogram(window_seconds=300.0)  # p50/p95/p99, last 5 min
         self.consensus_success_rate = 0.95
         
         # Engine integration
@@ -396,7 +566,8 @@ class ExecutionNervousSystem:
             await self._cleanup_expired_signals()
             
             # Get active signals
-            active_signals = list(self.active_signals.values())
+            aggregator = self.signal_aggregator
+            active_signals = list(aggregator.signals.values())
             
             if not active_signals:
                 # No signals - return neutral state
@@ -410,23 +581,13 @@ class ExecutionNervousSystem:
                     processing_latency=(time.time() - start_time) * 1000
                 )
             
-            # Calculate aggregated confidence
-            aggregated_confidence = await self._calculate_aggregated_confidence(active_signals)
-            
-            # Calculate stability score
-            stability_score = await self._calculate_stability_score(active_signals)
-            
-            # Calculate aggression score
-            aggression_score = await self._calculate_aggression_score(active_signals)
-            
-            # Detect conflicts
-            conflicting_signals = await self._detect_conflicts(active_signals)
-            
-            # Calculate consensus level
-            consensus_level = await self._calculate_consensus_level(active_signals, conflicting_signals)
-            
-            # Determine dominant engine
-            dominant_engine = await self._determine_dominant_engine(active_signals)
+            # Aggregates are maintained incrementally as signals arrive/expire
+            aggregated_confidence = aggregator.aggregated_confidence()
+            stability_score = aggregator.stability_score()
+            aggression_score = aggregator.aggression_score()
+            conflict_count = aggregator.conflict_count()
+            consensus_level = aggregator.consensus_level(conflict_count)
+            dominant_engine = aggregator.dominant_engine()
             
             # Create unified state
             unified_state = UnifiedState(
@@ -434,9 +595,11 @@ class ExecutionNervousSystem:
                 stability_score=stability_score,
                 aggression_score=aggression_score,
                 consensus_level=consensus_level,
-                active_signals=active_signals.copy(),
-                conflicting_signals=conflicting_signals,
+                active_signals=active_signals,
+                conflicting_signals=aggregator.conflict_samples(),
                 dominant_engine=dominant_engine,
+                conflict_count=conflict_count,
+                action_votes=dict(aggregator.action_votes),
                 processing_latency=(time.time() - start_time) * 1000
             )
             
@@ -607,6 +770,7 @@ class ExecutionNervousSystem:
                 "active_signals_count": len(self.active_signals),
                 "memory_buffer_usage": f"{len(self.memory_buffer)}/{self.memory_buffer_size}",
                 "average_processing_latency": self.average_processing_latency,
+                "processing_latency_percentiles": self.processing_latency_histogram.percentiles(),
                 "consensus_success_rate": self.consensus_success_rate,
                 "current_stability_score": self.current_unified_state.stability_score if self.current_unified_state else None,
                 "current_aggression_score": self.current_unified_state.aggression_score if self.current_unified_state else None,
@@ -634,7 +798,7 @@ class ExecutionNervousSystem:
         """Process and store a new signal"""
         try:
             # Store signal
-            self.active_signals[signal.signal_id] = signal
+            self.signal_aggregator.add(signal)
             self.signal_history.append(signal)
             self.total_signals_processed += 1
             
@@ -646,187 +810,22 @@ class ExecutionNervousSystem:
     async def _cleanup_expired_signals(self) -> None:
         """Remove expired signals from active signals"""
         try:
-            current_time = time.time()
-            expired_signals = []
-            
-            for signal_id, signal in self.active_signals.items():
-                if current_time - signal.timestamp > self.signal_timeout:
-                    expired_signals.append(signal_id)
-            
-            for signal_id in expired_signals:
-                del self.active_signals[signal_id]
-                
-            if expired_signals:
-                logger.debug(f"Cleaned up {len(expired_signals)} expired signals")
+            expired = self.signal_aggregator.expire(time.time() - self.signal_timeout)
+            if expired:
+                logger.debug(f"Cleaned up {expired} expired signals")
                 
         except Exception as e:
             logger.error(f"Error cleaning up expired signals: {e}")
     
-    async def _calculate_aggregated_confidence(self, signals: List[EngineSignal]) -> float:
-        """Calculate aggregated confidence from all signals"""
-        try:
-            if not signals:
-                return 50.0
-            
-            weighted_sum = 0.0
-            total_weight = 0.0
-            
-            for signal in signals:
-                engine_weight = self.engine_weights.get(signal.engine_type, 0.1)
-                priority_weight = self.priority_weights.get(signal.priority, 0.5)
-                total_signal_weight = engine_weight * priority_weight
-                
-                weighted_sum += signal.confidence * total_signal_weight
-                total_weight += total_signal_weight
-            
-            if total_weight > 0:
-                return min(100.0, max(0.0, weighted_sum / total_weight))
-            else:
-                return 50.0
-                
-        except Exception as e:
-            logger.warning(f"Error calculating aggregated confidence: {e}")
-            return 50.0
-    
-    async def _calculate_stability_score(self, signals: List[EngineSignal]) -> float:
-        """Calculate overall stability score"""
-        try:
-            if not signals:
-                return 75.0  # Default to stable
-            
-            stability_impacts = [signal.stability_impact for signal in signals]
-            weights = [self.engine_weights.get(signal.engine_type, 0.1) for signal in signals]
-            
-            # Calculate weighted average of stability impacts
-            if weights:
-                weighted_impact = sum(impact * weight for impact, weight in zip(stability_impacts, weights))
-                total_weight = sum(weights)
-                avg_impact = weighted_impact / total_weight if total_weight > 0 else 0.0
-            else:
-                avg_impact = 0.0
-            
-            # Convert impact (-1 to 1) to score (0 to 100)
-            stability_score = 50.0 + (avg_impact * 50.0)
-            return min(100.0, max(0.0, stability_score))
-            
-        except Exception as e:
-            logger.warning(f"Error calculating stability score: {e}")
-            return 50.0
-    
-    async def _calculate_aggression_score(self, signals: List[EngineSignal]) -> float:
-        """Calculate overall aggression score"""
-        try:
-            if not signals:
-                return 25.0  # Default to conservative
-            
-            aggression_levels = [signal.aggression_level for signal in signals]
-            weights = [self.engine_weights.get(signal.engine_type, 0.1) for signal in signals]
-            
-            # Calculate weighted average
-            if weights:
-                weighted_aggression = sum(level * weight for level, weight in zip(aggression_levels, weights))
-                total_weight = sum(weights)
-                avg_aggression = weighted_aggression / total_weight if total_weight > 0 else 0.0
-            else:
-                avg_aggression = 0.0
-            
-            # Convert to 0-100 scale
-            return min(100.0, max(0.0, avg_aggression * 100))
-            
-        except Exception as e:
-            logger.warning(f"Error calculating aggression score: {e}")
-            return 25.0
-    
-    async def _detect_conflicts(self, signals: List[EngineSignal]) -> List[Tuple[EngineSignal, EngineSignal]]:
-        """Detect conflicting signals between engines"""
-        try:
-            conflicts = []
-            
-            for i, signal1 in enumerate(signals):
-                for signal2 in signals[i+1:]:
-                    if self._are_signals_conflicting(signal1, signal2):
-                        conflicts.append((signal1, signal2))
-            
-            return conflicts
-            
-        except Exception as e:
-            logger.warning(f"Error detecting conflicts: {e}")
-            return []
-    
     def _are_signals_conflicting(self, signal1: EngineSignal, signal2: EngineSignal) -> bool:
         """Check if two signals are conflicting"""
         try:
-            action1 = signal1.action_recommendation
-            action2 = signal2.action_recommendation
-            
-            # Define conflicting actions
-            conflicting_pairs = [
-                ("BUY", "SELL"),
-                ("CANCEL", "BUY"),
-                ("CANCEL", "SELL"),
-                ("HOLD", "BUY"),
-                ("HOLD", "SELL"),
-                ("RE_ROUTE", "CANCEL")
-            ]
-            
-            # Check if actions conflict
-            for pair in conflicting_pairs:
-                if (action1 in pair and action2 in pair and action1 != action2):
-                    return True
-            
-            return False
+            return frozenset((signal1.action_recommendation, signal2.action_recommendation)) in _CONFLICTS
             
         except Exception as e:
             logger.warning(f"Error checking signal conflict: {e}")
             return False
     
-    async def _calculate_consensus_level(self, signals: List[EngineSignal], conflicts: List[Tuple[EngineSignal, EngineSignal]]) -> float:
-        """Calculate consensus level among engines"""
-        try:
-            if not signals:
-                return 100.0
-            
-            total_possible_conflicts = len(signals) * (len(signals) - 1) / 2
-            actual_conflicts = len(conflicts)
-            
-            if total_possible_conflicts == 0:
-                return 100.0
-            
-            consensus = ((total_possible_conflicts - actual_conflicts) / total_possible_conflicts) * 100
-            return min(100.0, max(0.0, consensus))
-            
-        except Exception as e:
-            logger.warning(f"Error calculating consensus level: {e}")
-            return 50.0
-    
-    async def _determine_dominant_engine(self, signals: List[EngineSignal]) -> Optional[EngineType]:
-        """Determine which engine has the most influence"""
-        try:
-            if not signals:
-                return None
-            
-            # Calculate influence score for each engine
-            engine_influence = defaultdict(float)
-            
-            for signal in signals:
-                engine_weight = self.engine_weights.get(signal.engine_type, 0.1)
-                priority_weight = self.priority_weights.get(signal.priority, 0.5)
-                confidence_factor = signal.confidence / 100.0
-                
-                influence = engine_weight * priority_weight * confidence_factor
-                engine_influence[signal.engine_type] += influence
-            
-            # Find the engine with highest influence
-            if engine_influence:
-                dominant_engine = max(engine_influence.items(), key=lambda x: x[1])[0]
-                return dominant_engine
-            
-            return None
-            
-        except Exception as e:
-            logger.warning(f"Error determining dominant engine: {e}")
-            return None
-    
     async def _determine_final_action_type(self, unified_state: UnifiedState) -> FinalExecutionActionType:
         """Determine final action type from unified state"""
         try:
@@ -839,16 +838,17 @@ class ExecutionNervousSystem:
             if not unified_state.active_signals:
                 return FinalExecutionActionType.NO_OP
             
-            # Count action recommendations
-            action_votes = defaultdict(float)
-            
-            for signal in unified_state.active_signals:
-                engine_weight = self.engine_weights.get(signal.engine_type, 0.1)
-                priority_weight = self.priority_weights.get(signal.priority, 0.5)
-                confidence_factor = signal.confidence / 100.0
-                
-                vote_strength = engine_weight * priority_weight * confidence_factor
-                action_votes[signal.action_recommendation] += vote_strength
+            # Action vote strengths (engine x priority x confidence), kept by the aggregator
+            action_votes = unified_state.action_votes
+            if not action_votes:
+                action_votes = defaultdict(float)
+                for signal in unified_state.active_signals:
+                    engine_weight = self.engine_weights.get(signal.engine_type, 0.1)
+                    priority_weight = self.priority_weights.get(signal.priority, 0.5)
+                    confidence_factor = signal.confidence / 100.0
+                    
+                    vote_strength = engine_weight * priority_weight * confidence_factor
+                    action_votes[signal.action_recommendation] += vote_strength
             
             # Find the action with highest vote strength
             if action_votes:
@@ -928,8 +928,8 @@ class ExecutionNervousSystem:
                 reasons.append(f"Influenced by {unified_state.dominant_engine.value}")
             
             # Add conflict information
-            if unified_state.conflicting_signals:
-                reasons.append(f"{len(unified_state.conflicting_signals)} conflicting signals resolved")
+            if unified_state.conflict_count:
+                reasons.append(f"{unified_state.conflict_count} conflicting signals resolved")
             
             # Add confidence information
             if unified_state.aggregated_confidence >= 80:
@@ -1258,6 +1258,7 @@ class ExecutionNervousSystem:
                 alpha * latency + 
                 (1 - alpha) * self.average_processing_latency
             )
+            self.processing_latency_histogram.observe(latency)
             
         except Exception as e:
             logger.warning(f"Error updating processing metrics: {e}")
@@ -25,9 +25,10 @@ from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from collections import defaultdict, deque
-import statistics
 import math
 
+from backend.utils.rolling import RollingWindow
+
 logger = logging.getLogger(__name__)
 
 
@@ -141,7 +142,14 @@ class ExecutionNeuralReactionEngine:
         # Memory and state tracking
         self.event_memory: deque = deque(maxlen=1000)  # Last 1000 events
         self.reaction_history: deque = deque(maxlen=500)  # Last 500 reactions
-        self.performance_metrics = defaultdict(list)
+        self.performance_metrics: Dict[str, RollingWindow] = {
+            "neural_scores": RollingWindow(500),
+            "confidence_scores": RollingWindow(500),
+        }
+        
+        # Rolling statistics over the most recent reactions, keyed by window size
+        self.recent_neural_scores = {size: RollingWindow(size) for size in (10, 20, 50)}
+        self.recent_confidences = {size: RollingWindow(size) for size in (10, 50)}
         
         # Current state
         self.current_confidence = 85.0  # Initial confidence level
@@ -154,9 +162,9 @@ class ExecutionNeuralReactionEngine:
         self.reaction_type_counts = defaultdict(int)
         
         # Performance tracking
-        self.latency_history: deque = deque(maxlen=100)
-        self.slippage_history: deque = deque(maxlen=100)
-        self.execution_success_history: deque = deque(maxlen=100)
+        self.latency_history = RollingWindow(100)
+        self.abs_slippage_history = RollingWindow(100)
+        self.execution_success_history = RollingWindow(100)
         
         # Neural processing weights
         self.event_weights = {
@@ -237,6 +245,10 @@ class ExecutionNeuralReactionEngine:
             
             # Store reaction in history
             self.reaction_history.append(reaction)
+            for window in self.recent_neural_scores.values():
+                window.append(reaction.neural_reaction_score)
+            for window in self.recent_confidences.values():
+                window.append(reaction.execution_confidence)
             self.reaction_type_counts[reaction_type] += 1
             
             logger.debug(f"Neural reaction generated: {reaction_type.value} (score: {neural_score:.3f})")
@@ -268,14 +280,13 @@ class ExecutionNeuralReactionEngine:
         """
         try:
             # Calculate averages from history
-            recent_reactions = list(self.reaction_history)[-50:]  # Last 50 reactions
-            
-            if recent_reactions:
-                recent_neural_score = recent_reactions[-1].neural_reaction_score
-                average_neural_score = statistics.mean(r.neural_reaction_score for r in recent_reactions)
-                average_confidence = statistics.mean(r.execution_confidence for r in recent_reactions)
-                recent_slippage_impact = recent_reactions[-1].slippage_impact_score
-                recent_latency_impact = recent_reactions[-1].latency_impact_score
+            if self.reaction_history:
+                last_reaction = self.reaction_history[-1]
+                recent_neural_score = last_reaction.neural_reaction_score
+                average_neural_score = self.recent_neural_scores[50].mean  # Last 50 reactions
+                average_confidence = self.recent_confidences[50].mean
+                recent_slippage_impact = last_reaction.slippage_impact_score
+                recent_latency_impact = last_reaction.latency_impact_score
             else:
                 recent_neural_score = self.current_neural_score
                 average_neural_score = 0.5
@@ -570,13 +581,10 @@ class ExecutionNeuralReactionEngine:
             if not self.reaction_history:
                 return self.system_stability_score
             
-            recent_reactions = list(self.reaction_history)[-20:]  # Last 20 reactions
-            
-            # Calculate stability based on variance in neural scores
-            neural_scores = [r.neural_reaction_score for r in recent_reactions]
+            # Calculate stability based on variance in the last 20 neural scores
+            variance = self.recent_neural_scores[20].variance
             
-            if len(neural_scores) > 1:
-                variance = statistics.variance(neural_scores)
+            if variance is not None:
                 stability = max(0.0, 1.0 - variance * 2)  # Lower variance = higher stability
             else:
                 stability = self.system_stability_score
@@ -600,21 +608,10 @@ class ExecutionNeuralReactionEngine:
             if len(self.reaction_history) < 10:
                 return 0.5  # Neutral trend
             
-            recent_scores = [r.neural_reaction_score for r in list(self.reaction_history)[-20:]]
-            
-            # Calculate trend using linear regression approximation
-            n = len(recent_scores)
-            x_values = list(range(n))
+            # Least-squares trend of the last 20 neural scores
+            slope = self.recent_neural_scores[20].slope
             
-            # Simple trend calculation
-            x_mean = statistics.mean(x_values)
-            y_mean = statistics.mean(recent_scores)
-            
-            numerator = sum((x_values[i] - x_mean) * (recent_scores[i] - y_mean) for i in range(n))
-            denominator = sum((x_values[i] - x_mean) ** 2 for i in range(n))
-            
-            if denominator > 0:
-                slope = numerator / denominator
+            if slope is not None:
                 # Convert slope to 0-1 score (positive slope = higher score)
                 trend_score = 0.5 + slope * 10  # Scaling factor
                 return max(0.0, min(1.0, trend_score))
@@ -632,22 +629,21 @@ class ExecutionNeuralReactionEngine:
             
             # Execution success rate
             if self.execution_success_history:
-                success_rate = sum(self.execution_success_history) / len(self.execution_success_history)
-                factors["execution_success_rate"] = success_rate
+                factors["execution_success_rate"] = self.execution_success_history.mean
             else:
                 factors["execution_success_rate"] = 0.5
             
             # Latency performance
             if self.latency_history:
-                avg_latency = statistics.mean(self.latency_history)
+                avg_latency = self.latency_history.mean
                 latency_factor = max(0.0, 1.0 - avg_latency / 1000)  # Normalize to 0-1
                 factors["latency_performance"] = latency_factor
             else:
                 factors["latency_performance"] = 0.5
             
             # Slippage performance
-            if self.slippage_history:
-                avg_slippage = statistics.mean(abs(s) for s in self.slippage_history)
+            if self.abs_slippage_history:
+                avg_slippage = self.abs_slippage_history.mean
                 slippage_factor = max(0.0, 1.0 - avg_slippage / 0.01)  # 1% as max
                 factors["slippage_performance"] = slippage_factor
             else:
@@ -658,8 +654,7 @@ class ExecutionNeuralReactionEngine:
             
             # Recent performance
             if self.reaction_history:
-                recent_avg = statistics.mean(r.neural_reaction_score for r in list(self.reaction_history)[-10:])
-                factors["recent_performance"] = recent_avg
+                factors["recent_performance"] = self.recent_neural_scores[10].mean
             else:
                 factors["recent_performance"] = 0.5
             
@@ -683,7 +678,7 @@ class ExecutionNeuralReactionEngine:
                 self.latency_history.append(event.latency)
             
             if event.slippage is not None:
-                self.slippage_history.append(event.slippage)
+                self.abs_slippage_history.append(abs(event.slippage))
             
             # Update execution success history
             if event.event_type == ExecutionEventType.EXECUTION_FILLED:
@@ -694,13 +689,6 @@ class ExecutionNeuralReactionEngine:
             # Update performance metrics
             self.performance_metrics["neural_scores"].append(reaction.neural_reaction_score)
             self.performance_metrics["confidence_scores"].append(reaction.execution_confidence)
-            
-            # Keep metrics deques at reasonable size
-            if len(self.performance_metrics["neural_scores"]) > 1000:
-                self.performance_metrics["neural_scores"] = self.performance_metrics["neural_scores"][-500:]
-            
-            if len(self.performance_metrics["confidence_scores"]) > 1000:
-                self.performance_metrics["confidence_scores"] = self.performance_metrics["confidence_scores"][-500:]
                 
         except Exception as e:
             logger.warning(f"Error updating internal state: {e}")
@@ -710,40 +698,23 @@ class ExecutionNeuralReactionEngine:
         try:
             metrics = {}
             
-            # Neural score metrics
-            if self.performance_metrics["neural_scores"]:
-                neural_scores = self.performance_metrics["neural_scores"]
-                metrics["average_neural_score"] = statistics.mean(neural_scores)
-                metrics["neural_score_std"] = statistics.stdev(neural_scores) if len(neural_scores) > 1 else 0
-                metrics["max_neural_score"] = max(neural_scores)
-                metrics["min_neural_score"] = min(neural_scores)
-            
-            # Confidence metrics
-            if self.performance_metrics["confidence_scores"]:
-                confidence_scores = self.performance_metrics["confidence_scores"]
-                metrics["average_confidence"] = statistics.mean(confidence_scores)
-                metrics["confidence_std"] = statistics.stdev(confidence_scores) if len(confidence_scores) > 1 else 0
-                metrics["max_confidence"] = max(confidence_scores)
-                metrics["min_confidence"] = min(confidence_scores)
-            
-            # Latency metrics
-            if self.latency_history:
-                metrics["average_latency"] = statistics.mean(self.latency_history)
-                metrics["latency_std"] = statistics.stdev(self.latency_history) if len(self.latency_history) > 1 else 0
-                metrics["max_latency"] = max(self.latency_history)
-                metrics["min_latency"] = min(self.latency_history)
-            
-            # Slippage metrics
-            if self.slippage_history:
-                abs_slippages = [abs(s) for s in self.slippage_history]
-                metrics["average_slippage"] = statistics.mean(abs_slippages)
-                metrics["slippage_std"] = statistics.stdev(abs_slippages) if len(abs_slippages) > 1 else 0
-                metrics["max_slippage"] = max(abs_slippages)
-                metrics["min_slippage"] = min(abs_slippages)
+            # Rolling-window metrics: (history, metric prefix, std key)
+            windows = (
+                (self.performance_metrics["neural_scores"], "neural_score", "neural_score_std"),
+                (self.performance_metrics["confidence_scores"], "confidence", "confidence_std"),
+                (self.latency_history, "latency", "latency_std"),
+                (self.abs_slippage_history, "slippage", "slippage_std"),
+            )
+            for window, name, std_key in windows:
+                if window:
+                    metrics[f"average_{name}"] = window.mean
+                    metrics[std_key] = window.stdev if len(window) > 1 else 0
+                    metrics[f"max_{name}"] = window.max
+                    metrics[f"min_{name}"] = window.min
             
             # Success rate
             if self.execution_success_history:
-                metrics["execution_success_rate"] = statistics.mean(self.execution_success_history)
+                metrics["execution_success_rate"] = self.execution_success_history.mean
             
             return metrics
             
@@ -785,9 +756,8 @@ class ExecutionNeuralReactionEngine:
             
             # Recent performance
             if self.reaction_history:
-                recent_reactions = list(self.reaction_history)[-10:]
-                indicators["recent_average_neural_score"] = statistics.mean(r.neural_reaction_score for r in recent_reactions)
-                indicators["recent_average_confidence"] = statistics.mean(r.execution_confidence for r in recent_reactions)
+                indicators["recent_average_neural_score"] = self.recent_neural_scores[10].mean
+                indicators["recent_average_confidence"] = self.recent_confidences[10].mean
             
             return indicators
             
@@ -29,6 +29,9 @@ import statistics
 import math
 import uuid
 
+from backend.utils.rolling import RollingWindow
+from backend.workers.metrics import SlidingWindowHistogram
+
 # Import related execution systems
 from .ExecutionNeuralReactionEngine import (
     get_execution_neural_reaction_engine, 
@@ -187,6 +190,7 @@ class ReflexState:
     emergency_actions_taken: int
     
     last_updated: float = field(default_factory=time.time)
+    latency_percentiles: Dict[str, Optional[float]] = field(default_factory=dict)
 
 
 class ExecutionReflexLoopEngine:
@@ -214,7 +218,8 @@ class ExecutionReflexLoopEngine:
         
         # Reflex processing
         self.reflex_history: deque = deque(maxlen=1000)  # Last 1000 reflexes
-        self.reflex_latencies: deque = deque(maxlen=100)  # Latency tracking
+        self.reflex_latencies = RollingWindow(100)  # Latency tracking
+        self.reflex_latency_histogram = SlidingWindowHistogram(window_seconds=300.0)  # p50/p95/p99, last 5 min
         self.action_counts = defaultdict(int)
         
         # State tracking
@@ -428,7 +433,7 @@ class ExecutionReflexLoopEngine:
             
             # Calculate averages
             if self.reflex_latencies:
-                average_latency = statistics.mean(self.reflex_latencies)
+                average_latency = self.reflex_latencies.mean
             else:
                 average_latency = 0.0
             
@@ -467,7 +472,8 @@ class ExecutionReflexLoopEngine:
                 rtem_connected=rtem_connected,
                 total_orders_processed=self.total_orders_processed,
                 total_reflexes_triggered=self.total_reflexes_triggered,
-                emergency_actions_taken=self.emergency_actions_taken
+                emergency_actions_taken=self.emergency_actions_taken,
+                latency_percentiles=self.reflex_latency_histogram.percentiles()
             )
             
         except Exception as e:
@@ -859,13 +865,14 @@ class ExecutionReflexLoopEngine:
         try:
             # Update latency tracking
             self.reflex_latencies.append(latency)
+            self.reflex_latency_histogram.observe(latency)
             
             # Update action counts
             self.action_counts[response.reflex_action] += 1
             
             # Update average metrics
             if self.reflex_latencies:
-                self.current_average_latency = statistics.mean(self.reflex_latencies)
+                self.current_average_latency = self.reflex_latencies.mean
             
             # Update confidence tracking (mock)
             self.current_average_confidence = (
@@ -1116,6 +1123,7 @@ def get_reflex_state() -> Dict[str, Any]:
             "total_orders_processed": state.total_orders_processed,
             "total_reflexes_triggered": state.total_reflexes_triggered,
             "emergency_actions_taken": state.emergency_actions_taken,
+            "latency_percentiles": state.latency_percentiles,
             "last_updated": state.last_updated
         }
         
@@ -0,0 +1,156 @@
+"""Fixed-window rolling statistics with O(1) updates."""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Deque, Iterator, Optional, Tuple
+
+
+class RollingWindow:
+    """
+    The last `size` values with running mean, variance, min/max, EWMA and
+    least-squares trend slope.
+
+    append() is O(1) amortized: sums are updated in place, variance uses a
+    windowed Welford mean/M2 (no sum-of-squares cancellation when values are
+    large relative to their spread), min/max use monotonic deques, and the
+    slope uses a running sum of index * value.
+    Queries are O(1). The window also behaves like the deque it replaces
+    (len, iteration, truthiness). Statistics that need more values than
+    the window holds return None. The sums are re-computed from the
+    window every `size` appends, which keeps floating-point drift bounded.
+
+    variance/stdev are sample statistics (n - 1), matching
+    statistics.variance/stdev. slope is the regression slope of the
+    values against their positions 0..n-1.
+    """
+
+    def __init__(self, size: int, ewma_alpha: float = 0.1) -> None:
+        if size < 1:
+            raise ValueError("size must be >= 1")
+        self.size = size
+        self.ewma_alpha = ewma_alpha
+        self._values: Deque[float] = deque(maxlen=size)
+        self._mins: Deque[Tuple[int, float]] = deque()
+        self._maxs: Deque[Tuple[int, float]] = deque()
+        self._count = 0  # values ever appended; index of the next one
+        self._sum = 0.0
+        self._mean = 0.0  # Welford running mean of the window
+        self._m2 = 0.0  # Welford sum of squared deviations from _mean
+        self._isum = 0.0  # sum of position * value, positions 0..n-1
+        self._since_resum = 0
+        self.ewma: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self._values)
+
+    def __repr__(self) -> str:
+        return f"RollingWindow(size={self.size}, n={len(self)}, mean={self.mean})"
+
+    def append(self, value: float) -> None:
+        value = float(value)
+        position = len(self._values)
+        if position == self.size:
+            oldest = self._values[0]
+            self._sum -= oldest
+            # every remaining value moves down one position
+            self._isum -= self._sum
+            position -= 1
+            # replace oldest with value: n stays the same
+            old_mean = self._mean
+            self._mean += (value - oldest) / self.size
+            self._m2 += (value - oldest) * (value - self._mean + oldest - old_mean)
+        else:
+            delta = value - self._mean
+            self._mean += delta / (position + 1)
+            self._m2 += delta * (value - self._mean)
+        self._isum += position * value
+        self._values.append(value)  # maxlen drops the oldest
+        self._sum += value
+
+        index = self._count
+        self._count += 1
+        expired = index - self.size
+        while self._mins and self._mins[-1][1] >= value:
+            self._mins.pop()
+        self._mins.append((index, value))
+        while self._mins[0][0] <= expired:
+            self._mins.popleft()
+        while self._maxs and self._maxs[-1][1] <= value:
+            self._maxs.pop()
+        self._maxs.append((index, value))
+        while self._maxs[0][0] <= expired:
+            self._maxs.popleft()
+
+        if self.ewma is None:
+            self.ewma = value
+        else:
+            self.ewma += self.ewma_alpha * (value - self.ewma)
+
+        self._since_resum += 1
+        if self._since_resum >= self.size:
+            self._resum()
+
+    def extend(self, values) -> None:
+        for value in values:
+            self.append(value)
+
+    def clear(self) -> None:
+        self.__init__(self.size, self.ewma_alpha)
+
+    def _resum(self) -> None:
+        self._since_resum = 0
+        self._sum = math.fsum(self._values)
+        self._mean = self._sum / len(self._values)
+        self._m2 = math.fsum((v - self._mean) ** 2 for v in self._values)
+        self._isum = math.fsum(i * v for i, v in enumerate(self._values))
+
+    @property
+    def first(self) -> Optional[float]:
+        return self._values[0] if self._values else None
+
+    @property
+    def last(self) -> Optional[float]:
+        return self._values[-1] if self._values else None
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    @property
+    def mean(self) -> Optional[float]:
+        n = len(self._values)
+        return self._sum / n if n else None
+
+    @property
+    def variance(self) -> Optional[float]:
+        n = len(self._values)
+        if n < 2:
+            return None
+        return max(0.0, self._m2 / (n - 1))
+
+    @property
+    def stdev(self) -> Optional[float]:
+        variance = self.variance
+        return math.sqrt(variance) if variance is not None else None
+
+    @property
+    def min(self) -> Optional[float]:
+        return self._mins[0][1] if self._mins else None
+
+    @property
+    def max(self) -> Optional[float]:
+        return self._maxs[0][1] if self._maxs else None
+
+    @property
+    def slope(self) -> Optional[float]:
+        n = len(self._values)
+        if n < 2:
+            return None
+        sum_x = n * (n - 1) / 2
+        denominator = n * n * (n * n - 1) / 12
+        return (n * self._isum - sum_x * self._sum) / denominator
@@ -8,6 +8,7 @@ from typing import Optional
 
 from backend.workers import job_store
 from backend.workers.orchestration import WorkerCoordinator
+from backend.workers.pool import JobPool, PoolConfig
 from backend.workers.runner import runner_loop
 
 logger = logging.getLogger(__name__)
@@ -20,12 +21,15 @@ async def _run_worker(
     shutdown_event: Optional[asyncio.Event] = None,
     heartbeat_interval: float = 5.0,
     poll_interval_ms: int = 500,
+    pool_config: Optional[PoolConfig] = None,
 ) -> None:
     coord = WorkerCoordinator(redis_url=redis_url)
     worker_identifier = worker_id or f"worker-{uuid.uuid4().hex[:8]}"
     await coord.register(worker_identifier)
 
     stop_event = shutdown_event or asyncio.Event()
+    pool_config = pool_config or PoolConfig.from_env()
+    pool = JobPool(pool_config) if pool_config is not None else None
 
     hb_task = asyncio.create_task(
         coord.heartbeat_loop(
@@ -40,6 +44,7 @@ async def _run_worker(
             shutdown_event=stop_event,
             store=job_store.default_store,
             poll_interval_ms=poll_interval_ms,
+            pool=pool,
         )
     )
 
@@ -64,6 +69,9 @@ async def _run_worker(
             runner_task.cancel()
             await asyncio.gather(runner_task, return_exceptions=True)
 
+        if pool is not None:
+            await pool.close()
+
         hb_task.cancel()
         await asyncio.gather(hb_task, return_exceptions=True)
         await coord.deregister(worker_identifier)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import heapq
 import os
 import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple, Union
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from backend.workers import metrics as _metrics
 
 # Redis is optional for local/test; guarded import keeps memory-only mode light
 try:
@@ -12,7 +16,18 @@ except Exception:  # pragma: no cover - optional dependency path
     RedisJobStore = None
 
 
+# States that end a job's lifecycle; these records are eligible for TTL expiry
+TERMINAL_STATES = frozenset({"done", "error"})
+# States that are never evicted for capacity (work queued, in flight or owed)
+_LIVE_STATES = frozenset({"enqueued", "running", "retry_scheduled"})
+
+DEFAULT_MAX_ENTRIES = 100_000
+DEFAULT_TERMINAL_TTL_SECONDS = 3600.0
+
+
 class JobRecord:
+    __slots__ = ("state", "attempts", "last_error", "updated_at", "next_retry_at", "last_job")
+
     def __init__(self) -> None:
         self.state: str = "unknown"  # enqueued|running|done|error
         self.attempts: int = 0
@@ -27,21 +42,116 @@ class JobStore:
     Simple thread-safe in-memory job store.
     API is synchronous to be easy to call from sync or async code.
     Replaceable later with a Redis/DB-backed implementation.
+
+    Bounded for long-running workers:
+      - due retries live in a min-heap keyed by next_retry_at, so
+        next_retry_jobs is O(k log N) for k due jobs instead of a full scan
+        (stale heap entries are skipped lazily and compacted when they pile up)
+      - terminal records (done/error) expire terminal_ttl_seconds after they
+        finish; done records drop their last_job copy immediately
+      - past max_entries the least recently used record that is not
+        enqueued, running or awaiting a retry is evicted; those records are
+        kept in their own LRU-ordered index so the victim is its head
+    Store size and eviction counts are reported through
+    backend.workers.metrics.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        max_entries: Optional[int] = DEFAULT_MAX_ENTRIES,
+        terminal_ttl_seconds: Optional[float] = DEFAULT_TERMINAL_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
         self._lock = threading.RLock()
-        self._store: Dict[str, JobRecord] = {}
+        # insertion/access order doubles as the LRU order
+        self._store: "OrderedDict[str, JobRecord]" = OrderedDict()
+        # (next_retry_at, seq, job_id); an entry is live while it matches the record
+        self._retry_heap: List[Tuple[float, int, str]] = []
+        self._retry_seq = 0
+        # job_id -> time it became terminal, oldest first
+        self._terminal: "OrderedDict[str, float]" = OrderedDict()
+        # job_ids of records that may be evicted for capacity, least recently used first
+        self._evictable: "OrderedDict[str, None]" = OrderedDict()
+        self.max_entries = max_entries
+        self.terminal_ttl_seconds = terminal_ttl_seconds
+        self._clock = clock
+        self.evicted_total = 0
+        self.expired_total = 0
+
+    # -- bookkeeping ---------------------------------------------------------
+    def _get(self, job_id: str) -> Optional[JobRecord]:
+        record = self._store.get(job_id)
+        if record is not None:
+            self._store.move_to_end(job_id)
+            if job_id in self._evictable:
+                self._evictable.move_to_end(job_id)
+        return record
+
+    def _insert(self, job_id: str, record: JobRecord) -> None:
+        self._store[job_id] = record
+        if record.state not in _LIVE_STATES:
+            self._evictable[job_id] = None
+
+    def _touch_state(self, job_id: str, record: JobRecord) -> None:
+        """Keep the terminal and evictable indexes in step with record.state."""
+        if record.state in _LIVE_STATES:
+            self._evictable.pop(job_id, None)
+        else:
+            self._evictable[job_id] = None
+            self._evictable.move_to_end(job_id)
+        if record.state in TERMINAL_STATES:
+            self._terminal.pop(job_id, None)
+            self._terminal[job_id] = record.updated_at
+            if record.state == "done":
+                record.last_job = None
+        else:
+            self._terminal.pop(job_id, None)
 
-    def _ensure(self, job_id: str) -> JobRecord:
+    def _remove(self, job_id: str) -> None:
+        self._store.pop(job_id, None)
+        self._terminal.pop(job_id, None)
+        self._evictable.pop(job_id, None)
+
+    def _enforce_limits(self) -> None:
+        if self.terminal_ttl_seconds is not None and self._terminal:
+            cutoff = self._clock() - self.terminal_ttl_seconds
+            while self._terminal:
+                job_id, finished_at = next(iter(self._terminal.items()))
+                if finished_at > cutoff:
+                    break
+                self._remove(job_id)
+                self.expired_total += 1
+                _metrics.job_store_evictions_total.labels(reason="ttl").inc()
+                _metrics.default_metrics.worker_job_store_expired_total.inc()
+        if self.max_entries is not None:
+            while len(self._store) > self.max_entries and self._evictable:
+                # an empty index means everything left is in flight; never drop owed work
+                victim = next(iter(self._evictable))
+                self._remove(victim)
+                self.evicted_total += 1
+                _metrics.job_store_evictions_total.labels(reason="capacity").inc()
+                _metrics.default_metrics.worker_job_store_evictions_total.inc()
+        self._report()
+
+    def _report(self) -> None:
+        size = len(self._store)
+        _metrics.job_store_size.set(size)
+        _metrics.default_metrics.worker_job_store_size.set(size)
+
+    def _ensure(self, job_id: str, enforce: bool = True) -> JobRecord:
+        """Get or create job_id; enforce=False leaves limits to the caller."""
         with self._lock:
-            record = self._store.get(job_id)
+            record = self._get(job_id)
             if record is None:
                 record = JobRecord()
                 record.state = "enqueued"
-                self._store[job_id] = record
+                record.updated_at = self._clock()
+                self._insert(job_id, record)
+                if enforce:
+                    self._enforce_limits()
             return record
 
+    # -- public API ----------------------------------------------------------
     def claim(self, job_id: str) -> bool:
         """
         Try to atomically claim the job for running.
@@ -50,13 +160,14 @@ class JobStore:
         """
 
         with self._lock:
-            record = self._store.get(job_id)
+            record = self._get(job_id)
             if record is None:
                 record = JobRecord()
                 record.state = "running"
                 record.attempts = 1
-                record.updated_at = time.time()
-                self._store[job_id] = record
+                record.updated_at = self._clock()
+                self._insert(job_id, record)
+                self._enforce_limits()
                 return True
 
             if record.state == "running":
@@ -68,7 +179,8 @@ class JobStore:
             record.state = "running"
             if previous_state != "retry_scheduled":
                 record.attempts += 1
-            record.updated_at = time.time()
+            record.updated_at = self._clock()
+            self._touch_state(job_id, record)
             return True
 
     def set_state(
@@ -78,13 +190,15 @@ class JobStore:
         last_error: Optional[str] = None,
     ) -> None:
         with self._lock:
-            record = self._ensure(job_id)
+            record = self._ensure(job_id, enforce=False)
             record.state = state
-            record.updated_at = time.time()
+            record.updated_at = self._clock()
             if last_error is not None:
                 record.last_error = last_error
             if state != "retry_scheduled":
                 record.next_retry_at = None
+            self._touch_state(job_id, record)
+            self._enforce_limits()
 
     def set_last_job(self, job_id: str, job: Dict) -> None:
         with self._lock:
@@ -93,14 +207,14 @@ class JobStore:
 
     def get_state(self, job_id: str) -> Optional[str]:
         with self._lock:
-            record = self._store.get(job_id)
+            record = self._get(job_id)
             return record.state if record else None
 
     def increment_attempts(self, job_id: str) -> int:
         with self._lock:
             record = self._ensure(job_id)
             record.attempts += 1
-            record.updated_at = time.time()
+            record.updated_at = self._clock()
             return record.attempts
 
     def schedule_retry(self, job_id: str, epoch_ms: float) -> None:
@@ -108,29 +222,61 @@ class JobStore:
             record = self._ensure(job_id)
             record.state = "retry_scheduled"
             record.next_retry_at = epoch_ms
-            record.updated_at = time.time()
+            record.updated_at = self._clock()
+            self._touch_state(job_id, record)
+            self._retry_seq += 1
+            heapq.heappush(self._retry_heap, (epoch_ms, self._retry_seq, job_id))
+            if len(self._retry_heap) > 2 * len(self._store) + 64:
+                self._compact_retries()
+
+    def _compact_retries(self) -> None:
+        self._retry_heap = [
+            entry for entry in self._retry_heap
+            if (record := self._store.get(entry[2])) is not None and record.next_retry_at == entry[0]
+        ]
+        heapq.heapify(self._retry_heap)
 
     def next_retry_jobs(self, now_ms: float) -> List[Tuple[str, Dict]]:
         with self._lock:
             due: List[Tuple[str, Dict]] = []
-            for job_id, record in self._store.items():
-                if record.next_retry_at is None:
+            heap = self._retry_heap
+            while heap and heap[0][0] <= now_ms:
+                at, _, job_id = heapq.heappop(heap)
+                record = self._store.get(job_id)
+                # skip entries superseded by a reschedule, a state change or eviction
+                if record is None or record.next_retry_at != at:
                     continue
-                if record.next_retry_at <= now_ms:
-                    record.next_retry_at = None
-                    if record.last_job:
-                        due.append((job_id, record.last_job.copy()))
+                record.next_retry_at = None
+                if record.last_job:
+                    due.append((job_id, record.last_job.copy()))
+            self._enforce_limits()
             return due
 
     def attempts(self, job_id: str) -> int:
         with self._lock:
-            record = self._store.get(job_id)
+            record = self._get(job_id)
             return record.attempts if record else 0
 
     def reset(self, job_id: str) -> None:
         with self._lock:
             if job_id in self._store:
-                del self._store[job_id]
+                self._remove(job_id)
+                self._report()
+
+    def size(self) -> int:
+        with self._lock:
+            return len(self._store)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._store),
+                "terminal": len(self._terminal),
+                "evictable": len(self._evictable),
+                "retry_heap": len(self._retry_heap),
+                "evicted_total": self.evicted_total,
+                "expired_total": self.expired_total,
+            }
 
     def dump(self) -> Dict[str, Dict]:
         """Helper for tests / debugging: shallow snapshot."""
@@ -152,7 +298,12 @@ def get_default_store() -> Union[JobStore, Any]:
     backend = os.getenv("JOB_STORE", "memory").lower()
     if backend == "redis" and RedisJobStore is not None:
         return RedisJobStore(redis_url=os.getenv("REDIS_URL"))
-    return JobStore()
+    max_entries = int(os.getenv("JOB_STORE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+    ttl_seconds = float(os.getenv("JOB_STORE_TERMINAL_TTL_SECONDS", DEFAULT_TERMINAL_TTL_SECONDS))
+    return JobStore(
+        max_entries=max_entries if max_entries > 0 else None,
+        terminal_ttl_seconds=ttl_seconds if ttl_seconds > 0 else None,
+    )
 
 
 default_store = get_default_store()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import List
+import math
+import time
+from typing import Callable, Dict, Iterable, List, Optional
 
 from prometheus_client import Counter, Gauge, Histogram
 
@@ -26,6 +28,28 @@ retry_scheduled_total = Counter(
     "Retries scheduled",
     ["job_path"],
 )
+job_store_size = Gauge(
+    "bagbot_job_store_size",
+    "Job records held by the in-memory job store",
+)
+job_store_evictions_total = Counter(
+    "bagbot_job_store_evictions_total",
+    "Job records dropped by the in-memory job store",
+    ["reason"],
+)
+job_queue_depth = Gauge(
+    "bagbot_job_queue_depth",
+    "Claimed jobs waiting for a worker pool slot",
+)
+jobs_in_flight = Gauge(
+    "bagbot_jobs_in_flight",
+    "Jobs executing in the worker pool",
+)
+job_queue_wait_seconds = Histogram(
+    "bagbot_job_queue_wait_seconds",
+    "Seconds a claimed job waited for a worker pool slot",
+    ["job_path"],
+)
 heartbeat_age_seconds = Gauge(
     "bagbot_heartbeat_age_seconds",
     "Last heartbeat age seconds",
@@ -42,12 +66,218 @@ class _Counter:
         self.count += value
 
 
-class _Histogram:
-    def __init__(self) -> None:
-        self.values: List[float] = []
+class _LogBuckets:
+    """Log-spaced bucket layout with bounded relative error (DDSketch-style).
+
+    Bucket i > 0 covers (gamma**(i-1), gamma**i] scaled by min_value, so a
+    quantile read from bucket midpoints is within `relative_accuracy` of the
+    true sample. Bucket 0 holds values <= min_value (including zero);
+    values above max_value land in the last bucket.
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = 0.01,
+        min_value: float = 1e-6,
+        max_value: float = 1e6,
+    ) -> None:
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        if not 0 < min_value < max_value:
+            raise ValueError("need 0 < min_value < max_value")
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self.gamma)
+        self.min_value = min_value
+        self.size = int(math.ceil(math.log(max_value / min_value) / self._log_gamma)) + 1
+
+    def index(self, value: float) -> int:
+        if value <= self.min_value:
+            return 0
+        i = int(math.ceil(math.log(value / self.min_value) / self._log_gamma))
+        return min(i, self.size - 1)
+
+    def value(self, index: int) -> float:
+        if index == 0:
+            return 0.0
+        return self.min_value * 2 * self.gamma ** index / (self.gamma + 1)
+
+
+def _quantiles_from_counts(
+    buckets: _LogBuckets,
+    counts: List[int],
+    total: int,
+    qs: Iterable[float],
+    lo: float,
+    hi: float,
+) -> List[Optional[float]]:
+    """One cumulative pass over the buckets for any number of quantiles."""
+    qs = list(qs)
+    if total == 0:
+        return [None] * len(qs)
+    order = sorted(range(len(qs)), key=lambda k: qs[k])
+    out: List[Optional[float]] = [None] * len(qs)
+    for k, q in enumerate(qs):
+        if q <= 0:
+            out[k] = lo
+        elif q >= 1:
+            out[k] = hi
+    order = [k for k in order if out[k] is None]
+    cumulative = 0
+    pos = 0
+    for index, count in enumerate(counts):
+        if not count:
+            continue
+        cumulative += count
+        while pos < len(order) and cumulative > qs[order[pos]] * (total - 1):
+            out[order[pos]] = min(max(buckets.value(index), lo), hi)
+            pos += 1
+        if pos == len(order):
+            break
+    return out
+
+
+DEFAULT_PERCENTILES = (0.5, 0.95, 0.99)
+
+
+class StreamingHistogram:
+    """Fixed-memory histogram with p50/p95/p99 queries in O(buckets).
+
+    Memory is one counter per log bucket (~1.4k for the default 1% accuracy
+    over 1e-6..1e6), however many values are observed.
+    """
+
+    def __init__(
+        self,
+        relative_accuracy: float = 0.01,
+        min_value: float = 1e-6,
+        max_value: float = 1e6,
+    ) -> None:
+        self._buckets = _LogBuckets(relative_accuracy, min_value, max_value)
+        self.reset()
+
+    def reset(self) -> None:
+        self._counts = [0] * self._buckets.size
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
 
     def observe(self, value: float) -> None:
-        self.values.append(value)
+        self._counts[self._buckets.index(value)] += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.sum / self.count if self.count else None
+
+    def quantiles(self, qs: Iterable[float]) -> List[Optional[float]]:
+        return _quantiles_from_counts(
+            self._buckets, self._counts, self.count, qs, self.min, self.max
+        )
+
+    def quantile(self, q: float) -> Optional[float]:
+        return self.quantiles([q])[0]
+
+    def percentiles(self, qs: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, Optional[float]]:
+        """{"p50": ..., "p95": ..., "p99": ...} (None while empty)."""
+        qs = list(qs)
+        return {f"p{q * 100:g}": v for q, v in zip(qs, self.quantiles(qs))}
+
+
+class SlidingWindowHistogram:
+    """StreamingHistogram over the last `window_seconds`.
+
+    The window is cut into `slices` sub-histograms that expire whole, so
+    the covered span is between window_seconds * (1 - 1/slices) and
+    window_seconds. A running total of the live slices keeps queries at
+    O(buckets).
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = 300.0,
+        slices: int = 10,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        relative_accuracy: float = 0.01,
+        min_value: float = 1e-6,
+        max_value: float = 1e6,
+    ) -> None:
+        if window_seconds <= 0 or slices < 1:
+            raise ValueError("window_seconds and slices must be positive")
+        self._buckets = _LogBuckets(relative_accuracy, min_value, max_value)
+        self._slice_seconds = window_seconds / slices
+        self._clock = clock
+        self._slices = [self._empty_slice() for _ in range(slices)]
+        self._epochs = [-1] * slices
+        self._totals = [0] * self._buckets.size
+        self.count = 0
+        self.sum = 0.0
+
+    def _empty_slice(self) -> Dict:
+        return {"counts": {}, "count": 0, "sum": 0.0, "min": math.inf, "max": -math.inf}
+
+    def _advance(self) -> int:
+        epoch = int(self._clock() // self._slice_seconds)
+        n = len(self._slices)
+        for k in range(n):
+            if self._epochs[k] != -1 and self._epochs[k] <= epoch - n:
+                self._expire(k)
+        return epoch
+
+    def _expire(self, k: int) -> None:
+        old = self._slices[k]
+        for index, c in old["counts"].items():
+            self._totals[index] -= c
+        self.count -= old["count"]
+        self.sum -= old["sum"]
+        self._slices[k] = self._empty_slice()
+        self._epochs[k] = -1
+
+    def observe(self, value: float) -> None:
+        epoch = self._advance()
+        k = epoch % len(self._slices)
+        if self._epochs[k] != epoch:
+            self._expire(k)
+            self._epochs[k] = epoch
+        current = self._slices[k]
+        index = self._buckets.index(value)
+        current["counts"][index] = current["counts"].get(index, 0) + 1
+        current["count"] += 1
+        current["sum"] += value
+        current["min"] = min(current["min"], value)
+        current["max"] = max(current["max"], value)
+        self._totals[index] += 1
+        self.count += 1
+        self.sum += value
+
+    @property
+    def mean(self) -> Optional[float]:
+        self._advance()
+        return self.sum / self.count if self.count else None
+
+    def quantiles(self, qs: Iterable[float]) -> List[Optional[float]]:
+        self._advance()
+        live = [s for s, e in zip(self._slices, self._epochs) if e != -1]
+        lo = min((s["min"] for s in live), default=math.inf)
+        hi = max((s["max"] for s in live), default=-math.inf)
+        return _quantiles_from_counts(self._buckets, self._totals, self.count, qs, lo, hi)
+
+    def quantile(self, q: float) -> Optional[float]:
+        return self.quantiles([q])[0]
+
+    def percentiles(self, qs: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, Optional[float]]:
+        qs = list(qs)
+        return {f"p{q * 100:g}": v for q, v in zip(qs, self.quantiles(qs))}
+
+
+class _Histogram(StreamingHistogram):
+    """In-memory job duration histogram (bounded; see StreamingHistogram)."""
 
 
 class _Gauge:
@@ -71,6 +301,12 @@ class Metrics:
         self.worker_jobs_running = _Gauge()
         self.worker_jobs_stuck = _Gauge()
         self.worker_latest_heartbeat_age_ms = _Gauge()
+        self.worker_job_store_size = _Gauge()
+        self.worker_job_store_evictions_total = _Counter()
+        self.worker_job_store_expired_total = _Counter()
+        self.worker_pool_queue_depth = _Gauge()
+        self.worker_pool_in_flight = _Gauge()
+        self.worker_jobs_timed_out_total = _Counter()
 
 
 default_metrics = Metrics()
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import importlib
+import inspect
+import logging
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from backend.workers import metrics as _metrics
+from backend.workers.metrics import (
+    job_queue_depth,
+    job_queue_wait_seconds,
+    jobs_in_flight,
+)
+from backend.workers.runner import JobTimeoutError, run_job_async
+
+logger = logging.getLogger(__name__)
+
+EXECUTION_MODES = ("inline", "thread", "process")
+
+# Jobs that must run on the event loop thread (they schedule loop tasks).
+DEFAULT_PATH_MODES: Dict[str, str] = {
+    "backend.workers.tasks.worker_heartbeat": "inline",
+}
+
+
+def _invoke_path(job_path: str, args: List[Any], kwargs: Dict[str, Any]) -> Any:
+    """Process-pool entrypoint: resolve the job function in the child."""
+    module_path, fn = job_path.rsplit(".", 1)
+    return getattr(importlib.import_module(module_path), fn)(*args, **kwargs)
+
+
+def _parse_mapping(raw: Optional[str]) -> Dict[str, str]:
+    """Parse "a.b.fn=thread,c.d.fn=process" into a dict."""
+    mapping: Dict[str, str] = {}
+    for item in (raw or "").split(","):
+        if "=" not in item:
+            continue
+        key, value = item.split("=", 1)
+        mapping[key.strip()] = value.strip()
+    return mapping
+
+
+class PoolConfig:
+    """Worker pool settings.
+
+    mode is how sync job functions run: "thread" and "process" offload them
+    to an executor, "inline" calls them on the event loop (the legacy
+    behaviour). Coroutine job functions always run on the loop.
+    path_modes / path_timeouts override mode and timeout_seconds per job
+    path. queue_size bounds jobs waiting for a slot (default: concurrency);
+    submit() blocks when it is full.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = 4,
+        *,
+        mode: str = "thread",
+        path_modes: Optional[Dict[str, str]] = None,
+        timeout_seconds: Optional[float] = None,
+        path_timeouts: Optional[Dict[str, float]] = None,
+        queue_size: Optional[int] = None,
+        process_workers: Optional[int] = None,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        self.concurrency = concurrency
+        self.mode = mode
+        self.path_modes = {**DEFAULT_PATH_MODES, **(path_modes or {})}
+        self.timeout_seconds = timeout_seconds
+        self.path_timeouts = dict(path_timeouts or {})
+        self.queue_size = queue_size or concurrency
+        self.process_workers = process_workers or concurrency
+        for value in (self.mode, *self.path_modes.values()):
+            if value not in EXECUTION_MODES:
+                raise ValueError(
+                    f"unknown execution mode {value!r}; expected one of {EXECUTION_MODES}"
+                )
+
+    def mode_for(self, job_path: str) -> str:
+        return self.path_modes.get(job_path, self.mode)
+
+    def timeout_for(self, job_path: str) -> Optional[float]:
+        timeout = self.path_timeouts.get(job_path, self.timeout_seconds)
+        return timeout if timeout and timeout > 0 else None
+
+    @classmethod
+    def from_env(cls) -> Optional["PoolConfig"]:
+        """Build from WORKER_* env vars; None when WORKER_CONCURRENCY is unset or 0."""
+        concurrency = int(os.getenv("WORKER_CONCURRENCY", "0") or 0)
+        if concurrency <= 0:
+            return None
+        timeout = os.getenv("WORKER_JOB_TIMEOUT_SECONDS")
+        return cls(
+            concurrency,
+            mode=os.getenv("WORKER_EXECUTOR", "thread"),
+            path_modes=_parse_mapping(os.getenv("WORKER_EXECUTOR_PATHS")),
+            timeout_seconds=float(timeout) if timeout else None,
+            path_timeouts={
+                path: float(value)
+                for path, value in _parse_mapping(os.getenv("WORKER_JOB_TIMEOUTS")).items()
+            },
+            queue_size=int(os.getenv("WORKER_QUEUE_SIZE", "0") or 0) or None,
+        )
+
+
+class JobPool:
+    """Bounded concurrent job execution for the runner loops.
+
+    `concurrency` worker tasks consume a bounded queue of claimed jobs and
+    run them through run_job_async, so a slow job no longer blocks the
+    event loop or the jobs behind it. A timed-out job fails with
+    JobTimeoutError and goes through the normal retry path; note that a
+    thread or process that overran keeps running in the background until
+    it returns, because executors cannot interrupt a started call.
+    """
+
+    def __init__(self, config: Optional[PoolConfig] = None) -> None:
+        self.config = config or PoolConfig()
+        self.in_flight = 0
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def _start(self) -> None:
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.config.queue_size)
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"job-pool-{i}")
+            for i in range(self.config.concurrency)
+        ]
+
+    def _report(self) -> None:
+        depth = self.queue_depth
+        job_queue_depth.set(depth)
+        jobs_in_flight.set(self.in_flight)
+        _metrics.default_metrics.worker_pool_queue_depth.set(depth)
+        _metrics.default_metrics.worker_pool_in_flight.set(self.in_flight)
+
+    async def submit(self, job: Dict[str, Any], *, store: Optional[Any] = None) -> None:
+        """Queue a claimed job; waits while the queue is full (backpressure)."""
+        self._start()
+        await self._queue.put((job, store, time.monotonic()))
+        self._report()
+
+    async def join(self) -> None:
+        """Wait until every submitted job has finished."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Cancel idle workers and shut down the executors."""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        for pool in (self._thread_pool, self._process_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        self._thread_pool = self._process_pool = None
+        self._report()
+
+    async def _worker(self) -> None:
+        while True:
+            job, store, queued_at = await self._queue.get()
+            job_path = job.get("job_path") or "unknown"
+            job_queue_wait_seconds.labels(job_path=job_path).observe(
+                time.monotonic() - queued_at
+            )
+            self.in_flight += 1
+            self._report()
+            try:
+                await run_job_async(job, skip_claim=True, store=store, pool=self)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # terminal failures are already recorded by run_job_async
+                logger.exception(
+                    "job failed permanently", extra={"job_id": job.get("job_id")}
+                )
+            finally:
+                self.in_flight -= 1
+                self._queue.task_done()
+                self._report()
+
+    def _executor(self, mode: str) -> Executor:
+        if mode == "process":
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=self.config.process_workers
+                )
+            return self._process_pool
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=self.config.concurrency,
+                thread_name_prefix="job-pool",
+            )
+        return self._thread_pool
+
+    async def call(
+        self,
+        job_path: str,
+        func: Callable[..., Any],
+        args: List[Any],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """Run one job function per the configured mode and timeout."""
+        mode = self.config.mode_for(job_path)
+        timeout = self.config.timeout_for(job_path)
+        if inspect.iscoroutinefunction(func):
+            awaitable = func(*args, **kwargs)
+        elif mode == "inline":
+            result = func(*args, **kwargs)
+            if not inspect.isawaitable(result):
+                return result
+            awaitable = result
+        else:
+            loop = asyncio.get_running_loop()
+            if mode == "process":
+                awaitable = loop.run_in_executor(
+                    self._executor(mode), _invoke_path, job_path, list(args), dict(kwargs)
+                )
+            else:
+                awaitable = loop.run_in_executor(
+                    self._executor(mode), functools.partial(func, *args, **kwargs)
+                )
+        if timeout is None:
+            return await awaitable
+        try:
+            return await asyncio.wait_for(awaitable, timeout)
+        except asyncio.TimeoutError:
+            _metrics.default_metrics.worker_jobs_timed_out_total.inc()
+            raise JobTimeoutError(f"{job_path} timed out after {timeout}s") from None
@@ -5,15 +5,56 @@ import time
 from typing import Any, Dict, List, Optional, Tuple
 
 from redis.asyncio import Redis
-from redis.exceptions import WatchError
 
 
 def _now_ms() -> int:
     return int(time.time() * 1000)
 
 
+# KEYS[1] = job hash; ARGV[1] = updated_at (ms).
+# Returns 1 when the job was claimed, 0 when it is already running or done.
+_CLAIM_LUA = """
+local state = redis.call('HGET', KEYS[1], 'state')
+if state == 'running' or state == 'done' then
+    return 0
+end
+local bump = 1
+if state == 'retry_scheduled' then
+    bump = 0
+end
+redis.call('HINCRBY', KEYS[1], 'attempts', bump)
+redis.call('HSET', KEYS[1], 'state', 'running', 'updated_at', ARGV[1])
+return 1
+"""
+
+# KEYS[1] = retry zset; ARGV[1] = now (ms), ARGV[2] = job hash key prefix.
+# Pops every due retry and returns a flat [job_id, last_job, ...] list.
+# Job hashes are derived from the prefix, so this assumes a single Redis
+# node (or that the namespace shares one hash slot).
+_POP_DUE_RETRIES_LUA = """
+local due = redis.call('ZRANGEBYSCORE', KEYS[1], 0, ARGV[1])
+local out = {}
+for _, job_id in ipairs(due) do
+    local key = ARGV[2] .. job_id
+    local last_job = redis.call('HGET', key, 'last_job')
+    redis.call('HSET', key, 'next_retry_at', '')
+    redis.call('ZREM', KEYS[1], job_id)
+    if last_job then
+        out[#out + 1] = job_id
+        out[#out + 1] = last_job
+    end
+end
+return out
+"""
+
+
 class RedisJobStore:
-    """Async Redis-backed JobStore matching the in-memory interface."""
+    """Async Redis-backed JobStore matching the in-memory interface.
+
+    Every operation costs one round trip: claim and the due-retry pop run as
+    server-side Lua scripts (atomic, no WATCH retry loop), and multi-command
+    transitions are sent as a single MULTI/EXEC pipeline.
+    """
 
     def __init__(
         self,
@@ -32,41 +73,17 @@ class RedisJobStore:
             self._own_client = True
         self._namespace = namespace
         self._retry_zset = f"{namespace}:retry_zset"
+        self._claim_script = self._redis.register_script(_CLAIM_LUA)
+        self._pop_due_script = self._redis.register_script(_POP_DUE_RETRIES_LUA)
 
     def _job_key(self, job_id: str) -> str:
         return f"{self._namespace}:{job_id}"
 
     async def claim(self, job_id: str) -> bool:
-        now_ms = _now_ms()
-        hkey = self._job_key(job_id)
-        while True:
-            try:
-                async with self._redis.pipeline(transaction=True) as pipe:
-                    await pipe.watch(hkey)
-                    state = await pipe.hget(hkey, "state")
-                    attempts_raw = await pipe.hget(hkey, "attempts")
-
-                    if state in ("running", "done"):
-                        await pipe.reset()
-                        return False
-
-                    attempts_val = int(attempts_raw or 0)
-                    if state != "retry_scheduled":
-                        attempts_val += 1
-
-                    pipe.multi()
-                    pipe.hset(
-                        hkey,
-                        mapping={
-                            "state": "running",
-                            "attempts": attempts_val,
-                            "updated_at": now_ms,
-                        },
-                    )
-                    await pipe.execute()
-                    return True
-            except WatchError:
-                continue
+        claimed = await self._claim_script(
+            keys=[self._job_key(job_id)], args=[_now_ms()]
+        )
+        return bool(int(claimed))
 
     async def set_state(
         self,
@@ -77,10 +94,12 @@ class RedisJobStore:
         mapping: Dict[str, Any] = {"state": state, "updated_at": _now_ms()}
         if last_error is not None:
             mapping["last_error"] = last_error
-        if state != "retry_scheduled":
-            mapping["next_retry_at"] = ""
-            await self._redis.zrem(self._retry_zset, job_id)
-        await self._redis.hset(self._job_key(job_id), mapping=mapping)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            if state != "retry_scheduled":
+                mapping["next_retry_at"] = ""
+                pipe.zrem(self._retry_zset, job_id)
+            pipe.hset(self._job_key(job_id), mapping=mapping)
+            await pipe.execute()
 
     async def set_last_job(self, job_id: str, job: Dict) -> None:
         await self._redis.hset(
@@ -91,12 +110,11 @@ class RedisJobStore:
         return await self._redis.hget(self._job_key(job_id), "state")
 
     async def increment_attempts(self, job_id: str) -> int:
-        attempts = await self._redis.hincrby(
-            self._job_key(job_id), "attempts", 1
-        )
-        await self._redis.hset(
-            self._job_key(job_id), mapping={"updated_at": _now_ms()}
-        )
+        hkey = self._job_key(job_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.hincrby(hkey, "attempts", 1)
+            pipe.hset(hkey, mapping={"updated_at": _now_ms()})
+            attempts, _ = await pipe.execute()
         return int(attempts)
 
     async def schedule_retry(self, job_id: str, epoch_ms: float) -> None:
@@ -114,32 +132,22 @@ class RedisJobStore:
             await pipe.execute()
 
     async def next_retry_jobs(self, now_ms: float) -> List[Tuple[str, Dict]]:
-        members = await self._redis.zrangebyscore(
-            self._retry_zset, min=0, max=now_ms
+        flat = await self._pop_due_script(
+            keys=[self._retry_zset], args=[now_ms, f"{self._namespace}:"]
         )
-        jobs: List[Tuple[str, Dict]] = []
-        if not members:
-            return jobs
-
-        for job_id in members:
-            last_job_json = await self._redis.hget(
-                self._job_key(job_id), "last_job"
-            )
-            await self._redis.hset(
-                self._job_key(job_id), mapping={"next_retry_at": ""}
-            )
-            await self._redis.zrem(self._retry_zset, job_id)
-            if last_job_json:
-                jobs.append((job_id, json.loads(last_job_json)))
-        return jobs
+        return [
+            (flat[i], json.loads(flat[i + 1])) for i in range(0, len(flat), 2)
+        ]
 
     async def attempts(self, job_id: str) -> int:
         attempts = await self._redis.hget(self._job_key(job_id), "attempts")
         return int(attempts or 0)
 
     async def reset(self, job_id: str) -> None:
-        await self._redis.delete(self._job_key(job_id))
-        await self._redis.zrem(self._retry_zset, job_id)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(self._job_key(job_id))
+            pipe.zrem(self._retry_zset, job_id)
+            await pipe.execute()
 
     async def dump(self) -> Dict[str, Dict[str, Any]]:
         snapshot: Dict[str, Dict[str, Any]] = {}
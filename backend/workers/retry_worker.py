@@ -6,7 +6,7 @@ from typing import Any, Dict, Optional
 
 from backend.workers import job_store, metrics
 from backend.workers.redis_job_store import RedisJobStore
-from backend.workers.runner import run_job_async
+from backend.workers.runner import dispatch_claimed
 
 
 async def _maybe_await(value):
@@ -25,15 +25,31 @@ async def redis_retry_worker(
     poll_interval_ms: int = 0,
     shutdown_event: Optional[asyncio.Event] = None,
     loop: Optional[asyncio.AbstractEventLoop] = None,
+    pool: Optional[Any] = None,
 ) -> None:
     """Drain due retries from RedisJobStore and re-run them.
 
-    Stops when the retry set is drained or when cancelled.
+    Stops when the retry set is drained or when cancelled. With a JobPool
+    the retries run concurrently and are awaited before returning.
     """
 
     store = store or job_store.default_store
     loop = loop or asyncio.get_event_loop()
 
+    try:
+        await _drain_retries(store, loop, pool, poll_interval_ms, shutdown_event)
+    finally:
+        if pool is not None:
+            await pool.join()
+
+
+async def _drain_retries(
+    store: Any,
+    loop: asyncio.AbstractEventLoop,
+    pool: Optional[Any],
+    poll_interval_ms: int,
+    shutdown_event: Optional[asyncio.Event],
+) -> None:
     while True:
         if shutdown_event and shutdown_event.is_set():
             break
@@ -64,12 +80,7 @@ async def redis_retry_worker(
             attempts = await _maybe_await(store.attempts(job_id))
             job_copy["attempts"] = attempts
             metrics.default_metrics.worker_retry_triggered_total.inc()
-            await run_job_async(
-                job_copy,
-                loop=loop,
-                skip_claim=True,
-                store=store,
-            )
+            await dispatch_claimed(job_copy, store=store, loop=loop, pool=pool)
 
         if poll_interval_ms:
             try:
@@ -19,6 +19,10 @@ from backend.workers.job_store import default_store
 from backend.workers.retry_policy import default_retry
 
 
+class JobTimeoutError(asyncio.TimeoutError):
+    """A job exceeded its worker pool timeout."""
+
+
 def _build_job(
     job_path: str,
     job_id: Optional[str] = None,
@@ -47,10 +51,13 @@ async def run_job_async(
     loop: Optional[asyncio.AbstractEventLoop] = None,
     skip_claim: bool = False,
     store: Optional[Any] = None,
+    pool: Optional[Any] = None,
 ) -> Any:
     """Async runner for a job dict; emits lifecycle events.
 
     skip_claim is used by retry workers that have already claimed the job.
+    With a JobPool the job function runs through pool.call (executor
+    offload and timeout); without one it is called inline.
     """
 
     loop = loop or asyncio.get_event_loop()
@@ -99,8 +106,13 @@ async def run_job_async(
     module_path, fn = job_path.rsplit(".", 1)
     mod = importlib.import_module(module_path)
     try:
-        result = getattr(mod, fn)(*args, **kwargs)
+        func = getattr(mod, fn)
+        if pool is not None:
+            result = await pool.call(job_path, func, args, kwargs)
+        else:
+            result = func(*args, **kwargs)
     except Exception as exc:  # pragma: no cover - defensive capture
+        result_label = "timeout" if isinstance(exc, JobTimeoutError) else "error"
         ts_finished = int(time.time() * 1000)
         attempts_next = await _maybe_await(
             store_ref.increment_attempts(job_identifier)
@@ -110,10 +122,10 @@ async def run_job_async(
 
         duration = time.monotonic() - started_monotonic
         job_run_total.labels(
-            job_path=job_path_label, result="error"
+            job_path=job_path_label, result=result_label
         ).inc()
         job_run_duration_seconds.labels(
-            job_path=job_path_label, result="error"
+            job_path=job_path_label, result=result_label
         ).observe(duration)
 
         await broadcast_job_event(
@@ -221,12 +233,32 @@ async def runner_loop(
     store: Optional[Any] = None,
     poll_interval_ms: int = 500,
     loop: Optional[asyncio.AbstractEventLoop] = None,
+    pool: Optional[Any] = None,
 ) -> None:
-    """Poll retry queue and execute jobs until shutdown_event is set."""
+    """Poll retry queue and execute jobs until shutdown_event is set.
+
+    Without a pool each job is awaited before the next one starts. With a
+    JobPool claimed jobs are submitted to it (blocking while its queue is
+    full) and in-flight jobs are awaited before returning.
+    """
 
     store_ref = store or default_store
     loop = loop or asyncio.get_event_loop()
 
+    try:
+        await _poll_retries(store_ref, loop, pool, poll_interval_ms, shutdown_event)
+    finally:
+        if pool is not None:
+            await pool.join()
+
+
+async def _poll_retries(
+    store_ref: Any,
+    loop: asyncio.AbstractEventLoop,
+    pool: Optional[Any],
+    poll_interval_ms: int,
+    shutdown_event: Optional[asyncio.Event],
+) -> None:
     while True:
         if shutdown_event and shutdown_event.is_set():
             break
@@ -259,12 +291,22 @@ async def runner_loop(
 
             attempts_val = await _maybe_await(store_ref.attempts(job_id))
             job_copy["attempts"] = attempts_val
-            await run_job_async(
-                job_copy,
-                loop=loop,
-                skip_claim=True,
-                store=store_ref,
-            )
+            await dispatch_claimed(job_copy, store=store_ref, loop=loop, pool=pool)
+
+
+async def dispatch_claimed(
+    job: Dict[str, Any],
+    *,
+    store: Any,
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+    pool: Optional[Any] = None,
+) -> None:
+    """Run a claimed job now, or hand it to the pool when one is given."""
+
+    if pool is not None:
+        await pool.submit(job, store=store)
+        return
+    await run_job_async(job, loop=loop, skip_claim=True, store=store)
 
 
 def run_once(job: Dict[str, Any]) -> Any:
@@ -145,7 +145,8 @@ class Backtester:
         self,
         strategy: Strategy,
         data: pd.DataFrame,
-        symbol: str = "BTC/USDT"
+        symbol: str = "BTC/USDT",
+        vectorized: bool = False
     ) -> BacktestResult:
         """
         Run backtest on historical data
@@ -154,10 +155,15 @@ class Backtester:
             strategy: Trading strategy to test
             data: OHLC DataFrame with columns [open, high, low, close, volume, timestamp]
             symbol: Trading pair symbol
+            vectorized: Use run_vectorized() (array simulation, same results
+                within floating point tolerance)
         
         Returns:
             BacktestResult with performance metrics
         """
+        if vectorized:
+            return self.run_vectorized(strategy, data, symbol)
+
         logger.info(f"Running backtest for {strategy.name} on {symbol}")
         logger.info(f"Data range: {data.index[0]} to {data.index[-1]} ({len(data)} bars)")
         
@@ -276,6 +282,120 @@ class Backtester:
         
         return result
     
+    def run_vectorized(
+        self,
+        strategy: Strategy,
+        data: pd.DataFrame,
+        symbol: str = "BTC/USDT"
+    ) -> BacktestResult:
+        """
+        Array-based equivalent of the bar loop in run().
+        
+        The position state is the forward-filled last actionable signal, so
+        entries/exits fall out of its diff. Each round trip scales the balance
+        by a fixed factor, which makes the balance path a cumulative product
+        over trades; the equity curve is then gathered per bar from the trade
+        that is open (or was last closed) at that bar. Only the Trade list is
+        built in Python, at O(trades).
+        
+        Args:
+            strategy: Trading strategy whose generate_signals returns a Series
+            data: OHLC DataFrame with columns [open, high, low, close, volume]
+            symbol: Trading pair symbol
+        
+        Returns:
+            BacktestResult matching run() within floating point tolerance
+        """
+        logger.info(f"Running vectorized backtest for {strategy.name} on {symbol}")
+        
+        required_columns = ['open', 'high', 'low', 'close', 'volume']
+        if not all(col in data.columns for col in required_columns):
+            raise ValueError(f"Data must contain columns: {required_columns}")
+        
+        signals = np.asarray(strategy.generate_signals(data), dtype=np.float64)
+        close = data['close'].to_numpy(dtype=np.float64)
+        n = len(close)
+        idx = np.arange(n)
+        
+        # Position held after processing bar i: last buy/sell signal wins
+        # (a buy while long or a sell while flat is a no-op in the loop)
+        actionable = (signals == 1) | (signals == -1)
+        last_action = np.maximum.accumulate(np.where(actionable, idx, -1))
+        held_after = np.where(last_action >= 0, signals[np.maximum(last_action, 0)] == 1, False)
+        
+        # 95% of balance is spent; the loop only opens if balance covers cost + fee
+        entry_frac = 0.95 * (1 + self.slippage) * (1 + self.commission)
+        if entry_frac > 1.0:
+            held_after[:] = False
+        held_during = np.concatenate(([False], held_after[:-1]))  # state when equity is marked
+        
+        entries = np.flatnonzero(held_after & ~held_during)
+        exits = np.flatnonzero(~held_after & held_during)
+        forced_exit = len(exits) < len(entries)
+        if forced_exit:
+            exits = np.append(exits, n - 1)
+        
+        # Per-trade balance path
+        entry_close = close[entries]
+        exit_price = close[exits] * (1 - self.slippage)
+        buy_price = entry_close * (1 + self.slippage)
+        growth = (1 - entry_frac) + 0.95 * exit_price * (1 - self.commission) / entry_close
+        balance_after = self.initial_balance * np.cumprod(growth)
+        balance_before = np.concatenate(([self.initial_balance], balance_after[:-1]))
+        quantity = balance_before * 0.95 / entry_close
+        entry_cost = quantity * buy_price
+        balance_open = balance_before - entry_cost * (1 + self.commission)
+        exit_value = quantity * exit_price * (1 - self.commission)
+        
+        # Per-bar gather: open trade index while held, else closed-trade count
+        opened = np.cumsum(held_after & ~held_during)
+        trade_idx = opened - 1
+        closed_before = np.concatenate(([0], np.cumsum(~held_after & held_during)[:-1]))
+        flat_balance = np.where(
+            closed_before > 0,
+            balance_after[np.maximum(closed_before - 1, 0)] if len(balance_after) else self.initial_balance,
+            self.initial_balance,
+        )
+        safe_trade = np.clip(trade_idx, 0, max(len(entries) - 1, 0))
+        if len(entries):
+            unrealized = (close - buy_price[safe_trade]) * quantity[safe_trade]
+            open_balance = balance_open[safe_trade]
+        else:
+            unrealized = np.zeros(n)
+            open_balance = flat_balance
+        position_value = np.where(held_during, unrealized, 0.0)
+        balance_curve = np.where(held_during, open_balance, flat_balance)
+        
+        equity_df = pd.DataFrame({
+            'timestamp': data.index,
+            'balance': balance_curve,
+            'position_value': position_value,
+            'total_equity': balance_curve + position_value,
+        })
+        
+        timestamps = data.index
+        trades: List[Trade] = []
+        for k in range(len(entries)):
+            trades.append(Trade(
+                timestamp=timestamps[entries[k]],
+                symbol=symbol,
+                side='buy',
+                quantity=float(quantity[k]),
+                price=float(buy_price[k]),
+                value=float(entry_cost[k] * (1 + self.commission))
+            ))
+            trades.append(Trade(
+                timestamp=timestamps[exits[k]],
+                symbol=symbol,
+                side='sell',
+                quantity=float(quantity[k]),
+                price=float(exit_price[k]),
+                value=float(exit_value[k])
+            ))
+        
+        final_balance = float(balance_after[-1]) if len(balance_after) else self.initial_balance
+        return self._calculate_metrics(equity_df, trades, self.initial_balance, final_balance)
+    
     def _calculate_metrics(
         self,
         equity_df: pd.DataFrame,
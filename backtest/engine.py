@@ -1,11 +1,13 @@
 """Backtesting engine for simulating strategy execution against historical data."""
 
 import pandas as pd
-from typing import Dict, Any, List, Callable, Optional
+from typing import Dict, Any, Iterable, List, Callable, Optional, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 
+from backtest.replay import merge_candle_streams
+
 
 @dataclass
 class Position:
@@ -413,3 +415,124 @@ class BacktestEngine:
         # Annualized Sharpe (assuming daily data, scale by sqrt(365))
         sharpe = (mean_return / std_return) * np.sqrt(365)
         return sharpe
+
+
+PortfolioStrategy = Callable[[str, Dict[str, Any], MockConnector], Optional[Dict[str, Any]]]
+
+
+class PortfolioBacktestEngine(BacktestEngine):
+    """Backtest several symbols in one pass against a shared account.
+    
+    Candle streams are merged by timestamp (heap-based k-way merge), each event
+    is routed to its symbol's strategy, and all orders hit one MockConnector so
+    capital is genuinely shared. Portfolio equity is kept up to date
+    incrementally: an event only re-marks its own symbol, so the per-event cost
+    stays O(log N) for N symbols instead of revaluing the whole book.
+    """
+    
+    def __init__(self, initial_capital: float = 10000.0):
+        super().__init__(initial_capital)
+        self.last_prices: Dict[str, float] = {}
+        self._marks: Dict[str, float] = {}
+        self._marked_total = 0.0
+        self._remarks = 0
+    
+    def run_portfolio(
+        self,
+        streams: Dict[str, Iterable[Dict[str, Any]]],
+        strategy_func: Union[PortfolioStrategy, Dict[str, PortfolioStrategy]],
+    ) -> BacktestResult:
+        """Run a portfolio backtest.
+        
+        Args:
+            streams: Mapping of symbol (e.g. "BTC/USDT") -> candle dicts sorted
+                     oldest to newest, each with "timestamp" and "close"
+            strategy_func: Callable (symbol, candle, connector) returning an
+                          order dict {"side", "quantity"} or None, either shared
+                          by all symbols or given per symbol in a dict
+            
+        Returns:
+            BacktestResult; the equity curve has one point per timestamp
+        """
+        self.connector = MockConnector(self.initial_capital)
+        self.trades = []
+        self.equity_curve = []
+        self.last_prices = {}
+        self._marks = {}
+        self._marked_total = 0.0
+        self._remarks = 0
+        
+        current_ts = None
+        for symbol, candle in merge_candle_streams(streams):
+            timestamp = candle["timestamp"]
+            if current_ts is not None and timestamp != current_ts:
+                self._record_equity(current_ts)
+            current_ts = timestamp
+            
+            price = float(candle["close"])
+            self.last_prices[symbol] = price
+            self._remark(symbol)
+            
+            func = strategy_func.get(symbol) if isinstance(strategy_func, dict) else strategy_func
+            signal = func(symbol, candle, self.connector) if func is not None else None
+            if signal:
+                side = signal.get("side")
+                quantity = signal.get("quantity", 0.0)
+                if side and quantity > 0:
+                    trade = self.connector.execute_trade(
+                        symbol=symbol,
+                        side=side,
+                        price=price,
+                        quantity=quantity,
+                        timestamp=_as_datetime(timestamp),
+                    )
+                    self._remark(symbol)
+                    if trade:
+                        self.trades.append(trade)
+        
+        if current_ts is not None:
+            self._record_equity(current_ts)
+        return self._calculate_results()
+    
+    def current_equity(self) -> float:
+        """Shared-account equity at the latest prices (incremental equivalent of
+        connector.get_total_equity(self.last_prices))."""
+        return self.connector.balance.get("USDT", 0) + self._marked_total
+    
+    def _symbol_value(self, symbol: str) -> float:
+        """Contribution of one symbol to get_total_equity at its last price."""
+        price = self.last_prices.get(symbol)
+        if price is None:
+            return 0.0
+        pos = self.connector.positions.get(symbol)
+        if pos is not None:
+            return pos.quantity * price if pos.side == "buy" else pos.unrealized_pnl(price)
+        amount = self.connector.balance.get(symbol.split("/")[0], 0)
+        return amount * price if amount > 0 else 0.0
+    
+    def _remark(self, symbol: str) -> None:
+        value = self._symbol_value(symbol)
+        self._marked_total += value - self._marks.get(symbol, 0.0)
+        self._marks[symbol] = value
+        # Re-sum once per len(marks) updates (amortised O(1)) to stop drift
+        self._remarks += 1
+        if self._remarks >= len(self._marks):
+            self._marked_total = sum(self._marks.values())
+            self._remarks = 0
+    
+    def _record_equity(self, timestamp: Any) -> None:
+        self.equity_curve.append({
+            "timestamp": timestamp.isoformat() if isinstance(timestamp, (pd.Timestamp, datetime)) else str(timestamp),
+            "equity": self.current_equity(),
+            "prices": dict(self.last_prices),
+        })
+
+
+def _as_datetime(timestamp: Any) -> datetime:
+    """Trades carry datetimes (BacktestResult.to_dict calls isoformat)."""
+    if isinstance(timestamp, datetime):
+        return timestamp
+    text = str(timestamp)
+    if text.isdigit():
+        return pd.to_datetime(int(text), unit="ms").to_pydatetime()
+    return pd.Timestamp(text).to_pydatetime()
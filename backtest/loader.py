@@ -1,9 +1,188 @@
 """Data loader for historical candle CSV files."""
 import csv
-from typing import List, Optional
+import hashlib
+import json
+import os
+from typing import List, Optional, Union
 
+import numpy as np
 
-def load_candles(filepath: str) -> List[dict]:
+CANDLE_FIELDS = ("timestamp", "open", "high", "low", "close", "volume")
+PRICE_FIELDS = CANDLE_FIELDS[1:]
+
+# Sidecar cache directory written next to the CSV: <file>.npcache/
+CACHE_SUFFIX = ".npcache"
+CACHE_VERSION = 1
+
+
+class CandleFrame:
+    """
+    Columnar candle storage: one NumPy array per field.
+
+    Prices and volume are float64 arrays, timestamps a fixed-width unicode
+    array sorted oldest to newest. Arrays loaded from the sidecar cache are
+    read-only memory maps, so slices are views and cost no copies.
+    """
+
+    __slots__ = CANDLE_FIELDS
+
+    def __init__(self, timestamp, open, high, low, close, volume):
+        self.timestamp = timestamp
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
+
+    def __len__(self) -> int:
+        return int(self.timestamp.shape[0])
+
+    def __getitem__(self, key):
+        """Integer index returns a candle dict; a slice returns a CandleFrame view."""
+        if isinstance(key, slice):
+            return CandleFrame(*(getattr(self, name)[key] for name in CANDLE_FIELDS))
+        candle = {"timestamp": str(self.timestamp[key])}
+        for name in PRICE_FIELDS:
+            candle[name] = float(getattr(self, name)[key])
+        return candle
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_dicts(self) -> List[dict]:
+        """Materialize the frame as the list-of-dicts format returned by load_candles."""
+        columns = [self.timestamp.tolist()] + [getattr(self, name).tolist() for name in PRICE_FIELDS]
+        return [dict(zip(CANDLE_FIELDS, row)) for row in zip(*columns)]
+
+    def slice_by_range(self, start_ts: Optional[str] = None, end_ts: Optional[str] = None) -> "CandleFrame":
+        """Binary-search the sorted timestamp column; returns a view."""
+        lo = 0 if start_ts is None else int(np.searchsorted(self.timestamp, start_ts, side="left"))
+        hi = len(self) if end_ts is None else int(np.searchsorted(self.timestamp, end_ts, side="right"))
+        return self[lo:max(lo, hi)]
+
+
+def _file_digest(filepath: str) -> str:
+    digest = hashlib.sha256()
+    with open(filepath, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _read_cache(cache_dir: str, stat: os.stat_result, filepath: str) -> Optional[CandleFrame]:
+    """
+    Return the cached frame when it matches the CSV, else None.
+
+    mtime and size are checked first; if they changed, the content hash decides
+    (a touched but identical file keeps its cache and the meta is refreshed).
+    """
+    meta_path = os.path.join(cache_dir, "meta.json")
+    try:
+        with open(meta_path, "r") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if meta.get("version") != CACHE_VERSION:
+        return None
+    if meta.get("mtime_ns") != stat.st_mtime_ns or meta.get("size") != stat.st_size:
+        if meta.get("sha256") != _file_digest(filepath):
+            return None
+        meta["mtime_ns"] = stat.st_mtime_ns
+        meta["size"] = stat.st_size
+        try:
+            with open(meta_path, "w") as f:
+                json.dump(meta, f)
+        except OSError:
+            pass
+    try:
+        columns = [np.load(os.path.join(cache_dir, f"{name}.npy"), mmap_mode="r") for name in CANDLE_FIELDS]
+    except (OSError, ValueError):
+        return None
+    return CandleFrame(*columns)
+
+
+def _write_cache(cache_dir: str, stat: os.stat_result, filepath: str, frame: CandleFrame) -> None:
+    """Best effort: an unwritable data directory just means no cache."""
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        for name in CANDLE_FIELDS:
+            np.save(os.path.join(cache_dir, f"{name}.npy"), getattr(frame, name))
+        meta = {
+            "version": CACHE_VERSION,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": _file_digest(filepath),
+            "rows": len(frame),
+        }
+        # meta.json is written last so a partially written cache is never trusted
+        with open(os.path.join(cache_dir, "meta.json"), "w") as f:
+            json.dump(meta, f)
+    except OSError:
+        pass
+
+
+def _parse_csv_columns(filepath: str) -> CandleFrame:
+    columns = {name: [] for name in CANDLE_FIELDS}
+    with open(filepath, 'r') as f:
+        first_line = f.readline()
+        f.seek(0)
+        has_headers = 'timestamp' in first_line.lower() or 'open' in first_line.lower()
+        reader = csv.reader(f)
+        if has_headers:
+            header = next(reader)
+            indices = [header.index(name) for name in CANDLE_FIELDS]
+            min_len = 0
+        else:
+            # Headerless Binance Kline format
+            indices = list(range(len(CANDLE_FIELDS)))
+            min_len = len(CANDLE_FIELDS)
+        targets = [columns[name] for name in CANDLE_FIELDS]
+        for row in reader:
+            if len(row) < min_len or not row:
+                continue
+            for target, idx in zip(targets, indices):
+                target.append(row[idx])
+
+    timestamps = np.array(columns["timestamp"], dtype=str)
+    order = np.argsort(timestamps, kind="stable")
+    prices = [np.array(columns[name], dtype=np.float64)[order] for name in PRICE_FIELDS]
+    return CandleFrame(timestamps[order], *prices)
+
+
+def load_candle_frame(filepath: str, cache: bool = True) -> CandleFrame:
+    """
+    Load historical candles into a columnar CandleFrame.
+
+    Args:
+        filepath: CSV path, same formats as load_candles
+        cache: Read/write the memory-mapped <file>.npcache/ sidecar keyed by the
+            CSV's mtime, size and SHA-256, so repeat loads skip CSV parsing
+
+    Returns:
+        CandleFrame sorted oldest to newest by timestamp
+
+    Raises:
+        ValueError: If file missing or CSV parsing error
+    """
+    try:
+        stat = os.stat(filepath)
+        cache_dir = filepath + CACHE_SUFFIX
+        if cache:
+            frame = _read_cache(cache_dir, stat, filepath)
+            if frame is not None:
+                return frame
+        frame = _parse_csv_columns(filepath)
+        if cache:
+            _write_cache(cache_dir, stat, filepath, frame)
+        return frame
+    except FileNotFoundError:
+        raise ValueError(f"Failed to load candles: file not found - {filepath}")
+    except (IndexError, ValueError, TypeError) as e:
+        raise ValueError(f"Failed to load candles: parse error - {e}")
+
+
+def load_candles(filepath: str, cache: bool = False) -> List[dict]:
     """
     Load historical candles from CSV file.
     
@@ -15,10 +194,13 @@ def load_candles(filepath: str) -> List[dict]:
         List of candle dicts sorted oldest to newest by timestamp.
         Each dict contains: {"timestamp": str, "open": float, "high": float, 
                             "low": float, "close": float, "volume": float}
+        With cache=True the rows come from load_candle_frame and its sidecar cache.
     
     Raises:
         ValueError: If file missing or CSV parsing error
     """
+    if cache:
+        return load_candle_frame(filepath, cache=True).to_dicts()
     try:
         candles = []
         with open(filepath, 'r') as f:
@@ -65,19 +247,26 @@ def load_candles(filepath: str) -> List[dict]:
         raise ValueError(f"Failed to load candles: parse error - {e}")
 
 
-def slice_by_range(candles: List[dict], start_ts: Optional[str] = None, 
-                   end_ts: Optional[str] = None) -> List[dict]:
+def slice_by_range(candles: Union[List[dict], CandleFrame], start_ts: Optional[str] = None, 
+                   end_ts: Optional[str] = None) -> Union[List[dict], CandleFrame]:
     """
     Filter candles by timestamp range.
     
+    A CandleFrame is sorted by construction and is binary-searched; a list
+    may come from any caller in any order, so it is filtered row by row.
+    
     Args:
-        candles: List of candle dicts with "timestamp" key
+        candles: List of candle dicts with "timestamp" key, or a CandleFrame
         start_ts: If provided, return only rows with timestamp >= start_ts
         end_ts: If provided, return only rows with timestamp <= end_ts
         
     Returns:
-        Filtered list maintaining chronological order. Does not mutate original.
+        Filtered list keeping the input order (a CandleFrame view for
+        CandleFrame input). Does not mutate original.
     """
+    if isinstance(candles, CandleFrame):
+        return candles.slice_by_range(start_ts, end_ts)
+
     result = []
     for candle in candles:
         ts = candle.get("timestamp", "")
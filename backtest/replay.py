@@ -1,5 +1,6 @@
 """Replay engine for feeding historical candles sequentially."""
-from typing import List, Callable, Optional
+import heapq
+from typing import Dict, Iterable, Iterator, List, Callable, Optional, Tuple
 
 
 class ReplayEngine:
@@ -9,26 +10,41 @@ class ReplayEngine:
     No threading, no sleeping, no concurrency. Pure deterministic iteration.
     """
     
-    def __init__(self, candles: List[dict], tick_callback: Optional[Callable[[dict], None]] = None):
+    def __init__(self, candles: List[dict], tick_callback: Optional[Callable[[dict], None]] = None,
+                 stop_condition: Optional[Callable[[int, dict], bool]] = None):
         """
         Initialize replay engine.
         
         Args:
             candles: List of candle dicts ordered oldest to newest
             tick_callback: Optional callback function called once per candle with the candle dict
+            stop_condition: Optional cooperative hook called as stop_condition(index, candle)
+                            after each tick; returning True ends the replay early
         """
         self.candles = candles
         self.tick_callback = tick_callback
+        self.stop_condition = stop_condition
+        # index of the last candle replayed when stop_condition ended the run
+        self.stopped_at: Optional[int] = None
     
     def run(self) -> None:
         """
         Iterate through all candles and call tick_callback(candle) for each sequentially.
         """
+        self.stopped_at = None
         if self.tick_callback is None:
             return
-            
-        for candle in self.candles:
+        
+        stop = self.stop_condition
+        if stop is None:
+            for candle in self.candles:
+                self.tick_callback(candle)
+            return
+        for i, candle in enumerate(self.candles):
             self.tick_callback(candle)
+            if stop(i, candle):
+                self.stopped_at = i
+                return
     
     def run_from_to(self, start_idx: int, end_idx: int) -> None:
         """
@@ -38,12 +54,41 @@ class ReplayEngine:
             start_idx: Starting index (inclusive)
             end_idx: Ending index (inclusive)
         """
+        self.stopped_at = None
         if self.tick_callback is None:
             return
             
         for i in range(start_idx, end_idx + 1):
             if 0 <= i < len(self.candles):
                 self.tick_callback(self.candles[i])
+                if self.stop_condition is not None and self.stop_condition(i, self.candles[i]):
+                    self.stopped_at = i
+                    return
+
+
+def merge_candle_streams(streams: Dict[str, Iterable[dict]]) -> Iterator[Tuple[str, dict]]:
+    """
+    K-way merge of per-symbol candle streams into one timestamp-ordered stream.
+    
+    Each stream must already be sorted oldest to newest (as returned by
+    load_candles). A heap holds one pending candle per symbol, so each event
+    costs O(log N) for N symbols and streams are consumed lazily. Ties on
+    timestamp are broken by the symbol order of `streams`, then by position
+    within the stream, which keeps replays deterministic.
+    
+    Args:
+        streams: Mapping of symbol -> iterable of candle dicts with "timestamp"
+        
+    Yields:
+        (symbol, candle) pairs ordered by candle["timestamp"]
+    """
+    def tagged(order: int, symbol: str, candles: Iterable[dict]):
+        for seq, candle in enumerate(candles):
+            yield candle["timestamp"], order, seq, symbol, candle
+    
+    iterables = [tagged(order, symbol, candles) for order, (symbol, candles) in enumerate(streams.items())]
+    for _, _, _, symbol, candle in heapq.merge(*iterables):
+        yield symbol, candle
 
 
 def create_brain_adapter(brain: object, executor: object) -> Callable[[dict], None]:
@@ -0,0 +1 @@
+"""Throughput benchmarks; run with `python -m benchmarks.run`."""
@@ -0,0 +1,136 @@
+"""
+Timing, result files and regression comparison for the benchmark suite.
+
+A result is a plain dict:
+    {"name": "backtest.replay", "metric": "candles_per_sec", "value": 12345.6,
+     "higher_is_better": True, "params": {...}}
+Result files wrap a list of them with run metadata and are written as JSON
+under artifacts/benchmarks/.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+DEFAULT_OUTPUT_DIR = Path("artifacts") / "benchmarks"
+BASELINE_NAME = "baseline.json"
+DEFAULT_THRESHOLD = 0.15
+
+
+def time_call(fn: Callable[[], Any], repeat: int = 5, min_time: float = 0.0) -> float:
+    """
+    Best-of-`repeat` wall time of one fn() call, in seconds.
+
+    With min_time > 0 each sample loops fn() until at least min_time has
+    elapsed and reports the per-call average, which keeps very short calls
+    above timer resolution.
+    """
+    samples = []
+    for _ in range(max(1, repeat)):
+        calls = 0
+        start = time.perf_counter()
+        while True:
+            fn()
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        samples.append(elapsed / calls)
+    return min(samples)
+
+
+def result(name: str, metric: str, value: float, higher_is_better: bool = True, **params: Any) -> Dict[str, Any]:
+    return {
+        "name": name,
+        "metric": metric,
+        "value": float(value),
+        "higher_is_better": higher_is_better,
+        "params": params,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def build_report(results: List[Dict[str, Any]], **meta: Any) -> Dict[str, Any]:
+    return {
+        "timestamp": datetime.now().strftime("%Y%m%d_%H%M%S"),
+        "git_commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        **meta,
+        "results": results,
+    }
+
+
+def write_report(report: Dict[str, Any], output_dir: Union[str, Path] = DEFAULT_OUTPUT_DIR,
+                 filename: Optional[str] = None) -> Path:
+    """Write `report` as bench_<timestamp>.json (or `filename`) under output_dir."""
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / (filename or f"bench_{report['timestamp']}.json")
+    tmp_path = path.with_suffix(".json.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(report, f, indent=2)
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_report(path: Union[str, Path]) -> Dict[str, Any]:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def compare_reports(current: Dict[str, Any], baseline: Dict[str, Any],
+                    threshold: float = DEFAULT_THRESHOLD) -> List[Dict[str, Any]]:
+    """
+    Compare results by name.
+
+    Each row has the baseline/current values, the change (positive = better
+    regardless of metric direction) and a "regression" flag set when the
+    change is worse than -threshold. Results missing from either side are
+    skipped.
+    """
+    base = {r["name"]: r for r in baseline.get("results", [])}
+    rows = []
+    for r in current.get("results", []):
+        b = base.get(r["name"])
+        if b is None or b["value"] <= 0 or r["value"] <= 0:
+            continue
+        if r.get("higher_is_better", True):
+            change = r["value"] / b["value"] - 1.0
+        else:
+            change = b["value"] / r["value"] - 1.0
+        rows.append({
+            "name": r["name"],
+            "metric": r["metric"],
+            "baseline": b["value"],
+            "current": r["value"],
+            "change": change,
+            "regression": change < -threshold,
+        })
+    return rows
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    lines = [f"{'benchmark':<44} {'baseline':>14} {'current':>14} {'change':>8}"]
+    for row in rows:
+        flag = "  REGRESSION" if row["regression"] else ""
+        lines.append(
+            f"{row['name']:<44} {row['baseline']:>14.4g} {row['current']:>14.4g} {row['change']:>+8.1%}{flag}"
+        )
+    return "\n".join(lines)
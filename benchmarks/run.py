@@ -0,0 +1,589 @@
+"""
+Throughput benchmarks for the backtest, indicator, optimizer, job store,
+execution engine, order routing and news classification hot paths.
+
+Usage:
+    python -m benchmarks.run                       # full suite
+    python -m benchmarks.run --quick               # smaller inputs, for CI smoke runs
+    python -m benchmarks.run --only backtest --only loader
+    python -m benchmarks.run --save-baseline       # also store as artifacts/benchmarks/baseline.json
+    python -m benchmarks.run --compare             # flag regressions against the saved baseline
+    python -m benchmarks.run --results a.json --compare b.json   # compare two files, no run
+
+Results are written to artifacts/benchmarks/bench_<timestamp>.json. Inputs
+are a seeded synthetic random walk, so runs on the same machine are
+comparable. Exit status is 1 when --compare finds a regression.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import logging
+import math
+import random
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from backtest.executor import BacktestExecutor
+from backtest.loader import load_candle_frame, load_candles
+from backtest.replay import ReplayEngine
+from benchmarks.harness import (
+    BASELINE_NAME,
+    DEFAULT_OUTPUT_DIR,
+    DEFAULT_THRESHOLD,
+    build_report,
+    compare_reports,
+    format_comparison,
+    load_report,
+    result,
+    time_call,
+    write_report,
+)
+from worker.executor.account import VirtualAccount
+from worker.indicators import ATR, EMA, MACD, RSI, SMA
+from worker.strategies.ai_fusion import AIFusionStrategy
+
+
+@dataclass
+class BenchContext:
+    """Inputs shared by the suites."""
+    candles: List[dict]
+    csv_path: Path
+    quick: bool
+    repeat: int
+    workers: int
+
+
+def synthetic_candles(n: int, seed: int = 7) -> List[dict]:
+    """Seeded hourly random walk with a slow cycle, in load_candles' dict format."""
+    rng = random.Random(seed)
+    candles = []
+    price = 100.0
+    for i in range(n):
+        open_ = price
+        price = max(1.0, price * (1.0 + rng.gauss(0.0, 0.004)) + 0.05 * math.sin(i / 50.0))
+        high = max(open_, price) * (1.0 + abs(rng.gauss(0.0, 0.002)))
+        low = min(open_, price) * (1.0 - abs(rng.gauss(0.0, 0.002)))
+        candles.append({
+            "timestamp": f"{1704067200000 + i * 3600000}",
+            "open": round(open_, 6),
+            "high": round(high, 6),
+            "low": round(low, 6),
+            "close": round(price, 6),
+            "volume": round(rng.uniform(10.0, 1000.0), 3),
+        })
+    return candles
+
+
+def write_csv(candles: List[dict], path: Path) -> Path:
+    with open(path, "w") as f:
+        f.write("timestamp,open,high,low,close,volume\n")
+        for c in candles:
+            f.write(f"{c['timestamp']},{c['open']},{c['high']},{c['low']},{c['close']},{c['volume']}\n")
+    return path
+
+
+# ——————————————————————————
+# Suites
+# ——————————————————————————
+def bench_backtest(ctx: BenchContext) -> List[Dict[str, Any]]:
+    """Candles/sec through ReplayEngine + BacktestExecutor + AIFusionStrategy."""
+    candles = ctx.candles
+
+    def run():
+        account = VirtualAccount(starting_balance=10000.0)
+        executor = BacktestExecutor(account, AIFusionStrategy())
+        ReplayEngine(candles, executor.process_candle).run()
+
+    seconds = time_call(run, repeat=ctx.repeat)
+    return [result("backtest.replay", "candles_per_sec", len(candles) / seconds, candles=len(candles))]
+
+
+def bench_indicators(ctx: BenchContext) -> List[Dict[str, Any]]:
+    """Per-call calculate() cost as the history passed in grows."""
+    lengths = (50, 200, 1000) if ctx.quick else (50, 200, 1000, 5000)
+    candles = synthetic_candles(max(lengths), seed=11)
+    closes = [c["close"] for c in candles]
+    cases: Dict[str, Callable[[int], Callable[[], Any]]] = {
+        "SMA": lambda n: (lambda h=closes[:n]: SMA().calculate(h, 20)),
+        "EMA": lambda n: (lambda h=closes[:n]: EMA().calculate(h, 20)),
+        "RSI": lambda n: (lambda h=closes[:n]: RSI().calculate(h, 14)),
+        "MACD": lambda n: (lambda h=closes[:n]: MACD().calculate(h, 12, 26, 9)),
+        "ATR": lambda n: (lambda h=candles[:n]: ATR().calculate(h, 14)),
+    }
+    results = []
+    for name, make in cases.items():
+        for n in lengths:
+            seconds = time_call(make(n), repeat=ctx.repeat, min_time=0.01)
+            results.append(result(f"indicators.{name}.calculate.n={n}", "us_per_call", seconds * 1e6,
+                                  higher_is_better=False, history=n))
+    return results
+
+
+def bench_loader(ctx: BenchContext) -> List[Dict[str, Any]]:
+    """load_candles CSV parse rate, and the cached CandleFrame path for reference."""
+    size_mb = ctx.csv_path.stat().st_size / 1e6
+    parse = time_call(lambda: load_candles(str(ctx.csv_path)), repeat=ctx.repeat)
+    load_candle_frame(str(ctx.csv_path))  # build the sidecar cache once
+    cached = time_call(lambda: load_candle_frame(str(ctx.csv_path)), repeat=ctx.repeat)
+    return [
+        result("loader.load_candles", "mb_per_sec", size_mb / parse, mb=round(size_mb, 3)),
+        result("loader.load_candle_frame.cached", "mb_per_sec", size_mb / cached, mb=round(size_mb, 3)),
+    ]
+
+
+def bench_optimizer(ctx: BenchContext) -> List[Dict[str, Any]]:
+    """Genomes backtested per second by run_ga (cache misses only)."""
+    from optimizer.fitness_cache import FitnessCache, dataset_fingerprint
+    from optimizer.genetic_optimizer import run_ga
+
+    candles = ctx.candles[:1000] if ctx.quick else ctx.candles[:5000]
+    pop, gens = (6, 1) if ctx.quick else (12, 2)
+    best = None
+    for _ in range(max(1, ctx.repeat // 2)):
+        cache = FitnessCache(dataset_fingerprint(candles))
+        with contextlib.redirect_stdout(io.StringIO()):
+            seconds = time_call(
+                lambda: run_ga(candles, pop_size=pop, generations=gens, seed=1, workers=ctx.workers, cache=cache),
+                repeat=1,
+            )
+        rate = cache.misses / seconds
+        best = rate if best is None else max(best, rate)
+    return [result("optimizer.run_ga", "genomes_per_sec", best, candles=len(candles), pop=pop,
+                   generations=gens, workers=ctx.workers)]
+
+
+def bench_job_store(ctx: BenchContext) -> List[Dict[str, Any]]:
+    """
+    Redis round trips per job for RedisJobStore, against fakeredis with a
+    simulated network round trip.
+
+    "lifecycle" is one job failing once and succeeding on retry (enqueue,
+    claim, fail, schedule retry, claim again, done); "next_retry_jobs" is a
+    batch of due retries popped together.
+    """
+    import fakeredis.aioredis
+    
+    from backend.workers.redis_job_store import RedisJobStore
+
+    rtt = 0.0002
+    jobs = 50 if ctx.quick else 200
+    counter = {"round_trips": 0}
+
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+    class CountingConnection(client.connection_pool.connection_class):
+        async def send_packed_command(self, command, check_health=True):
+            counter["round_trips"] += 1
+            await asyncio.sleep(rtt)
+            return await super().send_packed_command(command, check_health)
+
+    async def lifecycle(store: RedisJobStore, job_ids: List[str]) -> None:
+        for job_id in job_ids:
+            await store.set_state(job_id, "enqueued")
+            await store.set_last_job(job_id, {"job_path": "bench.noop", "job_id": job_id})
+            await store.claim(job_id)
+            await store.set_state(job_id, "error", last_error="boom")
+            await store.schedule_retry(job_id, 0)
+        for job_id, _ in await store.next_retry_jobs(time.time() * 1000):
+            await store.claim(job_id)
+            await store.set_state(job_id, "done")
+
+    async def pop_due(store: RedisJobStore, job_ids: List[str]) -> int:
+        for job_id in job_ids:
+            await store.set_last_job(job_id, {"job_path": "bench.noop", "job_id": job_id})
+            await store.schedule_retry(job_id, 0)
+        counter["round_trips"] = 0
+        return len(await store.next_retry_jobs(time.time() * 1000))
+
+    async def run() -> Dict[str, float]:
+        client.connection_pool.connection_class = CountingConnection
+        store = RedisJobStore(client=client, namespace="bench")
+        await store.claim("warmup")  # load the Lua scripts outside the measurement
+
+        counter["round_trips"] = 0
+        start = time.perf_counter()
+        await lifecycle(store, [f"life-{i}" for i in range(jobs)])
+        elapsed = time.perf_counter() - start
+        lifecycle_trips = counter["round_trips"]
+
+        popped = await pop_due(store, [f"due-{i}" for i in range(jobs)])
+        pop_trips = counter["round_trips"]
+        await client.aclose()
+        return {
+            "lifecycle_rt": lifecycle_trips / jobs,
+            "lifecycle_rate": jobs / elapsed,
+            "pop_rt": pop_trips / max(1, popped),
+        }
+
+    stats = asyncio.run(run())
+    return [
+        result("job_store.redis.lifecycle", "round_trips_per_job", stats["lifecycle_rt"],
+               higher_is_better=False, jobs=jobs),
+        result("job_store.redis.lifecycle.rtt=0.2ms", "jobs_per_sec", stats["lifecycle_rate"],
+               jobs=jobs, rtt_ms=rtt * 1000),
+        result("job_store.redis.next_retry_jobs", "round_trips_per_job", stats["pop_rt"],
+               higher_is_better=False, batch=jobs),
+    ]
+
+
+def bench_engines(ctx: BenchContext) -> List[Dict[str, Any]]:
+    """
+    ExecutionConsciousnessLayer: observe_ens_state + get_consciousness_report
+    per second, with the 500-state memory already full.
+    """
+    from backend.engines.execution.ExecutionConsciousnessLayer import ExecutionConsciousnessLayer
+    from backend.engines.execution.ExecutionNervousSystem import (
+        ExecutionNervousSystem,
+        UnifiedState,
+    )
+
+    rng = random.Random(5)
+    states = [
+        UnifiedState(
+            aggregated_confidence=rng.uniform(40, 90),
+            stability_score=rng.uniform(40, 90),
+            aggression_score=rng.uniform(20, 60),
+            consensus_level=rng.uniform(50, 95),
+            active_signals=[],
+            conflicting_signals=[],
+            processing_latency=rng.uniform(1, 20),
+        )
+        for _ in range(1000)
+    ]
+    layer = ExecutionConsciousnessLayer(ens=ExecutionNervousSystem())
+    for state in states[:500]:
+        layer.observe_ens_state(state)
+    stream = iter(states * 1000)
+
+    def step():
+        layer.observe_ens_state(next(stream))
+        layer.get_consciousness_report()
+
+    # the layer logs every report and each anomaly it finds
+    engine_logger = logging.getLogger(ExecutionConsciousnessLayer.__module__)
+    level = engine_logger.level
+    engine_logger.setLevel(logging.ERROR)
+    try:
+        seconds = time_call(step, repeat=ctx.repeat, min_time=0.05 if ctx.quick else 0.2)
+    finally:
+        engine_logger.setLevel(level)
+    return [result("engines.consciousness.observe_and_report", "states_per_sec", 1 / seconds,
+                   memory=len(layer.ens_state_memory))]
+
+
+def bench_order_router(ctx: BenchContext) -> List[Dict[str, Any]]:
+    """
+    route_order latency against a local fake exchange server (aiohttp), with
+    a connector built per order versus taken from a ConnectorPool.
+
+    A fresh connector opens its own HTTP session and loads market metadata
+    (the server delays that call by 5 ms) before the balance check and the
+    order, like a cold ccxt client; orders are persisted to in-memory SQLite.
+    """
+    import aiohttp
+    from aiohttp import web
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from backend.models import Base
+    from worker.connectors import IExchangeConnector
+    from worker.executor import order_router
+    from worker.executor.connector_pool import ConnectorPool
+
+    orders = 30 if ctx.quick else 150
+    markets_delay = 0.005
+    payload = {"symbol": "BTC/USDT", "side": "buy", "type": "market", "amount": 0.001}
+
+    async def markets(request):
+        await asyncio.sleep(markets_delay)
+        return web.json_response({"BTC/USDT": {"precision": {"amount": 6}}})
+
+    async def balance(request):
+        return web.json_response({"USDT": {"free": 1e6, "used": 0.0, "total": 1e6}})
+
+    async def order(request):
+        body = await request.json()
+        return web.json_response({"id": "1", "status": "closed", "filled": body["amount"]})
+
+    def connector_class(base_url: str):
+        class FakeExchangeConnector(IExchangeConnector):
+            def __init__(self, testnet: bool = True, **kwargs):
+                self.testnet = testnet
+                self._session = None
+
+            async def _ready(self):
+                if self._session is None:
+                    self._session = aiohttp.ClientSession(base_url)
+                    async with self._session.get("/markets") as resp:
+                        await resp.json()
+                return self._session
+
+            async def fetch_balance(self):
+                session = await self._ready()
+                async with session.get("/balance") as resp:
+                    return await resp.json()
+
+            async def create_order(self, order_payload):
+                session = await self._ready()
+                async with session.post("/order", json=order_payload) as resp:
+                    return await resp.json()
+
+            async def cancel_order(self, order_id):
+                return {"id": order_id, "status": "canceled"}
+
+            async def fetch_positions(self):
+                return {}
+
+            async def close(self):
+                if self._session is not None:
+                    await self._session.close()
+                    self._session = None
+
+        return FakeExchangeConnector
+
+    async def run() -> Dict[str, float]:
+        app = web.Application()
+        app.add_routes([web.get("/markets", markets), web.get("/balance", balance), web.post("/order", order)])
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        order_router.CONNECTOR_REGISTRY["fakeexchange"] = connector_class(f"http://127.0.0.1:{port}")
+        db = sessionmaker(bind=create_engine("sqlite:///:memory:"))()
+        Base.metadata.create_all(db.get_bind())
+        pool = ConnectorPool(order_router.load_connector)
+        timings = {}
+        try:
+            for label, use_pool in (("per_order", None), ("pooled", pool)):
+                await order_router.route_order("fakeexchange", dict(payload), db, pool=use_pool)  # warm up
+                start = time.perf_counter()
+                for _ in range(orders):
+                    await order_router.route_order("fakeexchange", dict(payload), db, pool=use_pool)
+                timings[label] = (time.perf_counter() - start) / orders
+        finally:
+            await pool.close_all()
+            order_router.CONNECTOR_REGISTRY.pop("fakeexchange", None)
+            db.close()
+            await runner.cleanup()
+        return timings
+
+    router_logger = logging.getLogger(order_router.__name__)
+    level = router_logger.level
+    router_logger.setLevel(logging.ERROR)
+    try:
+        best: Dict[str, float] = {}
+        for _ in range(max(1, ctx.repeat)):
+            for label, seconds in asyncio.run(run()).items():
+                best[label] = min(seconds, best.get(label, seconds))
+    finally:
+        router_logger.setLevel(level)
+    return [
+        result(f"order_router.route_order.{label}", "ms_per_order", seconds * 1000,
+               higher_is_better=False, orders=orders, markets_delay_ms=markets_delay * 1000)
+        for label, seconds in best.items()
+    ]
+
+
+def bench_order_journal(ctx: BenchContext) -> List[Dict[str, Any]]:
+    """
+    Orders persisted per second to a file-backed SQLite database: one
+    add/commit/refresh per order (route_order's inline path) versus the
+    batched OrderJournal writer.
+    """
+    from datetime import datetime
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from backend.models import Base, Order
+    from worker.executor.order_journal import OrderJournal
+
+    orders = 300 if ctx.quick else 2000
+
+    def make_orders():
+        now = datetime.utcnow()
+        return [Order(user_id=f"user-{i % 8}", symbol="BTC/USDT", qty=0.001, side="buy", status="filled",
+                      created_at=now, updated_at=now) for i in range(orders)]
+
+    def run(tmp: str) -> Dict[str, float]:
+        engine = create_engine(f"sqlite:///{tmp}/orders.db", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(engine)
+        factory = sessionmaker(bind=engine)
+        rates = {}
+
+        batch = make_orders()
+        db = factory()
+        start = time.perf_counter()
+        for order in batch:
+            db.add(order)
+            db.commit()
+            db.refresh(order)
+        rates["inline"] = orders / (time.perf_counter() - start)
+        db.close()
+
+        journal = OrderJournal(factory)
+        batch = make_orders()
+        start = time.perf_counter()
+        acks = [journal.submit(order) for order in batch]
+        for ack in acks:
+            ack.result()
+        rates["journal"] = orders / (time.perf_counter() - start)
+        journal.close()
+        engine.dispose()
+        return rates
+
+    best: Dict[str, float] = {}
+    for _ in range(max(1, ctx.repeat)):
+        with tempfile.TemporaryDirectory() as tmp:
+            for label, rate in run(tmp).items():
+                best[label] = max(rate, best.get(label, rate))
+    return [result(f"order_journal.sqlite.{label}", "orders_per_sec", rate, orders=orders)
+            for label, rate in best.items()]
+
+
+def synthetic_headlines(n: int, seed: int = 13) -> List[str]:
+    """Seeded market headlines mixing keyword and filler words."""
+    rng = random.Random(seed)
+    subjects = ["Stocks", "Bitcoin", "Dollar", "Euro", "Yen", "Gold", "Crude", "Treasury yields", "Nasdaq",
+                "Sterling", "Ethereum", "Shares", "Markets", "Futures", "Emerging markets"]
+    verbs = ["rally", "surge", "edge higher", "slip", "fall", "drop", "decline", "steady", "trade flat",
+             "hold gains", "turn lower", "climb", "sink", "rebound", "wobble"]
+    contexts = ["ahead of FOMC decision", "after CPI data", "as ECB signals patience", "on strong retail sales",
+                "before NFP report", "as traders weigh outlook", "after GDP miss", "on Powell speech",
+                "as BOJ holds", "amid earnings season", "on manufacturing survey", "in quiet session",
+                "as investors eye central bank", "after inflation surprise", "on supply concerns", ""]
+    return [f"{rng.choice(subjects)} {rng.choice(verbs)} {rng.choice(contexts)}".strip() for _ in range(n)]
+
+
+def bench_headlines(ctx: BenchContext) -> List[Dict[str, Any]]:
+    """
+    Headlines classified per second (impact, sentiment direction and asset
+    tags): one `keyword in title` test per keyword, as detect_event_type and
+    parse_marketwatch did, versus the compiled HeadlineClassifier, per
+    headline and as one batch.
+    """
+    from worker.news.headline_classifier import ASSET_KEYWORDS, NEGATIVE_KEYWORDS, POSITIVE_KEYWORDS
+    from worker.news.news_filter import HEADLINE_CLASSIFIER, NewsFilter, NewsImpact
+
+    headlines = synthetic_headlines(20_000 if ctx.quick else 100_000)
+    critical = [k.upper() for k in NewsFilter.CRITICAL_EVENTS]
+    assets = list(ASSET_KEYWORDS.items())
+
+    def keyword_loops():
+        for headline in headlines:
+            title = headline.upper()
+            if any(k in title for k in critical):
+                impact = NewsImpact.CRITICAL
+            elif any(k in title for k in NewsFilter.HIGH_IMPACT_KEYWORDS):
+                impact = NewsImpact.HIGH
+            elif any(k in title for k in NewsFilter.MEDIUM_IMPACT_KEYWORDS):
+                impact = NewsImpact.MEDIUM
+            else:
+                impact = NewsImpact.LOW
+            if any(k in title for k in POSITIVE_KEYWORDS):
+                sentiment = 1
+            elif any(k in title for k in NEGATIVE_KEYWORDS):
+                sentiment = -1
+            else:
+                sentiment = 0
+            tags = [asset for asset, keywords in assets if any(k in title for k in keywords)]
+            (impact, sentiment, tags)
+
+    cases = {
+        "keyword_loops": keyword_loops,
+        "compiled": lambda: [HEADLINE_CLASSIFIER.classify(h) for h in headlines],
+        "compiled_batch": lambda: HEADLINE_CLASSIFIER.classify_batch(headlines),
+    }
+    return [result(f"headlines.classify.{label}", "headlines_per_sec", len(headlines) / time_call(fn, repeat=ctx.repeat),
+                   headlines=len(headlines))
+            for label, fn in cases.items()]
+
+
+SUITES: Dict[str, Callable[[BenchContext], List[Dict[str, Any]]]] = {
+    "backtest": bench_backtest,
+    "engines": bench_engines,
+    "headlines": bench_headlines,
+    "indicators": bench_indicators,
+    "job_store": bench_job_store,
+    "loader": bench_loader,
+    "optimizer": bench_optimizer,
+    "order_journal": bench_order_journal,
+    "order_router": bench_order_router,
+}
+
+
+def run_suites(names: List[str], candles: int, quick: bool = False, repeat: int = 3,
+               workers: int = 1) -> List[Dict[str, Any]]:
+    """Run the named suites on a fresh synthetic dataset and return their results."""
+    data = synthetic_candles(candles)
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        ctx = BenchContext(data, write_csv(data, Path(tmp) / "bench.csv"), quick, repeat, workers)
+        for name in names:
+            print(f"[bench] {name} ...", flush=True)
+            for r in SUITES[name](ctx):
+                print(f"[bench]   {r['name']:<40} {r['value']:>14.4g} {r['metric']}")
+                results.append(r)
+    return results
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Backtest / indicator / optimizer throughput benchmarks")
+    parser.add_argument("--only", action="append", choices=sorted(SUITES), help="Run only this suite (repeatable).")
+    parser.add_argument("--quick", action="store_true", help="Smaller inputs and fewer repeats.")
+    parser.add_argument("--candles", type=int, default=0, help="Synthetic candles (default 20000, 3000 with --quick).")
+    parser.add_argument("--repeat", type=int, default=0, help="Timing repeats, best is kept (default 3, 2 with --quick).")
+    parser.add_argument("--workers", type=int, default=1, help="Workers passed to run_ga in the optimizer suite.")
+    parser.add_argument("--output-dir", type=str, default=str(DEFAULT_OUTPUT_DIR))
+    parser.add_argument("--save-baseline", action="store_true", help=f"Also write the results to <output-dir>/{BASELINE_NAME}.")
+    parser.add_argument("--compare", nargs="?", const="", default=None, metavar="BASELINE",
+                        help=f"Compare against BASELINE (default <output-dir>/{BASELINE_NAME}).")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Relative slowdown flagged as a regression (default {DEFAULT_THRESHOLD}).")
+    parser.add_argument("--results", type=str, default=None, help="Compare this result file instead of running.")
+    args = parser.parse_args(argv)
+
+    output_dir = Path(args.output_dir)
+    if args.results:
+        report = load_report(args.results)
+    else:
+        candles = args.candles or (3000 if args.quick else 20000)
+        repeat = args.repeat or (2 if args.quick else 3)
+        names = args.only or list(SUITES)
+        results = run_suites(names, candles, quick=args.quick, repeat=repeat, workers=args.workers)
+        report = build_report(results, quick=args.quick, candles=candles, repeat=repeat, suites=names)
+        print(f"[bench] results written to {write_report(report, output_dir)}")
+        if args.save_baseline:
+            print(f"[bench] baseline written to {write_report(report, output_dir, BASELINE_NAME)}")
+
+    if args.compare is None:
+        return 0
+    baseline_path = Path(args.compare) if args.compare else output_dir / BASELINE_NAME
+    if not baseline_path.exists():
+        print(f"[bench] no baseline at {baseline_path}; run with --save-baseline first")
+        return 2
+    rows = compare_reports(report, load_report(baseline_path), args.threshold)
+    print(format_comparison(rows))
+    regressions = [row for row in rows if row["regression"]]
+    if regressions:
+        print(f"[bench] {len(regressions)} regression(s) beyond {args.threshold:.0%}")
+        return 1
+    print(f"[bench] no regressions beyond {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
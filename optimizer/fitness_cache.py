@@ -0,0 +1,131 @@
+"""
+Fitness memo for the genetic optimizer.
+
+Scores are keyed by (objective, penalty_factor, genome tuple) inside a cache
+bound to one dataset fingerprint, and can be persisted as JSON under
+artifacts/fitness_cache/ so repeated or resumed optimizations skip genomes
+that were already scored on the same candles. An optional scope string
+separates scores computed differently on the same data (e.g. walk-forward
+windows). Only complete scores are stored: the optimizer never puts the
+partial score of an early-aborted (pruned) backtest here.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+from dataclasses import astuple
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+DEFAULT_CACHE_DIR = Path("artifacts") / "fitness_cache"
+
+CacheKey = Tuple[str, float, tuple]
+
+
+def dataset_fingerprint(candles: List[dict]) -> str:
+    """SHA-256 over the candle rows that feed a backtest."""
+    digest = hashlib.sha256()
+    for c in candles:
+        digest.update(
+            f"{c.get('timestamp')}|{c.get('open')}|{c.get('high')}|{c.get('low')}|"
+            f"{c.get('close')}|{c.get('volume')}\n".encode()
+        )
+    return digest.hexdigest()
+
+
+class FitnessCache:
+    """
+    In-memory fitness memo with optional JSON persistence.
+
+    Counts hits (scores served from the memo, including duplicates within a
+    generation) and misses (genomes that actually had to be backtested).
+    """
+
+    def __init__(self, fingerprint: str, path: Optional[Union[str, Path]] = None, scope: str = ""):
+        self.fingerprint = fingerprint
+        self.path = Path(path) if path is not None else None
+        self.scope = scope
+        self.entries: Dict[CacheKey, Any] = {}
+        self.hits = 0
+        self.misses = 0
+        self.loaded = 0
+
+    @classmethod
+    def for_candles(cls, candles: List[dict], cache_dir: Optional[Union[str, Path]] = None,
+                    scope: str = "") -> "FitnessCache":
+        """Build a cache for `candles`, loading <cache_dir>/<fingerprint>[-<scope hash>].json if present."""
+        fingerprint = dataset_fingerprint(candles)
+        path = None
+        if cache_dir is not None:
+            name = fingerprint[:16]
+            if scope:
+                name += "-" + hashlib.sha256(scope.encode()).hexdigest()[:8]
+            path = Path(cache_dir) / f"{name}.json"
+        cache = cls(fingerprint, path, scope)
+        cache.load()
+        return cache
+
+    @staticmethod
+    def key(genome, objective: str, penalty_factor: float) -> CacheKey:
+        return (objective, float(penalty_factor), astuple(genome))
+
+    def get(self, key: CacheKey) -> Any:
+        """Return a copy of the cached result, or None."""
+        result = self.entries.get(key)
+        if result is None:
+            return None
+        self.hits += 1
+        return copy.copy(result)
+
+    def put(self, key: CacheKey, result: Any) -> None:
+        self.misses += 1
+        self.entries[key] = copy.copy(result)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "entries": len(self.entries),
+            "loaded_from_disk": self.loaded,
+        }
+
+    def load(self) -> None:
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("fingerprint") != self.fingerprint or data.get("scope", "") != self.scope:
+            return
+        for entry in data.get("entries", []):
+            if isinstance(entry["result"], dict) and entry["result"].get("pruned"):
+                # partial score of an early-aborted backtest; never reuse it
+                continue
+            key = (entry["objective"], float(entry["penalty_factor"]), tuple(entry["genome"]))
+            self.entries[key] = entry["result"]
+        self.loaded = len(self.entries)
+
+    def save(self) -> None:
+        """Write the memo atomically (tmp file + rename)."""
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "fingerprint": self.fingerprint,
+            "scope": self.scope,
+            "entries": [
+                {"objective": objective, "penalty_factor": penalty, "genome": list(genome), "result": result}
+                for (objective, penalty, genome), result in self.entries.items()
+            ],
+        }
+        tmp_path = self.path.with_suffix(".json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(payload, f)
+        os.replace(tmp_path, self.path)
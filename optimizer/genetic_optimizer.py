@@ -9,7 +9,14 @@ Notes:
   - Runs backtests in-process using project's backtest API (no subprocesses)
   - Uses simple GA: tournament selection, one-point crossover, gaussian mutation
   - Objective: maximize final equity (last equity point)
-  - No threads or network calls
+  - Optional process pool for genome evaluation (--workers N); results are
+    identical to the serial path for a given seed
+  - Optional walk-forward / k-fold fitness (--wf-train/--wf-test, --kfold):
+    genomes are selected on the train spans and the winner is scored
+    out-of-sample on the test spans the GA never saw
+  - Optional early abort of hopeless backtests (--prune-equity-floor,
+    --prune-survivors)
+  - No network calls
 """
 
 from __future__ import annotations
@@ -17,10 +24,12 @@ import argparse
 import copy
 import json
 import math
+import multiprocessing
 import os
 import random
 import statistics
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
@@ -38,6 +47,9 @@ from backtest.replay import ReplayEngine
 from backtest.reporting import generate_report, compute_sharpe
 from worker.strategies.ai_fusion import AIFusionStrategy, AIFusionConfig
 from worker.executor.account import VirtualAccount
+from optimizer.fitness_cache import DEFAULT_CACHE_DIR, FitnessCache, dataset_fingerprint
+from optimizer.walk_forward import Window, WarmupCache, kfold_windows, walk_forward_windows, windows_scope
+from optimizer.pruning import EarlyStop, PruneConfig
 
 # ——————————————————————————
 # Helper dataclasses
@@ -145,7 +157,8 @@ def crossover(p1: Genome, p2: Genome, rng: random.Random) -> Tuple[Genome, Genom
 # ——————————————————————————
 from typing import Union
 
-def evaluate_genome(genome: Genome, candles: List[dict], objective: str = "sharpe", penalty_factor: float = 0.01) -> Union[float, dict]:
+def evaluate_genome(genome: Genome, candles: List[dict], objective: str = "sharpe", penalty_factor: float = 0.01,
+                    prune: Optional[PruneConfig] = None) -> Union[float, dict]:
     """
     Run a backtest with the genome parameters and return objective score.
     
@@ -155,115 +168,395 @@ def evaluate_genome(genome: Genome, candles: List[dict], objective: str = "sharp
     - 'dual': Returns dict with breakdown {sharpe, max_drawdown, score, final_equity}
               Score = sharpe - (max_drawdown * penalty_factor)
               Balances risk-adjusted returns with drawdown stability
+    
+    With prune (see optimizer.pruning) the replay stops early once the genome
+    is hopeless and the score of the truncated run is returned; 'dual'
+    breakdowns then carry pruned=True, pruned_at and prune_reason.
+    """
+    return _evaluate(genome, candles, objective, penalty_factor, prune)[0]
+
+
+def _evaluate(genome: Genome, candles: List[dict], objective: str, penalty_factor: float,
+              prune: Optional[PruneConfig] = None, window: Optional[Window] = None,
+              warmup: Optional[WarmupCache] = None, span: str = "test") -> Tuple[Union[float, dict], bool]:
+    """
+    Score `genome` on `candles` (on the `span` of `window` if given) and
+    report whether the replay was stopped early. A pruned score is partial,
+    so callers must not memoize it.
     """
     # 1) run backtest (existing logic) -> should produce `trade_history` and `equity_history`
     try:
-        cfg = genome.to_config()
-        strategy = AIFusionStrategy(cfg)
-        account = VirtualAccount(starting_balance=10000.0)
-        executor = BacktestExecutor(account, strategy)
-        replay = ReplayEngine(candles, executor.process_candle)
-        
-        # Run (deterministic)
-        replay.run()
+        if window is None:
+            account, stopper = _run_backtest(genome, candles, prune=prune, objective=objective,
+                                             penalty_factor=penalty_factor)
+        elif span == "train":
+            account, stopper = _run_backtest(genome, candles[window.train_start:window.test_start], prune=prune,
+                                             objective=objective, penalty_factor=penalty_factor)
+        else:
+            account, stopper = _run_backtest(genome, candles[window.test_start:window.test_end], warmup, window,
+                                             prune, objective, penalty_factor)
+        pruned = stopper is not None and stopper.reason is not None
+        return _mark_pruned(_score_account(account, objective, penalty_factor), stopper), pruned
+    except Exception as e:
+        # fail-safe: return very poor fitness
+        # (do not re-raise to keep optimizer running)
+        # print(f"eval error:", e)  # silent by design
+        return float("-1e9"), False
+
+
+def _run_backtest(genome: Genome, candles: List[dict], warmup: Optional[WarmupCache] = None,
+                  window: Optional[Window] = None, prune: Optional[PruneConfig] = None,
+                  objective: str = "sharpe", penalty_factor: float = 0.01) -> Tuple[VirtualAccount, Optional[EarlyStop]]:
+    """
+    Replay `candles` with the genome's strategy, optionally pre-warmed for
+    `window` and stopped early under `prune`. Returns (account, stopper).
+    """
+    cfg = genome.to_config()
+    strategy = AIFusionStrategy(cfg)
+    if warmup is not None and window is not None:
+        warmup.apply(strategy, window)
+    account = VirtualAccount(starting_balance=10000.0)
+    executor = BacktestExecutor(account, strategy)
+    stopper = None
+    if prune is not None and prune.enabled:
+        stopper = EarlyStop(account, len(candles), prune, objective, penalty_factor, starting_equity=10000.0)
+    replay = ReplayEngine(candles, executor.process_candle, stop_condition=stopper)
+    
+    # Run (deterministic)
+    replay.run()
+    return account, stopper
+
+
+def _mark_pruned(result: Union[float, dict], stopper: Optional[EarlyStop]) -> Union[float, dict]:
+    if stopper is not None and stopper.reason is not None and isinstance(result, dict):
+        result["pruned"] = True
+        result["pruned_at"] = stopper.index
+        result["prune_reason"] = stopper.reason
+    return result
+
+
+def _score_account(account: VirtualAccount, objective: str, penalty_factor: float) -> Union[float, dict]:
+    """Objective score of a finished backtest (see evaluate_genome)."""
+    # Get equity history - it might be empty if executor doesn't track it
+    # equity_history could be list[dict] or list[float]
+    equity_history = getattr(account, "equity_history", None)
+    
+    # Handle the objective
+    if objective == "sharpe" or objective == "dual":
+        # 2) compute sharpe using your backtest reporting function
+        # 3) extract equity as list[float] if needed
+        if equity_history and isinstance(equity_history, list) and len(equity_history) > 0:
+            # Check if it's list of dicts (extract value) or list of floats
+            if isinstance(equity_history[0], dict):
+                equity_series = [e.get("price", e.get("value", 10000.0)) for e in equity_history]
+            else:
+                equity_series = list(equity_history)
+            
+            sharpe = compute_sharpe(equity_series, risk_free_rate=0.0)
+        else:
+            sharpe = None
         
-        # Get equity history - it might be empty if executor doesn't track it
-        # equity_history could be list[dict] or list[float]
-        equity_history = getattr(account, "equity_history", None)
+        # Handle None (insufficient data) -> give a low score so optimizer avoids it
+        if sharpe is None:
+            # For dual objective, still return dict structure
+            if objective == "dual":
+                return {
+                    "sharpe": -999.0,
+                    "max_drawdown": 0.0,
+                    "score": -999.0,
+                    "final_equity": 10000.0,
+                    "penalty_factor": penalty_factor
+                }
+            # For sharpe objective, return float
+            return -999.0
         
-        # Handle the objective
-        if objective == "sharpe" or objective == "dual":
-            # 2) compute sharpe using your backtest reporting function
-            # 3) extract equity as list[float] if needed
-            if equity_history and isinstance(equity_history, list) and len(equity_history) > 0:
-                # Check if it's list of dicts (extract value) or list of floats
+        # For dual objective, compute max drawdown and apply penalty
+        if objective == "dual":
+            # Compute max drawdown from equity curve
+            if equity_history and len(equity_history) > 0:
                 if isinstance(equity_history[0], dict):
                     equity_series = [e.get("price", e.get("value", 10000.0)) for e in equity_history]
                 else:
                     equity_series = list(equity_history)
                 
-                sharpe = compute_sharpe(equity_series, risk_free_rate=0.0)
+                # Calculate max drawdown as fraction (0-1)
+                peak = equity_series[0]
+                max_dd = 0.0
+                for eq in equity_series:
+                    if eq > peak:
+                        peak = eq
+                    dd = (peak - eq) / peak if peak > 0 else 0.0
+                    if dd > max_dd:
+                        max_dd = dd
+                
+                # Dual objective: sharpe - (max_drawdown * penalty_factor)
+                score = float(sharpe) - (max_dd * penalty_factor)
+                final_equity = equity_series[-1] if equity_series else 10000.0
+                
+                # Return breakdown as dict (will be stored separately)
+                return {
+                    "sharpe": float(sharpe),
+                    "max_drawdown": max_dd,
+                    "score": score,
+                    "final_equity": final_equity,
+                    "penalty_factor": penalty_factor
+                }
             else:
-                sharpe = None
-            
-            # Handle None (insufficient data) -> give a low score so optimizer avoids it
-            if sharpe is None:
-                # For dual objective, still return dict structure
-                if objective == "dual":
-                    return {
-                        "sharpe": -999.0,
-                        "max_drawdown": 0.0,
-                        "score": -999.0,
-                        "final_equity": 10000.0,
-                        "penalty_factor": penalty_factor
-                    }
-                # For sharpe objective, return float
-                return -999.0
-            
-            # For dual objective, compute max drawdown and apply penalty
-            if objective == "dual":
-                # Compute max drawdown from equity curve
-                if equity_history and len(equity_history) > 0:
-                    if isinstance(equity_history[0], dict):
-                        equity_series = [e.get("price", e.get("value", 10000.0)) for e in equity_history]
-                    else:
-                        equity_series = list(equity_history)
-                    
-                    # Calculate max drawdown as fraction (0-1)
-                    peak = equity_series[0]
-                    max_dd = 0.0
-                    for eq in equity_series:
-                        if eq > peak:
-                            peak = eq
-                        dd = (peak - eq) / peak if peak > 0 else 0.0
-                        if dd > max_dd:
-                            max_dd = dd
-                    
-                    # Dual objective: sharpe - (max_drawdown * penalty_factor)
-                    score = float(sharpe) - (max_dd * penalty_factor)
-                    final_equity = equity_series[-1] if equity_series else 10000.0
-                    
-                    # Return breakdown as dict (will be stored separately)
-                    return {
-                        "sharpe": float(sharpe),
-                        "max_drawdown": max_dd,
-                        "score": score,
-                        "final_equity": final_equity,
-                        "penalty_factor": penalty_factor
-                    }
-                else:
-                    # No equity history, return low score
-                    return {"sharpe": -999.0, "max_drawdown": 1.0, "score": -999.0, "final_equity": 10000.0, "penalty_factor": penalty_factor}
-            
-            # Return Sharpe as the objective
-            return float(sharpe)
+                # No equity history, return low score
+                return {"sharpe": -999.0, "max_drawdown": 1.0, "score": -999.0, "final_equity": 10000.0, "penalty_factor": penalty_factor}
+        
+        # Return Sharpe as the objective
+        return float(sharpe)
+    else:
+        # objective == "equity" - return final equity
+        if equity_history and isinstance(equity_history, list) and len(equity_history) > 0:
+            if isinstance(equity_history[0], dict):
+                return float(equity_history[-1].get("price", equity_history[-1].get("value", 10000.0)))
+            else:
+                return float(equity_history[-1])
+        # fallback: just use final balance attr
+        bal = getattr(account, "balance", None)
+        if bal is not None:
+            return float(bal)
+        return 10000.0
+
+def evaluate_window(genome: Genome, candles: List[dict], window: Window, objective: str = "sharpe",
+                    penalty_factor: float = 0.01, warmup: Optional[WarmupCache] = None,
+                    prune: Optional[PruneConfig] = None, span: str = "test") -> Union[float, dict]:
+    """
+    Score of `genome` on one span of `window`.
+
+    span="train" is the in-sample score: a plain backtest of the train span.
+    span="test" is the out-of-sample score: the strategy starts from the
+    indicator state it would have after the train span (shared through
+    `warmup`) with a fresh account, so only test-span trades count.
+    """
+    if span not in ("train", "test"):
+        raise ValueError(f"span must be 'train' or 'test', got {span!r}")
+    if warmup is None and span == "test":
+        warmup = WarmupCache(candles)
+    return _evaluate(genome, candles, objective, penalty_factor, prune, window, warmup, span)[0]
+
+
+def aggregate_window_scores(results: List[Union[float, dict]], objective: str, penalty_factor: float) -> Union[float, dict]:
+    """
+    Mean of per-window scores.
+
+    For 'dual' every breakdown field is averaged (so score still equals
+    sharpe - max_drawdown * penalty_factor) and the per-window scores are kept
+    under "windows".
+    """
+    if objective != "dual":
+        return statistics.mean(float(r) if not isinstance(r, dict) else float(r.get("score", -999.0)) for r in results)
+    breakdowns = [
+        r if isinstance(r, dict)
+        else {"sharpe": float(r), "max_drawdown": 0.0, "score": float(r), "final_equity": 10000.0}
+        for r in results
+    ]
+    aggregate = {
+        field: statistics.mean(b[field] for b in breakdowns)
+        for field in ("sharpe", "max_drawdown", "score", "final_equity")
+    }
+    aggregate["penalty_factor"] = penalty_factor
+    aggregate["windows"] = [b["score"] for b in breakdowns]
+    if any(b.get("pruned") for b in breakdowns):
+        aggregate["pruned"] = True
+    return aggregate
+
+
+def evaluate_genome_walk_forward(genome: Genome, candles: List[dict], windows: List[Window], objective: str = "sharpe",
+                                 penalty_factor: float = 0.01, warmup: Optional[WarmupCache] = None,
+                                 prune: Optional[PruneConfig] = None, span: str = "test") -> Union[float, dict]:
+    """
+    Mean score of `genome` over walk-forward/k-fold `windows`: in-sample for
+    span="train" (what run_ga selects on), out-of-sample for span="test".
+    """
+    if warmup is None and span == "test":
+        warmup = WarmupCache(candles)
+    results = [evaluate_window(genome, candles, w, objective, penalty_factor, warmup, prune, span) for w in windows]
+    return aggregate_window_scores(results, objective, penalty_factor)
+
+# ——————————————————————————
+# Parallel evaluation
+# ——————————————————————————
+# Candle dataset seen by pool workers. Set before the pool starts so forked
+# workers inherit it; spawn-only platforms receive it once via the initializer.
+_SHARED_CANDLES: Optional[List[dict]] = None
+
+
+def _init_worker(candles: List[dict]) -> None:
+    global _SHARED_CANDLES
+    _SHARED_CANDLES = candles
+
+
+def _evaluate_shared(task: Tuple[Genome, str, float, Optional[Window], Optional[PruneConfig]]) -> Tuple[Union[float, dict], bool]:
+    genome, objective, penalty_factor, window, prune = task
+    if window is None:
+        return _evaluate(genome, _SHARED_CANDLES, objective, penalty_factor, prune)
+    # the GA only scores train spans on the pool; those replay cold
+    return _evaluate(genome, _SHARED_CANDLES, objective, penalty_factor, prune, window, span="train")
+
+
+def fitness_scope(windows: Optional[List[Window]] = None, prune: Optional[PruneConfig] = None) -> str:
+    """FitnessCache scope for scores computed with these windows / prune settings."""
+    parts = []
+    if windows:
+        # windowed fitness is the mean train-span score
+        parts.append(windows_scope(windows) + ":span=train")
+    if prune is not None and prune.enabled:
+        parts.append(prune.scope())
+    return "|".join(parts)
+
+
+def make_eval_pool(candles: List[dict], workers: int) -> ProcessPoolExecutor:
+    """
+    Create a process pool whose workers hold `candles` without per-task pickling.
+
+    Uses fork inheritance where available, otherwise ships the dataset once per
+    worker through the pool initializer.
+    """
+    global _SHARED_CANDLES
+    if "fork" in multiprocessing.get_all_start_methods():
+        _SHARED_CANDLES = candles
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork"))
+    return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(candles,))
+
+
+def evaluate_population(pop: List[Genome], candles: List[dict], objective: str, penalty_factor: float,
+                        pool: Optional[ProcessPoolExecutor] = None,
+                        cache: Optional[FitnessCache] = None,
+                        windows: Optional[List[Window]] = None,
+                        prune: Optional[PruneConfig] = None) -> List[Union[float, dict]]:
+    """
+    Evaluate genomes in population order, serially or on `pool`.
+
+    evaluate_genome is a pure function of (genome, candles), and results are
+    collected in submission order, so both paths return identical lists.
+    With a cache, genomes already scored (earlier generations, duplicates in
+    this one, or a previous run) are not backtested again.
+    With windows, each genome is scored on the train span of every window
+    (the test spans are held out for run_ga's final report) and the
+    (genome, window) pairs are what gets spread over the pool.
+    prune enables early abort of hopeless backtests (optimizer.pruning).
+    Pruned scores are partial (they depend on this generation's cutoff), so
+    they are returned but never stored in the cache.
+    """
+    if cache is None:
+        return _evaluate_unique(pop, candles, objective, penalty_factor, pool, windows, prune)[0]
+
+    keys = [FitnessCache.key(g, objective, penalty_factor) for g in pop]
+    pending: dict = {}
+    for g, key in zip(pop, keys):
+        if key not in cache.entries and key not in pending:
+            pending[key] = g
+    fresh, pruned = _evaluate_unique(list(pending.values()), candles, objective, penalty_factor, pool, windows, prune)
+    partial = {}
+    for key, result, was_pruned in zip(pending, fresh, pruned):
+        if was_pruned:
+            cache.misses += 1
+            partial[key] = result
         else:
-            # objective == "equity" - return final equity
-            if equity_history and isinstance(equity_history, list) and len(equity_history) > 0:
-                if isinstance(equity_history[0], dict):
-                    return float(equity_history[-1].get("price", equity_history[-1].get("value", 10000.0)))
-                else:
-                    return float(equity_history[-1])
-            # fallback: just use final balance attr
-            bal = getattr(account, "balance", None)
-            if bal is not None:
-                return float(bal)
-            return 10000.0
-    except Exception as e:
-        # fail-safe: return very poor fitness
-        # (do not re-raise to keep optimizer running)
-        # print(f"eval error:", e)  # silent by design
-        return float("-1e9")
+            cache.put(key, result)
+    # hits are the lookups that did not trigger a backtest
+    cache.hits += len(pop) - len(pending)
+    return [copy.copy(partial[key] if key in partial else cache.entries[key]) for key in keys]
+
+
+def _evaluate_unique(pop: List[Genome], candles: List[dict], objective: str, penalty_factor: float,
+                     pool: Optional[ProcessPoolExecutor], windows: Optional[List[Window]] = None,
+                     prune: Optional[PruneConfig] = None) -> Tuple[List[Union[float, dict]], List[bool]]:
+    """Scores of `pop` plus, per genome, whether any of its replays was pruned."""
+    if windows is None:
+        if pool is None:
+            evaluated = [_evaluate(g, candles, objective, penalty_factor, prune) for g in pop]
+        else:
+            # one genome per task: each backtest dwarfs the IPC cost of a Genome
+            evaluated = list(pool.map(_evaluate_shared, [(g, objective, penalty_factor, None, prune) for g in pop]))
+        return [result for result, _ in evaluated], [pruned for _, pruned in evaluated]
+
+    tasks = [(g, objective, penalty_factor, w, prune) for g in pop for w in windows]
+    if pool is None:
+        evaluated = [_evaluate(g, candles, objective, penalty_factor, prune, w, span="train") for g, _, _, w, _ in tasks]
+    else:
+        evaluated = list(pool.map(_evaluate_shared, tasks))
+    k = len(windows)
+    results = [
+        aggregate_window_scores([result for result, _ in evaluated[i * k:(i + 1) * k]], objective, penalty_factor)
+        for i in range(len(pop))
+    ]
+    return results, [any(pruned for _, pruned in evaluated[i * k:(i + 1) * k]) for i in range(len(pop))]
+
 
 # ——————————————————————————
 # Genetic algorithm
 # ——————————————————————————
-def run_ga(candles: List[dict], pop_size: int, generations: int, seed: int, objective: str = "sharpe", penalty_factor: float = 0.01):
+def run_ga(candles: List[dict], pop_size: int, generations: int, seed: int, objective: str = "sharpe", penalty_factor: float = 0.01,
+           workers: int = 1, cache: Optional[FitnessCache] = None, windows: Optional[List[Window]] = None,
+           prune: Optional[PruneConfig] = None):
+    """
+    Run the GA and return (best_genome, best_result).
+
+    workers > 1 evaluates each generation in a process pool; the outcome for a
+    given seed is identical to workers=1.
+    cache memoizes scores so repeated genomes are scored once; pass a
+    FitnessCache built with a cache_dir to persist it across runs. Without one
+    an in-memory memo is used for this run only.
+    windows (see optimizer.walk_forward) switches fitness to the mean
+    in-sample score over the train spans of those train/test splits. The
+    test spans are held out: once the GA is done, best_result is the best
+    genome's mean out-of-sample score over them (for 'dual' the breakdown
+    also carries the in-sample score it was selected on as "in_sample_score").
+    prune (see optimizer.pruning) aborts hopeless backtests early; with
+    survivor_pruning the cutoff for each generation is the worst parent that
+    won a tournament. Results then differ from an unpruned run. Pruned scores
+    are never memoized or persisted; only complete backtests are cached.
+    A persistent cache must be built with scope=fitness_scope(windows, prune).
+    """
+    global _SHARED_CANDLES
+    if prune is not None and not prune.enabled:
+        prune = None
+    scope = fitness_scope(windows, prune)
+    if cache is None:
+        cache = FitnessCache(dataset_fingerprint(candles), scope=scope)
+    elif cache.scope != scope:
+        raise ValueError(f"fitness cache scope {cache.scope!r} does not match run scope {scope!r}")
+    pool = make_eval_pool(candles, workers) if workers > 1 else None
+    try:
+        best_genome, best_result = _run_ga(candles, pop_size, generations, seed, objective, penalty_factor, pool, cache,
+                                           windows or None, prune)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+            _SHARED_CANDLES = None
+        cache.save()
+        stats = cache.stats()
+        print(f"[GA] fitness cache  hits={stats['hits']} misses={stats['misses']} hit_rate={stats['hit_rate']:.1%}")
+    if not windows:
+        return best_genome, best_result
+    return best_genome, _out_of_sample_result(best_genome, best_result, candles, windows, objective, penalty_factor)
+
+
+def _out_of_sample_result(genome: Genome, in_sample: Union[float, dict], candles: List[dict], windows: List[Window],
+                          objective: str, penalty_factor: float) -> Union[float, dict]:
+    """Score the selected genome once on the held-out test spans (never pruned)."""
+    result = evaluate_genome_walk_forward(genome, candles, windows, objective, penalty_factor, span="test")
+    in_sample_score = float(in_sample["score"]) if isinstance(in_sample, dict) else float(in_sample)
+    score = float(result["score"]) if isinstance(result, dict) else float(result)
+    if isinstance(result, dict):
+        result["in_sample_score"] = in_sample_score
+    print(f"[GA] best genome  in-sample={in_sample_score:.2f} out-of-sample={score:.2f} over {len(windows)} test spans")
+    return result
+
+
+def _run_ga(candles: List[dict], pop_size: int, generations: int, seed: int, objective: str, penalty_factor: float,
+            pool: Optional[ProcessPoolExecutor], cache: FitnessCache, windows: Optional[List[Window]] = None,
+            prune: Optional[PruneConfig] = None):
     rng = random.Random(seed)
     # init population
     pop: List[Genome] = [random_genome(rng) for _ in range(pop_size)]
     # evaluate - store both results and breakdowns for dual
-    results = [evaluate_genome(g, candles, objective, penalty_factor) for g in pop]
+    # (no survivors yet, so only the fixed prune rules apply)
+    results = evaluate_population(pop, candles, objective, penalty_factor, pool, cache, windows, prune)
     
     # Extract fitness scores (handle both float and dict returns)
     if objective == "dual":
@@ -276,12 +569,16 @@ def run_ga(candles: List[dict], pop_size: int, generations: int, seed: int, obje
     for gen in range(generations):
         # selection: tournament
         next_pop: List[Genome] = []
+        worst_survivor = math.inf
         while len(next_pop) < pop_size:
             # tournament
             i1, i2 = rng.randrange(pop_size), rng.randrange(pop_size)
-            p1 = pop[i1] if fitnesses[i1] >= fitnesses[i2] else pop[i2]
+            w1 = i1 if fitnesses[i1] >= fitnesses[i2] else i2
+            p1 = pop[w1]
             i3, i4 = rng.randrange(pop_size), rng.randrange(pop_size)
-            p2 = pop[i3] if fitnesses[i3] >= fitnesses[i4] else pop[i4]
+            w2 = i3 if fitnesses[i3] >= fitnesses[i4] else i4
+            p2 = pop[w2]
+            worst_survivor = min(worst_survivor, fitnesses[w1], fitnesses[w2])
             
             # crossover
             c1, c2 = crossover(p1, p2, rng)
@@ -294,7 +591,10 @@ def run_ga(candles: List[dict], pop_size: int, generations: int, seed: int, obje
         
         next_pop = next_pop[:pop_size]
         # evaluate next pop
-        next_results = [evaluate_genome(g, candles, objective, penalty_factor) for g in next_pop]
+        gen_prune = prune
+        if prune is not None and prune.survivor_pruning:
+            gen_prune = prune.with_threshold(worst_survivor)
+        next_results = evaluate_population(next_pop, candles, objective, penalty_factor, pool, cache, windows, gen_prune)
         
         # Extract fitness scores
         if objective == "dual":
@@ -319,7 +619,10 @@ def run_ga(candles: List[dict], pop_size: int, generations: int, seed: int, obje
         # deterministic logging (kept minimal)
         best = max(fitnesses)
         mean = statistics.mean(fitnesses)
-        print(f"[GA] gen {gen+1}/{generations}  best={best:.2f} mean={mean:.2f}")
+        pruned = ""
+        if prune is not None:
+            pruned = f" pruned={sum(1 for r in next_results if isinstance(r, dict) and r.get('pruned'))}"
+        print(f"[GA] gen {gen+1}/{generations}  best={best:.2f} mean={mean:.2f}{pruned}")
     
     # final best
     best_idx = max(range(len(pop)), key=lambda i: fitnesses[i])
@@ -350,14 +653,77 @@ def main():
         default=0.01,
         help="Penalty factor for dual objective (default=0.01). Higher values penalize drawdown more.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Processes used to evaluate each generation (default=1, serial). Results do not depend on this.",
+    )
+    parser.add_argument(
+        "--fitness-cache-dir",
+        type=str,
+        default=str(DEFAULT_CACHE_DIR),
+        help=f"Directory for the persistent fitness memo (default={DEFAULT_CACHE_DIR}).",
+    )
+    parser.add_argument(
+        "--no-fitness-cache",
+        action="store_true",
+        help="Do not read or write the persistent fitness memo.",
+    )
+    parser.add_argument("--wf-train", type=int, default=0, help="Walk-forward train span in candles (use with --wf-test).")
+    parser.add_argument("--wf-test", type=int, default=0, help="Walk-forward test span in candles (use with --wf-train).")
+    parser.add_argument("--wf-step", type=int, default=0, help="Walk-forward window advance in candles (default=--wf-test).")
+    parser.add_argument("--wf-anchored", action="store_true", help="Grow the walk-forward train span from the first candle.")
+    parser.add_argument("--kfold", type=int, default=0,
+                        help="Select on the train spans of K time-series folds and report the test spans out-of-sample.")
+    parser.add_argument(
+        "--prune-equity-floor",
+        type=float,
+        default=None,
+        help="Stop a backtest once equity falls below this fraction of the starting balance (e.g. 0.5).",
+    )
+    parser.add_argument(
+        "--prune-survivors",
+        action="store_true",
+        help="Stop a backtest whose partial score trails the generation's worst tournament survivor.",
+    )
+    parser.add_argument(
+        "--prune-min-progress",
+        type=float,
+        default=0.5,
+        help="Fraction of candles replayed before --prune-survivors may stop a backtest (default=0.5).",
+    )
     args = parser.parse_args()
     
     # load candles (preserves original input format)
     candles = load_candles(args.data)
     
-    best_genome, best_result = run_ga(candles, pop_size=args.pop, generations=args.gens, seed=args.seed, objective=args.objective, penalty_factor=args.penalty_factor)
+    windows = None
+    if args.kfold:
+        windows = kfold_windows(len(candles), args.kfold)
+    elif args.wf_train or args.wf_test:
+        if not (args.wf_train and args.wf_test):
+            parser.error("--wf-train and --wf-test must be given together")
+        windows = walk_forward_windows(len(candles), args.wf_train, args.wf_test, args.wf_step, args.wf_anchored)
+        if not windows:
+            parser.error(f"{len(candles)} candles is too few for --wf-train {args.wf_train} --wf-test {args.wf_test}")
+    if windows:
+        print(f"[GA] fitness on {len(windows)} train spans, best genome reported on the held-out test spans")
+    prune = PruneConfig(
+        equity_floor=args.prune_equity_floor,
+        survivor_pruning=args.prune_survivors,
+        min_progress=args.prune_min_progress,
+    )
+    prune = prune if prune.enabled else None
+    
+    cache_dir = None if args.no_fitness_cache else args.fitness_cache_dir
+    cache = FitnessCache.for_candles(candles, cache_dir, scope=fitness_scope(windows, prune))
+    best_genome, best_result = run_ga(candles, pop_size=args.pop, generations=args.gens, seed=args.seed, objective=args.objective, penalty_factor=args.penalty_factor, workers=args.workers, cache=cache, windows=windows, prune=prune)
+    cache_stats = cache.stats()
     
     print("=== OPTIMIZATION COMPLETE ===")
+    if windows:
+        print(f"best score below is the mean out-of-sample score over {len(windows)} test spans")
     if args.objective == "sharpe":
         print("best score (Sharpe ratio):", best_result)
     elif args.objective == "dual":
@@ -400,6 +766,8 @@ def main():
         genome_data["sharpe"] = best_result["sharpe"]
         genome_data["max_drawdown"] = best_result["max_drawdown"]
         genome_data["penalty_factor"] = args.penalty_factor
+        if "in_sample_score" in best_result:
+            genome_data["in_sample_score"] = best_result["in_sample_score"]
     
     # Add metadata
     genome_data["_metadata"] = {
@@ -408,7 +776,11 @@ def main():
         "population_size": args.pop,
         "generations": args.gens,
         "seed": args.seed,
-        "data_file": args.data
+        "workers": args.workers,
+        "data_file": args.data,
+        "fitness_cache": cache_stats,
+        "windows": [asdict(w) for w in windows] if windows else None,
+        "prune": asdict(prune) if prune else None,
     }
     
     with open(save_path, "w") as f:
@@ -435,7 +807,17 @@ def main():
         f.write(f"{'=' * 60}\n\n")
         f.write(f"Objective: {args.objective}\n")
         f.write(f"Population: {args.pop} | Generations: {args.gens} | Seed: {args.seed}\n")
-        f.write(f"Data: {args.data}\n\n")
+        f.write(f"Data: {args.data}\n")
+        f.write(
+            f"Fitness cache: hits={cache_stats['hits']} misses={cache_stats['misses']} "
+            f"hit_rate={cache_stats['hit_rate']:.1%} loaded={cache_stats['loaded_from_disk']}\n\n"
+        )
+        if windows:
+            f.write(f"Fitness: mean in-sample score over the train spans of {len(windows)} windows; scores below are the\n")
+            f.write("best genome's mean out-of-sample score over the test spans (train_start, test_start, test_end):\n")
+            for w in windows:
+                f.write(f"  {w.train_start}, {w.test_start}, {w.test_end}\n")
+            f.write("\n")
         if args.objective == "dual" and isinstance(best_result, dict):
             f.write(f"Dual Score: {best_result['score']:.4f}\n")
             f.write(f"Sharpe Ratio: {best_result['sharpe']:.4f}\n")
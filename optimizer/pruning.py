@@ -0,0 +1,123 @@
+"""
+Early-abort rules for genome evaluation.
+
+EarlyStop is a ReplayEngine stop condition that watches the account's equity
+history while the backtest runs. It keeps running return statistics
+(Welford) and the drawdown, so each check is O(1) however long the replay is.
+It ends the replay when:
+
+  - equity falls below `equity_floor` x starting equity, or
+  - after `min_progress` of the candles, the partial score (Sharpe, or
+    Sharpe - max_drawdown * penalty_factor for 'dual') is below
+    `score_threshold`.
+
+The score rule is a heuristic rather than a bound: a genome that trails the
+worst tournament survivor halfway through is assumed not to recover.
+Pruned results are marked in the 'dual' breakdown ("pruned", "pruned_at",
+"prune_reason").
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, replace
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class PruneConfig:
+    """Early-abort settings; the defaults disable both rules."""
+    equity_floor: Optional[float] = None      # fraction of starting equity
+    score_threshold: Optional[float] = None   # fixed partial-score cutoff
+    survivor_pruning: bool = False            # run_ga: cutoff = worst tournament survivor
+    min_progress: float = 0.5                 # fraction of candles before score pruning
+    check_every: int = 25                     # candles between score checks
+
+    @property
+    def enabled(self) -> bool:
+        return self.equity_floor is not None or self.score_threshold is not None or self.survivor_pruning
+
+    def with_threshold(self, score_threshold: Optional[float]) -> "PruneConfig":
+        return replace(self, score_threshold=score_threshold)
+
+    def scope(self) -> str:
+        """Settings that change cached scores (a per-generation survivor cutoff is not included)."""
+        return (f"prune:floor={self.equity_floor}:threshold={self.score_threshold}:"
+                f"survivor={self.survivor_pruning}:progress={self.min_progress}:every={self.check_every}")
+
+
+class EarlyStop:
+    """
+    ReplayEngine stop_condition over an account with a float equity_history.
+
+    Partial statistics mirror compute_sharpe and the dual drawdown in
+    evaluate_genome, so the partial score is the score the truncated run gets.
+    """
+
+    def __init__(self, account, n_candles: int, config: PruneConfig, objective: str = "sharpe",
+                 penalty_factor: float = 0.01, starting_equity: float = 10000.0):
+        self.account = account
+        self.n_candles = n_candles
+        self.config = config
+        self.objective = objective
+        self.penalty_factor = penalty_factor
+        self.floor = None if config.equity_floor is None else config.equity_floor * starting_equity
+        self.min_index = int(math.ceil(config.min_progress * n_candles)) - 1
+        self.reason: Optional[str] = None
+        self.index: Optional[int] = None
+        self._seen = 0
+        self._prev: Optional[float] = None
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._peak: Optional[float] = None
+        self._max_dd = 0.0
+
+    def __call__(self, index: int, candle: dict) -> bool:
+        history = self.account.equity_history
+        if self.floor is not None and history and history[-1] < self.floor:
+            self.reason, self.index = "equity_floor", index
+            return True
+        threshold = self.config.score_threshold
+        if threshold is None or index < self.min_index or index % self.config.check_every:
+            return False
+        score = self.partial_score()
+        if score is not None and score < threshold:
+            self.reason, self.index = "score", index
+            return True
+        return False
+
+    def _consume(self) -> None:
+        history = self.account.equity_history
+        for i in range(self._seen, len(history)):
+            equity = float(history[i])
+            if self._peak is None:
+                self._peak = equity
+            if equity > self._peak:
+                self._peak = equity
+            if self._peak > 0:
+                self._max_dd = max(self._max_dd, (self._peak - equity) / self._peak)
+            if self._prev is not None and self._prev != 0:
+                ret = (equity - self._prev) / self._prev
+                self._count += 1
+                delta = ret - self._mean
+                self._mean += delta / self._count
+                self._m2 += delta * (ret - self._mean)
+            self._prev = equity
+        self._seen = len(history)
+
+    def partial_score(self) -> Optional[float]:
+        """Objective score of the equity seen so far, or None if Sharpe is undefined."""
+        if self.objective == "equity":
+            history = self.account.equity_history
+            return float(history[-1]) if history else None
+        self._consume()
+        if self._count < 2:
+            return None
+        std = math.sqrt(self._m2 / (self._count - 1))
+        if std == 0:
+            return None
+        sharpe = self._mean / std * math.sqrt(252)
+        if self.objective == "dual":
+            return sharpe - self._max_dd * self.penalty_factor
+        return sharpe
@@ -0,0 +1,149 @@
+"""
+Walk-forward and k-fold windows for genome selection and out-of-sample scoring.
+
+A Window splits the candle list by index into a train span
+[train_start, test_start) and a test span [test_start, test_end). The
+optimizer selects genomes on their train-span scores only and holds the test
+spans out: once the GA is done, the winning genome is scored on each test
+span, starting from the indicator state the train span leaves behind rather
+than a cold strategy.
+
+WarmupCache computes that warm-up once per window boundary. Streams are
+keyed by indicator type and parameters, so genomes that share e.g. an RSI
+period or a MACD triple reuse one warmed copy.
+"""
+
+from __future__ import annotations
+
+import copy
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from worker.indicators.streaming import StreamingIndicator
+from worker.strategies.ai_fusion import HISTORY_LIMIT, AIFusionStrategy
+
+
+@dataclass(frozen=True)
+class Window:
+    """Index bounds of one train/test split (end indices exclusive)."""
+    train_start: int
+    test_start: int
+    test_end: int
+
+
+def walk_forward_windows(n_candles: int, train_size: int, test_size: int, step: int = 0,
+                         anchored: bool = False) -> List[Window]:
+    """
+    Rolling train/test windows over n_candles.
+
+    Each window trains on `train_size` candles and tests on the next
+    `test_size`; windows advance by `step` (default: test_size, i.e.
+    non-overlapping test spans). With anchored=True the train span always
+    starts at 0 and grows with each window.
+    """
+    if train_size <= 0 or test_size <= 0:
+        raise ValueError("train_size and test_size must be positive")
+    step = step or test_size
+    if step <= 0:
+        raise ValueError("step must be positive")
+    windows = []
+    start = 0
+    while start + train_size + test_size <= n_candles:
+        test_start = start + train_size
+        windows.append(Window(0 if anchored else start, test_start, test_start + test_size))
+        start += step
+    return windows
+
+
+def kfold_windows(n_candles: int, folds: int) -> List[Window]:
+    """
+    Time-series k-fold: cut the candles into folds + 1 contiguous blocks and
+    test on each block after the first, training on everything before it.
+    """
+    if folds <= 0:
+        raise ValueError("folds must be positive")
+    block = n_candles // (folds + 1)
+    if block == 0:
+        raise ValueError(f"{n_candles} candles is too few for {folds} folds")
+    windows = []
+    for i in range(1, folds + 1):
+        test_end = n_candles if i == folds else (i + 1) * block
+        windows.append(Window(0, i * block, test_end))
+    return windows
+
+
+def windows_scope(windows: List[Window]) -> str:
+    """Stable description of a window set, used to scope persisted fitness scores."""
+    return "windows:" + ";".join(f"{w.train_start}-{w.test_start}-{w.test_end}" for w in windows)
+
+
+def _indicator_candle(candle: dict) -> dict:
+    # same shape AIFusionStrategy.compute_indicators builds from a candle
+    price = float(candle["close"])
+    return {
+        "high": float(candle.get("high", price)),
+        "low": float(candle.get("low", price)),
+        "close": price,
+    }
+
+
+def _stream_key(indicator: StreamingIndicator) -> tuple:
+    params = tuple(
+        getattr(indicator, attr) for attr in ("window", "period", "fast", "slow", "signal")
+        if hasattr(indicator, attr)
+    )
+    return (type(indicator).__name__, indicator.history_limit) + params
+
+
+class WarmupCache:
+    """
+    Warmed AIFusionStrategy indicator state per window boundary.
+
+    The strategy only ever looks at its last HISTORY_LIMIT candles, so the
+    warm-up replays at most that many train candles. Warmed streams are held
+    in an LRU of `max_streams` entries and deep-copied into each strategy.
+    """
+
+    def __init__(self, candles: List[dict], max_streams: int = 4096):
+        self.candles = candles
+        self.max_streams = max_streams
+        self._history: Dict[Tuple[int, int], List[dict]] = {}
+        self._streams: "OrderedDict[tuple, StreamingIndicator]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def history(self, window: Window) -> List[dict]:
+        """Indicator inputs for the train candles the strategy would still hold at test_start."""
+        lo = max(window.train_start, window.test_start - HISTORY_LIMIT)
+        key = (lo, window.test_start)
+        history = self._history.get(key)
+        if history is None:
+            history = [_indicator_candle(c) for c in self.candles[lo:window.test_start]]
+            self._history[key] = history
+        return history
+
+    def apply(self, strategy: AIFusionStrategy, window: Window) -> None:
+        """Load the warmed indicator state for `window` into a fresh strategy."""
+        history = self.history(window)
+        if not history:
+            return
+        symbol = self.candles[window.test_start].get("symbol", "DEFAULT")
+        streams = {}
+        for name, fresh in strategy._new_streams().items():
+            key = (window.train_start, window.test_start, _stream_key(fresh))
+            warmed = self._streams.get(key)
+            if warmed is None:
+                self.misses += 1
+                for candle in history:
+                    fresh.update(candle)
+                warmed = fresh
+                self._streams[key] = warmed
+                if len(self._streams) > self.max_streams:
+                    self._streams.popitem(last=False)
+            else:
+                self.hits += 1
+                self._streams.move_to_end(key)
+            streams[name] = copy.deepcopy(warmed)
+        strategy.indicator_streams[symbol] = streams
+        strategy.candle_history[symbol] = deque(history, maxlen=HISTORY_LIMIT)
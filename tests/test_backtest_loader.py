@@ -70,3 +70,97 @@ def test_slice_by_range_no_mutation():
     slice_by_range(candles, start_ts="2024-01-01T01:00:00")
     
     assert len(candles) == original_len
+
+
+def test_slice_by_range_unsorted_list():
+    """Test an unsorted list is filtered in input order, not binary-searched."""
+    candles = [
+        {"timestamp": "2024-01-01T03:00:00", "close": 103.0},
+        {"timestamp": "2024-01-01T00:00:00", "close": 100.0},
+        {"timestamp": "2024-01-01T02:00:00", "close": 102.0},
+        {"timestamp": "2024-01-01T04:00:00", "close": 104.0},
+        {"timestamp": "2024-01-01T01:00:00", "close": 101.0},
+    ]
+    
+    result = slice_by_range(candles, start_ts="2024-01-01T01:00:00", end_ts="2024-01-01T03:00:00")
+    
+    assert [c["close"] for c in result] == [103.0, 102.0, 101.0]
+    assert [c["close"] for c in slice_by_range(candles, end_ts="2024-01-01T00:30:00")] == [100.0]
+
+
+def _write_csv(directory, content, name="candles.csv"):
+    path = os.path.join(directory, name)
+    with open(path, "w") as f:
+        f.write(content)
+    return path
+
+
+UNSORTED_CSV = """timestamp,open,high,low,close,volume
+2024-01-01T02:00:00,101.5,103.0,101.0,102.0,2000.0
+2024-01-01T00:00:00,100.0,101.0,99.0,100.5,1000.0
+2024-01-01T01:00:00,100.5,102.0,100.0,101.5,1500.0
+"""
+
+
+def test_load_candle_frame_matches_load_candles():
+    """Columnar frame holds the same rows as the list-of-dicts loader."""
+    from backtest.loader import load_candle_frame
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_csv(tmp, UNSORTED_CSV)
+        frame = load_candle_frame(path, cache=False)
+
+        assert len(frame) == 3
+        assert frame.close.dtype.name == "float64"
+        assert frame.to_dicts() == load_candles(path)
+        assert frame[0] == load_candles(path)[0]
+        assert not os.path.exists(path + ".npcache")
+
+
+def test_load_candle_frame_headerless_binance_rows():
+    """Headerless kline rows use the first six columns; short rows are skipped."""
+    from backtest.loader import load_candle_frame
+
+    content = "1704067200000,1,2,0.5,1.5,10,extra\n1704070800000,1.5,3,1,2.5,20,extra\nbad,row\n"
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_csv(tmp, content)
+        frame = load_candle_frame(path, cache=False)
+        assert frame.to_dicts() == load_candles(path)
+
+
+def test_load_candle_frame_cache_roundtrip_and_invalidation():
+    """Second load comes from the memory-mapped sidecar; edits invalidate it."""
+    from backtest.loader import load_candle_frame
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = _write_csv(tmp, UNSORTED_CSV)
+        first = load_candle_frame(path)
+        assert os.path.exists(os.path.join(path + ".npcache", "meta.json"))
+
+        cached = load_candle_frame(path)
+        assert not cached.close.flags.writeable  # memory-mapped, read-only
+        assert cached.to_dicts() == first.to_dicts()
+
+        # Touching the file without changing content keeps the cache valid
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+        assert load_candle_frame(path).to_dicts() == first.to_dicts()
+
+        with open(path, "a") as f:
+            f.write("2024-01-01T03:00:00,102.0,104.0,101.5,103.0,2500.0\n")
+        reloaded = load_candle_frame(path)
+        assert len(reloaded) == 4
+        assert reloaded[3]["close"] == 103.0
+
+
+def test_slice_by_range_frame_binary_search():
+    """CandleFrame slicing returns a view bounded by inclusive timestamps."""
+    from backtest.loader import load_candle_frame
+
+    with tempfile.TemporaryDirectory() as tmp:
+        frame = load_candle_frame(_write_csv(tmp, UNSORTED_CSV), cache=False)
+
+        window = slice_by_range(frame, start_ts="2024-01-01T00:30:00", end_ts="2024-01-01T02:00:00")
+        assert [c["timestamp"] for c in window] == ["2024-01-01T01:00:00", "2024-01-01T02:00:00"]
+        assert len(slice_by_range(frame, start_ts="2025-01-01")) == 0
+        assert len(slice_by_range(frame)) == 3
@@ -411,3 +411,144 @@ class TestBacktestIntegration:
         print(f"Max Drawdown:    {result.max_drawdown:.2f}%")
         print(f"Sharpe Ratio:    {result.sharpe_ratio:.2f}")
         print(f"{'='*60}\n")
+
+
+class TestVectorizedBacktester:
+    """Vectorized signal-array simulation matches the bar loop."""
+    
+    @staticmethod
+    def _random_walk(n=3000, seed=1):
+        import numpy as np
+        rng = np.random.default_rng(seed)
+        prices = np.abs(100 + np.cumsum(rng.standard_normal(n) * 0.5)) + 5
+        index = pd.date_range('2024-01-01', periods=n, freq='1h')
+        return pd.DataFrame({
+            'open': prices, 'high': prices * 1.01, 'low': prices * 0.99,
+            'close': prices, 'volume': 1.0,
+        }, index=index)
+    
+    @pytest.mark.parametrize("fast,slow", [(3, 7), (5, 20), (20, 50)])
+    def test_matches_loop_engine(self, fast, slow):
+        """Test vectorized run reproduces the loop results within tolerance."""
+        from backtest.backtester import Backtester, SimpleMovingAverageStrategy
+        
+        data = self._random_walk()
+        strategy = SimpleMovingAverageStrategy(fast_period=fast, slow_period=slow)
+        backtester = Backtester(initial_balance=10000.0)
+        
+        loop = backtester.run(strategy, data)
+        fast_result = backtester.run(strategy, data, vectorized=True)
+        
+        assert fast_result.total_trades == loop.total_trades
+        assert fast_result.winning_trades == loop.winning_trades
+        assert fast_result.final_balance == pytest.approx(loop.final_balance, rel=1e-9)
+        assert fast_result.max_drawdown == pytest.approx(loop.max_drawdown, rel=1e-9, abs=1e-9)
+        assert fast_result.sharpe_ratio == pytest.approx(loop.sharpe_ratio, rel=1e-7, abs=1e-9)
+        assert fast_result.sortino_ratio == pytest.approx(loop.sortino_ratio, rel=1e-7, abs=1e-9)
+        assert list(fast_result.equity_curve.columns) == list(loop.equity_curve.columns)
+        for col in ('balance', 'position_value', 'total_equity'):
+            assert fast_result.equity_curve[col].to_numpy() == pytest.approx(
+                loop.equity_curve[col].to_numpy(), rel=1e-9, abs=1e-6
+            )
+        for a, b in zip(fast_result.trades, loop.trades):
+            assert (a.timestamp, a.side) == (b.timestamp, b.side)
+            assert a.price == pytest.approx(b.price, rel=1e-12)
+            assert a.value == pytest.approx(b.value, rel=1e-9)
+    
+    def test_open_position_is_closed_at_end(self):
+        """Test a position still open on the last bar is force-closed like the loop."""
+        from backtest.backtester import Backtester, Strategy
+        
+        class BuyOnce(Strategy):
+            def generate_signals(self, data):
+                signals = pd.Series(0, index=data.index)
+                signals.iloc[3] = 1
+                signals.iloc[4] = 1  # ignored: already long
+                return signals
+        
+        data = self._random_walk(n=20)
+        backtester = Backtester(initial_balance=1000.0)
+        loop = backtester.run(BuyOnce(), data)
+        fast_result = backtester.run_vectorized(BuyOnce(), data)
+        
+        assert [t.side for t in fast_result.trades] == ['buy', 'sell']
+        assert fast_result.final_balance == pytest.approx(loop.final_balance, rel=1e-12)
+
+
+class TestPortfolioBacktestEngine:
+    """Multi-symbol backtests over merged candle streams with shared capital."""
+    
+    @staticmethod
+    def _stream(start_price, n=40, step=1.0, offset_hours=0):
+        timestamps = pd.date_range('2024-01-01', periods=n, freq='1h') + pd.Timedelta(hours=offset_hours)
+        return [
+            {"timestamp": ts.isoformat(), "open": start_price + i * step,
+             "high": start_price + i * step + 1, "low": start_price + i * step - 1,
+             "close": start_price + i * step + 0.5, "volume": 1.0}
+            for i, ts in enumerate(timestamps)
+        ]
+    
+    def test_merge_candle_streams_orders_by_timestamp(self):
+        """Test the heap merge yields global timestamp order, ties by symbol order."""
+        from backtest.replay import merge_candle_streams
+        
+        streams = {
+            "BTC/USDT": self._stream(100, n=5),
+            "ETH/USDT": self._stream(10, n=5, offset_hours=2),
+        }
+        merged = list(merge_candle_streams(streams))
+        
+        assert len(merged) == 10
+        timestamps = [candle["timestamp"] for _, candle in merged]
+        assert timestamps == sorted(timestamps)
+        ties = [symbol for symbol, candle in merged if candle["timestamp"] == streams["ETH/USDT"][0]["timestamp"]]
+        assert ties == ["BTC/USDT", "ETH/USDT"]
+    
+    def test_incremental_equity_matches_full_revaluation(self):
+        """Test per-event equity equals get_total_equity over all last prices."""
+        from backtest.engine import PortfolioBacktestEngine
+        
+        engine = PortfolioBacktestEngine(initial_capital=10000.0)
+        checks = []
+        
+        def strategy(symbol, candle, connector):
+            checks.append((engine.current_equity(), connector.get_total_equity(engine.last_prices)))
+            index = int(candle["open"]) % 10
+            if index == 2 and symbol not in connector.positions:
+                return {"side": "buy", "quantity": 1.0}
+            if index == 7 and symbol in connector.positions:
+                return {"side": "sell", "quantity": 1.0}
+            return None
+        
+        result = engine.run_portfolio(
+            {"BTC/USDT": self._stream(100), "ETH/USDT": self._stream(50, step=-0.5, offset_hours=3)},
+            strategy,
+        )
+        
+        assert result.total_trades > 0
+        for incremental, full in checks:
+            assert incremental == pytest.approx(full, rel=1e-12)
+        assert engine.current_equity() == pytest.approx(
+            engine.connector.get_total_equity(engine.last_prices), rel=1e-12
+        )
+        # one equity point per distinct timestamp
+        assert len(result.equity_curve) == 43
+        assert result.to_dict()["trades"]
+    
+    def test_symbols_share_capital(self):
+        """Test orders for every symbol draw on the same account."""
+        from backtest.engine import PortfolioBacktestEngine
+        
+        def buy_first(symbol, candle, connector):
+            if symbol not in connector.positions:
+                return {"side": "buy", "quantity": 50.0}
+            return None
+        
+        engine = PortfolioBacktestEngine(initial_capital=10000.0)
+        engine.run_portfolio(
+            {"AAA/USDT": self._stream(100), "BBB/USDT": self._stream(100)},
+            {"AAA/USDT": buy_first, "BBB/USDT": buy_first},
+        )
+        
+        # 50 * 100.5 fits once; the second symbol's order is rejected for funds
+        assert set(engine.connector.positions) == {"AAA/USDT"}
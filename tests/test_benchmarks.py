@@ -0,0 +1,45 @@
+"""Tests for the benchmark harness and regression comparison."""
+import json
+
+from benchmarks.harness import compare_reports, result
+
+
+def test_compare_flags_regressions_in_metric_direction():
+    """Test throughput drops and latency rises beyond the threshold are regressions."""
+    baseline = {"results": [
+        result("backtest.replay", "candles_per_sec", 1000.0),
+        result("indicators.SMA.calculate.n=50", "us_per_call", 2.0, higher_is_better=False),
+        result("loader.load_candles", "mb_per_sec", 50.0),
+        result("removed.bench", "ops", 1.0),
+    ]}
+    current = {"results": [
+        result("backtest.replay", "candles_per_sec", 800.0),
+        result("indicators.SMA.calculate.n=50", "us_per_call", 1.0, higher_is_better=False),
+        result("loader.load_candles", "mb_per_sec", 48.0),
+        result("new.bench", "ops", 1.0),
+    ]}
+
+    rows = {row["name"]: row for row in compare_reports(current, baseline, threshold=0.15)}
+
+    assert set(rows) == {"backtest.replay", "indicators.SMA.calculate.n=50", "loader.load_candles"}
+    assert rows["backtest.replay"]["regression"]
+    assert rows["indicators.SMA.calculate.n=50"]["change"] == 1.0
+    assert not rows["indicators.SMA.calculate.n=50"]["regression"]
+    assert not rows["loader.load_candles"]["regression"]
+
+
+def test_quick_run_writes_json_and_compares(tmp_path):
+    """Test a tiny run writes a result file and compares cleanly against itself."""
+    from benchmarks.run import main
+
+    args = ["--only", "loader", "--only", "backtest", "--candles", "300", "--repeat", "1",
+            "--output-dir", str(tmp_path), "--save-baseline"]
+    assert main(args) == 0
+
+    baseline = json.loads((tmp_path / "baseline.json").read_text())
+    names = [r["name"] for r in baseline["results"]]
+    assert names == ["loader.load_candles", "loader.load_candle_frame.cached", "backtest.replay"]
+    assert all(r["value"] > 0 for r in baseline["results"])
+    assert len(list(tmp_path.glob("bench_*.json"))) == 1
+
+    assert main(["--results", str(tmp_path / "baseline.json"), "--compare", str(tmp_path / "baseline.json")]) == 0
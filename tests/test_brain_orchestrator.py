@@ -90,4 +90,239 @@ def test_import_safe():
     import importlib
 
     module = importlib.import_module("backend.brain.orchestrator")
-    assert hasattr(module, "orchestrate_providers")
\ No newline at end of file
+    assert hasattr(module, "orchestrate_providers")
+
+def _signal(provider_id, action="hold", confidence=0.5):
+    from backend.brain.orchestrator.schema import ProviderSignal
+
+    return ProviderSignal(provider_id, action, confidence, 0.4, [provider_id], {})
+
+
+def test_async_matches_sync_decision():
+    import asyncio
+
+    from backend.brain.orchestrator import orchestrate_providers_async
+
+    sync_result = orchestrate_providers({"foo": "bar"}, fake_mode=True)
+    async_result = asyncio.run(orchestrate_providers_async({"foo": "bar"}, fake_mode=True))
+
+    assert async_result["action"] == sync_result["action"]
+    assert async_result["confidence"] == sync_result["confidence"]
+    assert async_result["meta"]["signals_used"] == sync_result["meta"]["signals_used"]
+    assert set(async_result["meta"]["provider_latency_ms"]) == set(sync_result["meta"]["signals_used"])
+
+
+def test_async_slow_provider_times_out(monkeypatch):
+    import asyncio
+
+    from backend.brain.orchestrator import orchestrate_providers_async, providers
+
+    async def slow(payload, env=None):
+        await asyncio.sleep(1.0)
+        return _signal("tradingview", "buy", 0.99)
+
+    monkeypatch.setitem(providers.PROVIDER_FUNCS, "tradingview", slow)
+    metrics = _StubMetrics()
+
+    result = asyncio.run(
+        orchestrate_providers_async({}, fake_mode=True, provider_timeout=0.05, metrics_client=metrics)
+    )
+
+    assert "tradingview" in result["meta"]["failed_providers"]
+    assert "tradingview" not in result["meta"]["signals_used"]
+    assert result["action"] in {"buy", "hold"}
+    assert _metrics_count(metrics.calls, "brain_orchestrator_provider_failure_total", "reason", "timeout") == 1
+
+
+def test_async_deadline_marks_pending_providers(monkeypatch):
+    import asyncio
+
+    from backend.brain.orchestrator import orchestrate_providers_async, providers
+
+    async def slow(payload, env=None):
+        await asyncio.sleep(1.0)
+        return _signal("indicators")
+
+    monkeypatch.setitem(providers.PROVIDER_FUNCS, "indicators", slow)
+
+    result = asyncio.run(orchestrate_providers_async({}, fake_mode=True, deadline=0.05))
+
+    assert result["meta"]["failed_providers"] == ["indicators"]
+
+
+def test_sync_entrypoint_does_not_wait_for_blocking_provider(monkeypatch):
+    import time
+
+    from backend.brain.orchestrator import providers
+
+    def blocking(payload, env=None):
+        time.sleep(1.0)
+        return _signal("indicators")
+
+    monkeypatch.setitem(providers.PROVIDER_FUNCS, "indicators", blocking)
+    monkeypatch.setenv("BRAIN_ORCHESTRATOR_CONCURRENT", "1")
+    monkeypatch.setenv("BRAIN_DECISION_DEADLINE_MS", "200")
+
+    started = time.perf_counter()
+    result = orchestrate_providers({}, fake_mode=True, cache=False)
+    elapsed = time.perf_counter() - started
+
+    assert result["meta"]["failed_providers"] == ["indicators"]
+    assert elapsed <= 0.2 + 0.1  # deadline plus scheduling slack, far below the 1 s provider
+
+
+def test_async_completion_order_keeps_tiebreak(monkeypatch):
+    import asyncio
+
+    from backend.brain.orchestrator import orchestrate_providers_async, providers
+
+    async def late_a(payload, env=None):
+        await asyncio.sleep(0.02)
+        return _signal("a", "buy", 0.7)
+
+    async def early_b(payload, env=None):
+        return _signal("b", "sell", 0.7)
+
+    monkeypatch.setitem(providers.PROVIDER_FUNCS, "tradingview", late_a)
+    monkeypatch.setitem(providers.PROVIDER_FUNCS, "indicators", early_b)
+
+    result = asyncio.run(orchestrate_providers_async({}, fake_mode=True))
+
+    assert result["action"] == "buy"
+    assert result["meta"]["signals_used"] == ["a", "b", "brain", "marketdata"]
+
+
+def test_async_hedged_call_recovers_flaky_provider(monkeypatch):
+    import asyncio
+
+    from backend.brain.orchestrator import orchestrate_providers_async, providers
+
+    calls = []
+
+    async def flaky(payload, env=None):
+        calls.append(1)
+        if len(calls) == 1:
+            await asyncio.sleep(1.0)
+        return _signal("marketdata", "sell", 0.95)
+
+    monkeypatch.setitem(providers.PROVIDER_FUNCS, "marketdata", flaky)
+    metrics = _StubMetrics()
+
+    result = asyncio.run(
+        orchestrate_providers_async(
+            {},
+            fake_mode=True,
+            provider_timeout=0.5,
+            hedge=["marketdata"],
+            hedge_delay=0.02,
+            metrics_client=metrics,
+        )
+    )
+
+    assert len(calls) == 2
+    assert result["action"] == "sell"
+    assert _metrics_count(metrics.calls, "brain_orchestrator_provider_hedged_total", "provider", "marketdata") == 1
+
+
+def test_provider_metrics_carry_latency_label():
+    metrics = _StubMetrics()
+
+    orchestrate_providers({}, fake_mode=True, metrics_client=metrics)
+
+    success = [lbl for n, lbl in metrics.calls if n == "brain_orchestrator_provider_success_total"]
+    assert success
+    assert all("latency_le" in lbl for lbl in success)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _counting_provider(provider_id, calls):
+    def provider(payload, env=None):
+        calls.append(provider_id)
+        return _signal(provider_id)
+
+    return provider
+
+
+def test_payload_digest_ignores_key_order():
+    from backend.brain.orchestrator import payload_digest
+
+    assert payload_digest({"a": 1, "b": {"x": 1, "y": 2}}) == payload_digest({"b": {"y": 2, "x": 1}, "a": 1})
+    assert payload_digest({"a": 1}) != payload_digest({"a": 2})
+
+
+def test_result_cache_skips_repeat_provider_calls(monkeypatch):
+    from backend.brain.orchestrator import ProviderResultCache, providers
+
+    calls = []
+    for provider_id in list(providers.PROVIDER_FUNCS):
+        monkeypatch.setitem(providers.PROVIDER_FUNCS, provider_id, _counting_provider(provider_id, calls))
+    cache = ProviderResultCache(default_ttl=10.0)
+    metrics = _StubMetrics()
+
+    first = orchestrate_providers({"x": 1}, fake_mode=False, cache=cache, metrics_client=metrics)
+    second = orchestrate_providers({"x": 1}, fake_mode=False, cache=cache, metrics_client=metrics)
+
+    assert len(calls) == 4
+    assert second["action"] == first["action"]
+    assert second["meta"]["signals_used"] == first["meta"]["signals_used"]
+    assert cache.stats()["hit_ratio"] == 0.5
+    assert _metrics_count(metrics.calls, "brain_orchestrator_provider_cache_total", "result", "hit") == 4
+
+
+def test_result_cache_per_provider_ttl_and_lru():
+    from backend.brain.orchestrator import ProviderResultCache
+
+    clock = _Clock()
+    cache = ProviderResultCache(default_ttl=1.0, ttls={"brain": 0.1, "marketdata": 0}, max_entries=2, clock=clock)
+    cache.put("brain", "d", _signal("brain"))
+    cache.put("indicators", "d", _signal("indicators"))
+    cache.put("marketdata", "d", _signal("marketdata"))
+
+    assert cache.get("marketdata", "d") is None  # ttl 0 disables caching
+    clock.now = 0.5
+    assert cache.get("brain", "d") is None  # expired
+    assert cache.get("indicators", "d") is not None
+
+    cache.put("a", "d", _signal("a"))
+    cache.put("b", "d", _signal("b"))
+    assert len(cache) == 2
+    assert cache.get("indicators", "d") is None  # least recently used, evicted
+
+
+def test_result_cache_bypassed_in_fake_mode(monkeypatch):
+    from backend.brain.orchestrator import ProviderResultCache, providers
+
+    calls = []
+    for provider_id in list(providers.PROVIDER_FUNCS):
+        monkeypatch.setitem(providers.PROVIDER_FUNCS, provider_id, _counting_provider(provider_id, calls))
+    cache = ProviderResultCache(default_ttl=10.0)
+
+    orchestrate_providers({"x": 1}, fake_mode=True, cache=cache)
+    orchestrate_providers({"x": 1}, fake_mode=True, cache=cache)
+
+    assert len(calls) == 8
+    assert len(cache) == 0
+
+
+def test_async_uses_result_cache(monkeypatch):
+    import asyncio
+
+    from backend.brain.orchestrator import ProviderResultCache, orchestrate_providers_async, providers
+
+    calls = []
+    for provider_id in list(providers.PROVIDER_FUNCS):
+        monkeypatch.setitem(providers.PROVIDER_FUNCS, provider_id, _counting_provider(provider_id, calls))
+    cache = ProviderResultCache(default_ttl=10.0)
+
+    orchestrate_providers({"x": 1}, fake_mode=False, cache=cache)
+    result = asyncio.run(orchestrate_providers_async({"x": 1}, fake_mode=False, cache=cache))
+
+    assert len(calls) == 4
+    assert result["meta"]["signals_used"] == list(providers.PROVIDER_FUNCS)
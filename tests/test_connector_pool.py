@@ -0,0 +1,219 @@
+"""
+Unit tests for the pooled exchange connectors used by route_order.
+
+Tests cover:
+- Reuse of warm connectors per (name, testnet, credentials)
+- Health-check refresh of broken connectors
+- Balance TTL cache and invalidation on fills
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.models import Base
+from worker.executor.connector_pool import ConnectorPool
+from worker.executor.order_router import route_order
+
+
+class FakeConnector:
+    """In-memory connector that counts calls."""
+
+    def __init__(self, name, testnet=True, **kwargs):
+        self.name = name
+        self.testnet = testnet
+        self.kwargs = kwargs
+        self.balance_calls = 0
+        self.order_calls = 0
+        self.closed = False
+        self.fail_balance = False
+        self.order_response = {"id": "1", "status": "closed", "filled": 0.001}
+
+    async def fetch_balance(self):
+        self.balance_calls += 1
+        if self.fail_balance:
+            raise ConnectionError("socket closed")
+        return {"USDT": {"free": 1000.0, "used": 0.0, "total": 1000.0}}
+
+    async def create_order(self, order_payload):
+        self.order_calls += 1
+        return dict(self.order_response)
+
+    async def close(self):
+        self.closed = True
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def built():
+    return []
+
+
+@pytest.fixture
+def pool(built):
+    def factory(name, testnet=True, **kwargs):
+        connector = FakeConnector(name, testnet=testnet, **kwargs)
+        built.append(connector)
+        return connector
+
+    return ConnectorPool(factory, balance_ttl=2.0, health_check_interval=30.0, clock=Clock())
+
+
+@pytest.fixture
+def db_session():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+ORDER = {"symbol": "BTC/USDT", "side": "buy", "type": "market", "amount": 0.001}
+
+
+class TestConnectorPool:
+    """Test connector reuse and refresh."""
+
+    def test_reuses_connector_per_key(self, pool, built):
+        """Test the same key returns the same warm connector."""
+        async def run():
+            first = await pool.acquire("binance", testnet=True)
+            second = await pool.acquire("BINANCE", testnet=True)
+            other = await pool.acquire("binance", testnet=False)
+            keyed = await pool.acquire("binance", testnet=True, api_key="k2", api_secret="s2")
+            return first, second, other, keyed
+
+        first, second, other, keyed = asyncio.run(run())
+
+        assert first is second
+        assert other is not first
+        assert keyed is not first
+        assert len(built) == 3
+        assert pool.stats()["reused"] == 1
+
+    def test_key_does_not_hold_secret(self):
+        """Test credentials are fingerprinted in the pool key."""
+        key = ConnectorPool.key_for("binance", True, api_key="key", api_secret="very-secret")
+
+        assert "very-secret" not in repr(key)
+        assert key != ConnectorPool.key_for("binance", True, api_key="key", api_secret="other")
+
+    def test_failed_health_check_rebuilds_connector(self, pool, built):
+        """Test an unhealthy connector is closed and replaced."""
+        async def run():
+            first = await pool.acquire("binance")
+            first.fail_balance = True
+            pool.mark_unhealthy("binance")
+            second = await pool.acquire("binance")
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first.closed
+        assert second is not first
+        assert pool.stats()["refreshed"] == 1
+
+    def test_periodic_health_check(self, pool, built):
+        """Test idle connectors are checked after the interval."""
+        async def run():
+            connector = await pool.acquire("binance")
+            pool._clock.now = 31.0
+            again = await pool.acquire("binance")
+            return connector, again
+
+        connector, again = asyncio.run(run())
+
+        assert again is connector
+        assert connector.balance_calls == 1
+
+    def test_new_event_loop_gets_new_connector(self, pool, built):
+        """Test connectors are not shared across event loops."""
+        first = asyncio.run(pool.acquire("binance"))
+        second = asyncio.run(pool.acquire("binance"))
+
+        assert first is not second
+
+
+class TestBalanceCache:
+    """Test the short-TTL balance cache."""
+
+    def test_balance_cached_within_ttl(self, pool, built):
+        """Test repeat balance reads inside the TTL skip the exchange."""
+        async def run():
+            await pool.fetch_balance("binance")
+            await pool.fetch_balance("binance")
+            pool._clock.now = 2.5
+            await pool.fetch_balance("binance")
+
+        asyncio.run(run())
+
+        assert built[0].balance_calls == 2
+        assert pool.stats()["balance_hits"] == 1
+
+    def test_invalidate_balance(self, pool, built):
+        """Test invalidation forces a fresh fetch."""
+        async def run():
+            await pool.fetch_balance("binance")
+            pool.invalidate_balance("binance")
+            await pool.fetch_balance("binance")
+
+        asyncio.run(run())
+
+        assert built[0].balance_calls == 2
+
+
+class TestRouteOrderPooling:
+    """Test route_order with an explicit pool."""
+
+    def test_orders_share_connector_and_fill_invalidates_balance(self, pool, built, db_session):
+        """Test two orders use one connector; a fill forces a fresh balance."""
+        async def run():
+            await route_order("binance", dict(ORDER), db_session, pool=pool)
+            await route_order("binance", dict(ORDER), db_session, pool=pool)
+
+        asyncio.run(run())
+
+        assert len(built) == 1
+        assert built[0].order_calls == 2
+        assert built[0].balance_calls == 2  # each fill invalidated the cached balance
+        assert not built[0].closed
+
+    def test_open_order_keeps_cached_balance(self, pool, built, db_session):
+        """Test unfilled orders reuse the cached balance."""
+        async def run():
+            connector = await pool.acquire("binance")
+            connector.order_response = {"id": "2", "status": "open", "filled": 0.0}
+            await route_order("binance", dict(ORDER), db_session, pool=pool)
+            await route_order("binance", dict(ORDER), db_session, pool=pool)
+
+        asyncio.run(run())
+
+        assert built[0].balance_calls == 1
+
+    def test_exchange_error_marks_connector_unhealthy(self, pool, built, db_session):
+        """Test an exchange error triggers a health check on the next order."""
+        async def run():
+            connector = await pool.acquire("binance")
+
+            async def boom(order_payload):
+                raise ConnectionError("reset by peer")
+
+            connector.create_order = boom
+            with pytest.raises(ConnectionError):
+                await route_order("binance", dict(ORDER), db_session, pool=pool)
+            connector.fail_balance = True
+            return connector, await pool.acquire("binance")
+
+        broken, replacement = asyncio.run(run())
+
+        assert broken.closed
+        assert replacement is not broken
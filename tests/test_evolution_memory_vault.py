@@ -0,0 +1,168 @@
+import asyncio
+import glob
+import os
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from backend.core.EvolutionMemoryVault import (
+    EvolutionEventType,
+    EvolutionMemoryVault,
+    EvolutionRecord,
+)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def _record(i: int, module: str = "fusion") -> EvolutionRecord:
+    return EvolutionRecord(
+        timestamp=time.time() + i * 1e-3,
+        module=module,
+        event_type=EvolutionEventType.MODULE_IMPROVEMENT,
+        previous_state={"i": i - 1},
+        new_state={"i": i},
+        reason="test",
+        metrics={"score": i},
+    )
+
+
+def _row_count(db_path: str) -> int:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM evolution_records").fetchone()[0]
+    finally:
+        conn.close()
+
+
+@pytest.mark.anyio("asyncio")
+async def test_write_behind_group_commits(tmp_path):
+    vault = EvolutionMemoryVault(str(tmp_path), write_behind=True, batch_size=50)
+    await vault.initialize()
+
+    for i in range(200):
+        assert await vault.save_evolution_record(_record(i, module=f"m{i % 2}"))
+    await vault.flush()
+
+    stats = await vault.get_vault_statistics()
+    assert _row_count(vault.db_path) == 200
+    assert stats["pending_writes"] == 0
+    assert stats["batches_committed"] <= 10  # not one commit per record
+    history = await vault.get_evolution_history_for("m1", limit=150)
+    assert len(history) == 100
+    await vault.shutdown()
+
+
+@pytest.mark.anyio("asyncio")
+async def test_full_queue_applies_backpressure(tmp_path, monkeypatch):
+    vault = EvolutionMemoryVault(
+        str(tmp_path), write_behind=True, batch_size=1, max_pending_writes=2
+    )
+    await vault.initialize()
+    release = threading.Event()
+    insert = vault._writer._insert
+
+    def blocked_insert(rows):
+        release.wait(5)
+        insert(rows)
+
+    monkeypatch.setattr(vault._writer, "_insert", blocked_insert)
+
+    await vault.save_evolution_record(_record(0))
+    await asyncio.sleep(0.02)  # record 0 is in the (blocked) commit
+    await vault.save_evolution_record(_record(1))
+    await vault.save_evolution_record(_record(2))
+    fourth = asyncio.create_task(vault.save_evolution_record(_record(3)))
+    await asyncio.sleep(0.05)
+    assert not fourth.done()
+    assert len(vault.record_cache) == 3  # no fallback to the cache either
+
+    release.set()
+    assert await asyncio.wait_for(fourth, timeout=2)
+    await vault.flush()
+    assert _row_count(vault.db_path) == 4
+    await vault.shutdown()
+
+
+@pytest.mark.anyio("asyncio")
+async def test_shutdown_flushes_pending_records(tmp_path):
+    vault = EvolutionMemoryVault(
+        str(tmp_path), write_behind=True, batch_size=1000, flush_interval_ms=60_000
+    )
+    await vault.initialize()
+    for i in range(5):
+        await vault.save_evolution_record(_record(i))
+    assert _row_count(vault.db_path) == 0  # still waiting for the batch
+
+    await vault.shutdown()
+
+    assert _row_count(vault.db_path) == 5
+    (backup,) = glob.glob(os.path.join(vault.backup_path, "*", "evolution.db"))
+    assert _row_count(backup) == 5
+
+
+@pytest.mark.anyio("asyncio")
+async def test_direct_mode_commits_each_save(tmp_path):
+    vault = EvolutionMemoryVault(str(tmp_path), write_behind=False)
+    await vault.initialize()
+
+    assert await vault.save_evolution_record(_record(1))
+    assert _row_count(vault.db_path) == 1
+
+    duplicate = _record(2)
+    duplicate.vault_id = vault.record_cache[-1].vault_id
+    assert not await vault.save_evolution_record(duplicate)
+    assert vault.failed_writes == 1
+    await vault.shutdown()
+
+
+@pytest.mark.anyio("asyncio")
+async def test_module_index_tracks_cache_eviction(tmp_path):
+    vault = EvolutionMemoryVault(str(tmp_path), max_cache_size=10)
+    await vault.initialize()
+    for i in range(25):
+        record = _record(i, module="a" if i % 3 else "b")
+        record.success = i % 2 == 0
+        await vault.save_evolution_record(record)
+
+    cached = list(vault.record_cache)
+    for module in ("a", "b"):
+        expected = [r for r in cached if r.module == module]
+        assert await vault.get_evolution_history_for(module, limit=len(expected)) == expected
+        assert vault.cache_index.module_stats[module]["total_events"] == len(expected)
+
+    summary = await vault.summarize_patterns()
+    b_records = [r for r in cached if r.module == "b"]
+    assert summary["module_trends"]["b"]["success_rate"] == (
+        sum(r.success for r in b_records) / len(b_records)
+    )
+    assert summary["module_trends"]["b"]["last_activity"] == b_records[-1].timestamp
+    assert sum(summary["event_frequencies"].values()) == 10
+
+    await vault.get_evolution_history_for("a", limit=500)  # more than cached
+    await vault.load_recent_evolution(5)
+    stats = await vault.get_vault_statistics()
+    assert stats["cache_hits_by_index"] == {"module": 2, "recent": 1}
+    assert stats["cache_misses_by_index"] == {"module": 1}
+    await vault.shutdown()
+
+
+@pytest.mark.anyio("asyncio")
+async def test_reloaded_cache_is_oldest_first(tmp_path):
+    vault = EvolutionMemoryVault(str(tmp_path))
+    await vault.initialize()
+    for i in range(5):
+        await vault.save_evolution_record(_record(i))
+    saved = [r.vault_id for r in vault.record_cache]
+    await vault.shutdown()
+
+    reopened = EvolutionMemoryVault(str(tmp_path))
+    await reopened.initialize()
+    recent = await reopened.load_recent_evolution(2)
+    assert [r.vault_id for r in recent] == saved[-2:]
+    assert [r.vault_id for r in await reopened.get_evolution_history_for("fusion", 5)] == saved
+    await reopened.shutdown()
@@ -0,0 +1,112 @@
+"""
+Tests for the incremental signal aggregation in ExecutionNervousSystem.
+"""
+import asyncio
+import random
+import time
+
+import pytest
+
+from backend.engines.execution.ExecutionNervousSystem import (
+    CONFLICTING_ACTION_PAIRS,
+    EngineSignal,
+    EngineType,
+    ExecutionNervousSystem,
+    SignalPriority,
+)
+
+ACTIONS = ["BUY", "SELL", "HOLD", "CANCEL", "RE_ROUTE", "HEDGE"]
+
+
+def _signal(rng, timestamp):
+    return EngineSignal(
+        engine_type=rng.choice(list(EngineType)),
+        signal_type="test",
+        confidence=rng.uniform(0, 100),
+        priority=rng.choice(list(SignalPriority)),
+        action_recommendation=rng.choice(ACTIONS),
+        data={},
+        timestamp=timestamp,
+        stability_impact=rng.uniform(-1, 1),
+        aggression_level=rng.uniform(0, 1),
+    )
+
+
+def _reference(ens, signals):
+    """Full rescan with the original pairwise formulas."""
+    ew = [ens.engine_weights.get(s.engine_type, 0.1) for s in signals]
+    sw = [w * ens.priority_weights.get(s.priority, 0.5) for w, s in zip(ew, signals)]
+    conflicts = sum(
+        1
+        for i, a in enumerate(signals)
+        for b in signals[i + 1:]
+        if any(a.action_recommendation in p and b.action_recommendation in p
+               and a.action_recommendation != b.action_recommendation
+               for p in CONFLICTING_ACTION_PAIRS)
+    )
+    n = len(signals)
+    possible = n * (n - 1) / 2
+    return {
+        "confidence": sum(s.confidence * w for s, w in zip(signals, sw)) / sum(sw),
+        "stability": 50.0 + sum(s.stability_impact * w for s, w in zip(signals, ew)) / sum(ew) * 50.0,
+        "aggression": sum(s.aggression_level * w for s, w in zip(signals, ew)) / sum(ew) * 100,
+        "conflicts": conflicts,
+        "consensus": 100.0 if possible == 0 else (possible - conflicts) / possible * 100,
+    }
+
+
+def test_incremental_state_matches_full_rescan():
+    """Test running aggregates equal a from-scratch recompute as signals arrive and expire."""
+    ens = ExecutionNervousSystem()
+    rng = random.Random(4)
+    now = time.time()
+
+    async def scenario():
+        for step in range(6):
+            for k in range(40):
+                await ens._process_signal(_signal(rng, now - rng.uniform(0, 12)))
+            state = await ens.compute_unified_state()
+            active = {s.signal_id for s in state.active_signals}
+            for s in ens.signal_history:
+                if now - s.timestamp < ens.signal_timeout - 1:
+                    assert s.signal_id in active
+                elif now - s.timestamp > ens.signal_timeout + 1:
+                    assert s.signal_id not in active
+            expected = _reference(ens, state.active_signals)
+
+            assert state.aggregated_confidence == pytest.approx(expected["confidence"])
+            assert state.stability_score == pytest.approx(max(0.0, min(100.0, expected["stability"])))
+            assert state.aggression_score == pytest.approx(expected["aggression"])
+            assert state.conflict_count == expected["conflicts"]
+            assert state.consensus_level == pytest.approx(expected["consensus"])
+            assert len(state.conflicting_signals) == min(50, expected["conflicts"])
+            for a, b in state.conflicting_signals:
+                assert ens._are_signals_conflicting(a, b)
+
+    asyncio.run(scenario())
+
+
+def test_expired_signals_leave_the_aggregates():
+    """Test expiry drops a signal's contribution and an empty set resets to neutral."""
+    ens = ExecutionNervousSystem()
+    now = time.time()
+
+    async def scenario():
+        old = EngineSignal(EngineType.REFLEX_LOOP, "t", 90.0, SignalPriority.HIGH, "SELL", {}, timestamp=now - 60)
+        fresh = EngineSignal(EngineType.NEURAL_REACTION, "t", 40.0, SignalPriority.HIGH, "BUY", {}, timestamp=now)
+        await ens._process_signal(old)
+        await ens._process_signal(fresh)
+
+        state = await ens.compute_unified_state()
+        assert [s.signal_id for s in state.active_signals] == [fresh.signal_id]
+        assert state.aggregated_confidence == pytest.approx(40.0)
+        assert state.conflict_count == 0
+        assert state.dominant_engine == EngineType.NEURAL_REACTION
+
+        ens.signal_timeout = -1.0  # everything is stale now
+        state = await ens.compute_unified_state()
+        assert state.active_signals == []
+        assert ens.signal_aggregator.action_counts == {}
+        assert ens.signal_aggregator.confidence_weight == 0.0
+
+    asyncio.run(scenario())
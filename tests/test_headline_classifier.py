@@ -0,0 +1,123 @@
+"""
+Tests for the compiled headline classifier.
+
+Tests cover:
+- Impact, sentiment and asset tags from one scan
+- Agreement with the per-keyword substring checks it replaces
+- Batch classification of a feed
+- NewsFilter / NewsAnchor parser integration
+"""
+
+import random
+
+from worker.news.headline_classifier import (
+    ASSET_KEYWORDS,
+    NEGATIVE_KEYWORDS,
+    POSITIVE_KEYWORDS,
+    HeadlineClassifier,
+)
+from worker.news.news_anchor import MarketBias, parse_marketwatch, parse_reuters
+from worker.news.news_filter import HEADLINE_CLASSIFIER, NewsFilter, NewsImpact
+
+WORDS = [
+    "markets", "stocks", "bitcoin", "dollar", "yen", "traders", "outlook", "futures", "treasury",
+    "earnings", "shares", "gold", "crude", "central bank", "interest rate", "inflation", "retail",
+    "sales", "data", "survey", "report", "speech", "rally", "surges", "gains", "up", "falls", "drop",
+    "decline", "down", "fomc", "ecb", "boe", "cpi", "gdp", "nfp", "supply", "update", "dow jones",
+]
+
+
+def reference_classify(title):
+    """The keyword loops the classifier replaced, with keywords upper-cased."""
+    title = title.upper()
+    if any(k.upper() in title for k in NewsFilter.CRITICAL_EVENTS):
+        impact = NewsImpact.CRITICAL
+    elif any(k in title for k in NewsFilter.HIGH_IMPACT_KEYWORDS):
+        impact = NewsImpact.HIGH
+    elif any(k in title for k in NewsFilter.MEDIUM_IMPACT_KEYWORDS):
+        impact = NewsImpact.MEDIUM
+    else:
+        impact = NewsImpact.LOW
+    if any(k in title for k in POSITIVE_KEYWORDS):
+        sentiment = 1
+    elif any(k in title for k in NEGATIVE_KEYWORDS):
+        sentiment = -1
+    else:
+        sentiment = 0
+    assets = tuple(sorted(a for a, keywords in ASSET_KEYWORDS.items() if any(k in title for k in keywords)))
+    return impact, sentiment, assets
+
+
+class TestHeadlineClassifier:
+    """Test single and batch classification."""
+
+    def test_classifies_impact_sentiment_and_assets(self):
+        """Test one headline yields all three labels."""
+        result = HEADLINE_CLASSIFIER.classify("Bitcoin rally as Federal Reserve holds rates")
+
+        assert result.impact == NewsImpact.CRITICAL
+        assert result.sentiment == 1
+        assert result.assets == ("CRYPTO", "USD")
+        assert "FEDERAL RESERVE" in result.keywords
+
+    def test_positive_wins_over_negative(self):
+        """Test a headline with both directions is positive, as before."""
+        assert HEADLINE_CLASSIFIER.classify("Stocks drop then rally").sentiment == 1
+        assert HEADLINE_CLASSIFIER.classify("Gold falls").sentiment == -1
+        assert HEADLINE_CLASSIFIER.classify("Quiet session").sentiment == 0
+
+    def test_matches_substring_semantics(self):
+        """Test agreement with the old substring checks on a random corpus."""
+        rng = random.Random(3)
+        headlines = [" ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 10))).title() for _ in range(2000)]
+
+        for headline, result in zip(headlines, HEADLINE_CLASSIFIER.classify_batch(headlines)):
+            assert (result.impact, result.sentiment, result.assets) == reference_classify(headline), headline
+
+    def test_batch_matches_single(self):
+        """Test classify_batch equals classify per headline, including empty ones."""
+        headlines = ["CPI data due", "", "Yen slides lower", "Retail sales up"]
+
+        assert HEADLINE_CLASSIFIER.classify_batch(headlines) == [HEADLINE_CLASSIFIER.classify(h) for h in headlines]
+        assert HEADLINE_CLASSIFIER.classify_batch(["a\nb", "rally"])[1].sentiment == 1
+        assert HEADLINE_CLASSIFIER.classify_batch([]) == []
+
+    def test_overlapping_mode_finds_adjacent_keywords(self):
+        """Test overlapping=True finds keywords sharing letters with a previous match."""
+        fast = HeadlineClassifier([], default_impact="low", asset_keywords={"USD": ["DOLLAR"]})
+        exact = HeadlineClassifier([], default_impact="low", asset_keywords={"USD": ["DOLLAR"]}, overlapping=True)
+
+        assert fast.classify("DOLLARALLY").sentiment == 0
+        assert exact.classify("DOLLARALLY").sentiment == 1
+        assert exact.classify("DOLLARALLY").assets == ("USD",)
+
+
+class TestNewsIntegration:
+    """Test NewsFilter and the anchor parsers use the classifier."""
+
+    def test_detect_event_type(self):
+        """Test impact precedence, including mixed-case critical keywords."""
+        news_filter = NewsFilter()
+
+        assert news_filter.detect_event_type("Non-Farm Payrolls") == NewsImpact.CRITICAL
+        assert news_filter.detect_event_type("ECB President Speech") == NewsImpact.CRITICAL
+        assert news_filter.detect_event_type("Fed Chair Speech") == NewsImpact.HIGH
+        assert news_filter.detect_event_type("Retail Sales") == NewsImpact.MEDIUM
+        assert news_filter.detect_event_type("Bank Holiday") == NewsImpact.LOW
+        assert [r.impact for r in news_filter.classify_headlines(["GDP", "Survey"])] == [
+            NewsImpact.CRITICAL, NewsImpact.MEDIUM]
+
+    def test_parsers_classify_feed(self):
+        """Test feed parsers take sentiment and assets from the classifier."""
+        data = {"articles": [
+            {"headline": "Bitcoin surges", "published_date": "2025-01-06T12:00:00"},
+            {"headline": "Markets decline", "published_date": "2025-01-06T13:00:00"},
+        ]}
+
+        events = parse_marketwatch(data)
+
+        assert [e.sentiment_score for e in events] == [0.5, -0.5]
+        assert [e.market_impact for e in events] == [MarketBias.RISK_ON, MarketBias.RISK_OFF]
+        assert events[0].affected_assets == ["CRYPTO"]
+        assert events[1].affected_assets == ["STOCKS", "CRYPTO"]
+        assert [e.source for e in parse_reuters(data)] == ["Reuters", "Reuters"]
@@ -0,0 +1,206 @@
+"""
+Tests for the shared HTTP client and the news/REST callers that use it.
+
+Runs against a local aiohttp test server:
+- Session reuse and conditional GET (ETag / If-Modified-Since)
+- Concurrent NewsFilter / NewsAnchor source refresh
+- GenericRESTAdapter requests through the pooled session
+"""
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import aiohttp
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from worker.http_client import SharedHTTPClient
+from worker.markets.generic_rest_adapter import GenericRESTAdapter
+from worker.markets.market_adapter import MarketType
+from worker.news.news_anchor import MacroEvent, MarketBias, NewsAnchor
+from worker.news.news_filter import NewsEvent, NewsFilter, NewsImpact, FilterMode
+
+
+def make_app(hits):
+    """Feed server: /etag and /modified revalidate, /slow/{n} delays 0.2s."""
+    async def etag(request):
+        hits["etag"] = hits.get("etag", 0) + 1
+        if request.headers.get("If-None-Match") == '"v1"':
+            return web.Response(status=304)
+        return web.json_response({"version": 1}, headers={"ETag": '"v1"'})
+
+    async def modified(request):
+        hits["modified"] = hits.get("modified", 0) + 1
+        stamp = "Wed, 01 Jan 2025 00:00:00 GMT"
+        if request.headers.get("If-Modified-Since") == stamp:
+            return web.Response(status=304)
+        return web.json_response({"version": 2}, headers={"Last-Modified": stamp})
+
+    async def slow(request):
+        await asyncio.sleep(0.2)
+        return web.json_response({"name": request.match_info["name"]})
+
+    async def echo(request):
+        body = await request.json() if request.can_read_body else None
+        return web.json_response({"method": request.method, "body": body, "key": request.headers.get("X-API-KEY")})
+
+    app = web.Application()
+    app.router.add_get("/etag", etag)
+    app.router.add_get("/modified", modified)
+    app.router.add_get("/slow/{name}", slow)
+    app.router.add_route("*", "/echo", echo)
+    return app
+
+
+async def with_server(hits, body):
+    server = TestServer(make_app(hits))
+    await server.start_server()
+    client = SharedHTTPClient(limit_per_host=8)
+    try:
+        return await body(server, client)
+    finally:
+        await client.close()
+        await server.close()
+
+
+class TestSharedHTTPClient:
+    """Test pooling and conditional GET."""
+
+    def test_etag_revalidation_returns_cached_body(self):
+        """Test a 304 reuses the previous body."""
+        hits = {}
+
+        async def body(server, client):
+            first = await client.get_json(str(server.make_url("/etag")))
+            second = await client.get_json(str(server.make_url("/etag")))
+            return first, second, client.get_stats()
+
+        first, second, stats = asyncio.run(with_server(hits, body))
+
+        assert first.status == 200 and not first.not_modified
+        assert second.not_modified and second.data == {"version": 1}
+        assert hits["etag"] == 2
+        assert stats["not_modified"] == 1
+        assert stats["sessions_created"] == 1
+
+    def test_if_modified_since_revalidation(self):
+        """Test Last-Modified is sent back as If-Modified-Since."""
+        async def body(server, client):
+            await client.get_json(str(server.make_url("/modified")))
+            return await client.get_json(str(server.make_url("/modified")))
+
+        result = asyncio.run(with_server({}, body))
+
+        assert result.not_modified and result.data == {"version": 2}
+
+    def test_unconditional_get_skips_validators(self):
+        """Test conditional=False always fetches the full body."""
+        async def body(server, client):
+            await client.get_json(str(server.make_url("/etag")))
+            return await client.get_json(str(server.make_url("/etag")), conditional=False)
+
+        result = asyncio.run(with_server({}, body))
+
+        assert result.status == 200 and not result.not_modified
+
+    def test_new_loop_opens_new_session(self):
+        """Test sessions are not reused across event loops."""
+        client = SharedHTTPClient()
+
+        async def grab():
+            session = client.session()
+            await client.close()
+            return session
+
+        assert asyncio.run(grab()) is not asyncio.run(grab())
+
+    def test_request_json_raises_on_error_status(self):
+        """Test non-2xx responses raise."""
+        async def body(server, client):
+            with pytest.raises(aiohttp.ClientResponseError):
+                await client.request_json("GET", str(server.make_url("/missing")))
+            return await client.request_json("POST", str(server.make_url("/echo")), json={"a": 1})
+
+        result = asyncio.run(with_server({}, body))
+
+        assert result == {"method": "POST", "body": {"a": 1}, "key": None}
+
+
+class TestConcurrentNewsRefresh:
+    """Test news sources refresh concurrently through the shared client."""
+
+    def test_news_filter_refreshes_sources_concurrently(self):
+        """Test three 0.2s sources refresh in roughly one round trip."""
+        soon = datetime.now() + timedelta(minutes=10)
+
+        def parser(data):
+            return [NewsEvent(source=data["name"], title=f"{data['name']} Data", impact=NewsImpact.MEDIUM,
+                              currency="USD", time=soon)]
+
+        async def body(server, client):
+            news_filter = NewsFilter(http_client=client)
+            for name in ("a", "b", "c"):
+                news_filter.register_source(name, str(server.make_url(f"/slow/{name}")), parser)
+            start = time.perf_counter()
+            decision = await news_filter.check_trading_conditions(["EURUSD"])
+            return decision, time.perf_counter() - start, news_filter
+
+        decision, elapsed, news_filter = asyncio.run(with_server({}, body))
+
+        assert elapsed < 0.5
+        assert decision.mode == FilterMode.SOFT_FILTER
+        assert [e.source for e in news_filter.active_events] == ["a", "b", "c"]
+        assert all(cfg["last_check"] for cfg in news_filter.sources.values())
+
+    def test_news_filter_failed_source_retried_next_time(self):
+        """Test a failing source leaves last_check unset."""
+        async def body(server, client):
+            news_filter = NewsFilter(http_client=client)
+            news_filter.register_source("broken", str(server.make_url("/missing")), lambda data: [])
+            await news_filter._update_events()
+            return news_filter
+
+        news_filter = asyncio.run(with_server({}, body))
+
+        assert news_filter.sources["broken"]["last_check"] is None
+
+    def test_news_anchor_refreshes_sources_concurrently(self):
+        """Test NewsAnchor macro refresh runs due sources together."""
+        def parser(data):
+            return [MacroEvent(title=data["name"], summary="", source=data["name"], timestamp=datetime.now(),
+                               market_impact=MarketBias.NEUTRAL, affected_assets=[], sentiment_score=0.0)]
+
+        async def body(server, client):
+            anchor = NewsAnchor(http_client=client)
+            for name in ("x", "y", "z"):
+                anchor.register_source(name, str(server.make_url(f"/slow/{name}")), parser)
+            start = time.perf_counter()
+            await anchor._update_macro_events()
+            return anchor, time.perf_counter() - start
+
+        anchor, elapsed = asyncio.run(with_server({}, body))
+
+        assert elapsed < 0.5
+        assert [e.title for e in anchor.macro_events] == ["x", "y", "z"]
+
+
+class TestGenericRESTAdapterPooling:
+    """Test the REST adapter uses the shared client."""
+
+    def test_requests_share_one_session(self):
+        """Test repeated calls reuse the pooled session."""
+        async def body(server, client):
+            adapter = GenericRESTAdapter("local", str(server.make_url("")).rstrip("/"), MarketType.CRYPTO,
+                                         api_key="k", http_client=client)
+            first = await adapter._request("GET", "/echo", requires_auth=True)
+            second = await adapter._request("POST", "/echo", data={"x": 1})
+            return first, second, client.get_stats()
+
+        first, second, stats = asyncio.run(with_server({}, body))
+
+        assert first["key"] == "k"
+        assert second["body"] == {"x": 1}
+        assert stats["sessions_created"] == 1
+        assert stats["requests"] == 2
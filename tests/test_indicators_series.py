@@ -0,0 +1,87 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from worker.indicators.sma import SMA
+from worker.indicators.ema import EMA
+from worker.indicators.rsi import RSI
+from worker.indicators.macd import MACD
+from worker.indicators.atr import ATR
+from worker.indicators.engine import IndicatorEngine
+from worker.indicators.series import sma_series, ema_series, rsi_series, macd_series, atr_series
+
+
+def _random_candles(n, seed=11):
+    rng = random.Random(seed)
+    price = 100.0
+    candles = []
+    for _ in range(n):
+        price = max(1.0, price + rng.uniform(-2.0, 2.0))
+        spread = rng.uniform(0.0, 1.5)
+        candles.append({"high": price + spread, "low": price - spread, "close": price})
+    return candles
+
+
+def _assert_matches(value, reference):
+    if reference is None:
+        assert math.isnan(value)
+    else:
+        assert value == pytest.approx(reference, rel=1e-9, abs=1e-9)
+
+
+@pytest.mark.parametrize("window", [1, 5, 20])
+def test_sma_and_ema_series_match_reference(window):
+    prices = [c["close"] for c in _random_candles(120)]
+    sma = sma_series(np.array(prices), window)
+    ema = ema_series(np.array(prices), window)
+    assert sma.shape == ema.shape == (len(prices),)
+    for i in range(len(prices)):
+        _assert_matches(sma[i], SMA().calculate(prices[:i + 1], window=window))
+        _assert_matches(ema[i], EMA().calculate(prices[:i + 1], window=window))
+
+
+@pytest.mark.parametrize("period", [2, 14])
+def test_rsi_series_matches_reference(period):
+    prices = [c["close"] for c in _random_candles(120)] + [200.0 + i for i in range(20)]
+    rsi = rsi_series(prices, period)
+    for i in range(len(prices)):
+        _assert_matches(rsi[i], RSI().calculate(prices[:i + 1], period=period))
+
+
+@pytest.mark.parametrize("fast,slow,signal", [(12, 26, 9), (30, 18, 5), (8, 6, 12)])
+def test_macd_series_matches_reference(fast, slow, signal):
+    prices = [c["close"] for c in _random_candles(100)]
+    series = macd_series(prices, fast, slow, signal)
+    for i in range(len(prices)):
+        ref = MACD().calculate(prices[:i + 1], fast=fast, slow=slow, signal=signal)
+        for key in ("macd", "signal", "histogram"):
+            _assert_matches(series[key][i], None if ref is None else ref[key])
+
+
+def test_atr_series_matches_reference():
+    candles = _random_candles(120)
+    atr = atr_series([c["high"] for c in candles], [c["low"] for c in candles], 14)
+    for i in range(len(candles)):
+        _assert_matches(atr[i], ATR().calculate(candles[:i + 1], period=14))
+
+
+def test_short_input_is_all_nan():
+    assert np.isnan(sma_series([1.0, 2.0], 5)).all()
+    assert np.isnan(macd_series([1.0] * 10)["macd"]).all()
+
+
+def test_indicator_engine_series_mode():
+    engine = IndicatorEngine()
+    candles = _random_candles(60)
+    prices = [c["close"] for c in candles]
+
+    sma = engine.get("SMA", prices, series=True)
+    assert sma["name"] == "SMA"
+    assert sma["value"][-1] == pytest.approx(engine.get("SMA", prices)["value"])
+
+    atr = engine.get("ATR", candles, series=True)
+    assert atr["value"][-1] == pytest.approx(engine.get("ATR", candles)["value"])
+
+    assert engine.get("UNKNOWN", prices, series=True)["value"] is None
@@ -0,0 +1,136 @@
+import random
+
+import pytest
+
+from worker.indicators.sma import SMA
+from worker.indicators.ema import EMA
+from worker.indicators.rsi import RSI
+from worker.indicators.macd import MACD
+from worker.indicators.atr import ATR
+from worker.indicators.streaming import (
+    StreamingSMA,
+    StreamingEMA,
+    StreamingRSI,
+    StreamingMACD,
+    StreamingATR,
+)
+from worker.strategies.ai_fusion import AIFusionStrategy, AIFusionConfig, HISTORY_LIMIT
+
+
+def _random_candles(n, seed=7):
+    rng = random.Random(seed)
+    price = 100.0
+    candles = []
+    for _ in range(n):
+        price = max(1.0, price + rng.uniform(-2.0, 2.0))
+        spread = rng.uniform(0.0, 1.5)
+        candles.append({"high": price + spread, "low": price - spread, "close": price})
+    return candles
+
+
+def _assert_same(streamed, reference):
+    if reference is None:
+        assert streamed is None
+    elif isinstance(reference, dict):
+        assert streamed is not None
+        for key, val in reference.items():
+            assert streamed[key] == pytest.approx(val, rel=1e-9, abs=1e-9)
+    else:
+        assert streamed == pytest.approx(reference, rel=1e-9, abs=1e-9)
+
+
+@pytest.mark.parametrize("window", [1, 3, 20])
+def test_streaming_sma_matches_reference(window):
+    candles = _random_candles(150)
+    stream = StreamingSMA(window)
+    prices = []
+    for c in candles:
+        prices.append(c["close"])
+        _assert_same(stream.update(c), SMA().calculate(prices, window=window))
+
+
+@pytest.mark.parametrize("window", [1, 5, 47])
+def test_streaming_ema_matches_reference(window):
+    candles = _random_candles(150)
+    stream = StreamingEMA(window)
+    prices = []
+    for c in candles:
+        prices.append(c["close"])
+        _assert_same(stream.update(c["close"]), EMA().calculate(prices, window=window))
+
+
+@pytest.mark.parametrize("period", [2, 14, 24])
+def test_streaming_rsi_matches_reference(period):
+    candles = _random_candles(150)
+    stream = StreamingRSI(period)
+    prices = []
+    for c in candles:
+        prices.append(c["close"])
+        _assert_same(stream.update(c), RSI().calculate(prices, period=period))
+
+
+def test_streaming_rsi_all_gains_is_exactly_100():
+    stream = StreamingRSI(14)
+    for i in range(1, 40):
+        value = stream.update(float(i))
+    assert value == 100.0
+
+
+@pytest.mark.parametrize("fast,slow,signal", [(12, 26, 9), (10, 18, 8), (30, 18, 5), (8, 6, 12)])
+def test_streaming_macd_matches_reference(fast, slow, signal):
+    candles = _random_candles(120)
+    stream = StreamingMACD(fast, slow, signal)
+    prices = []
+    for c in candles:
+        prices.append(c["close"])
+        _assert_same(stream.update(c), MACD().calculate(prices, fast=fast, slow=slow, signal=signal))
+
+
+@pytest.mark.parametrize("period", [3, 16])
+def test_streaming_atr_matches_reference(period):
+    candles = _random_candles(150)
+    stream = StreamingATR(period)
+    for i, c in enumerate(candles, start=1):
+        _assert_same(stream.update(c), ATR().calculate(candles[:i], period=period))
+
+
+def test_history_limit_matches_truncated_reference():
+    candles = _random_candles(200)
+    sma = StreamingSMA(60, history_limit=50)
+    macd = StreamingMACD(10, 30, 12, history_limit=50)
+    prices = []
+    for c in candles:
+        prices.append(c["close"])
+        window = prices[-50:]
+        _assert_same(sma.update(c), SMA().calculate(window, window=60))
+        _assert_same(macd.update(c), MACD().calculate(window, fast=10, slow=30, signal=12))
+
+
+def test_ai_fusion_streaming_matches_reference_calculate():
+    cfg = AIFusionConfig(sma_long=60, macd_fast=14, macd_slow=30, macd_signal=10)
+    strategy = AIFusionStrategy(cfg)
+    history = []
+    for c in _random_candles(250):
+        indicators = strategy.compute_indicators({"symbol": "BTCUSDT", **c})
+        history.append(c)
+        candles = history[-HISTORY_LIMIT:]
+        prices = [x["close"] for x in candles]
+        _assert_same(indicators["sma_short"], SMA().calculate(prices, window=cfg.sma_short))
+        _assert_same(indicators["sma_long"], SMA().calculate(prices, window=cfg.sma_long))
+        _assert_same(indicators["ema_short"], EMA().calculate(prices, window=cfg.ema_short))
+        _assert_same(indicators["ema_long"], EMA().calculate(prices, window=cfg.ema_long))
+        _assert_same(indicators["rsi"], RSI().calculate(prices, period=cfg.rsi_period))
+        _assert_same(
+            indicators["macd"],
+            MACD().calculate(prices, fast=cfg.macd_fast, slow=cfg.macd_slow, signal=cfg.macd_signal),
+        )
+        _assert_same(indicators["atr"], ATR().calculate(candles, period=cfg.atr_period))
+
+
+def test_ai_fusion_streams_are_per_symbol():
+    strategy = AIFusionStrategy(AIFusionConfig(sma_short=3))
+    for price in (1.0, 2.0, 3.0):
+        strategy.compute_indicators({"symbol": "A", "price": price})
+    result = strategy.compute_indicators({"symbol": "B", "price": 50.0})
+    assert result["sma_short"] is None
+    assert strategy.compute_indicators({"symbol": "A", "price": 4.0})["sma_short"] == pytest.approx(3.0)
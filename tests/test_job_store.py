@@ -27,3 +27,131 @@ def test_increment_attempts_and_reset():
 
     store.reset(job_id)
     assert store.get_state(job_id) is None
+
+
+class _Clock:
+    def __init__(self, now: float = 1000.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_next_retry_jobs_pops_due_entries_in_order():
+    store = JobStore()
+    for job_id, at in (("late", 300.0), ("early", 100.0), ("mid", 200.0)):
+        store.set_last_job(job_id, {"job_path": "x.y", "id": job_id})
+        store.schedule_retry(job_id, at)
+
+    assert store.next_retry_jobs(50.0) == []
+    due = store.next_retry_jobs(200.0)
+    assert [job_id for job_id, _ in due] == ["early", "mid"]
+    assert due[0][1]["id"] == "early"
+    # popped retries are not returned twice
+    assert store.next_retry_jobs(200.0) == []
+    assert [job_id for job_id, _ in store.next_retry_jobs(1000.0)] == ["late"]
+
+
+def test_rescheduled_and_cancelled_retries_skip_stale_heap_entries():
+    store = JobStore()
+    store.set_last_job("a", {"job_path": "x.y"})
+    store.schedule_retry("a", 100.0)
+    store.schedule_retry("a", 500.0)  # pushed back
+    store.set_last_job("b", {"job_path": "x.y"})
+    store.schedule_retry("b", 100.0)
+    store.set_state("b", "running")  # cancelled by a state change
+
+    assert store.next_retry_jobs(200.0) == []
+    assert [job_id for job_id, _ in store.next_retry_jobs(500.0)] == ["a"]
+
+
+def test_terminal_records_expire_after_ttl():
+    from backend.workers import metrics
+
+    test_metrics = metrics.Metrics()
+    original = metrics.default_metrics
+    metrics.default_metrics = test_metrics
+    try:
+        clock = _Clock()
+        store = JobStore(terminal_ttl_seconds=60.0, clock=clock)
+        store.claim("done-job")
+        store.set_last_job("done-job", {"job_path": "x.y"})
+        store.set_state("done-job", "done")
+        store.claim("running-job")
+
+        clock.now += 59.0
+        store.next_retry_jobs(0)
+        assert store.get_state("done-job") == "done"
+
+        clock.now += 2.0
+        store.next_retry_jobs(0)
+        assert store.get_state("done-job") is None
+        assert store.get_state("running-job") == "running"
+        assert store.stats()["expired_total"] == 1
+        assert test_metrics.worker_job_store_expired_total.count == 1
+        assert test_metrics.worker_job_store_size.value == 1
+    finally:
+        metrics.default_metrics = original
+
+
+def test_capacity_evicts_least_recently_used_finished_record():
+    from backend.workers import metrics
+
+    test_metrics = metrics.Metrics()
+    original = metrics.default_metrics
+    metrics.default_metrics = test_metrics
+    try:
+        store = JobStore(max_entries=3, terminal_ttl_seconds=None)
+        store.claim("live")  # running: never evicted
+        for job_id in ("old", "recent"):
+            store.claim(job_id)
+            store.set_state(job_id, "done")
+        store.get_state("old")  # touch: "recent" is now least recently used
+
+        store.claim("new")
+
+        assert store.size() == 3
+        assert store.get_state("recent") is None
+        assert store.get_state("old") == "done"
+        assert store.get_state("live") == "running"
+        assert test_metrics.worker_job_store_evictions_total.count == 1
+
+        # only in-flight records left beyond the cap: nothing is dropped
+        store.claim("another")
+        store.set_state("old", "running")
+        store.claim("one-more")
+        assert store.get_state("live") == "running"
+        assert store.get_state("one-more") == "running"
+    finally:
+        metrics.default_metrics = original
+
+
+def test_done_records_drop_last_job_copy():
+    store = JobStore()
+    store.claim("j")
+    store.set_last_job("j", {"job_path": "x.y", "payload": "x" * 1000})
+    store.set_state("j", "done")
+
+    assert store._store["j"].last_job is None
+
+
+def test_evictable_index_follows_state_and_limits_run_once(monkeypatch):
+    store = JobStore(max_entries=2, terminal_ttl_seconds=None)
+    store.claim("a")
+    store.set_state("a", "done")
+    store.claim("b")
+    assert list(store._evictable) == ["a"]
+
+    store.set_state("a", "running")  # live again: not a capacity victim
+    store.set_state("b", "error")
+    assert list(store._evictable) == ["b"]
+
+    calls = []
+    original = store._enforce_limits
+    monkeypatch.setattr(store, "_enforce_limits", lambda: (calls.append(1), original())[1])
+    store.set_state("c", "done")  # creates the record and finishes it
+
+    assert len(calls) == 1
+    assert store.get_state("b") is None
+    assert store.size() == 2
+    assert store.stats()["evictable"] == 1
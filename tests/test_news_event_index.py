@@ -0,0 +1,162 @@
+"""
+Tests for the time-indexed news event store.
+
+Tests cover:
+- Bucketed window queries and ordering
+- Replacement by key and TTL eviction
+- Secondary tag indexes
+- NewsFilter / NewsAnchor helpers backed by the index
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+from worker.news.event_index import EventTimeIndex
+from worker.news.news_anchor import MacroEvent, MarketBias, NewsAnchor
+from worker.news.news_filter import FilterMode, NewsEvent, NewsFilter, NewsImpact
+
+T0 = datetime(2025, 1, 6, 12, 0)
+
+
+def news(title, minutes, impact=NewsImpact.MEDIUM, currency="USD"):
+    return NewsEvent(source="test", title=title, impact=impact, currency=currency, time=T0 + timedelta(minutes=minutes))
+
+
+def macro(title, age, bias=MarketBias.NEUTRAL, assets=(), sentiment=0.0):
+    return MacroEvent(title=title, summary="", source="test", timestamp=datetime.now() - age,
+                      market_impact=bias, affected_assets=list(assets), sentiment_score=sentiment)
+
+
+def make_index():
+    return EventTimeIndex(
+        time_of=lambda e: e.time,
+        bucket_of=lambda e: e.impact,
+        key_of=lambda e: e.title,
+        tags_of=lambda e: [e.currency],
+    )
+
+
+class TestEventTimeIndex:
+    """Test window queries, replacement and eviction."""
+
+    def test_window_merges_buckets_in_time_order(self):
+        """Test results span the requested buckets, soonest first."""
+        index = make_index()
+        index.extend([
+            news("c", 20, NewsImpact.CRITICAL),
+            news("a", 5, NewsImpact.HIGH),
+            news("low", 6, NewsImpact.LOW),
+            news("b", 10, NewsImpact.CRITICAL),
+            news("late", 90, NewsImpact.CRITICAL),
+        ])
+
+        result = index.window(T0, T0 + timedelta(minutes=60), buckets=[NewsImpact.HIGH, NewsImpact.CRITICAL])
+
+        assert [e.title for e in result] == ["a", "b", "c"]
+
+    def test_window_bounds_are_inclusive(self):
+        """Test events exactly at start and end are returned."""
+        index = make_index()
+        index.extend([news("start", 0), news("end", 15), news("before", -1)])
+
+        assert [e.title for e in index.window(T0, T0 + timedelta(minutes=15))] == ["start", "end"]
+        assert [e.title for e in index.window(T0, inclusive_start=False)] == ["end"]
+
+    def test_replacement_keeps_arrival_position(self):
+        """Test re-adding a key moves the event in time but not in arrival order."""
+        index = make_index()
+        index.extend([news("x", 10), news("y", 20)])
+        index.add(news("x", 30, NewsImpact.HIGH))
+
+        assert len(index) == 2
+        assert [e.title for e in index.events()] == ["x", "y"]
+        assert [e.title for e in index] == ["y", "x"]
+        assert index.bucket_count(NewsImpact.MEDIUM) == 1
+
+    def test_evict_before_drops_prefix_and_tags(self):
+        """Test eviction removes old events from buckets and tag indexes."""
+        index = make_index()
+        index.extend([news("old", -30, currency="EUR"), news("new", 30, currency="EUR"), news("usd", -40)])
+
+        assert index.evict_before(T0) == 2
+        assert [e.title for e in index.events()] == ["new"]
+        assert [e.title for e in index.by_tag("EUR")] == ["new"]
+        assert index.tag_count("USD") == 0
+        assert "old" not in index
+
+
+class TestNewsFilterIndex:
+    """Test NewsFilter window checks on the index."""
+
+    def test_window_checks_and_eviction(self):
+        """Test impact windows pick the right mode and past events are evicted."""
+        news_filter = NewsFilter(event_retention=timedelta(minutes=30))
+        for event in (news("Retail Data", 10), news("Old Speech", -90, NewsImpact.HIGH),
+                      news("FOMC", 120, NewsImpact.CRITICAL, currency="usd")):
+            news_filter.events.add(event, key=event.title)
+
+        decision = asyncio.run(news_filter.check_trading_conditions(["EURUSD"], current_time=T0))
+
+        assert decision.mode == FilterMode.SOFT_FILTER
+        assert [e.title for e in decision.events] == ["Retail Data"]
+        assert [e.title for e in news_filter.active_events] == ["Retail Data", "FOMC"]
+        assert [e.title for e in news_filter.get_events_for_currency("USD")] == ["Retail Data", "FOMC"]
+        assert news_filter.get_status()["active_events_count"] == 2
+
+    def test_critical_event_triggers_kill_switch(self):
+        """Test a critical event inside the hour wins over lower impacts."""
+        news_filter = NewsFilter()
+        for event in (news("Sales", 5), news("NFP", 45, NewsImpact.CRITICAL)):
+            news_filter.events.add(event, key=event.title)
+
+        decision = asyncio.run(news_filter.check_trading_conditions(["EURUSD"], current_time=T0))
+
+        assert decision.mode == FilterMode.KILL_SWITCH
+        assert [e.title for e in decision.events] == ["NFP"]
+
+
+class TestNewsAnchorIndex:
+    """Test NewsAnchor helpers backed by secondary indexes."""
+
+    def make_anchor(self):
+        anchor = NewsAnchor()
+        anchor.events.extend([
+            macro("FED holds rates", timedelta(hours=2), MarketBias.RISK_OFF, ["USD"], -0.8),
+            macro("ECB and BOE diverge", timedelta(hours=20), MarketBias.NEUTRAL, ["EUR", "GBP"], 0.0),
+            macro("Bitcoin rally", timedelta(hours=1), MarketBias.RISK_ON, ["crypto"], 0.9),
+            macro("Old selloff", timedelta(days=5), MarketBias.RISK_OFF, ["STOCKS"], -0.9),
+        ])
+        return anchor
+
+    def test_secondary_indexes(self):
+        """Test asset and central bank lookups."""
+        anchor = self.make_anchor()
+
+        assert [e.title for e in anchor.get_events_for_asset("CRYPTO")] == ["Bitcoin rally"]
+        assert [e.title for e in anchor.get_central_bank_events("ecb")] == ["ECB and BOE diverge"]
+        assert len(anchor.get_central_bank_events()) == 2
+        assert anchor._summarize_central_banks() == "2 central bank updates in last 7 days"
+        assert anchor._summarize_forex() == "2 forex-relevant events"
+        assert anchor._summarize_crypto() == "Bullish crypto sentiment"
+
+    def test_recency_windows(self):
+        """Test risk factors, opportunities and sentiment only use recent events."""
+        anchor = self.make_anchor()
+
+        assert anchor._identify_risk_factors() == ["FED holds rates (test)"]
+        assert anchor._identify_opportunities() == ["Bitcoin rally (crypto)"]
+        assert anchor._calculate_current_sentiment() == (-0.8 + 0.0 + 0.9) / 3
+
+    def test_update_evicts_week_old_events(self):
+        """Test refresh drops events older than 7 days."""
+        anchor = NewsAnchor()
+        anchor.events.add(macro("stale", timedelta(days=8)))
+        anchor.register_source("feed", "http://feed.invalid", lambda data: [])
+
+        async def fake_fetch(source_name, config):
+            return [macro("fresh", timedelta(hours=1))]
+
+        anchor._fetch_source = fake_fetch
+        asyncio.run(anchor._update_macro_events())
+
+        assert [e.title for e in anchor.macro_events] == ["fresh"]
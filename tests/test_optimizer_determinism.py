@@ -306,3 +306,57 @@ def test_dual_objective_penalty_factor():
         
     finally:
         os.unlink(temp_path)
+
+
+def _wave_candles(n=120):
+    import math
+
+    candles = []
+    for i in range(n):
+        close = 100.0 + 10.0 * math.sin(i / 7.0) + 0.1 * i
+        candles.append({
+            "timestamp": f"2024-01-01T{i:04d}",
+            "open": close, "high": close + 0.3, "low": close - 0.3, "close": close, "volume": 1.0,
+        })
+    return candles
+
+
+def test_parallel_evaluation_matches_serial():
+    """Test that a process-pool run is identical to the serial run for a seed."""
+    from bagbot.optimizer.genetic_optimizer import run_ga
+
+    candles = _wave_candles()
+
+    for objective in ("sharpe", "dual"):
+        best_serial, score_serial = run_ga(candles, pop_size=6, generations=2, seed=7, objective=objective)
+        best_parallel, score_parallel = run_ga(candles, pop_size=6, generations=2, seed=7, objective=objective, workers=2)
+
+        assert best_serial == best_parallel
+        assert score_serial == score_parallel
+
+
+def test_fitness_cache_persists_and_preserves_results():
+    """Test that the persistent fitness memo skips known genomes without changing results."""
+    from bagbot.optimizer.genetic_optimizer import run_ga
+    from optimizer.fitness_cache import FitnessCache
+
+    candles = _wave_candles()
+    baseline = run_ga(candles, pop_size=6, generations=3, seed=3, objective="dual")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        first_cache = FitnessCache.for_candles(candles, cache_dir)
+        first = run_ga(candles, pop_size=6, generations=3, seed=3, objective="dual", cache=first_cache)
+        assert first == baseline
+        assert first_cache.misses == len(first_cache.entries)
+        assert first_cache.hits + first_cache.misses == 6 * 4
+
+        second_cache = FitnessCache.for_candles(candles, cache_dir)
+        assert second_cache.loaded == len(first_cache.entries)
+        second = run_ga(candles, pop_size=6, generations=3, seed=3, objective="dual", cache=second_cache)
+        assert second == baseline
+        assert second_cache.misses == 0
+        assert second_cache.stats()["hit_rate"] == 1.0
+
+        # a different dataset must not reuse these scores
+        other_cache = FitnessCache.for_candles(candles[:-1], cache_dir)
+        assert other_cache.loaded == 0
@@ -0,0 +1,136 @@
+"""
+Tests for early-abort (pruned) genome evaluation.
+"""
+import math
+import random
+
+import pytest
+
+
+def _candles(n=600):
+    candles = []
+    for i in range(n):
+        close = 100.0 + 8.0 * math.sin(i / 9.0) + 2.0 * math.sin(i / 31.0) + 0.02 * i
+        candles.append({
+            "timestamp": f"2024-01-01T{i:05d}",
+            "open": close, "high": close + 0.4, "low": close - 0.4, "close": close, "volume": 1.0,
+        })
+    return candles
+
+
+def test_partial_score_matches_full_evaluation():
+    """Test the running statistics reproduce the dual score of the full run."""
+    from backtest.executor import BacktestExecutor
+    from backtest.replay import ReplayEngine
+    from bagbot.optimizer.genetic_optimizer import evaluate_genome, random_genome
+    from optimizer.pruning import EarlyStop, PruneConfig
+    from worker.executor.account import VirtualAccount
+    from worker.strategies.ai_fusion import AIFusionStrategy
+
+    candles = _candles()
+    rng = random.Random(4)
+    for _ in range(3):
+        genome = random_genome(rng)
+        account = VirtualAccount(starting_balance=10000.0)
+        executor = BacktestExecutor(account, AIFusionStrategy(genome.to_config()))
+        stopper = EarlyStop(account, len(candles), PruneConfig(), "dual", 0.05)
+        ReplayEngine(candles, executor.process_candle).run()
+
+        expected = evaluate_genome(genome, candles, "dual", 0.05)
+        partial = stopper.partial_score()
+        if expected["sharpe"] == -999.0:
+            assert partial is None
+        else:
+            assert partial == pytest.approx(expected["score"], rel=1e-9)
+
+
+def test_score_pruning_marks_breakdown():
+    """Test a genome below the cutoff stops after min_progress and is marked pruned."""
+    from bagbot.optimizer.genetic_optimizer import evaluate_genome, random_genome
+    from optimizer.pruning import PruneConfig
+
+    candles = _candles()
+    genome = random_genome(random.Random(2))
+    full = evaluate_genome(genome, candles, "dual", 0.01)
+    assert "pruned" not in full
+
+    never = evaluate_genome(genome, candles, "dual", 0.01, PruneConfig(score_threshold=-1e18))
+    assert never == full
+
+    config = PruneConfig(score_threshold=1e18, min_progress=0.5, check_every=10)
+    pruned = evaluate_genome(genome, candles, "dual", 0.01, config)
+    if full["sharpe"] == -999.0:
+        pytest.skip("genome never produces a defined Sharpe on this data")
+    assert pruned["pruned"] is True
+    assert pruned["prune_reason"] == "score"
+    assert len(candles) // 2 - 1 <= pruned["pruned_at"] < len(candles) // 2 + 10
+
+
+def test_equity_floor_stops_replay():
+    """Test the equity floor ends the replay on the first candle below it."""
+    from bagbot.optimizer.genetic_optimizer import evaluate_genome, random_genome
+    from optimizer.pruning import PruneConfig
+
+    genome = random_genome(random.Random(2))
+    # a floor above the starting balance is breached as soon as equity is recorded
+    result = evaluate_genome(genome, _candles(), "dual", 0.01, PruneConfig(equity_floor=1.5))
+
+    assert result["pruned"] is True
+    assert result["prune_reason"] == "equity_floor"
+    assert result["pruned_at"] == 0
+
+
+def test_survivor_pruning_ga_is_deterministic_and_scoped():
+    """Test pruned GA runs agree serial vs pool and use their own cache scope."""
+    from bagbot.optimizer.genetic_optimizer import fitness_scope, run_ga
+    from optimizer.fitness_cache import FitnessCache
+    from optimizer.pruning import PruneConfig
+
+    candles = _candles(400)
+    prune = PruneConfig(equity_floor=0.5, survivor_pruning=True)
+
+    serial = run_ga(candles, pop_size=6, generations=2, seed=5, objective="dual", prune=prune)
+    parallel = run_ga(candles, pop_size=6, generations=2, seed=5, objective="dual", prune=prune, workers=2)
+    assert serial == parallel
+
+    assert fitness_scope(None, prune) != fitness_scope(None, None)
+    with pytest.raises(ValueError):
+        run_ga(candles, pop_size=2, generations=1, seed=5, prune=prune, cache=FitnessCache.for_candles(candles))
+
+
+
+def test_survivor_pruned_scores_are_not_persisted(tmp_path, monkeypatch):
+    """Test partial scores under a per-generation cutoff never reach the memo or disk."""
+    import json
+
+    from bagbot.optimizer import genetic_optimizer
+    from bagbot.optimizer.genetic_optimizer import fitness_scope, run_ga
+    from optimizer.fitness_cache import FitnessCache
+    from optimizer.pruning import EarlyStop, PruneConfig
+
+    candles = _candles(200)
+    prune = PruneConfig(survivor_pruning=True, min_progress=0.0, check_every=1)
+    scope = fitness_scope(None, prune)
+    # every partial score trails the survivors, so each generation after the first is pruned
+    monkeypatch.setattr(EarlyStop, "partial_score", lambda self: -1e6)
+
+    pruned_seen = []
+    evaluate = genetic_optimizer._evaluate
+
+    def spy(*args, **kwargs):
+        result, pruned = evaluate(*args, **kwargs)
+        pruned_seen.append(pruned)
+        return result, pruned
+
+    monkeypatch.setattr(genetic_optimizer, "_evaluate", spy)
+
+    for _ in range(2):
+        cache = FitnessCache.for_candles(candles, tmp_path, scope=scope)
+        run_ga(candles, pop_size=6, generations=2, seed=7, objective="dual", prune=prune, cache=cache)
+        assert not any(isinstance(r, dict) and r.get("pruned") for r in cache.entries.values())
+
+    assert any(pruned_seen)
+    (path,) = tmp_path.glob("*.json")
+    entries = json.loads(path.read_text())["entries"]
+    assert entries
+    assert not any(entry["result"].get("pruned") for entry in entries)
@@ -0,0 +1,167 @@
+"""
+Tests for walk-forward / k-fold genome selection and out-of-sample scoring.
+"""
+import math
+import random
+
+import pytest
+
+
+def _wave_candles(n=400):
+    candles = []
+    for i in range(n):
+        close = 100.0 + 10.0 * math.sin(i / 7.0) + 3.0 * math.sin(i / 23.0) + 0.05 * i
+        candles.append({
+            "timestamp": f"2024-01-01T{i:05d}",
+            "open": close, "high": close + 0.3, "low": close - 0.3, "close": close, "volume": 1.0,
+        })
+    return candles
+
+
+def test_walk_forward_windows_rolling_and_anchored():
+    """Test rolling and anchored windows cover the data by index."""
+    from optimizer.walk_forward import Window, walk_forward_windows
+
+    rolling = walk_forward_windows(100, train_size=40, test_size=20)
+    assert rolling == [Window(0, 40, 60), Window(20, 60, 80), Window(40, 80, 100)]
+
+    anchored = walk_forward_windows(100, train_size=40, test_size=20, step=30, anchored=True)
+    assert anchored == [Window(0, 40, 60), Window(0, 70, 90)]
+
+    assert walk_forward_windows(50, train_size=40, test_size=20) == []
+    with pytest.raises(ValueError):
+        walk_forward_windows(100, train_size=0, test_size=20)
+
+
+def test_kfold_windows_are_contiguous():
+    """Test k-fold tests on each block after the first, last fold takes the remainder."""
+    from optimizer.walk_forward import Window, kfold_windows
+
+    assert kfold_windows(103, 4) == [Window(0, 20, 40), Window(0, 40, 60), Window(0, 60, 80), Window(0, 80, 103)]
+    with pytest.raises(ValueError):
+        kfold_windows(3, 4)
+
+
+def test_warm_start_matches_replaying_train_candles():
+    """Test the cached warm-up yields the same indicators as replaying the train span."""
+    from bagbot.optimizer.genetic_optimizer import random_genome
+    from optimizer.walk_forward import Window, WarmupCache
+    from worker.strategies.ai_fusion import AIFusionStrategy
+
+    candles = _wave_candles()
+    window = Window(50, 250, 300)
+    warmup = WarmupCache(candles)
+    rng = random.Random(5)
+
+    for _ in range(4):
+        cfg = random_genome(rng).to_config()
+        cold = AIFusionStrategy(cfg)
+        for candle in candles[window.train_start:window.test_start]:
+            cold.compute_indicators(candle)
+        warm = AIFusionStrategy(cfg)
+        warmup.apply(warm, window)
+
+        for candle in candles[window.test_start:window.test_end]:
+            expected = cold.compute_indicators(candle)
+            actual = warm.compute_indicators(candle)
+            for name, value in expected.items():
+                if isinstance(value, dict):
+                    for key in value:
+                        assert actual[name][key] == pytest.approx(value[key], rel=1e-9, abs=1e-9)
+                else:
+                    assert actual[name] == pytest.approx(value, rel=1e-9, abs=1e-9)
+
+    # a second genome with the same periods reuses every warmed stream
+    misses = warmup.misses
+    warmup.apply(AIFusionStrategy(cfg), window)
+    assert warmup.misses == misses
+
+
+def test_walk_forward_fitness_is_out_of_sample_mean():
+    """Test the aggregate is the mean of per-window test-span scores."""
+    from bagbot.optimizer.genetic_optimizer import evaluate_genome_walk_forward, evaluate_window, random_genome
+    from optimizer.walk_forward import walk_forward_windows
+
+    candles = _wave_candles()
+    windows = walk_forward_windows(len(candles), train_size=150, test_size=80)
+    genome = random_genome(random.Random(11))
+
+    per_window = [evaluate_window(genome, candles, w, "dual", 0.05) for w in windows]
+    result = evaluate_genome_walk_forward(genome, candles, windows, "dual", 0.05)
+
+    assert result["windows"] == [r["score"] for r in per_window]
+    assert result["score"] == pytest.approx(sum(r["score"] for r in per_window) / len(windows))
+    assert result["score"] == pytest.approx(result["sharpe"] - result["max_drawdown"] * 0.05)
+
+    sharpe = evaluate_genome_walk_forward(genome, candles, windows, "sharpe")
+    assert sharpe == pytest.approx(sum(evaluate_window(genome, candles, w) for w in windows) / len(windows))
+
+
+def test_train_span_score_is_plain_in_sample_backtest():
+    """Test span="train" scores the train candles alone and rejects unknown spans."""
+    from bagbot.optimizer.genetic_optimizer import (
+        evaluate_genome, evaluate_genome_walk_forward, evaluate_window, random_genome,
+    )
+    from optimizer.walk_forward import walk_forward_windows
+
+    candles = _wave_candles()
+    windows = walk_forward_windows(len(candles), train_size=150, test_size=80)
+    genome = random_genome(random.Random(11))
+
+    for w in windows:
+        expected = evaluate_genome(genome, candles[w.train_start:w.test_start], "dual", 0.05)
+        assert evaluate_window(genome, candles, w, "dual", 0.05, span="train") == expected
+    in_sample = evaluate_genome_walk_forward(genome, candles, windows, "dual", 0.05, span="train")
+    assert len(in_sample["windows"]) == len(windows)
+    with pytest.raises(ValueError):
+        evaluate_window(genome, candles, windows[0], span="all")
+
+
+def test_ga_selects_on_train_spans_and_reports_test_spans(monkeypatch):
+    """Test the GA never replays a test span until it reports the winner out-of-sample."""
+    from bagbot.optimizer import genetic_optimizer
+    from bagbot.optimizer.genetic_optimizer import evaluate_genome_walk_forward, run_ga
+    from optimizer.walk_forward import kfold_windows
+
+    candles = _wave_candles(300)
+    windows = kfold_windows(len(candles), 3)
+    index = {c["timestamp"]: i for i, c in enumerate(candles)}
+    replayed = []
+    run_backtest = genetic_optimizer._run_backtest
+
+    def spy(genome, span_candles, *args, **kwargs):
+        replayed.append((index[span_candles[0]["timestamp"]], index[span_candles[-1]["timestamp"]] + 1))
+        return run_backtest(genome, span_candles, *args, **kwargs)
+
+    monkeypatch.setattr(genetic_optimizer, "_run_backtest", spy)
+    best, result = run_ga(candles, pop_size=4, generations=1, seed=9, objective="dual", windows=windows)
+
+    train_spans = {(w.train_start, w.test_start) for w in windows}
+    test_spans = [(w.test_start, w.test_end) for w in windows]
+    assert set(replayed[:-len(windows)]) <= train_spans
+    assert replayed[-len(windows):] == test_spans
+
+    monkeypatch.setattr(genetic_optimizer, "_run_backtest", run_backtest)
+    expected = evaluate_genome_walk_forward(best, candles, windows, "dual", 0.01)
+    assert {k: v for k, v in result.items() if k != "in_sample_score"} == expected
+    assert "in_sample_score" in result
+
+
+def test_walk_forward_ga_parallel_matches_serial():
+    """Test (genome, window) tasks on a pool give the serial walk-forward result."""
+    from bagbot.optimizer.genetic_optimizer import run_ga
+    from optimizer.fitness_cache import FitnessCache
+    from optimizer.walk_forward import kfold_windows
+
+    candles = _wave_candles(300)
+    windows = kfold_windows(len(candles), 3)
+
+    serial = run_ga(candles, pop_size=6, generations=2, seed=9, objective="dual", windows=windows)
+    parallel = run_ga(candles, pop_size=6, generations=2, seed=9, objective="dual", windows=windows, workers=2)
+    assert serial == parallel
+    assert len(serial[1]["windows"]) == 3
+
+    # full-history scores must not be reused for windowed fitness
+    with pytest.raises(ValueError):
+        run_ga(candles, pop_size=2, generations=1, seed=9, windows=windows,
+               cache=FitnessCache.for_candles(candles))
@@ -0,0 +1,138 @@
+"""
+Unit tests for the batched order journal used by route_order.
+
+Tests cover:
+- Batched commits with durable acks carrying the database id
+- Per-user ordering
+- Isolation of records that fail to persist
+- route_order persisting through the journal
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.models import Base, Order
+from worker.executor.order_journal import OrderJournal
+from worker.executor import order_router
+from worker.executor.order_router import RiskCheckError, route_order
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'orders.db'}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def journal(session_factory):
+    journal = OrderJournal(session_factory, batch_size=50, linger=0.01)
+    yield journal
+    journal.close(timeout=5)
+
+
+def make_order(user_id="u1", qty=1.0, symbol="BTC/USDT"):
+    now = datetime.utcnow()
+    return Order(user_id=user_id, symbol=symbol, qty=qty, side="buy", status="open", created_at=now, updated_at=now)
+
+
+class ConnectorStub:
+    async def fetch_balance(self):
+        return {}
+
+    async def create_order(self, order_payload):
+        return {"id": "ext-1", "status": "closed", "filled": order_payload["amount"]}
+
+    async def close(self):
+        pass
+
+
+class TestOrderJournal:
+    """Test batching, acks and ordering."""
+
+    def test_acks_resolve_with_ids_after_commit(self, journal, session_factory):
+        """Test every ack resolves with the committed row id."""
+        acks = [journal.submit(make_order(qty=i + 1)) for i in range(120)]
+
+        ids = [ack.result(timeout=5) for ack in acks]
+
+        assert all(ack.done() for ack in acks)
+        assert ids == sorted(ids)
+        assert journal.stats()["records"] == 120
+        assert journal.stats()["batches"] < 120
+        with session_factory() as session:
+            assert session.query(Order).count() == 120
+
+    def test_per_user_order_preserved(self, journal, session_factory):
+        """Test orders of one user are stored in submission order."""
+        for i in range(30):
+            journal.submit(make_order(user_id=f"u{i % 3}", qty=float(i + 1)))
+        assert journal.flush(timeout=5)
+
+        with session_factory() as session:
+            for user in ("u0", "u1", "u2"):
+                rows = session.query(Order).filter(Order.user_id == user).order_by(Order.id).all()
+                qtys = [row.qty for row in rows]
+                assert qtys == sorted(qtys)
+
+    def test_bad_record_does_not_sink_batch(self, journal, session_factory):
+        """Test a failing record fails only its own ack."""
+        good = journal.submit(make_order(qty=1.0))
+        bad = journal.submit(make_order(symbol=None))  # symbol is NOT NULL
+        also_good = journal.submit(make_order(qty=2.0))
+
+        assert good.result(timeout=5) < also_good.result(timeout=5)
+        with pytest.raises(Exception):
+            bad.result(timeout=5)
+        assert journal.stats()["failures"] == 1
+
+    def test_async_wait(self, journal):
+        """Test acks can be awaited from the event loop."""
+        async def run():
+            ack = journal.submit(make_order())
+            return await ack.wait()
+
+        assert asyncio.run(run()) > 0
+
+    def test_submit_after_close_raises(self, journal):
+        """Test a closed journal refuses new records."""
+        journal.close(timeout=5)
+
+        with pytest.raises(RuntimeError):
+            journal.submit(make_order())
+
+
+class TestRouteOrderJournal:
+    """Test route_order persisting through the journal."""
+
+    def test_accepted_order_has_id(self, journal, monkeypatch):
+        """Test accepted orders wait for their durable ack."""
+        payload = {"symbol": "BTC/USDT", "side": "buy", "type": "market", "amount": 0.001}
+        monkeypatch.setattr(order_router, "load_connector", lambda *a, **k: ConnectorStub())
+
+        order = asyncio.run(route_order("binance", payload, db=None, journal=journal))
+
+        assert order.id is not None
+        assert order.status == "filled"
+
+    def test_rejection_is_journaled(self, journal, session_factory):
+        """Test rejected orders are written without blocking the caller."""
+        payload = {"symbol": "BTCUSDT", "side": "buy", "type": "market", "amount": 0.001}
+
+        async def run():
+            with pytest.raises(RiskCheckError):
+                await route_order("binance", payload, db=None, journal=journal)
+            await journal.aflush()
+
+        asyncio.run(run())
+
+        with session_factory() as session:
+            rows = session.query(Order).all()
+            assert [row.status for row in rows] == ["rejected"]
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 import fakeredis.aioredis
@@ -58,3 +60,58 @@ async def test_schedule_and_next_retry(redis_store):
     assert due == [(job_id, {"job_id": job_id, "args": []})]
     assert await redis_store.attempts(job_id) == 0
     assert await redis_store.get_state(job_id) == "retry_scheduled"
+
+
+@pytest.mark.anyio("asyncio")
+async def test_concurrent_claims_have_single_winner(redis_store):
+    job_id = "j-redis-race"
+    await redis_store.set_state(job_id, "enqueued")
+
+    results = await asyncio.gather(*(redis_store.claim(job_id) for _ in range(20)))
+
+    assert results.count(True) == 1
+    assert await redis_store.attempts(job_id) == 1
+
+
+@pytest.mark.anyio("asyncio")
+async def test_claim_of_scheduled_retry_keeps_attempts(redis_store):
+    job_id = "j-redis-retry-claim"
+
+    assert await redis_store.claim(job_id) is True
+    await redis_store.increment_attempts(job_id)
+    await redis_store.schedule_retry(job_id, 100)
+
+    assert await redis_store.claim(job_id) is True
+    assert await redis_store.attempts(job_id) == 2
+
+
+@pytest.mark.anyio("asyncio")
+async def test_next_retry_jobs_pops_due_batch_in_one_round_trip():
+    counter = {"round_trips": 0}
+
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+
+    class CountingConnection(client.connection_pool.connection_class):
+        async def send_packed_command(self, command, check_health=True):
+            counter["round_trips"] += 1
+            return await super().send_packed_command(command, check_health)
+
+    client.connection_pool.connection_class = CountingConnection
+    store = RedisJobStore(client=client, namespace="batch")
+    for i in range(10):
+        await store.set_last_job(f"due-{i}", {"i": i})
+        await store.schedule_retry(f"due-{i}", 100 + i)
+    await store.schedule_retry("no-payload", 100)
+    await store.set_last_job("later", {"i": -1})
+    await store.schedule_retry("later", 500)
+    await store.next_retry_jobs(0)  # loads the script
+
+    counter["round_trips"] = 0
+    due = await store.next_retry_jobs(200)
+
+    assert counter["round_trips"] == 1
+    assert due == [(f"due-{i}", {"i": i}) for i in range(10)]
+    assert await store.next_retry_jobs(200) == []
+    assert await store.next_retry_jobs(500) == [("later", {"i": -1})]
+    await client.flushall()
+    await client.aclose()
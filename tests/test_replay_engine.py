@@ -47,3 +47,27 @@ def test_replay_engine_run_from_to():
     
     assert len(received) == 3
     assert received == ["2", "3", "4"]
+
+
+def test_replay_engine_stop_condition_ends_run_early():
+    """Test stop_condition is checked after each tick and stops the replay."""
+    from backtest.replay import ReplayEngine
+    
+    candles = [{"timestamp": str(i), "close": 100.0 + i} for i in range(10)]
+    received = []
+    
+    engine = ReplayEngine(
+        candles,
+        tick_callback=lambda candle: received.append(candle["timestamp"]),
+        stop_condition=lambda index, candle: candle["close"] >= 103.0,
+    )
+    engine.run()
+    
+    assert received == ["0", "1", "2", "3"]
+    assert engine.stopped_at == 3
+    
+    received.clear()
+    engine.stop_condition = lambda index, candle: False
+    engine.run()
+    assert len(received) == 10
+    assert engine.stopped_at is None
@@ -0,0 +1,79 @@
+import random
+import statistics
+
+import pytest
+
+from backend.utils.rolling import RollingWindow
+
+
+def _slope(values):
+    n = len(values)
+    x_mean = (n - 1) / 2
+    y_mean = statistics.mean(values)
+    numerator = sum((i - x_mean) * (v - y_mean) for i, v in enumerate(values))
+    return numerator / sum((i - x_mean) ** 2 for i in range(n))
+
+
+@pytest.mark.parametrize("size", [1, 2, 5, 20])
+def test_matches_statistics_over_a_random_stream(size):
+    rng = random.Random(size)
+    window = RollingWindow(size)
+    values = []
+    for _ in range(5 * size + 37):
+        value = rng.uniform(-50, 150)
+        window.append(value)
+        values.append(value)
+        recent = values[-size:]
+
+        assert list(window) == recent
+        assert window.mean == pytest.approx(statistics.mean(recent))
+        assert window.sum == pytest.approx(sum(recent))
+        assert window.min == min(recent)
+        assert window.max == max(recent)
+        assert (window.first, window.last) == (recent[0], recent[-1])
+        if len(recent) > 1:
+            assert window.variance == pytest.approx(statistics.variance(recent), abs=1e-6)
+            assert window.stdev == pytest.approx(statistics.stdev(recent), abs=1e-6)
+            assert window.slope == pytest.approx(_slope(recent), abs=1e-9)
+        else:
+            assert window.variance is window.stdev is window.slope is None
+
+
+def test_empty_and_degenerate_windows():
+    window = RollingWindow(3)
+    assert not window
+    assert window.mean is window.min is window.max is window.ewma is None
+
+    for _ in range(10):
+        window.append(42.0)
+    assert window.variance == 0.0  # clamped, never a tiny negative
+    assert window.slope == 0.0
+    assert window.ewma == 42.0
+
+    with pytest.raises(ValueError):
+        RollingWindow(0)
+
+
+def test_long_stream_does_not_drift():
+    rng = random.Random(9)
+    window = RollingWindow(50)
+    for _ in range(200_000):
+        window.append(rng.uniform(1e6, 1e6 + 1))
+    recent = list(window)
+    assert window.mean == pytest.approx(statistics.mean(recent), rel=1e-12)
+    assert window.variance == pytest.approx(statistics.variance(recent), rel=1e-3)
+
+
+@pytest.mark.parametrize("size", [2, 7, 50])
+def test_variance_with_large_offset(size):
+    rng = random.Random(16)
+    window = RollingWindow(size)
+    values = []
+    for _ in range(3 * size + 11):
+        value = 1e8 + rng.gauss(0.0, 0.3)
+        window.append(value)
+        values.append(value)
+        recent = values[-size:]
+        if len(recent) > 1:
+            assert window.variance == pytest.approx(statistics.variance(recent), rel=1e-6)
+            assert window.stdev == pytest.approx(statistics.stdev(recent), rel=1e-6)
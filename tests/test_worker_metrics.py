@@ -0,0 +1,72 @@
+import random
+
+import pytest
+
+from backend.workers.metrics import (
+    Metrics,
+    SlidingWindowHistogram,
+    StreamingHistogram,
+)
+
+
+def _exact(sorted_values, q):
+    return sorted_values[int(q * (len(sorted_values) - 1))]
+
+
+def test_streaming_quantiles_within_relative_accuracy():
+    rng = random.Random(3)
+    values = [rng.lognormvariate(-3, 1.2) for _ in range(20000)]
+    hist = StreamingHistogram(relative_accuracy=0.01)
+    for v in values:
+        hist.observe(v)
+    values.sort()
+
+    for q in (0.5, 0.95, 0.99):
+        assert hist.quantile(q) == pytest.approx(_exact(values, q), rel=0.02)
+    assert hist.quantile(0) == values[0]
+    assert hist.quantile(1) == values[-1]
+    assert hist.count == len(values)
+    assert set(hist.percentiles()) == {"p50", "p95", "p99"}
+
+
+def test_streaming_histogram_memory_is_fixed():
+    hist = StreamingHistogram()
+    buckets = len(hist._counts)
+    for i in range(50000):
+        hist.observe(i * 0.001)
+    assert len(hist._counts) == buckets
+
+    hist.observe(0.0)
+    hist.observe(1e9)  # beyond max_value: clamped into the last bucket
+    assert hist.quantile(1) == 1e9
+    assert StreamingHistogram().quantile(0.5) is None
+
+
+def test_sliding_window_drops_expired_slices():
+    now = [0.0]
+    hist = SlidingWindowHistogram(window_seconds=60.0, slices=6, clock=lambda: now[0])
+
+    for _ in range(100):
+        hist.observe(1.0)
+    now[0] = 30.0
+    for _ in range(100):
+        hist.observe(10.0)
+    assert hist.count == 200
+    assert hist.quantile(0.25) == pytest.approx(1.0, rel=0.02)
+
+    now[0] = 65.0  # the t=0 slice has left the window
+    assert hist.quantile(0.25) == pytest.approx(10.0, rel=0.02)
+    assert hist.count == 100
+
+    now[0] = 200.0
+    assert hist.quantile(0.5) is None
+    assert hist.count == 0
+    assert hist.sum == 0.0
+
+
+def test_worker_duration_histogram_keeps_observe():
+    metrics = Metrics()
+    for v in (0.1, 0.2, 0.3):
+        metrics.worker_job_duration_seconds.observe(v)
+    assert metrics.worker_job_duration_seconds.count == 3
+    assert metrics.worker_job_duration_seconds.quantile(0.5) == pytest.approx(0.2, rel=0.02)
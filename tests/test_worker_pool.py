@@ -0,0 +1,174 @@
+import asyncio
+import os
+import time
+
+import pytest
+
+from backend.workers import metrics
+from backend.workers.job_store import JobStore
+from backend.workers.pool import JobPool, PoolConfig
+from backend.workers.runner import runner_loop
+
+
+def _slow_job(seconds: float) -> str:
+    time.sleep(seconds)
+    return "ok"
+
+
+def _pid_job() -> int:
+    return os.getpid()
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def events(monkeypatch):
+    seen = []
+
+    async def fake_broadcast(job_id, job_path, state, payload=None, ts=None):
+        seen.append((job_id, state))
+
+    monkeypatch.setattr(
+        "backend.workers.runner.broadcast_job_event", fake_broadcast
+    )
+    return seen
+
+
+@pytest.fixture
+def test_metrics(monkeypatch):
+    m = metrics.Metrics()
+    monkeypatch.setattr(metrics, "default_metrics", m)
+    return m
+
+
+def _claimed(store: JobStore, job_id: str, path: str, args=None) -> dict:
+    store.claim(job_id)
+    return {
+        "job_id": job_id,
+        "job_path": f"{__name__}.{path}",
+        "args": args or [],
+        "kwargs": {},
+        "attempts": store.attempts(job_id),
+    }
+
+
+@pytest.mark.anyio("asyncio")
+async def test_sync_jobs_run_concurrently_off_the_loop(events, test_metrics):
+    store = JobStore()
+    pool = JobPool(PoolConfig(concurrency=4))
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    ticker_task = asyncio.create_task(ticker())
+    started = time.monotonic()
+    for i in range(4):
+        await pool.submit(_claimed(store, f"slow-{i}", "_slow_job", [0.2]), store=store)
+    await pool.join()
+    elapsed = time.monotonic() - started
+    ticker_task.cancel()
+    await pool.close()
+
+    assert elapsed < 0.6
+    assert ticks >= 10  # the event loop kept running while jobs slept
+    assert all(store.get_state(f"slow-{i}") == "done" for i in range(4))
+    assert test_metrics.worker_pool_in_flight.value == 0
+
+
+@pytest.mark.anyio("asyncio")
+async def test_submit_blocks_when_queue_is_full(events, test_metrics):
+    store = JobStore()
+    pool = JobPool(PoolConfig(concurrency=1, queue_size=1))
+
+    await pool.submit(_claimed(store, "a", "_slow_job", [0.2]), store=store)
+    await asyncio.sleep(0.02)  # "a" is running, the queue is empty
+    await pool.submit(_claimed(store, "b", "_slow_job", [0.0]), store=store)
+    assert test_metrics.worker_pool_queue_depth.value == 1
+    assert test_metrics.worker_pool_in_flight.value == 1
+
+    third = asyncio.create_task(
+        pool.submit(_claimed(store, "c", "_slow_job", [0.0]), store=store)
+    )
+    await asyncio.sleep(0.05)
+    assert not third.done()  # backpressure until "a" finishes
+
+    await asyncio.wait_for(third, timeout=1.0)
+    await pool.join()
+    await pool.close()
+    assert [store.get_state(j) for j in ("a", "b", "c")] == ["done"] * 3
+
+
+@pytest.mark.anyio("asyncio")
+async def test_timed_out_job_is_scheduled_for_retry(events, test_metrics):
+    store = JobStore()
+    path = f"{__name__}._slow_job"
+    pool = JobPool(PoolConfig(concurrency=2, path_timeouts={path: 0.05}))
+
+    await pool.submit(_claimed(store, "t", "_slow_job", [0.5]), store=store)
+    await pool.join()
+    await pool.close()
+
+    assert store.get_state("t") == "retry_scheduled"
+    assert test_metrics.worker_jobs_timed_out_total.count == 1
+    assert ("t", "error") in events
+
+
+@pytest.mark.anyio("asyncio")
+async def test_runner_loop_submits_due_retries_to_pool(events, test_metrics):
+    store = JobStore()
+    for i in range(3):
+        store.set_last_job(f"r-{i}", {"job_path": f"{__name__}._slow_job", "args": [0.1]})
+        store.schedule_retry(f"r-{i}", 0)
+    pool = JobPool(PoolConfig(concurrency=3))
+
+    started = time.monotonic()
+    await runner_loop(store=store, poll_interval_ms=0, pool=pool)
+    elapsed = time.monotonic() - started
+    await pool.close()
+
+    assert elapsed < 0.3
+    assert [store.get_state(f"r-{i}") for i in range(3)] == ["done"] * 3
+
+
+@pytest.mark.anyio("asyncio")
+async def test_process_mode_runs_job_in_child(events, test_metrics):
+    store = JobStore()
+    path = f"{__name__}._pid_job"
+    pool = JobPool(PoolConfig(concurrency=1, mode="inline", path_modes={path: "process"}))
+
+    job = _claimed(store, "p", "_pid_job")
+    child_pid = await pool.call(path, _pid_job, [], {})
+    await pool.submit(job, store=store)
+    await pool.join()
+    await pool.close()
+
+    assert child_pid != os.getpid()
+    assert store.get_state("p") == "done"
+
+
+def test_pool_config_from_env(monkeypatch):
+    monkeypatch.delenv("WORKER_CONCURRENCY", raising=False)
+    assert PoolConfig.from_env() is None
+
+    monkeypatch.setenv("WORKER_CONCURRENCY", "8")
+    monkeypatch.setenv("WORKER_EXECUTOR_PATHS", "a.b.heavy=process")
+    monkeypatch.setenv("WORKER_JOB_TIMEOUTS", "a.b.heavy=30")
+    monkeypatch.setenv("WORKER_JOB_TIMEOUT_SECONDS", "5")
+    config = PoolConfig.from_env()
+
+    assert config.concurrency == 8
+    assert config.mode_for("a.b.heavy") == "process"
+    assert config.mode_for("a.b.light") == "thread"
+    assert config.mode_for("backend.workers.tasks.worker_heartbeat") == "inline"
+    assert config.timeout_for("a.b.heavy") == 30.0
+    assert config.timeout_for("a.b.light") == 5.0
+
+    with pytest.raises(ValueError):
+        PoolConfig(mode="fiber")
@@ -0,0 +1,224 @@
+"""
+Pool of long-lived exchange connectors for the order router.
+
+Building a connector per order pays client construction, market metadata
+loading and a TLS handshake every time. The pool keeps one warm connector
+per (connector_name, testnet, credentials) and reuses it across orders:
+
+- health checks run at most every health_check_interval seconds (and right
+  after an exchange error); a connector that fails one is closed and rebuilt
+- account balance is cached for balance_ttl seconds and invalidated on fills
+- connectors are bound to the event loop they were created on; a lookup
+  from a different loop builds a fresh one
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from worker.connectors import IExchangeConnector
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BALANCE_TTL_SECONDS = 2.0
+DEFAULT_HEALTH_CHECK_INTERVAL_SECONDS = 30.0
+
+PoolKey = Tuple[str, bool, str]
+
+
+def credentials_fingerprint(connector_name: str, api_key: Optional[str] = None, api_secret: Optional[str] = None) -> str:
+    """
+    Stable fingerprint of the credentials a connector will use.
+
+    Falls back to the <NAME>_API_KEY / <NAME>_API_SECRET environment
+    variables, the same ones the connectors read. The secret is hashed so it
+    never sits in a pool key in clear text.
+    """
+    prefix = connector_name.upper()
+    api_key = api_key or os.getenv(f"{prefix}_API_KEY", "")
+    api_secret = api_secret or os.getenv(f"{prefix}_API_SECRET", "")
+    digest = hashlib.sha256(f"{api_key}\0{api_secret}".encode()).hexdigest()
+    return digest[:16]
+
+
+class _PoolEntry:
+    __slots__ = ("connector", "loop", "created_at", "checked_at", "healthy", "balance", "balance_at")
+
+    def __init__(self, connector: IExchangeConnector, loop: asyncio.AbstractEventLoop, now: float) -> None:
+        self.connector = connector
+        self.loop = loop
+        self.created_at = now
+        self.checked_at = now
+        self.healthy = True
+        self.balance: Optional[Dict[str, Any]] = None
+        self.balance_at = 0.0
+
+
+class ConnectorPool:
+    """
+    Warm exchange connectors keyed by (connector_name, testnet, credentials).
+
+    Args:
+        factory: Builds a connector, called as factory(name, testnet=..., **kwargs)
+        balance_ttl: Seconds a fetched balance is reused (0 disables caching)
+        health_check_interval: Seconds between health checks of an idle connector
+        clock: Monotonic time source (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        factory: Callable[..., IExchangeConnector],
+        balance_ttl: float = DEFAULT_BALANCE_TTL_SECONDS,
+        health_check_interval: float = DEFAULT_HEALTH_CHECK_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._factory = factory
+        self.balance_ttl = balance_ttl
+        self.health_check_interval = health_check_interval
+        self._clock = clock
+        self._entries: Dict[PoolKey, _PoolEntry] = {}
+        self._locks: Dict[PoolKey, Tuple[asyncio.AbstractEventLoop, asyncio.Lock]] = {}
+        self.created_total = 0
+        self.reused_total = 0
+        self.refreshed_total = 0
+        self.balance_hits = 0
+        self.balance_misses = 0
+
+    @staticmethod
+    def key_for(connector_name: str, testnet: bool = True, **kwargs) -> PoolKey:
+        """Pool key for a connector; credentials are fingerprinted, not stored."""
+        name = connector_name.lower()
+        fingerprint = credentials_fingerprint(name, kwargs.get("api_key"), kwargs.get("api_secret"))
+        return name, bool(testnet), fingerprint
+
+    def _lock_for(self, key: PoolKey) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        owner, lock = self._locks.get(key, (None, None))
+        if owner is not loop:
+            lock = asyncio.Lock()
+            self._locks[key] = (loop, lock)
+        return lock
+
+    async def acquire(self, connector_name: str, testnet: bool = True, **kwargs) -> IExchangeConnector:
+        """
+        Get a warm connector, building or refreshing it when needed.
+
+        Args:
+            connector_name: Name of the connector ('binance', ...)
+            testnet: Whether to use testnet/sandbox mode
+            **kwargs: Connector parameters (api_key/api_secret are part of the key)
+
+        Returns:
+            Connector instance owned by the pool (do not close it)
+
+        Raises:
+            ConnectorNotFoundError: If the factory does not know connector_name
+        """
+        key = self.key_for(connector_name, testnet, **kwargs)
+        loop = asyncio.get_running_loop()
+        async with self._lock_for(key):
+            entry = self._entries.get(key)
+            if entry is not None and entry.loop is not loop:
+                # Sessions cannot move between loops; drop it without awaiting on the wrong loop.
+                self._entries.pop(key, None)
+                entry = None
+            if entry is not None and self._needs_check(entry) and not await self._health_check(entry):
+                logger.warning(f"Connector {key[0]} (testnet={key[1]}) failed health check, rebuilding")
+                await self._close_entry(entry)
+                self._entries.pop(key, None)
+                self.refreshed_total += 1
+                entry = None
+            if entry is None:
+                connector = self._factory(key[0], testnet=testnet, **kwargs)
+                entry = self._entries[key] = _PoolEntry(connector, loop, self._clock())
+                self.created_total += 1
+                logger.info(f"Pooled new connector: {key[0]} (testnet={testnet})")
+            else:
+                self.reused_total += 1
+            return entry.connector
+
+    def _needs_check(self, entry: _PoolEntry) -> bool:
+        return not entry.healthy or self._clock() - entry.checked_at >= self.health_check_interval
+
+    async def _health_check(self, entry: _PoolEntry) -> bool:
+        """Balance fetch doubles as the health check and refreshes the cached balance."""
+        try:
+            balance = await entry.connector.fetch_balance()
+        except Exception as e:
+            logger.warning(f"Connector health check failed: {e}")
+            return False
+        now = self._clock()
+        entry.balance, entry.balance_at = balance, now
+        entry.checked_at = now
+        entry.healthy = True
+        return True
+
+    async def fetch_balance(self, connector_name: str, testnet: bool = True, **kwargs) -> Dict[str, Any]:
+        """
+        Account balance through the pooled connector, cached for balance_ttl.
+
+        Raises:
+            Exception: Whatever the connector raises; the connector is then
+                marked for a health check on its next acquire
+        """
+        key = self.key_for(connector_name, testnet, **kwargs)
+        connector = await self.acquire(connector_name, testnet, **kwargs)
+        entry = self._entries[key]
+        now = self._clock()
+        if entry.balance is not None and self.balance_ttl > 0 and now - entry.balance_at < self.balance_ttl:
+            self.balance_hits += 1
+            return entry.balance
+        self.balance_misses += 1
+        try:
+            balance = await connector.fetch_balance()
+        except Exception:
+            entry.healthy = False
+            raise
+        entry.balance, entry.balance_at = balance, self._clock()
+        entry.checked_at = entry.balance_at
+        return balance
+
+    def invalidate_balance(self, connector_name: str, testnet: bool = True, **kwargs) -> None:
+        """Forget the cached balance, e.g. after a fill changed it."""
+        entry = self._entries.get(self.key_for(connector_name, testnet, **kwargs))
+        if entry is not None:
+            entry.balance = None
+
+    def mark_unhealthy(self, connector_name: str, testnet: bool = True, **kwargs) -> None:
+        """Force a health check on the next acquire (after an exchange error)."""
+        entry = self._entries.get(self.key_for(connector_name, testnet, **kwargs))
+        if entry is not None:
+            entry.healthy = False
+            entry.balance = None
+
+    @staticmethod
+    async def _close_entry(entry: _PoolEntry) -> None:
+        try:
+            await entry.connector.close()
+        except Exception as e:
+            logger.warning(f"Error closing pooled connector: {e}")
+
+    async def close_all(self) -> None:
+        """Close every pooled connector created on the running loop and empty the pool."""
+        loop = asyncio.get_running_loop()
+        entries, self._entries = self._entries, {}
+        self._locks.clear()
+        for entry in entries.values():
+            if entry.loop is loop:
+                await self._close_entry(entry)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "created": self.created_total,
+            "reused": self.reused_total,
+            "refreshed": self.refreshed_total,
+            "balance_hits": self.balance_hits,
+            "balance_misses": self.balance_misses,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
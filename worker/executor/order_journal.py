@@ -0,0 +1,226 @@
+"""
+Background, batched persistence of Order records for the order router.
+
+route_order runs on the event loop; a synchronous add/commit/refresh per
+order stalls every other coroutine while the database fsyncs. The journal
+takes Order records off that path:
+
+- submit() queues a record and returns an OrderAck immediately
+- one writer thread drains the queue and commits records in batches, in
+  submission order, so orders of the same user are persisted in the order
+  they were routed
+- an OrderAck resolves with the database id once the record's transaction
+  has committed (durable), or with the exception that prevented it
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 200
+DEFAULT_LINGER_SECONDS = 0.002
+
+_STOP = object()
+
+
+class OrderAck:
+    """
+    Durable acknowledgement for one journaled order.
+
+    Resolves with the order's database id after its transaction commits.
+    """
+
+    __slots__ = ("order", "_future")
+
+    def __init__(self, order: Any):
+        self.order = order
+        self._future: "Future[int]" = Future()
+
+    def done(self) -> bool:
+        return self._future.done()
+
+    def result(self, timeout: Optional[float] = None) -> int:
+        """
+        Block until the order is committed.
+
+        Returns:
+            Database id of the order
+
+        Raises:
+            Exception: Whatever made the write fail
+            concurrent.futures.TimeoutError: If timeout elapses first
+        """
+        return self._future.result(timeout)
+
+    async def wait(self) -> int:
+        """Await the commit without blocking the event loop; returns the database id."""
+        return await asyncio.wrap_future(self._future)
+
+
+class OrderJournal:
+    """
+    Single writer thread that persists Order records in batched transactions.
+
+    Args:
+        session_factory: Returns a new SQLAlchemy Session (e.g. SessionLocal)
+        batch_size: Maximum records per transaction
+        linger: Seconds the writer waits for more records before committing
+            a batch that is not full (0 commits whatever is queued)
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        linger: float = DEFAULT_LINGER_SECONDS,
+    ):
+        self._session_factory = session_factory
+        self.batch_size = max(1, batch_size)
+        self.linger = linger
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._closed = False
+        self.batches_total = 0
+        self.records_total = 0
+        self.failures_total = 0
+
+    def start(self) -> None:
+        """Start the writer thread (submit() does this on first use)."""
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="order-journal", daemon=True)
+                self._thread.start()
+
+    def submit(self, order: Any) -> OrderAck:
+        """
+        Queue an Order for persistence.
+
+        Args:
+            order: Unsaved Order instance; do not modify it until its ack resolves
+
+        Returns:
+            OrderAck that resolves with the database id after commit
+
+        Raises:
+            RuntimeError: If the journal has been closed
+        """
+        if self._closed:
+            raise RuntimeError("OrderJournal is closed")
+        ack = OrderAck(order)
+        self.start()
+        self._queue.put(ack)
+        return ack
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until everything submitted so far has been written.
+
+        Returns:
+            True if the journal drained within timeout
+        """
+        if self._thread is None:
+            return True
+        barrier: "Future[None]" = Future()
+        self._queue.put(barrier)
+        try:
+            barrier.result(timeout)
+            return True
+        except Exception:
+            return False
+
+    async def aflush(self) -> None:
+        """Await flush() without blocking the event loop."""
+        if self._thread is None:
+            return
+        barrier: "Future[None]" = Future()
+        self._queue.put(barrier)
+        await asyncio.wrap_future(barrier)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Write everything queued, then stop the writer thread."""
+        self._closed = True
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pending": self._queue.qsize(),
+            "batches": self.batches_total,
+            "records": self.records_total,
+            "failures": self.failures_total,
+        }
+
+    # -- writer thread ---------------------------------------------------------
+    def _next_batch(self) -> Tuple[List[Any], bool]:
+        """Block for one item, then gather up to batch_size (lingering briefly)."""
+        items = [self._queue.get()]
+        deadline = time.monotonic() + self.linger
+        while len(items) < self.batch_size and items[-1] is not _STOP:
+            remaining = deadline - time.monotonic()
+            try:
+                items.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+            except queue.Empty:
+                break
+        stop = items[-1] is _STOP
+        return (items[:-1] if stop else items), stop
+
+    def _run(self) -> None:
+        while True:
+            items, stop = self._next_batch()
+            acks: List[OrderAck] = []
+            for item in items:
+                if isinstance(item, OrderAck):
+                    acks.append(item)
+                    continue
+                # Barrier: everything before it must be written first.
+                self._write(acks)
+                acks = []
+                item.set_result(None)
+            self._write(acks)
+            if stop:
+                return
+
+    def _write(self, acks: List[OrderAck]) -> None:
+        if not acks:
+            return
+        try:
+            self._commit(acks)
+        except Exception as e:
+            logger.warning(f"Order journal batch of {len(acks)} failed, retrying one by one: {e}")
+            # Isolate the bad record(s); the rest still commit, in order.
+            for ack in acks:
+                try:
+                    self._commit([ack])
+                except Exception as exc:
+                    self.failures_total += 1
+                    logger.error(f"Order journal failed to persist order: {exc}")
+                    ack._future.set_exception(exc)
+
+    def _commit(self, acks: List[OrderAck]) -> None:
+        session = self._session_factory()
+        # Keep loaded attributes readable on the detached orders after commit.
+        session.expire_on_commit = False
+        try:
+            session.add_all([ack.order for ack in acks])
+            session.commit()
+        except Exception:
+            session.rollback()
+            session.expunge_all()
+            raise
+        finally:
+            session.close()
+        self.batches_total += 1
+        self.records_total += len(acks)
+        for ack in acks:
+            ack._future.set_result(ack.order.id)
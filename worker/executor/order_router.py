@@ -2,10 +2,11 @@
 Order routing module for handling order execution through exchange connectors.
 
 This module provides the main order routing logic including:
-- Connector loading by name
+- Connector loading by name, pooled across orders (see connector_pool)
 - Risk checks before order execution
 - Order creation through exchange connectors
-- Database persistence of order details
+- Database persistence of order details, inline or through the batched
+  OrderJournal (see order_journal)
 """
 
 import os
@@ -17,6 +18,8 @@ from sqlalchemy.orm import Session
 from worker.connectors import IExchangeConnector, BinanceConnector
 from backend.models import Order
 from worker.risk.risk import check_order_limits, RiskLimitError
+from worker.executor.connector_pool import ConnectorPool
+from worker.executor.order_journal import OrderJournal
 
 logger = logging.getLogger(__name__)
 
@@ -70,6 +73,88 @@ def load_connector(connector_name: str, testnet: bool = True, **kwargs) -> IExch
     return connector_class(testnet=testnet, **kwargs)
 
 
+_connector_pool: Optional[ConnectorPool] = None
+
+
+def get_connector_pool() -> ConnectorPool:
+    """
+    Process-wide connector pool used by route_order.
+
+    Connectors are built through load_connector (looked up at call time).
+    ORDER_BALANCE_TTL_SECONDS and CONNECTOR_HEALTH_CHECK_SECONDS tune the
+    balance cache and health-check interval.
+    """
+    global _connector_pool
+    if _connector_pool is None:
+        _connector_pool = ConnectorPool(
+            lambda name, **kwargs: load_connector(name, **kwargs),
+            balance_ttl=float(os.getenv("ORDER_BALANCE_TTL_SECONDS", "2.0")),
+            health_check_interval=float(os.getenv("CONNECTOR_HEALTH_CHECK_SECONDS", "30.0")),
+        )
+    return _connector_pool
+
+
+def _pooling_enabled() -> bool:
+    return os.getenv("ORDER_ROUTER_POOL_CONNECTORS", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+_order_journal: Optional[OrderJournal] = None
+
+
+def get_order_journal() -> OrderJournal:
+    """
+    Process-wide order journal used by route_order, writing through
+    backend.models.SessionLocal. ORDER_JOURNAL_BATCH_SIZE caps the records
+    per transaction.
+    """
+    global _order_journal
+    if _order_journal is None:
+        from backend.models import SessionLocal
+
+        if SessionLocal is None:
+            raise RuntimeError("OrderJournal needs backend.models.SessionLocal")
+        _order_journal = OrderJournal(
+            SessionLocal,
+            batch_size=int(os.getenv("ORDER_JOURNAL_BATCH_SIZE", "200")),
+        )
+    return _order_journal
+
+
+def _journal_enabled() -> bool:
+    return os.getenv("ORDER_JOURNAL_ENABLED", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+async def _persist_order(db: Session, db_order: Order, journal: Optional[OrderJournal], wait: bool) -> None:
+    """
+    Store an order inline on db, or hand it to the journal.
+
+    With a journal, wait=True awaits the durable ack (db_order.id is set on
+    return) without blocking the event loop; wait=False returns at once.
+    """
+    if journal is None:
+        db.add(db_order)
+        db.commit()
+        db.refresh(db_order)
+        return
+    ack = journal.submit(db_order)
+    if wait:
+        await ack.wait()
+
+
+def _rejected_order(order_payload: Dict[str, Any], user_id: str) -> Order:
+    return Order(
+        user_id=user_id,
+        symbol=order_payload.get("symbol", "UNKNOWN"),
+        qty=float(order_payload.get("amount", 0)),
+        price=float(order_payload.get("price")) if order_payload.get("price") else None,
+        side=order_payload.get("side", "buy").lower(),
+        status="rejected",
+        external_id=None,
+        created_at=datetime.utcnow(),
+        updated_at=datetime.utcnow(),
+    )
+
+
 def check_risk_limits(order_payload: Dict[str, Any]) -> None:
     """
     Perform risk checks on order before execution.
@@ -134,12 +219,14 @@ async def route_order(
     db: Session,
     user_id: str = "default_user",
     testnet: bool = True,
+    pool: Optional[ConnectorPool] = None,
+    journal: Optional[OrderJournal] = None,
 ) -> Order:
     """
     Route an order through the specified exchange connector.
     
     This function:
-    1. Loads the appropriate connector
+    1. Loads the appropriate connector (or takes a warm one from the pool)
     2. Performs risk checks
     3. Creates the order on the exchange
     4. Stores order details in the database
@@ -155,6 +242,14 @@ async def route_order(
         db: SQLAlchemy database session
         user_id: User identifier for the order
         testnet: Whether to use testnet/sandbox mode (default True for safety)
+        pool: Connector pool to keep connectors warm across orders. Defaults
+            to get_connector_pool() when ORDER_ROUTER_POOL_CONNECTORS=1;
+            otherwise a connector is built and closed per order
+        journal: Order journal that persists records off the event loop in
+            batched transactions. Defaults to get_order_journal() when
+            ORDER_JOURNAL_ENABLED=1; otherwise orders are committed inline
+            on db. Accepted orders wait for their durable ack (so the
+            returned order has its id); rejections are queued without waiting
     
     Returns:
         Order: Created order object with external_id from exchange
@@ -177,6 +272,9 @@ async def route_order(
         ... )
         >>> print(f"Order created: {order.external_id}")
     """
+    if journal is None and _journal_enabled():
+        journal = get_order_journal()
+    
     try:
         # Step 1: Perform risk checks first (before connector initialization)
         logger.info(f"Processing order: {order_payload}")
@@ -185,9 +283,17 @@ async def route_order(
         check_risk_limits(order_payload)  # Legacy checks
         
         # Step 1b: Fetch account info for position-based risk checks
-        connector = load_connector(connector_name, testnet=testnet)
+        if pool is None and _pooling_enabled():
+            pool = get_connector_pool()
+        if pool is not None:
+            connector = await pool.acquire(connector_name, testnet=testnet)
+        else:
+            connector = load_connector(connector_name, testnet=testnet)
         try:
-            balance = await connector.fetch_balance()
+            if pool is not None:
+                balance = await pool.fetch_balance(connector_name, testnet=testnet)
+            else:
+                balance = await connector.fetch_balance()
             account_info = {"balance": balance, "positions": {}}
             # Note: Position tracking would need to be implemented separately
             # For now, check_order_limits will work without position info
@@ -203,7 +309,12 @@ async def route_order(
         
         # Step 3: Create order on exchange
         logger.info(f"Creating order on {connector_name}: {order_payload}")
-        exchange_order = await connector.create_order(order_payload)
+        try:
+            exchange_order = await connector.create_order(order_payload)
+        except Exception:
+            if pool is not None:
+                pool.mark_unhealthy(connector_name, testnet=testnet)
+            raise
         
         # Step 4: Extract order details from exchange response
         external_id = exchange_order.get("id")
@@ -220,6 +331,10 @@ async def route_order(
         else:
             status = "open"
         
+        if pool is not None and filled and filled > 0:
+            # A fill moved the balance; the next risk check must see it.
+            pool.invalidate_balance(connector_name, testnet=testnet)
+        
         # Step 5: Create database record
         db_order = Order(
             user_id=user_id,
@@ -233,56 +348,29 @@ async def route_order(
             updated_at=datetime.utcnow(),
         )
         
-        db.add(db_order)
-        db.commit()
-        db.refresh(db_order)
+        await _persist_order(db, db_order, journal, wait=True)
         
         logger.info(
             f"Order created successfully: DB ID={db_order.id}, "
             f"External ID={external_id}, Status={status}"
         )
         
-        # Step 6: Close connector
-        await connector.close()
+        # Step 6: Close connector (pooled connectors stay open for the next order)
+        if pool is None:
+            await connector.close()
         
         return db_order
     
     except (RiskCheckError, RiskLimitError) as e:
         logger.error(f"Risk check failed: {e}")
         # Create order record with rejected status
-        db_order = Order(
-            user_id=user_id,
-            symbol=order_payload.get("symbol", "UNKNOWN"),
-            qty=float(order_payload.get("amount", 0)),
-            price=float(order_payload.get("price")) if order_payload.get("price") else None,
-            side=order_payload.get("side", "buy").lower(),
-            status="rejected",
-            external_id=None,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-        )
-        db.add(db_order)
-        db.commit()
-        db.refresh(db_order)
+        await _persist_order(db, _rejected_order(order_payload, user_id), journal, wait=False)
         raise
     
     except Exception as e:
         logger.error(f"Error creating order: {e}")
         # Create order record with rejected status
-        db_order = Order(
-            user_id=user_id,
-            symbol=order_payload.get("symbol", "UNKNOWN"),
-            qty=float(order_payload.get("amount", 0)),
-            price=float(order_payload.get("price")) if order_payload.get("price") else None,
-            side=order_payload.get("side", "buy").lower(),
-            status="rejected",
-            external_id=None,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
-        )
-        db.add(db_order)
-        db.commit()
-        db.refresh(db_order)
+        await _persist_order(db, _rejected_order(order_payload, user_id), journal, wait=False)
         raise
 
 
@@ -0,0 +1,217 @@
+"""
+Shared HTTP client for worker-side REST and feed polling.
+
+Opening an aiohttp.ClientSession per request pays a DNS lookup, a TCP (and
+TLS) handshake and a new connector every time. SharedHTTPClient keeps one
+pooled session per event loop instead:
+
+- connection pooling with keep-alive, a global limit and a per-host limit
+- conditional GET: the last ETag / Last-Modified and parsed body of each URL
+  are remembered, and a 304 Not Modified reuses the cached body
+- get_http_client() returns the process-wide instance
+"""
+
+import asyncio
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LIMIT = 100
+DEFAULT_LIMIT_PER_HOST = 8
+DEFAULT_TIMEOUT_SECONDS = 10.0
+
+
+@dataclass
+class HTTPResult:
+    """Outcome of a GET through the shared client."""
+    status: int
+    data: Any
+    not_modified: bool = False
+
+
+class SharedHTTPClient:
+    """
+    Pooled aiohttp session shared by every caller on the same event loop.
+
+    Sessions are bound to the loop that created them; a call from a new loop
+    (e.g. a fresh asyncio.run) transparently opens a new session.
+    """
+
+    def __init__(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        limit_per_host: int = DEFAULT_LIMIT_PER_HOST,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+    ):
+        """
+        Initialize shared HTTP client.
+
+        Args:
+            limit: Maximum open connections in total
+            limit_per_host: Maximum open connections per host
+            timeout: Default total timeout per request in seconds
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # url -> (etag, last_modified, data)
+        self._validators: Dict[str, Tuple[Optional[str], Optional[str], Any]] = {}
+        self.requests_total = 0
+        self.not_modified_total = 0
+        self.sessions_created = 0
+
+    def session(self) -> aiohttp.ClientSession:
+        """Get the pooled session for the running loop, creating it if needed."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=300,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+            self._loop = loop
+            self.sessions_created += 1
+            logger.debug(
+                f"🌐 Shared HTTP session opened (limit={self.limit}, per_host={self.limit_per_host})"
+            )
+        return self._session
+
+    async def get_json(
+        self,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        conditional: bool = True,
+    ) -> HTTPResult:
+        """
+        GET a JSON document, revalidating with ETag / If-Modified-Since.
+
+        Args:
+            url: Absolute URL
+            params: Query parameters
+            headers: Extra request headers
+            timeout: Total timeout in seconds (default: client timeout)
+            conditional: Send validators from the previous response of this URL
+
+        Returns:
+            HTTPResult; on 304 data is the cached body and not_modified is True.
+            Non-200 responses return data=None.
+        """
+        request_headers = dict(headers or {})
+        cache_key = self._cache_key(url, params)
+        cached = self._validators.get(cache_key) if conditional else None
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                request_headers["If-None-Match"] = etag
+            if last_modified:
+                request_headers["If-Modified-Since"] = last_modified
+
+        self.requests_total += 1
+        async with self.session().get(
+            url,
+            params=params,
+            headers=request_headers,
+            timeout=aiohttp.ClientTimeout(total=timeout or self.timeout),
+        ) as response:
+            if response.status == 304 and cached:
+                self.not_modified_total += 1
+                return HTTPResult(status=304, data=cached[2], not_modified=True)
+            if response.status != 200:
+                return HTTPResult(status=response.status, data=None)
+            data = await response.json(content_type=None)
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            if conditional and (etag or last_modified):
+                self._validators[cache_key] = (etag, last_modified, data)
+            return HTTPResult(status=200, data=data)
+
+    async def request_json(
+        self,
+        method: str,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Send a request and return the decoded JSON body.
+
+        Raises:
+            aiohttp.ClientResponseError: On a non-2xx status
+        """
+        self.requests_total += 1
+        async with self.session().request(
+            method=method,
+            url=url,
+            params=params,
+            json=json,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=timeout or self.timeout),
+        ) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+    @staticmethod
+    def _cache_key(url: str, params: Optional[Dict[str, Any]]) -> str:
+        if not params:
+            return url
+        return url + "?" + "&".join(f"{k}={params[k]}" for k in sorted(params))
+
+    def forget(self, url: Optional[str] = None) -> None:
+        """Drop cached validators for url (or all URLs)."""
+        if url is None:
+            self._validators.clear()
+        else:
+            self._validators.pop(url, None)
+
+    async def close(self) -> None:
+        """Close the pooled session if it belongs to the running loop."""
+        if self._session is not None and not self._session.closed:
+            if self._loop is asyncio.get_running_loop():
+                await self._session.close()
+        self._session = None
+        self._loop = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests_total,
+            "not_modified": self.not_modified_total,
+            "sessions_created": self.sessions_created,
+            "cached_validators": len(self._validators),
+        }
+
+
+_shared_client: Optional[SharedHTTPClient] = None
+
+
+def get_http_client() -> SharedHTTPClient:
+    """
+    Process-wide shared client. HTTP_POOL_LIMIT and HTTP_POOL_LIMIT_PER_HOST
+    override the connection limits.
+    """
+    global _shared_client
+    if _shared_client is None:
+        _shared_client = SharedHTTPClient(
+            limit=int(os.getenv("HTTP_POOL_LIMIT", str(DEFAULT_LIMIT))),
+            limit_per_host=int(os.getenv("HTTP_POOL_LIMIT_PER_HOST", str(DEFAULT_LIMIT_PER_HOST))),
+        )
+    return _shared_client
+
+
+__all__ = ["HTTPResult", "SharedHTTPClient", "get_http_client"]
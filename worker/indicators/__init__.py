@@ -3,5 +3,37 @@ from worker.indicators.ema import EMA
 from worker.indicators.rsi import RSI
 from worker.indicators.macd import MACD
 from worker.indicators.atr import ATR
+from worker.indicators.streaming import (
+    StreamingIndicator,
+    StreamingSMA,
+    StreamingEMA,
+    StreamingRSI,
+    StreamingMACD,
+    StreamingATR,
+)
+from worker.indicators.series import (
+    sma_series,
+    ema_series,
+    rsi_series,
+    macd_series,
+    atr_series,
+)
 
-__all__ = ["SMA", "EMA", "RSI", "MACD", "ATR"]
+__all__ = [
+    "SMA",
+    "EMA",
+    "RSI",
+    "MACD",
+    "ATR",
+    "StreamingIndicator",
+    "StreamingSMA",
+    "StreamingEMA",
+    "StreamingRSI",
+    "StreamingMACD",
+    "StreamingATR",
+    "sma_series",
+    "ema_series",
+    "rsi_series",
+    "macd_series",
+    "atr_series",
+]
@@ -3,6 +3,7 @@ from worker.indicators.ema import EMA
 from worker.indicators.rsi import RSI
 from worker.indicators.macd import MACD
 from worker.indicators.atr import ATR
+from worker.indicators.series import sma_series, ema_series, rsi_series, macd_series, atr_series
 
 
 class IndicatorEngine:
@@ -17,17 +18,23 @@ class IndicatorEngine:
         self.macd = MACD()
         self.atr = ATR()
 
-    def get(self, name: str, data) -> dict:
+    def get(self, name: str, data, series: bool = False) -> dict:
         """
         Safely call indicator.calculate(data) and return result.
 
         Args:
             name: Indicator name (SMA, EMA, RSI, MACD, ATR)
             data: Data to pass to calculate method
+            series: If True, return the whole-history series (NumPy array, NaN
+                where history is insufficient; dict of arrays for MACD) computed
+                by the vectorized worker.indicators.series functions
 
         Returns:
             Dict with 'name' and 'value' keys
         """
+        if series:
+            return {"name": name, "value": self._get_series(name, data)}
+
         result = None
         try:
             if name == "SMA":
@@ -44,3 +51,27 @@ class IndicatorEngine:
             result = None
 
         return {"name": name, "value": result}
+
+    def _get_series(self, name: str, data):
+        """
+        Series-mode counterpart of get(); `data` is a closes array for the
+        price indicators and a list of candle dicts for ATR.
+        """
+        try:
+            if name == "SMA":
+                return sma_series(data)
+            if name == "EMA":
+                return ema_series(data)
+            if name == "RSI":
+                return rsi_series(data)
+            if name == "MACD":
+                return macd_series(data)
+            if name == "ATR":
+                if not isinstance(data, list):
+                    return None
+                highs = [float(c["high"]) for c in data]
+                lows = [float(c["low"]) for c in data]
+                return atr_series(highs, lows)
+        except Exception:
+            return None
+        return None
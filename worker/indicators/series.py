@@ -0,0 +1,112 @@
+"""
+Vectorized full-history indicator series.
+
+Each function takes a contiguous float64 array and returns an array of the
+same length where element i equals the matching calculate() result for
+closes[:i + 1], or NaN where calculate() would return None. Backtests and the
+optimizer can compute a series once and index it by bar number instead of
+calling calculate() on every bar.
+"""
+
+from typing import Dict
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def _as_float64(values) -> np.ndarray:
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def _nan_like(values: np.ndarray) -> np.ndarray:
+    return np.full(values.shape[0], np.nan, dtype=np.float64)
+
+
+def _check_window(window: int) -> None:
+    if window <= 0:
+        raise ValueError("window must be positive")
+
+
+def sma_series(closes, window: int = 20) -> np.ndarray:
+    """SMA series, reference: SMA.calculate."""
+    _check_window(window)
+    closes = _as_float64(closes)
+    out = _nan_like(closes)
+    if closes.shape[0] >= window:
+        out[window - 1:] = sliding_window_view(closes, window).mean(axis=1)
+    return out
+
+
+def ema_series(closes, window: int = 20) -> np.ndarray:
+    """
+    EMA series, reference: EMA.calculate.
+
+    EMA.calculate seeds with the window mean and smooths over the last `window`
+    prices, which unrolls to seed * d**w + sum(k * d**(w-1-j) * p_j); both terms
+    are window reductions.
+    """
+    _check_window(window)
+    closes = _as_float64(closes)
+    out = _nan_like(closes)
+    if closes.shape[0] < window:
+        return out
+    k = 2.0 / (window + 1.0)
+    decay = 1.0 - k
+    weights = k * decay ** np.arange(window - 1, -1, -1, dtype=np.float64)
+    windows = sliding_window_view(closes, window)
+    out[window - 1:] = windows.mean(axis=1) * decay ** window + windows @ weights
+    return out
+
+
+def rsi_series(closes, period: int = 14) -> np.ndarray:
+    """RSI series, reference: RSI.calculate."""
+    _check_window(period)
+    closes = _as_float64(closes)
+    out = _nan_like(closes)
+    if closes.shape[0] < period + 1:
+        return out
+    deltas = np.diff(closes)
+    gains = sliding_window_view(np.where(deltas > 0, deltas, 0.0), period).sum(axis=1)
+    losses = sliding_window_view(np.where(deltas > 0, 0.0, -deltas), period).sum(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rs = (gains / period) / (losses / period)
+        rsi = np.where(losses == 0, 100.0, 100.0 - (100.0 / (1.0 + rs)))
+    out[period:] = rsi
+    return out
+
+
+def macd_series(closes, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, np.ndarray]:
+    """
+    MACD series, reference: MACD.calculate.
+
+    Returns a dict of "macd", "signal" and "histogram" arrays; all three are
+    NaN on bars where MACD.calculate returns None.
+    """
+    closes = _as_float64(closes)
+    n = closes.shape[0]
+    line = ema_series(closes, fast) - ema_series(closes, slow)
+    sig = _nan_like(closes)
+    first = max(fast, slow) - 1
+    if n > first:
+        sig[first:] = ema_series(line[first:], signal)
+    # mirror MACD.calculate's gating: history length and the number of valid
+    # MACD points among the last `slow` prefixes it rebuilds
+    lengths = np.arange(1, n + 1)
+    valid = lengths - np.maximum(lengths - slow + 1, max(fast, slow)) + 1
+    ready = (lengths >= slow + signal) & (lengths >= fast) & (valid >= signal)
+    macd_line = np.where(ready, line, np.nan)
+    signal_line = np.where(ready, sig, np.nan)
+    return {"macd": macd_line, "signal": signal_line, "histogram": macd_line - signal_line}
+
+
+def atr_series(highs, lows, period: int = 14) -> np.ndarray:
+    """ATR series, reference: ATR.calculate (high - low range averaged over `period`)."""
+    _check_window(period)
+    highs = _as_float64(highs)
+    lows = _as_float64(lows)
+    out = _nan_like(highs)
+    if highs.shape[0] < period + 1:
+        return out
+    ranges = highs - lows
+    out[period:] = sliding_window_view(ranges[1:], period).mean(axis=1)
+    return out
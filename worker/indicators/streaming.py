@@ -0,0 +1,224 @@
+from collections import deque
+from typing import Any, Dict, Optional, Union
+
+Candle = Union[float, int, Dict[str, Any]]
+
+
+def _close_of(candle: Candle) -> float:
+    if isinstance(candle, dict):
+        return float(candle["close"])
+    return float(candle)
+
+
+class _RollingSum:
+    """
+    Fixed-size window with a running sum.
+
+    The sum is rebuilt from the window contents once every `size` pushes so
+    floating point drift from the add/subtract pairs cannot accumulate over
+    long feeds. The rebuild is O(size) every `size` updates, i.e. O(1) amortised.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self.values: deque = deque(maxlen=size)
+        self.total = 0.0
+        self._since_resync = 0
+
+    def push(self, value: float) -> None:
+        if len(self.values) == self.size:
+            self.total -= self.values[0]
+        self.values.append(value)
+        self.total += value
+        self._since_resync += 1
+        if self._since_resync >= self.size:
+            self.total = sum(self.values)
+            self._since_resync = 0
+
+    def full(self) -> bool:
+        return len(self.values) == self.size
+
+
+class StreamingIndicator:
+    """
+    Base class for the constant-time streaming indicators.
+
+    Each instance tracks a single series (one symbol) and is fed one candle at
+    a time through update(candle), which returns the same value the matching
+    stateless calculate() would return for the full history seen so far.
+
+    history_limit mirrors callers that only keep the last N candles around
+    (e.g. AIFusionStrategy): indicators whose reference implementation needs
+    more than N points stay None, exactly as calculate() would on the
+    truncated list.
+    """
+
+    def __init__(self, history_limit: Optional[int] = None):
+        self.history_limit = history_limit
+        self.count = 0
+        self.value: Any = None
+
+    def _available(self) -> int:
+        if self.history_limit is None:
+            return self.count
+        return min(self.count, self.history_limit)
+
+    def update(self, candle: Candle):
+        self.count += 1
+        self.value = self._update(candle)
+        return self.value
+
+    def _update(self, candle: Candle):
+        raise NotImplementedError("_update not implemented")
+
+
+class StreamingSMA(StreamingIndicator):
+    """
+    Streaming Simple Moving Average, reference: SMA.calculate.
+    """
+
+    def __init__(self, window: int = 20, history_limit: Optional[int] = None):
+        if window <= 0:
+            raise ValueError("window must be positive")
+        super().__init__(history_limit)
+        self.window = window
+        self._sum = _RollingSum(window)
+
+    def _update(self, candle: Candle) -> Optional[float]:
+        self._sum.push(_close_of(candle))
+        if self._available() < self.window:
+            return None
+        return self._sum.total / float(self.window)
+
+
+class StreamingEMA(StreamingIndicator):
+    """
+    Streaming EMA, reference: EMA.calculate.
+
+    EMA.calculate seeds with the window mean and smooths over the last
+    `window` prices only, so its result is seed * d**w + k * sum(d**(w-1-j) * p_j)
+    with d = 1 - k. Both the plain and the decay-weighted window sums are
+    maintained incrementally; the weighted one is self-correcting because any
+    error is multiplied by d on every step.
+    """
+
+    def __init__(self, window: int = 20, history_limit: Optional[int] = None):
+        if window <= 0:
+            raise ValueError("window must be positive")
+        super().__init__(history_limit)
+        self.window = window
+        self._k = 2.0 / (window + 1.0)
+        self._decay = 1.0 - self._k
+        self._decay_w = self._decay ** window
+        self._sum = _RollingSum(window)
+        self._weighted = 0.0
+
+    def _update(self, candle: Candle) -> Optional[float]:
+        price = _close_of(candle)
+        if self._sum.full():
+            self._weighted = self._weighted * self._decay - self._decay_w * self._sum.values[0] + price
+        else:
+            self._weighted = self._weighted * self._decay + price
+        self._sum.push(price)
+        if self._available() < self.window:
+            return None
+        seed = self._sum.total / float(self.window)
+        return seed * self._decay_w + self._k * self._weighted
+
+
+class StreamingRSI(StreamingIndicator):
+    """
+    Streaming RSI, reference: RSI.calculate.
+
+    Keeps running gain/loss sums over the last `period` deltas and a count of
+    losing deltas, so the all-gains case returns exactly 100.0 like the
+    reference instead of depending on a drifted zero.
+    """
+
+    def __init__(self, period: int = 14, history_limit: Optional[int] = None):
+        if period <= 0:
+            raise ValueError("period must be positive")
+        super().__init__(history_limit)
+        self.period = period
+        self._prev: Optional[float] = None
+        self._gains = _RollingSum(period)
+        self._losses = _RollingSum(period)
+        self._loss_count = 0
+
+    def _update(self, candle: Candle) -> Optional[float]:
+        price = _close_of(candle)
+        prev, self._prev = self._prev, price
+        if prev is None:
+            return None
+        diff = price - prev
+        if self._losses.full() and self._losses.values[0] > 0:
+            self._loss_count -= 1
+        if diff > 0:
+            self._gains.push(diff)
+            self._losses.push(0.0)
+        else:
+            self._gains.push(0.0)
+            self._losses.push(abs(diff))
+            if diff < 0:
+                self._loss_count += 1
+        if self._available() < self.period + 1:
+            return None
+        if self._loss_count == 0:
+            return 100.0
+        rs = (self._gains.total / self.period) / (self._losses.total / self.period)
+        return 100.0 - (100.0 / (1.0 + rs))
+
+
+class StreamingMACD(StreamingIndicator):
+    """
+    Streaming MACD, reference: MACD.calculate.
+
+    The reference rebuilds the MACD line for every prefix of the last `slow`
+    bars; here each bar's MACD value is pushed once into a streaming signal EMA.
+    """
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9, history_limit: Optional[int] = None):
+        super().__init__(history_limit)
+        self.fast = fast
+        self.slow = slow
+        self.signal = signal
+        self._ema_fast = StreamingEMA(fast)
+        self._ema_slow = StreamingEMA(slow)
+        self._ema_signal = StreamingEMA(signal)
+
+    def _update(self, candle: Candle) -> Optional[Dict[str, float]]:
+        price = _close_of(candle)
+        ef = self._ema_fast.update(price)
+        es = self._ema_slow.update(price)
+        if ef is not None and es is not None:
+            self._ema_signal.update(ef - es)
+        n = self._available()
+        if n < self.slow + self.signal or n < self.fast:
+            return None
+        # number of valid MACD points among the last `slow` prefixes the
+        # reference inspects; it bails out when fewer than `signal` exist
+        valid = n - max(n - self.slow + 1, self.fast, self.slow) + 1
+        if valid < self.signal:
+            return None
+        macd_line = ef - es
+        sig = self._ema_signal.value
+        return {"macd": macd_line, "signal": sig, "histogram": macd_line - sig}
+
+
+class StreamingATR(StreamingIndicator):
+    """
+    Streaming ATR, reference: ATR.calculate (high - low range averaged over `period`).
+    """
+
+    def __init__(self, period: int = 14, history_limit: Optional[int] = None):
+        if period <= 0:
+            raise ValueError("period must be positive")
+        super().__init__(history_limit)
+        self.period = period
+        self._ranges = _RollingSum(period)
+
+    def _update(self, candle: Candle) -> Optional[float]:
+        self._ranges.push(float(candle["high"]) - float(candle["low"]))
+        if self._available() < self.period + 1:
+            return None
+        return self._ranges.total / float(self.period)
@@ -8,8 +8,8 @@ with a standard REST API interface.
 import logging
 from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime
-import aiohttp
 
+from worker.http_client import SharedHTTPClient, get_http_client
 from worker.markets.market_adapter import (
     MarketAdapter,
     MarketType,
@@ -40,7 +40,8 @@ class GenericRESTAdapter(MarketAdapter):
         market_type: MarketType,
         api_key: Optional[str] = None,
         secret_key: Optional[str] = None,
-        auth_handler: Optional[Callable] = None
+        auth_handler: Optional[Callable] = None,
+        http_client: Optional[SharedHTTPClient] = None
     ):
         """
         Initialize generic REST adapter.
@@ -52,6 +53,7 @@ class GenericRESTAdapter(MarketAdapter):
             api_key: API key
             secret_key: Secret key
             auth_handler: Custom authentication handler
+            http_client: Pooled HTTP client (default: process-wide shared client)
         """
         super().__init__(market_type, name)
         
@@ -59,6 +61,7 @@ class GenericRESTAdapter(MarketAdapter):
         self.api_key = api_key
         self.secret_key = secret_key
         self.auth_handler = auth_handler
+        self.http = http_client or get_http_client()
         
         # Endpoint configurations
         self.endpoints: Dict[str, Dict[str, Any]] = {}
@@ -128,17 +131,14 @@ class GenericRESTAdapter(MarketAdapter):
         elif requires_auth and self.api_key:
             headers["X-API-KEY"] = self.api_key
         
-        async with aiohttp.ClientSession() as session:
-            async with session.request(
-                method=method,
-                url=url,
-                params=params,
-                json=data,
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=10)
-            ) as response:
-                response.raise_for_status()
-                return await response.json()
+        return await self.http.request_json(
+            method,
+            url,
+            params=params,
+            json=data,
+            headers=headers,
+            timeout=10
+        )
     
     async def connect(self) -> bool:
         """Test connection to exchange."""
@@ -0,0 +1,179 @@
+"""
+Time-sorted event index shared by NewsFilter and NewsAnchor.
+
+Events live in one time-sorted list per bucket (impact level, market bias,
+...) so a window query is two bisects per bucket plus the k matches, and
+evicting everything older than a cutoff drops a list prefix. Secondary tag
+indexes (asset, central bank, ...) are maintained on insert/evict so lookups
+by tag never scan the whole store. Re-adding an event under an existing key
+replaces it in place.
+"""
+
+import heapq
+import itertools
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from typing import Any, Callable, Dict, Generic, Hashable, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+E = TypeVar("E")
+
+# (event time, insertion sequence); the sequence keeps equal times stable
+_SortKey = Tuple[datetime, int]
+
+
+class EventTimeIndex(Generic[E]):
+    """
+    Events bucketed by a category and sorted by time within each bucket.
+
+    Args:
+        time_of: Event -> datetime used for ordering and windows
+        bucket_of: Event -> bucket (e.g. NewsImpact)
+        key_of: Event -> dedupe key (default: object identity)
+        tags_of: Event -> iterable of secondary-index tags
+    """
+
+    def __init__(
+        self,
+        time_of: Callable[[E], datetime],
+        bucket_of: Callable[[E], Hashable],
+        key_of: Optional[Callable[[E], Hashable]] = None,
+        tags_of: Optional[Callable[[E], Iterable[Hashable]]] = None,
+    ):
+        self._time_of = time_of
+        self._bucket_of = bucket_of
+        self._key_of = key_of or id
+        self._tags_of = tags_of or (lambda event: ())
+        self._seq = itertools.count()
+        self._times: Dict[Hashable, List[_SortKey]] = {}
+        # bucket -> keys, parallel to _times
+        self._keys: Dict[Hashable, List[Hashable]] = {}
+        # key -> (bucket, sort key, event, tags), insertion ordered
+        self._entries: Dict[Hashable, Tuple[Hashable, _SortKey, E, Tuple[Hashable, ...]]] = {}
+        # tag -> {key: event}, insertion ordered
+        self._tags: Dict[Hashable, Dict[Hashable, E]] = {}
+
+    def add(self, event: E, key: Optional[Hashable] = None) -> None:
+        """
+        Insert an event.
+
+        Args:
+            event: Event to index
+            key: Dedupe key (default: key_of(event)); an existing event with
+                the same key is replaced and keeps its insertion position
+        """
+        if key is None:
+            key = self._key_of(event)
+        if key in self._entries:
+            self._unlink(key)
+        bucket = self._bucket_of(event)
+        sort_key = (self._time_of(event), next(self._seq))
+        times = self._times.setdefault(bucket, [])
+        pos = bisect_right(times, sort_key)
+        times.insert(pos, sort_key)
+        self._keys.setdefault(bucket, []).insert(pos, key)
+        tags = tuple(dict.fromkeys(self._tags_of(event)))
+        for tag in tags:
+            self._tags.setdefault(tag, {})[key] = event
+        self._entries[key] = (bucket, sort_key, event, tags)
+
+    def extend(self, events: Iterable[E]) -> None:
+        for event in events:
+            self.add(event)
+
+    def _unlink(self, key: Hashable) -> None:
+        """Remove key from its bucket and tags, leaving its _entries slot."""
+        bucket, sort_key, _, tags = self._entries[key]
+        times = self._times[bucket]
+        pos = bisect_left(times, sort_key)
+        del times[pos]
+        del self._keys[bucket][pos]
+        self._untag(key, tags)
+
+    def _untag(self, key: Hashable, tags: Tuple[Hashable, ...]) -> None:
+        for tag in tags:
+            tagged = self._tags.get(tag)
+            if tagged is not None:
+                tagged.pop(key, None)
+                if not tagged:
+                    del self._tags[tag]
+
+    def window(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        buckets: Optional[Iterable[Hashable]] = None,
+        inclusive_start: bool = True,
+    ) -> List[E]:
+        """
+        Events with start <= time <= end (either bound optional), oldest first.
+
+        Args:
+            start: Lower time bound
+            end: Upper time bound (inclusive)
+            buckets: Restrict to these buckets (default: all)
+            inclusive_start: False makes the lower bound strict (time > start)
+
+        Returns:
+            Matching events in time order; O(b log n + k) for b buckets
+        """
+        slices = []
+        for bucket in (self._times if buckets is None else buckets):
+            times = self._times.get(bucket)
+            if not times:
+                continue
+            lo = 0
+            if start is not None:
+                lo = bisect_left(times, (start, -1)) if inclusive_start else bisect_right(times, (start, float("inf")))
+            hi = len(times) if end is None else bisect_right(times, (end, float("inf")))
+            if lo < hi:
+                slices.append(zip(times[lo:hi], self._keys[bucket][lo:hi]))
+        if len(slices) == 1:
+            pairs = slices[0]
+        else:
+            pairs = heapq.merge(*slices, key=lambda pair: pair[0])
+        return [self._entries[key][2] for _, key in pairs]
+
+    def evict_before(self, cutoff: datetime) -> int:
+        """Drop every event with time < cutoff; returns how many were dropped."""
+        dropped = 0
+        for bucket, times in self._times.items():
+            pos = bisect_left(times, (cutoff, -1))
+            if not pos:
+                continue
+            keys = self._keys[bucket]
+            for key in keys[:pos]:
+                self._untag(key, self._entries.pop(key)[3])
+            del times[:pos]
+            del keys[:pos]
+            dropped += pos
+        return dropped
+
+    def by_tag(self, tag: Hashable) -> List[E]:
+        """Events carrying tag, in insertion order."""
+        return list(self._tags.get(tag, {}).values())
+
+    def tag_count(self, tag: Hashable) -> int:
+        return len(self._tags.get(tag, ()))
+
+    def bucket_count(self, bucket: Hashable) -> int:
+        return len(self._times.get(bucket, ()))
+
+    def events(self) -> List[E]:
+        """All events in insertion order."""
+        return [entry[2] for entry in self._entries.values()]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._times.clear()
+        self._keys.clear()
+        self._tags.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[E]:
+        """All events in time order."""
+        return iter(self.window())
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._entries
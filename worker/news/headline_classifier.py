@@ -0,0 +1,209 @@
+"""
+Compiled keyword matcher for news headline classification.
+
+NewsFilter.detect_event_type and the NewsAnchor feed parsers used to upper-case
+every headline and run one `keyword in title` test per keyword per list.
+HeadlineClassifier compiles every keyword (impact, sentiment and asset terms)
+into a single trie-shaped regex, so one scan of a headline finds all of them
+and yields impact level, sentiment direction and asset tags together.
+classify_batch() classifies a whole feed response at once, and keyword
+combinations already seen are resolved from a memo.
+
+Matching keeps the substring semantics of the old `in` checks ("UP" matches
+"UPBEAT"). Each keyword carries the labels of every keyword it contains, so a
+long match ("FEDERAL RESERVE") also reports the short ones inside it. The scan
+is leftmost-longest and non-overlapping, so a keyword that shares letters with
+the end of a previous match in the same run of letters ("DOLLARALLY") is not
+seen; overlapping=True uses a lookahead scan that tries every position and
+matches the old checks exactly, at roughly half the speed.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Hashable, Iterable, List, Optional, Sequence, Tuple
+
+# Sentiment vocabulary used by the feed parsers
+POSITIVE_KEYWORDS = ["RALLY", "SURGE", "GAINS", "UP"]
+NEGATIVE_KEYWORDS = ["FALL", "DROP", "DECLINE", "DOWN"]
+
+# Asset tag -> headline keywords
+ASSET_KEYWORDS: Dict[str, List[str]] = {
+    "CRYPTO": ["CRYPTO", "BITCOIN", "BTC", "ETHEREUM", "ETH ", "BINANCE", "STABLECOIN"],
+    "USD": ["USD", "DOLLAR", "FOMC", "FEDERAL RESERVE", "TREASURY", "NFP", "NON-FARM"],
+    "EUR": ["EUR", "ECB", "LAGARDE"],
+    "GBP": ["GBP", "POUND", "STERLING", "BOE", "ENGLAND"],
+    "JPY": ["JPY", "YEN", "BOJ", "JAPAN"],
+    "STOCKS": ["STOCK", "EQUIT", "SHARES", "NASDAQ", "S&P", "DOW JONES", "EARNINGS"],
+    "GOLD": ["GOLD", "XAU"],
+    "OIL": ["CRUDE", "BRENT", "WTI", "OPEC"],
+}
+
+# Cap on memoized keyword combinations
+MAX_RESOLVED_COMBINATIONS = 50_000
+
+_SENTIMENT_POSITIVE = 1
+_SENTIMENT_NEGATIVE = 2
+
+
+@dataclass(frozen=True)
+class HeadlineClassification:
+    """Result of classifying one headline."""
+    impact: Hashable
+    sentiment: int  # +1 positive, -1 negative, 0 neutral
+    assets: Tuple[str, ...]
+    keywords: Tuple[str, ...]
+
+
+class HeadlineClassifier:
+    """
+    Classify headlines by impact, sentiment direction and asset tags in one pass.
+
+    Args:
+        impact_keywords: (impact, keywords) pairs from lowest to highest
+            precedence; a headline gets the highest impact it matches
+        default_impact: Impact when no impact keyword matches
+        positive_keywords: Keywords that mark a headline positive
+        negative_keywords: Keywords that mark a headline negative (positive wins)
+        asset_keywords: Asset tag -> keywords (default: ASSET_KEYWORDS)
+        overlapping: Also find keywords overlapping a previous match
+    """
+
+    def __init__(
+        self,
+        impact_keywords: Sequence[Tuple[Hashable, Iterable[str]]],
+        default_impact: Hashable,
+        positive_keywords: Iterable[str] = POSITIVE_KEYWORDS,
+        negative_keywords: Iterable[str] = NEGATIVE_KEYWORDS,
+        asset_keywords: Optional[Dict[str, Iterable[str]]] = None,
+        overlapping: bool = False,
+    ):
+        self.impacts: List[Hashable] = [default_impact] + [impact for impact, _ in impact_keywords]
+        self.default_impact = default_impact
+
+        # keyword -> (impact rank, sentiment bits, asset tags)
+        labels: Dict[str, Tuple[int, int, FrozenSet[str]]] = {}
+
+        def label(keyword: str, rank: int = 0, bits: int = 0, assets: FrozenSet[str] = frozenset()) -> None:
+            keyword = keyword.upper()
+            if not keyword:
+                return
+            old_rank, old_bits, old_assets = labels.get(keyword, (0, 0, frozenset()))
+            labels[keyword] = (max(old_rank, rank), old_bits | bits, old_assets | assets)
+
+        for rank, (_, keywords) in enumerate(impact_keywords, start=1):
+            for keyword in keywords:
+                label(keyword, rank=rank)
+        for keyword in positive_keywords:
+            label(keyword, bits=_SENTIMENT_POSITIVE)
+        for keyword in negative_keywords:
+            label(keyword, bits=_SENTIMENT_NEGATIVE)
+        for asset, keywords in (ASSET_KEYWORDS if asset_keywords is None else asset_keywords).items():
+            for keyword in keywords:
+                label(keyword, assets=frozenset([asset]))
+
+        # Fold in the labels of every keyword contained in a longer one
+        self._labels: Dict[str, Tuple[int, int, FrozenSet[str], Tuple[str, ...]]] = {}
+        for keyword in labels:
+            inner = [other for other in labels if other in keyword]
+            self._labels[keyword] = (
+                max(labels[k][0] for k in inner),
+                _or_bits(labels[k][1] for k in inner),
+                frozenset().union(*(labels[k][2] for k in inner)),
+                tuple(sorted(inner)),
+            )
+
+        trie = _trie_regex(self._labels)
+        self.overlapping = overlapping
+        self._pattern = re.compile(f"(?=({trie}))" if overlapping else trie)
+        # Feeds repeat the same keyword combinations; resolve each one once
+        self._resolved: Dict[Tuple[str, ...], HeadlineClassification] = {}
+
+    def classify(self, headline: str) -> HeadlineClassification:
+        """Classify one headline."""
+        return self._resolve(tuple(self._pattern.findall(headline.upper())))
+
+    def classify_batch(self, headlines: Sequence[str]) -> List[HeadlineClassification]:
+        """
+        Classify a whole feed, upper-casing it in one call.
+
+        Args:
+            headlines: Headlines to classify
+
+        Returns:
+            One classification per headline, in order
+        """
+        if not headlines:
+            return []
+        lines = "\n".join(headlines).upper().split("\n")
+        if len(lines) != len(headlines):
+            # A headline contains the separator
+            lines = [headline.upper() for headline in headlines]
+        findall = self._pattern.findall
+        resolve = self._resolve
+        return [resolve(tuple(findall(line))) for line in lines]
+
+    def _resolve(self, matches: Tuple[str, ...]) -> HeadlineClassification:
+        resolved = self._resolved.get(matches)
+        if resolved is None:
+            resolved = self._combine(matches)
+            if len(self._resolved) < MAX_RESOLVED_COMBINATIONS:
+                self._resolved[matches] = resolved
+        return resolved
+
+    def _combine(self, matches: Tuple[str, ...]) -> HeadlineClassification:
+        if not matches:
+            return HeadlineClassification(self.default_impact, 0, (), ())
+        rank = 0
+        bits = 0
+        assets: FrozenSet[str] = frozenset()
+        keywords: Dict[str, None] = {}
+        for match in matches:
+            match_rank, match_bits, match_assets, inner = self._labels[match]
+            if match_rank > rank:
+                rank = match_rank
+            bits |= match_bits
+            if match_assets:
+                assets = assets | match_assets
+            keywords.update(dict.fromkeys(inner))
+        if bits & _SENTIMENT_POSITIVE:
+            sentiment = 1
+        elif bits & _SENTIMENT_NEGATIVE:
+            sentiment = -1
+        else:
+            sentiment = 0
+        return HeadlineClassification(self.impacts[rank], sentiment, tuple(sorted(assets)), tuple(keywords))
+
+
+def _or_bits(values: Iterable[int]) -> int:
+    bits = 0
+    for value in values:
+        bits |= value
+    return bits
+
+
+def _trie_regex(keywords: Iterable[str]) -> str:
+    """Alternation of keywords factored into a trie, longest match preferred."""
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+__all__ = [
+    "ASSET_KEYWORDS",
+    "HeadlineClassification",
+    "HeadlineClassifier",
+    "NEGATIVE_KEYWORDS",
+    "POSITIVE_KEYWORDS",
+]
@@ -24,11 +24,13 @@ Sources:
 import logging
 import asyncio
 from typing import Dict, Any, List, Optional
-from datetime import datetime, time
+from datetime import datetime, time, timedelta
 from enum import Enum
 from dataclasses import dataclass
-import aiohttp
 
+from worker.http_client import SharedHTTPClient, get_http_client
+from worker.news.event_index import EventTimeIndex
+from worker.news.news_filter import HEADLINE_CLASSIFIER
 from worker.pycares_compat import ensure_pycares_compat
 
 logger = logging.getLogger(__name__)
@@ -97,10 +99,24 @@ class NewsAnchor:
     - Risk Engine (position sizing adjustment)
     """
     
-    def __init__(self):
-        """Initialize news anchor."""
+    CENTRAL_BANKS = ["FED", "ECB", "BOE", "BOJ", "FOMC"]
+    FOREX_ASSETS = {"USD", "EUR", "GBP"}
+    
+    def __init__(self, http_client: Optional[SharedHTTPClient] = None):
+        """
+        Initialize news anchor.
+        
+        Args:
+            http_client: Pooled HTTP client (default: process-wide shared client)
+        """
+        self.http = http_client or get_http_client()
         self.current_briefing: Optional[DailyBriefing] = None
-        self.macro_events: List[MacroEvent] = []
+        # Time-sorted per market bias, secondary indexes by asset and central bank
+        self.events: EventTimeIndex[MacroEvent] = EventTimeIndex(
+            time_of=lambda e: e.timestamp,
+            bucket_of=lambda e: e.market_impact,
+            tags_of=self._event_tags
+        )
         self.last_briefing_time: Optional[datetime] = None
         
         # Sentiment tracking
@@ -240,40 +256,100 @@ class NewsAnchor:
         logger.info(f"✅ Registered source: {name}")
     
     async def _update_macro_events(self) -> None:
-        """Fetch and update macro events from all sources."""
-        for source_name, config in self.sources.items():
-            try:
-                # Check if update needed
-                if config["last_update"]:
-                    elapsed = (datetime.now() - config["last_update"]).total_seconds()
-                    if elapsed < config["update_interval"]:
-                        continue
-                
-                # Fetch data
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(config["url"], timeout=10) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            
-                            # Parse events
-                            events = config["parser"](data)
-                            
-                            # Add to events list
-                            self.macro_events.extend(events)
-                            
-                            # Keep only recent events (last 7 days)
-                            cutoff = datetime.now() - timedelta(days=7)
-                            self.macro_events = [
-                                e for e in self.macro_events
-                                if e.timestamp > cutoff
-                            ]
-                            
-                            config["last_update"] = datetime.now()
-                            
-                            logger.debug(f"✅ Updated {source_name}: {len(events)} events")
+        """Fetch and update macro events from all due sources concurrently."""
+        now = datetime.now()
+        due = [
+            (source_name, config)
+            for source_name, config in self.sources.items()
+            if not config["last_update"]
+            or (now - config["last_update"]).total_seconds() >= config["update_interval"]
+        ]
+        if not due:
+            return
+        
+        results = await asyncio.gather(
+            *(self._fetch_source(source_name, config) for source_name, config in due)
+        )
+        
+        # Apply in registration order so event order is deterministic
+        updated = False
+        for (source_name, config), events in zip(due, results):
+            if events is None:
+                continue
+            self.events.extend(events)
+            config["last_update"] = datetime.now()
+            updated = True
+        
+        if updated:
+            # Keep only recent events (last 7 days)
+            self.events.evict_before(datetime.now() - timedelta(days=7))
+    
+    @property
+    def macro_events(self) -> List[MacroEvent]:
+        """All retained macro events in arrival order."""
+        return self.events.events()
+    
+    def _event_tags(self, event: MacroEvent) -> List[str]:
+        """Secondary index tags: ASSET:<asset>, CB:<bank>, FOREX, CENTRAL_BANK, VOLATILE."""
+        assets = {a.upper() for a in event.affected_assets}
+        tags = [f"ASSET:{a}" for a in assets]
+        if assets & self.FOREX_ASSETS:
+            tags.append("FOREX")
+        title = event.title.upper()
+        banks = [cb for cb in self.CENTRAL_BANKS if cb in title]
+        if banks:
+            tags.append("CENTRAL_BANK")
+            tags.extend(f"CB:{cb}" for cb in banks)
+        if abs(event.sentiment_score) > 0.7:
+            tags.append("VOLATILE")
+        return tags
+    
+    def get_events_for_asset(self, asset: str) -> List[MacroEvent]:
+        """Retained events affecting asset (e.g. "CRYPTO", "USD")."""
+        return self.events.by_tag(f"ASSET:{asset.upper()}")
+    
+    def get_central_bank_events(self, bank: Optional[str] = None) -> List[MacroEvent]:
+        """Retained events mentioning bank (e.g. "ECB"), or any central bank."""
+        return self.events.by_tag(f"CB:{bank.upper()}" if bank else "CENTRAL_BANK")
+    
+    def _events_since(
+        self,
+        age: timedelta,
+        bias: Optional[MarketBias] = None
+    ) -> List[MacroEvent]:
+        """Events newer than now - age, optionally of one market bias."""
+        return self.events.window(
+            datetime.now() - age,
+            buckets=[bias] if bias else None,
+            inclusive_start=False
+        )
+    
+    async def _fetch_source(
+        self,
+        source_name: str,
+        config: Dict[str, Any]
+    ) -> Optional[List[MacroEvent]]:
+        """
+        Fetch and parse one source.
+        
+        Returns:
+            Parsed events, [] when the feed is unchanged (304), None on failure
+        """
+        try:
+            result = await self.http.get_json(config["url"], timeout=10)
+            if result.not_modified:
+                logger.debug(f"✅ {source_name} unchanged")
+                return []
+            if result.status != 200:
+                return None
             
-            except Exception as e:
-                logger.error(f"Failed to update {source_name}: {e}")
+            events = config["parser"](result.data)
+            logger.debug(f"✅ Updated {source_name}: {len(events)} events")
+            return events
+        
+        except Exception as e:
+            logger.error(f"Failed to update {source_name}: {e}")
+            return None
     
     def _calculate_market_bias(self) -> MarketBias:
         """
@@ -282,14 +358,11 @@ class NewsAnchor:
         Returns:
             Market bias
         """
-        if not self.macro_events:
+        if not self.events:
             return MarketBias.NEUTRAL
         
-        # Calculate average sentiment from recent events
-        recent_events = [
-            e for e in self.macro_events
-            if (datetime.now() - e.timestamp).days <= 1
-        ]
+        # Calculate average sentiment from recent events (under 2 whole days old)
+        recent_events = self._events_since(timedelta(days=2))
         
         if not recent_events:
             return MarketBias.NEUTRAL
@@ -317,7 +390,7 @@ class NewsAnchor:
         total_weight = 0
         weighted_sentiment = 0
         
-        for event in self.macro_events:
+        for event in self.events:
             # Recent events have more weight
             days_ago = (datetime.now() - event.timestamp).days
             weight = max(0.1, 1.0 - (days_ago / 7.0))
@@ -347,17 +420,13 @@ class NewsAnchor:
         risk_factors = []
         
         # Check for risk-off events
-        risk_off_events = [
-            e for e in self.macro_events
-            if e.market_impact == MarketBias.RISK_OFF
-            and (datetime.now() - e.timestamp).days <= 2
-        ]
+        risk_off_events = self._events_since(timedelta(days=3), MarketBias.RISK_OFF)
         
         for event in risk_off_events[:3]:
             risk_factors.append(f"{event.title} ({event.source})")
         
         # Check for high volatility warnings
-        if len([e for e in self.macro_events if abs(e.sentiment_score) > 0.7]) > 3:
+        if self.events.tag_count("VOLATILE") > 3:
             risk_factors.append("High market volatility detected")
         
         return risk_factors
@@ -367,11 +436,7 @@ class NewsAnchor:
         opportunities = []
         
         # Check for risk-on events
-        risk_on_events = [
-            e for e in self.macro_events
-            if e.market_impact == MarketBias.RISK_ON
-            and (datetime.now() - e.timestamp).days <= 2
-        ]
+        risk_on_events = self._events_since(timedelta(days=3), MarketBias.RISK_ON)
         
         for event in risk_on_events[:3]:
             opportunities.append(f"{event.title} ({', '.join(event.affected_assets)})")
@@ -380,22 +445,16 @@ class NewsAnchor:
     
     def _summarize_central_banks(self) -> str:
         """Summarize central bank activity."""
-        cb_events = [
-            e for e in self.macro_events
-            if any(cb in e.title.upper() for cb in ["FED", "ECB", "BOE", "BOJ", "FOMC"])
-        ]
+        cb_count = self.events.tag_count("CENTRAL_BANK")
         
-        if not cb_events:
+        if not cb_count:
             return "No major central bank updates"
         
-        return f"{len(cb_events)} central bank updates in last 7 days"
+        return f"{cb_count} central bank updates in last 7 days"
     
     def _summarize_crypto(self) -> str:
         """Summarize crypto market sentiment."""
-        crypto_events = [
-            e for e in self.macro_events
-            if "CRYPTO" in [a.upper() for a in e.affected_assets]
-        ]
+        crypto_events = self.get_events_for_asset("CRYPTO")
         
         if not crypto_events:
             return "Neutral crypto sentiment"
@@ -411,15 +470,12 @@ class NewsAnchor:
     
     def _summarize_forex(self) -> str:
         """Summarize forex market outlook."""
-        forex_events = [
-            e for e in self.macro_events
-            if any(pair in [a.upper() for a in e.affected_assets] for pair in ["USD", "EUR", "GBP"])
-        ]
+        forex_count = self.events.tag_count("FOREX")
         
-        if not forex_events:
+        if not forex_count:
             return "Stable forex conditions"
         
-        return f"{len(forex_events)} forex-relevant events"
+        return f"{forex_count} forex-relevant events"
     
     def _create_briefing_summary(
         self,
@@ -444,10 +500,7 @@ class NewsAnchor:
     
     def _calculate_current_sentiment(self) -> float:
         """Calculate current market sentiment."""
-        recent = [
-            e.sentiment_score for e in self.macro_events
-            if (datetime.now() - e.timestamp).hours <= 24
-        ]
+        recent = [e.sentiment_score for e in self.events.window(datetime.now() - timedelta(hours=24))]
         
         if not recent:
             return 0.0
@@ -484,7 +537,7 @@ class NewsAnchor:
         return {
             "last_briefing": self.last_briefing_time.isoformat() if self.last_briefing_time else None,
             "current_bias": self.current_briefing.overall_bias.value if self.current_briefing else None,
-            "macro_events_count": len(self.macro_events),
+            "macro_events_count": len(self.events),
             "sources_count": len(self.sources),
             "current_sentiment": self._calculate_current_sentiment(),
             "risk_level": self._calculate_risk_level()
@@ -493,27 +546,23 @@ class NewsAnchor:
 
 # Example parser functions
 
-def parse_marketwatch(data: Dict[str, Any]) -> List[MacroEvent]:
-    """Parse MarketWatch API response."""
+def _parse_articles(data: Dict[str, Any], source: str) -> List[MacroEvent]:
+    """Build MacroEvents from an articles feed, classifying all headlines in one pass."""
+    articles = data.get("articles", [])
+    classified = HEADLINE_CLASSIFIER.classify_batch([item.get("headline", "") for item in articles])
     events = []
     
-    for item in data.get("articles", []):
-        # Determine sentiment from headline
-        sentiment = 0.0
-        headline = item.get("headline", "").upper()
-        
-        if any(word in headline for word in ["RALLY", "SURGE", "GAINS", "UP"]):
-            sentiment = 0.5
-        elif any(word in headline for word in ["FALL", "DROP", "DECLINE", "DOWN"]):
-            sentiment = -0.5
+    for item, headline in zip(articles, classified):
+        # Sentiment direction from headline keywords
+        sentiment = 0.5 * headline.sentiment
         
         event = MacroEvent(
             title=item.get("headline", ""),
             summary=item.get("summary", ""),
-            source="MarketWatch",
+            source=source,
             timestamp=datetime.fromisoformat(item.get("published_date", datetime.now().isoformat())),
             market_impact=MarketBias.RISK_ON if sentiment > 0 else MarketBias.RISK_OFF,
-            affected_assets=["STOCKS", "CRYPTO"],
+            affected_assets=list(headline.assets) or ["STOCKS", "CRYPTO"],
             sentiment_score=sentiment
         )
         events.append(event)
@@ -521,11 +570,11 @@ def parse_marketwatch(data: Dict[str, Any]) -> List[MacroEvent]:
     return events
 
 
+def parse_marketwatch(data: Dict[str, Any]) -> List[MacroEvent]:
+    """Parse MarketWatch API response."""
+    return _parse_articles(data, "MarketWatch")
+
+
 def parse_reuters(data: Dict[str, Any]) -> List[MacroEvent]:
-    """Parse Reuters API response."""
-    events = []
-    
-    # Similar parsing logic
-    # Placeholder implementation
-    
-    return events
+    """Parse Reuters API response (same articles layout as MarketWatch)."""
+    return _parse_articles(data, "Reuters")
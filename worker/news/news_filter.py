@@ -22,7 +22,10 @@ from typing import Dict, Any, List, Optional, Set
 from datetime import datetime, timedelta
 from enum import Enum
 from dataclasses import dataclass
-import aiohttp
+
+from worker.http_client import SharedHTTPClient, get_http_client
+from worker.news.event_index import EventTimeIndex
+from worker.news.headline_classifier import HeadlineClassification, HeadlineClassifier
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +38,10 @@ class NewsImpact(Enum):
     CRITICAL = "critical"
 
 
+# Impact levels in ascending order; window queries take a suffix of this
+IMPACT_ORDER = [NewsImpact.LOW, NewsImpact.MEDIUM, NewsImpact.HIGH, NewsImpact.CRITICAL]
+
+
 class FilterMode(Enum):
     """Filter response modes."""
     ALLOW = "allow"  # Normal trading
@@ -83,11 +90,32 @@ class NewsFilter:
         "NFP", "Non-Farm", "FOMC", "Federal Reserve", "Interest Rate",
         "CPI", "Inflation", "GDP", "Central Bank", "ECB", "BOE", "BOJ"
     }
+    HIGH_IMPACT_KEYWORDS = ["SPEECH", "DECISION", "ANNOUNCEMENT", "REPORT"]
+    MEDIUM_IMPACT_KEYWORDS = ["DATA", "INDEX", "SURVEY", "SALES"]
     
-    def __init__(self):
-        """Initialize news filter."""
-        self.active_events: List[NewsEvent] = []
-        self.event_cache: Dict[str, NewsEvent] = {}
+    def __init__(
+        self,
+        http_client: Optional[SharedHTTPClient] = None,
+        event_retention: timedelta = timedelta(hours=1),
+        classifier: Optional[HeadlineClassifier] = None
+    ):
+        """
+        Initialize news filter.
+        
+        Args:
+            http_client: Pooled HTTP client (default: process-wide shared client)
+            event_retention: How long past events are kept before eviction
+            classifier: Headline classifier (default: HEADLINE_CLASSIFIER)
+        """
+        self.http = http_client or get_http_client()
+        self.classifier = classifier or HEADLINE_CLASSIFIER
+        self.event_retention = event_retention
+        # Time-sorted per impact level, secondary index by currency
+        self.events: EventTimeIndex[NewsEvent] = EventTimeIndex(
+            time_of=lambda e: e.time,
+            bucket_of=lambda e: e.impact,
+            tags_of=lambda e: (e.currency.upper(),) if e.currency else ()
+        )
         self.manual_override = False
         self.override_until: Optional[datetime] = None
         
@@ -156,8 +184,9 @@ class NewsFilter:
                     position_size_multiplier=0.0
                 )
         
-        # Fetch latest events
+        # Fetch latest events and drop the ones long past
         await self._update_events()
+        self.events.evict_before(current_time - self.event_retention)
         
         # Check for critical events in the next hour
         upcoming_critical = self._get_upcoming_events(
@@ -247,24 +276,19 @@ class NewsFilter:
         Returns:
             NewsImpact level
         """
-        title_upper = title.upper()
-        
-        # Check for critical keywords
-        for keyword in self.CRITICAL_EVENTS:
-            if keyword in title_upper:
-                return NewsImpact.CRITICAL
-        
-        # High impact indicators
-        high_indicators = ["SPEECH", "DECISION", "ANNOUNCEMENT", "REPORT"]
-        if any(ind in title_upper for ind in high_indicators):
-            return NewsImpact.HIGH
-        
-        # Medium impact indicators
-        medium_indicators = ["DATA", "INDEX", "SURVEY", "SALES"]
-        if any(ind in title_upper for ind in medium_indicators):
-            return NewsImpact.MEDIUM
+        return self.classifier.classify(title).impact
+    
+    def classify_headlines(self, titles: List[str]) -> List[HeadlineClassification]:
+        """
+        Classify a batch of titles (e.g. a whole feed response) in one scan.
         
-        return NewsImpact.LOW
+        Args:
+            titles: Event titles or headlines
+            
+        Returns:
+            Impact, sentiment direction and asset tags per title
+        """
+        return self.classifier.classify_batch(titles)
     
     def enable_manual_override(
         self,
@@ -294,40 +318,64 @@ class NewsFilter:
         logger.info("▶️  Manual override disabled")
     
     async def _update_events(self) -> None:
-        """Fetch latest events from all sources."""
-        for source_name, config in self.sources.items():
-            try:
-                # Check if we need to update
-                if config["last_check"]:
-                    elapsed = (datetime.now() - config["last_check"]).total_seconds()
-                    if elapsed < config["check_interval"]:
-                        continue
-                
-                # Fetch data
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(config["url"], timeout=10) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            
-                            # Parse events
-                            events = config["parser"](data)
-                            
-                            # Update cache
-                            for event in events:
-                                cache_key = f"{source_name}_{event.time.isoformat()}_{event.title}"
-                                self.event_cache[cache_key] = event
-                            
-                            config["last_check"] = datetime.now()
-                            
-                            logger.debug(
-                                f"✅ Updated {source_name}: {len(events)} events"
-                            )
+        """Fetch latest events from all due sources concurrently."""
+        now = datetime.now()
+        due = [
+            (source_name, config)
+            for source_name, config in self.sources.items()
+            if not config["last_check"]
+            or (now - config["last_check"]).total_seconds() >= config["check_interval"]
+        ]
+        
+        if due:
+            results = await asyncio.gather(
+                *(self._fetch_source(source_name, config) for source_name, config in due)
+            )
             
-            except Exception as e:
-                logger.error(f"Failed to update {source_name}: {e}")
+            # Apply in registration order so the cache is deterministic
+            for (source_name, config), events in zip(due, results):
+                if events is None:
+                    continue
+                for event in events:
+                    cache_key = f"{source_name}_{event.time.isoformat()}_{event.title}"
+                    self.events.add(event, key=cache_key)
+                config["last_check"] = datetime.now()
+    
+    @property
+    def active_events(self) -> List[NewsEvent]:
+        """All cached events in arrival order."""
+        return self.events.events()
+    
+    def get_events_for_currency(self, currency: str) -> List[NewsEvent]:
+        """Cached events tagged with currency (e.g. "USD", "CRYPTO")."""
+        return self.events.by_tag(currency.upper())
+    
+    async def _fetch_source(
+        self,
+        source_name: str,
+        config: Dict[str, Any]
+    ) -> Optional[List[NewsEvent]]:
+        """
+        Fetch and parse one source.
         
-        # Update active events list
-        self.active_events = list(self.event_cache.values())
+        Returns:
+            Parsed events, [] when the feed is unchanged (304), None on failure
+        """
+        try:
+            result = await self.http.get_json(config["url"], timeout=10)
+            if result.not_modified:
+                logger.debug(f"✅ {source_name} unchanged")
+                return []
+            if result.status != 200:
+                return None
+            
+            events = config["parser"](result.data)
+            logger.debug(f"✅ Updated {source_name}: {len(events)} events")
+            return events
+        
+        except Exception as e:
+            logger.error(f"Failed to update {source_name}: {e}")
+            return None
     
     def _get_upcoming_events(
         self,
@@ -344,29 +392,14 @@ class NewsFilter:
             min_impact: Minimum impact level
             
         Returns:
-            List of upcoming events
+            List of upcoming events, soonest first
         """
-        upcoming = []
-        end_time = current_time + time_window
-        
-        impact_levels = {
-            NewsImpact.LOW: 0,
-            NewsImpact.MEDIUM: 1,
-            NewsImpact.HIGH: 2,
-            NewsImpact.CRITICAL: 3
-        }
-        
-        min_level = impact_levels[min_impact]
-        
-        for event in self.active_events:
-            # Check if event is upcoming
-            if current_time <= event.time <= end_time:
-                # Check impact level
-                event_level = impact_levels[event.impact]
-                if event_level >= min_level:
-                    upcoming.append(event)
-        
-        return upcoming
+        # Bisect each impact bucket at or above min_impact: O(log n + k)
+        return self.events.window(
+            current_time,
+            current_time + time_window,
+            buckets=IMPACT_ORDER[IMPACT_ORDER.index(min_impact):]
+        )
     
     async def _check_crypto_volatility(self) -> float:
         """
@@ -376,21 +409,18 @@ class NewsFilter:
             Risk score (0.0 to 1.0)
         """
         try:
-            async with aiohttp.ClientSession() as session:
-                # Check Binance system status
-                async with session.get(self.binance_status_url, timeout=5) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        
-                        # Status: 0=normal, 1=maintenance
-                        if data.get("status", 0) != 0:
-                            logger.warning("⚠️  Binance maintenance detected")
-                            return 0.8
-                
-                # Additional checks could go here:
-                # - Check volatility index
-                # - Check liquidation levels
-                # - Check funding rates
+            # Check Binance system status
+            result = await self.http.get_json(self.binance_status_url, timeout=5)
+            if result.status in (200, 304) and result.data is not None:
+                # Status: 0=normal, 1=maintenance
+                if result.data.get("status", 0) != 0:
+                    logger.warning("⚠️  Binance maintenance detected")
+                    return 0.8
+            
+            # Additional checks could go here:
+            # - Check volatility index
+            # - Check liquidation levels
+            # - Check funding rates
             
             return 0.0
         
@@ -403,7 +433,7 @@ class NewsFilter:
         return {
             "manual_override": self.manual_override,
             "override_until": self.override_until.isoformat() if self.override_until else None,
-            "active_events_count": len(self.active_events),
+            "active_events_count": len(self.events),
             "sources_count": len(self.sources),
             "recent_events": [
                 {
@@ -412,11 +442,28 @@ class NewsFilter:
                     "time": e.time.isoformat(),
                     "currency": e.currency
                 }
-                for e in sorted(self.active_events, key=lambda x: x.time)[:5]
+                for e in self.events.window()[:5]
             ]
         }
 
 
+def build_headline_classifier(**kwargs: Any) -> HeadlineClassifier:
+    """HeadlineClassifier using NewsFilter's impact keywords (CRITICAL > HIGH > MEDIUM > LOW)."""
+    return HeadlineClassifier(
+        impact_keywords=[
+            (NewsImpact.MEDIUM, NewsFilter.MEDIUM_IMPACT_KEYWORDS),
+            (NewsImpact.HIGH, NewsFilter.HIGH_IMPACT_KEYWORDS),
+            (NewsImpact.CRITICAL, NewsFilter.CRITICAL_EVENTS),
+        ],
+        default_impact=NewsImpact.LOW,
+        **kwargs
+    )
+
+
+# Shared by NewsFilter and the NewsAnchor feed parsers
+HEADLINE_CLASSIFIER = build_headline_classifier()
+
+
 # Example parsers for different sources
 
 def parse_forexfactory_response(data: Dict[str, Any]) -> List[NewsEvent]:
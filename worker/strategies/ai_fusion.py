@@ -4,14 +4,21 @@ Full Hybrid AI Fusion Strategy - deterministic indicator-based decision system.
 Pure Python only. No new dependencies or network calls.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 from worker.strategies.base import StrategyBase
-from worker.indicators.sma import SMA
-from worker.indicators.ema import EMA
-from worker.indicators.rsi import RSI
-from worker.indicators.macd import MACD
-from worker.indicators.atr import ATR
+from worker.indicators.streaming import (
+    StreamingIndicator,
+    StreamingSMA,
+    StreamingEMA,
+    StreamingRSI,
+    StreamingMACD,
+    StreamingATR,
+)
+
+# Candles kept per symbol; indicators see the same truncated history as before
+HISTORY_LIMIT = 100
 
 
 @dataclass
@@ -41,24 +48,29 @@ class AIFusionStrategy(StrategyBase):
     """
     Full Hybrid AI Fusion Strategy using indicators: SMA, EMA, RSI, MACD, ATR.
     Deterministic and unit-test friendly.
-    Important: indicators are per-symbol in real systems, but for this exercise reuse instances
-    and always pass symbol price payloads as the tests do.
+    Indicators are streaming (O(1) per tick) and kept per symbol.
     """
 
     def __init__(self, config: Optional[AIFusionConfig] = None):
         self.cfg = config or AIFusionConfig()
-        # Indicator instances keep state per symbol
-        self.sma_short = SMA()
-        self.sma_long = SMA()
-        self.ema_short = EMA()
-        self.ema_long = EMA()
-        self.rsi = RSI()
-        self.macd = MACD()
-        self.atr = ATR()
-        # Keep candle history per symbol (for indicators that need OHLC data)
-        self.candle_history: Dict[str, list] = {}
+        # Streaming indicator instances per symbol (symbol -> name -> indicator)
+        self.indicator_streams: Dict[str, Dict[str, StreamingIndicator]] = {}
+        # Keep candle history per symbol (last HISTORY_LIMIT candles)
+        self.candle_history: Dict[str, deque] = {}
         self.last_trailing = {}  # store trailing stop per symbol (symbol -> float)
 
+    def _new_streams(self) -> Dict[str, StreamingIndicator]:
+        cfg = self.cfg
+        return {
+            "sma_short": StreamingSMA(cfg.sma_short, history_limit=HISTORY_LIMIT),
+            "sma_long": StreamingSMA(cfg.sma_long, history_limit=HISTORY_LIMIT),
+            "ema_short": StreamingEMA(cfg.ema_short, history_limit=HISTORY_LIMIT),
+            "ema_long": StreamingEMA(cfg.ema_long, history_limit=HISTORY_LIMIT),
+            "rsi": StreamingRSI(cfg.rsi_period, history_limit=HISTORY_LIMIT),
+            "macd": StreamingMACD(cfg.macd_fast, cfg.macd_slow, cfg.macd_signal, history_limit=HISTORY_LIMIT),
+            "atr": StreamingATR(cfg.atr_period, history_limit=HISTORY_LIMIT),
+        }
+
     def compute_indicators(self, payload: dict) -> dict:
         """
         Push the price into indicators and return latest values.
@@ -85,36 +97,12 @@ class AIFusionStrategy(StrategyBase):
         
         # Update candle history
         if symbol not in self.candle_history:
-            self.candle_history[symbol] = []
+            self.candle_history[symbol] = deque(maxlen=HISTORY_LIMIT)
+            self.indicator_streams[symbol] = self._new_streams()
         self.candle_history[symbol].append(candle)
-        # Keep reasonable history (e.g., last 100 candles)
-        if len(self.candle_history[symbol]) > 100:
-            self.candle_history[symbol] = self.candle_history[symbol][-100:]
-        
-        candles = self.candle_history[symbol]
-        prices = [c["close"] for c in candles]
         
-        # Feed indicators - .calculate() can return None if insufficient data
-        sma_s = self.sma_short.calculate(prices, window=self.cfg.sma_short)
-        sma_l = self.sma_long.calculate(prices, window=self.cfg.sma_long)
-        ema_s = self.ema_short.calculate(prices, window=self.cfg.ema_short)
-        ema_l = self.ema_long.calculate(prices, window=self.cfg.ema_long)
-        rsi_v = self.rsi.calculate(prices, period=self.cfg.rsi_period)
-        macd_v = self.macd.calculate(prices, fast=self.cfg.macd_fast, slow=self.cfg.macd_slow, signal=self.cfg.macd_signal)  # expect dict {macd, signal, hist} or number
-        
-        # ATR needs candles with high/low/close
-        atr_v = self.atr.calculate(candles, period=self.cfg.atr_period)
-        
-        # If indicator .update() returns None due to insufficient history, propagate None values
-        return {
-            "sma_short": sma_s,
-            "sma_long": sma_l,
-            "ema_short": ema_s,
-            "ema_long": ema_l,
-            "rsi": rsi_v,
-            "macd": macd_v,
-            "atr": atr_v,
-        }
+        # Feed indicators - .update() returns None if insufficient data, propagate None values
+        return {name: ind.update(candle) for name, ind in self.indicator_streams[symbol].items()}
 
     def _volatility_ok(self, atr: Optional[float]) -> bool:
         """Return True if volatility is acceptable (not above threshold)."""